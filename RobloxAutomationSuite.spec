@@ -5,7 +5,7 @@ a = Analysis(
     ['C:\\Users\\natha\\OneDrive\\Desktop\\Programs\\Roblox Automation Suite\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[('config', 'config'), ('modules', 'modules'), ('core', 'core'), ('gui', 'gui')],
+    datas=[('config', 'config'), ('modules', 'modules'), ('core', 'core'), ('gui', 'gui'), ('vision', 'vision')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
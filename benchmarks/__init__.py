@@ -0,0 +1 @@
+"""Micro-benchmarks for Roblox Automation Suite hot paths"""
@@ -0,0 +1,114 @@
+"""
+Throughput Benchmark
+End-to-end task pipelines against the simulated game
+
+Usage:
+    python -m benchmarks.bench_throughput [--duration S] [--concurrency 1,4,16]
+                                          [--tasks coin_farm,...] [--failure-rate F] [--json]
+
+Each case starts ``concurrency`` engines running the same task against one
+SimulatedGame on a SimulatedClock and plays ``duration`` virtual seconds.
+Reported per task type and concurrency level: actions/s and yield/hour in
+game time, p99 action latency, failure count, and how long the run took in
+real time.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.automation_engine import AutomationEngine
+from core.clock import SimulatedClock
+from core.simulated_game import SimulatedGame
+
+TASKS = {
+    "coin_farm": {"type": "coin_farm", "delay": 1.0},
+    "auto_click": {"type": "auto_click", "cps": 10.0, "delay": 0.1},
+    "harvest_crops": {"type": "harvest_crops", "delay": 5.0},
+    "full_auto_cycle": {"type": "full_auto_cycle", "delay": 30.0},
+}
+CONCURRENCY = [1, 4, 16]
+
+def run_case(task: str, concurrency: int, duration: float = 3600.0, failure_rate: float = 0.01,
+             contention: float = 0.1, seed: int = 0) -> Dict[str, Any]:
+    """Run one task type at one concurrency level"""
+    clock = SimulatedClock(auto_advance=False)
+    game = SimulatedGame(clock, failure_rate=failure_rate, contention=contention, seed=seed)
+    if TASKS[task]["type"] == "harvest_crops":
+        # Something to harvest: plots planted with staggered ripening times
+        for index, plot in enumerate(game.plots):
+            plot.crop = "Carrot"
+            plot.ready_at = 10.0 * index
+    engines = [AutomationEngine(clock=clock, environment=game) for _ in range(concurrency)]
+
+    wall_start = time.perf_counter()
+    for engine in engines:
+        engine.start_automation(dict(TASKS[task]))
+    clock.run_for(duration)
+    stats = [engine.get_stats() for engine in engines]
+    for engine in engines:
+        engine.stop_automation()
+    wall = time.perf_counter() - wall_start
+
+    actions = sum(s["actions_performed"] for s in stats)
+    action_stats = game.action_stats().get(TASKS[task]["type"], {})
+    hours = duration / 3600.0
+    return {
+        "task": task,
+        "concurrency": concurrency,
+        "virtual_seconds": duration,
+        "actions": actions,
+        "errors": sum(s["errors"] for s in stats),
+        "actions_per_s": round(actions / duration, 3),
+        "currency_per_hour": round(sum(s["currency"] for s in stats) / hours, 1),
+        "items_per_hour": round(sum(s["items"] for s in stats) / hours, 1),
+        "p50_latency_ms": round(action_stats.get("p50", 0.0) * 1000.0, 1),
+        "p99_latency_ms": round(action_stats.get("p99", 0.0) * 1000.0, 1),
+        "wall_seconds": round(wall, 3),
+    }
+
+def run(tasks: List[str], concurrency: List[int], duration: float = 3600.0,
+        failure_rate: float = 0.01) -> Dict[str, Any]:
+    """Run every task type at every concurrency level"""
+    return {
+        "benchmark": "throughput",
+        "cases": [run_case(task, level, duration, failure_rate) for task in tasks for level in concurrency],
+    }
+
+def main(argv=None) -> int:
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_throughput", description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--duration", type=float, default=3600.0, help="Virtual seconds per case")
+    parser.add_argument("--concurrency", default=",".join(map(str, CONCURRENCY)), help="Comma-separated engine counts")
+    parser.add_argument("--tasks", default=",".join(TASKS), help=f"Comma-separated tasks ({', '.join(TASKS)})")
+    parser.add_argument("--failure-rate", type=float, default=0.01, help="Fraction of actions that fail")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    tasks = [task for task in args.tasks.split(",") if task]
+    unknown = [task for task in tasks if task not in TASKS]
+    if unknown:
+        parser.error(f"unknown task {unknown[0]!r}")
+    # Injected failures are expected; keep the engine's error log quiet
+    logging.getLogger("core.automation_engine").setLevel(logging.CRITICAL)
+
+    result = run(tasks, [int(level) for level in args.concurrency.split(",")], args.duration, args.failure_rate)
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"{'task':<16}{'conc':>5}{'actions/s':>11}{'currency/h':>12}{'items/h':>9}{'p99 ms':>9}{'errors':>8}{'wall s':>8}")
+        for case in result["cases"]:
+            print(f"{case['task']:<16}{case['concurrency']:>5}{case['actions_per_s']:>11.3f}"
+                  f"{case['currency_per_hour']:>12.1f}{case['items_per_hour']:>9.1f}"
+                  f"{case['p99_latency_ms']:>9.1f}{case['errors']:>8}{case['wall_seconds']:>8.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+Soak Test
+Long runs of start/pause/resume/stop looking for thread and memory leaks
+
+Usage:
+    python -m benchmarks.soak [--hours H] [--cycle S] [--games N] [--bots N]
+                              [--max-growth-kb KB] [--json]
+
+Every cycle starts one action of every game automation plus a set of bots
+on a shared SimulatedClock, plays ``cycle`` virtual seconds with a pause and
+a resume in between, then stops everything. After each cycle it samples the
+live thread count, traced memory (tracemalloc) and, when a display and
+customtkinter are available, the Tk ``after`` queue of a BotTab that is
+refreshed and edited every cycle.
+
+Samples taken after the warm-up cycles must stay flat: any extra thread, a
+growing after() queue or memory growth beyond ``--max-growth-kb`` fails the
+run (exit status 1) and the largest allocation differences are reported.
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.automation_engine import AutomationEngine
+from core.bot_framework import BotFramework, BotType
+from core.clock import SimulatedClock
+from modules.game_automation import GameAutomation, GameAutomationManager
+
+WARMUP_CYCLES = 2
+
+def _default_args(automation: GameAutomation, action: str) -> List[Any]:
+    """Arguments for an action's parameters that have no default"""
+    args = []
+    for param in automation.definition.actions[action]["params"]:
+        if "default" in param:
+            break
+        args.append(1 if param.get("kind") == "int" else "Default")
+    return args
+
+class _TkProbe:
+    """A BotTab in a hidden window whose after() queue is measured"""
+
+    def __init__(self):
+        import customtkinter as ctk
+        from gui.tabs.bot_tab import BotTab
+
+        class _MainWindow:
+            def update_status(self, message, level="info"):
+                pass
+
+        self.root = ctk.CTk()
+        self.root.withdraw()
+        frame = ctk.CTkFrame(self.root)
+        self.tab = BotTab(frame, _MainWindow())
+
+    def exercise(self):
+        """Create and remove a bot and refresh the list, as a user would"""
+        self.tab.game_id_entry.insert(0, "1")
+        self.tab.create_bot()
+        for bot_id in list(self.tab.bot_framework.bots):
+            self.tab.remove_bot(bot_id)
+        self.tab._update_bots_list()
+        self.root.update()
+
+    def pending(self) -> int:
+        """Get the number of scheduled after() callbacks"""
+        return len(self.root.tk.splitlist(self.root.tk.call("after", "info")))
+
+    def close(self):
+        self.tab.stop_updates()
+        self.root.destroy()
+
+def _open_tk_probe() -> Optional[_TkProbe]:
+    try:
+        return _TkProbe()
+    except Exception as e:
+        logging.getLogger(__name__).info("Tk after() sampling skipped: %s", e)
+        return None
+
+def soak(hours: float = 2.0, cycle: float = 300.0, games: Optional[int] = None, bots: int = 8,
+         max_growth_kb: float = 256.0) -> Dict[str, Any]:
+    """Run the soak test and return samples and verdicts"""
+    clock = SimulatedClock(auto_advance=False)
+    manager = GameAutomationManager()
+    automations = []
+    for name in manager.list_games()[:games]:
+        automation = manager.create_automation(name)
+        automation.engine = AutomationEngine(game=name, clock=clock)
+        actions = automation.list_actions()
+        if actions:
+            automations.append((automation, actions))
+    framework = BotFramework(clock=clock)
+    bot_types = [BotType.VISIT_BOT, BotType.SERVER_BOT, BotType.FOLLOW_BOT, BotType.FARM_BOT]
+    tk_probe = _open_tk_probe()
+
+    cycles = max(WARMUP_CYCLES + 2, int(hours * 3600.0 / cycle))
+    samples: List[Dict[str, Any]] = []
+    stop_failures = 0
+    reference_snapshot = None
+    tracemalloc.start(1)
+    wall_start = time.perf_counter()
+    try:
+        for number in range(cycles):
+            for automation, actions in automations:
+                action = actions[number % len(actions)]
+                automation.run_action(action, *_default_args(automation, action))
+            for i in range(bots):
+                bot_id = f"soak_{number}_{i}"
+                framework.create_bot(bot_id, bot_types[i % len(bot_types)], {"game_id": i, "delay": 5})
+                framework.start_bot(bot_id)
+
+            clock.run_for(cycle * 0.4)
+            for automation, _ in automations:
+                automation.engine.pause_automation()
+            for bot_id in list(framework.bots)[::2]:
+                framework.stop_bot(bot_id)
+            clock.run_for(cycle * 0.2)
+            for automation, _ in automations:
+                automation.engine.resume_automation()
+            clock.run_for(cycle * 0.4)
+
+            for automation, _ in automations:
+                if not automation.stop_farming():
+                    stop_failures += 1
+            for bot_id in list(framework.bots):
+                framework.remove_bot(bot_id)
+            if tk_probe is not None:
+                tk_probe.exercise()
+
+            gc.collect()
+            sample = {
+                "cycle": number,
+                "virtual_hours": round(clock.elapsed / 3600.0, 3),
+                "threads": threading.active_count(),
+                "traced_kb": round(tracemalloc.get_traced_memory()[0] / 1024.0, 1),
+            }
+            if tk_probe is not None:
+                sample["tk_after"] = tk_probe.pending()
+            samples.append(sample)
+            if number == WARMUP_CYCLES - 1:
+                reference_snapshot = tracemalloc.take_snapshot()
+        final_snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        for automation, _ in automations:
+            automation.engine.stop_automation()
+        if tk_probe is not None:
+            tk_probe.close()
+        clock.close()
+
+    return _verdict(samples, reference_snapshot, final_snapshot, stop_failures, max_growth_kb,
+                    time.perf_counter() - wall_start, len(automations), bots)
+
+def _verdict(samples: List[Dict[str, Any]], reference, final, stop_failures: int, max_growth_kb: float,
+             wall: float, engines: int, bots: int) -> Dict[str, Any]:
+    """Compare post-warm-up samples and build the report"""
+    steady = samples[WARMUP_CYCLES - 1:]
+    first, last = steady[0], steady[-1]
+    failures = []
+    if stop_failures:
+        failures.append(f"{stop_failures} stop_automation calls missed their deadline")
+    if max(sample["threads"] for sample in steady) > first["threads"]:
+        failures.append(f"thread count grew from {first['threads']} to {max(s['threads'] for s in steady)}")
+    growth = last["traced_kb"] - first["traced_kb"]
+    if growth > max_growth_kb:
+        failures.append(f"traced memory grew {growth:.1f} KB (limit {max_growth_kb:.0f} KB)")
+    if "tk_after" in first and max(sample["tk_after"] for sample in steady) > first["tk_after"]:
+        failures.append(f"Tk after() queue grew from {first['tk_after']} to {last['tk_after']}")
+
+    top_growth = []
+    for stat in final.compare_to(reference, "lineno")[:10]:
+        if stat.size_diff > 0:
+            frame = stat.traceback[0]
+            top_growth.append({"location": f"{frame.filename}:{frame.lineno}",
+                               "size_diff_kb": round(stat.size_diff / 1024.0, 1),
+                               "count_diff": stat.count_diff})
+    return {
+        "benchmark": "soak",
+        "passed": not failures,
+        "failures": failures,
+        "engines": engines,
+        "bots_per_cycle": bots,
+        "cycles": len(samples),
+        "virtual_hours": last["virtual_hours"],
+        "wall_seconds": round(wall, 2),
+        "memory_growth_kb": round(growth, 1),
+        "top_growth": top_growth,
+        "samples": samples,
+    }
+
+def main(argv=None) -> int:
+    """Soak test entry point"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.soak", description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--hours", type=float, default=2.0, help="Virtual hours to run")
+    parser.add_argument("--cycle", type=float, default=300.0, help="Virtual seconds per start/pause/resume/stop cycle")
+    parser.add_argument("--games", type=int, help="Only the first N games")
+    parser.add_argument("--bots", type=int, default=8, help="Bots started per cycle")
+    parser.add_argument("--max-growth-kb", type=float, default=256.0, help="Allowed traced memory growth")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    # Handlers log every simulated action at INFO
+    logging.disable(logging.WARNING)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="soak-") as scratch:
+        # Keep the checkout's config/ and cache/ out of it
+        os.chdir(scratch)
+        try:
+            report = soak(args.hours, args.cycle, args.games, args.bots, args.max_growth_kb)
+        finally:
+            os.chdir(cwd)
+
+    if args.json:
+        print(json.dumps(report))
+    else:
+        print(f"{report['engines']} engines, {report['bots_per_cycle']} bots/cycle, {report['cycles']} cycles, "
+              f"{report['virtual_hours']} virtual hours in {report['wall_seconds']}s")
+        for sample in report["samples"]:
+            tk = f"  after={sample['tk_after']}" if "tk_after" in sample else ""
+            print(f"  cycle {sample['cycle']:>3}: threads={sample['threads']:<4} traced={sample['traced_kb']:>9.1f} KB{tk}")
+        for item in report["top_growth"]:
+            print(f"  +{item['size_diff_kb']:.1f} KB ({item['count_diff']:+d} blocks) {item['location']}")
+        print("PASS" if report["passed"] else "FAIL: " + "; ".join(report["failures"]))
+    return 0 if report["passed"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,431 @@
+"""
+Benchmark Suite
+Core hot paths measured against stored baselines
+
+Usage:
+    python -m benchmarks.suite [--only PREFIX] [--quick] [--json] [--output FILE]
+                               [--baseline FILE] [--save-baseline] [--threshold F]
+
+Runs headless in a temporary working directory (so config/ and cache/ of the
+checkout are untouched) and compares every result with the baseline file
+(default benchmarks/baselines.json). A result slower than its baseline by
+more than the case's threshold is a regression and makes the exit status 1.
+
+The JSON output has the same format as the baseline file, so results saved
+with ``--output`` on one branch can be passed as ``--baseline`` on another.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+# Add project root to path
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core.automation_engine import AutomationEngine
+from core.bot_framework import BotFramework, BotType
+from core.clock import Clock, SimulatedClock
+from core.input_backend import InputBackend
+from core.task_spec import compile_task
+from core.yield_tracker import TaskOutcome
+
+BASELINE_FILE = Path(__file__).resolve().parent / "baselines.json"
+DEFAULT_THRESHOLD = 0.25
+MACRO_SIZES = (1000, 100000, 1000000)
+QUICK_MACRO_SIZES = (1000, 100000)
+
+class InstantClock(Clock):
+    """Real time, but sleeps return at once (measures the code, not its delays)"""
+
+    def sleep(self, seconds: float):
+        pass
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        return event.is_set()
+
+class NullBackend(InputBackend):
+    """Input backend that discards everything"""
+
+    def click(self, x=None, y=None, button="left"):
+        pass
+
+    def press(self, key):
+        pass
+
+    def move_to(self, x, y):
+        pass
+
+    def position(self):
+        return (0, 0)
+
+# name -> (function(quick) -> results, default threshold)
+BENCHMARKS: Dict[str, Tuple[Callable[[bool], List[Dict[str, Any]]], float]] = {}
+
+def benchmark(name: str, threshold: float = DEFAULT_THRESHOLD):
+    """Register a benchmark function returning a list of results"""
+    def decorator(function):
+        BENCHMARKS[name] = (function, threshold)
+        return function
+    return decorator
+
+def _result(name: str, value: float, unit: str, **details) -> Dict[str, Any]:
+    result = {"name": name, "value": round(value, 3), "unit": unit}
+    if details:
+        result["details"] = details
+    return result
+
+def _best_ns(function: Callable[[], Any], iterations: int, repeats: int = 5) -> float:
+    """Get nanoseconds per call (best of ``repeats`` runs)"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            function()
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+    return best
+
+def _best_ms(function: Callable[[], Any], repeats: int) -> float:
+    """Get milliseconds per call of a slow operation (best of ``repeats``)"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, (time.perf_counter() - start) * 1000.0)
+    return best
+
+# ========== ENGINE ==========
+
+@benchmark("engine.dispatch", threshold=1.0)
+def bench_engine_dispatch(quick: bool) -> List[Dict[str, Any]]:
+    """Per-tick work of the engine loop for every built-in task type, without delays"""
+    engine = AutomationEngine(clock=InstantClock(), input_backend=NullBackend())
+    per_type = {}
+    iterations = 500 if quick else 2000
+    for task_type, handler in sorted(engine._handlers.items()):
+        config = {"type": task_type, "game": "Benchmark"}
+        if task_type == "clicker":
+            config["position"] = (10, 10)
+        spec = compile_task(config)
+
+        def tick(spec=spec, handler=handler):
+            outcome = TaskOutcome.coerce(handler(spec))
+            engine._record_outcome(spec, outcome)
+            engine.stats["actions_performed"] += 1
+
+        per_type[task_type] = _best_ns(tick, iterations, repeats=3)
+    mean = sum(per_type.values()) / len(per_type)
+    slowest = max(per_type, key=per_type.get)
+    return [
+        _result("engine.dispatch.mean", mean, "ns/tick", task_types=len(per_type)),
+        _result("engine.dispatch.max", per_type[slowest], "ns/tick", task_type=slowest),
+    ]
+
+@benchmark("engine.lifecycle", threshold=3.0)
+def bench_engine_lifecycle(quick: bool) -> List[Dict[str, Any]]:
+    """Latency of start_automation and of stop_automation on a running task"""
+    starts, stops = [], []
+    for _ in range(10 if quick else 30):
+        engine = AutomationEngine(input_backend=NullBackend())
+        start = time.perf_counter()
+        engine.start_automation({"type": "macro", "delay": 60.0})
+        starts.append(time.perf_counter() - start)
+        time.sleep(0.001)
+        start = time.perf_counter()
+        engine.stop_automation()
+        stops.append(time.perf_counter() - start)
+    starts.sort()
+    stops.sort()
+    return [
+        _result("engine.start", starts[len(starts) // 2] * 1000.0, "ms", max_ms=round(starts[-1] * 1000.0, 3)),
+        _result("engine.stop", stops[len(stops) // 2] * 1000.0, "ms", max_ms=round(stops[-1] * 1000.0, 3)),
+    ]
+
+# ========== MACROS ==========
+
+def _macro(size: int) -> List[Dict[str, Any]]:
+    """Build a recorded macro of ``size`` actions, 50 ms apart"""
+    kinds = ("click", "move", "key")
+    actions = []
+    for i in range(size):
+        kind = kinds[i % 3]
+        data = {"key": "e"} if kind == "key" else {"x": i % 1920, "y": i % 1080}
+        actions.append({"type": kind, "timestamp": i * 0.05, "data": data})
+    return actions
+
+@benchmark("macro", threshold=0.5)
+def bench_macro(quick: bool) -> List[Dict[str, Any]]:
+    """MacroRecorder playback, save and load by macro size"""
+    from modules.macro_clicker import MacroRecorder
+
+    results = []
+    for size in QUICK_MACRO_SIZES if quick else MACRO_SIZES:
+        actions = _macro(size)
+        repeats = 3 if size <= 100000 else 1
+        recorder = MacroRecorder(clock=SimulatedClock(), backend=NullBackend())
+        recorder.macro_actions = actions
+        results.append(_result(f"macro.play.{size}", _best_ms(recorder.play_macro, repeats), "ms"))
+        path = str(Path("macro-bench.json").resolve())
+        results.append(_result(f"macro.save.{size}", _best_ms(lambda: recorder.save_macro(path), repeats), "ms"))
+        results.append(_result(f"macro.load.{size}", _best_ms(lambda: recorder.load_macro(path), repeats), "ms"))
+        os.remove(path)
+    return results
+
+# ========== GAMES ==========
+
+@benchmark("games", threshold=0.5)
+def bench_games(quick: bool) -> List[Dict[str, Any]]:
+    """Game catalogue loading, manager construction and search"""
+    from modules.game_catalog import load_catalog
+    from modules.game_automation import GameAutomationManager
+
+    cache_file = Path("cache") / "bench_catalog.pickle"
+
+    def cold():
+        if cache_file.exists():
+            cache_file.unlink()
+        load_catalog(cache_file=cache_file)
+
+    results = [
+        _result("games.catalog_cold", _best_ms(cold, 3), "ms"),
+        _result("games.catalog_warm", _best_ms(lambda: load_catalog(cache_file=cache_file), 5), "ms"),
+    ]
+    GameAutomationManager()  # Load the process-wide catalogue and plugins once
+    results.append(_result("games.manager_init", _best_ns(GameAutomationManager, 200) / 1000.0, "us"))
+    manager = GameAutomationManager()
+    queries = ("sim", "garden", "blox", "z", "tycoon")
+    search = lambda: [manager.search_games(query) for query in queries]
+    results.append(_result("games.search", _best_ns(search, 2000) / len(queries), "ns/query"))
+    return results
+
+# ========== CONFIG ==========
+
+@benchmark("config", threshold=1.0)
+def bench_config(quick: bool) -> List[Dict[str, Any]]:
+    """ConfigManager load (cached) and save (atomic write)"""
+    from core.config_manager import ConfigManager
+
+    manager = ConfigManager()
+    config = manager.load_config()
+    config["game_configs"] = {f"Game {i}": {"delay": 1.0 + i, "auto_farm": {"location": "Spawn"}} for i in range(50)}
+    manager.save_config(config)
+    return [
+        _result("config.load", _best_ns(manager.load_config, 1000) / 1000.0, "us"),
+        _result("config.save", _best_ms(lambda: manager.save_config(config), 20), "ms"),
+    ]
+
+# ========== STATS ==========
+
+@benchmark("stats", threshold=0.5)
+def bench_stats(quick: bool) -> List[Dict[str, Any]]:
+    """Stats snapshots as the GUI and CLI poll them"""
+    engine = AutomationEngine(clock=InstantClock())
+    for i in range(5000):
+        spec = compile_task({"type": "auto_farm", "location": f"Zone {i % 20}", "delay": 1.0 + i % 5})
+        engine._record_outcome(spec, TaskOutcome(items=1, currency=5.0))
+    framework = BotFramework()
+    for i in range(100):
+        framework.create_bot(f"bot{i}", BotType.VISIT_BOT, {"game_id": i})
+
+    def bots():
+        return [framework.get_bot_stats(bot.bot_id) for bot in framework.get_all_bots()]
+
+    return [
+        _result("stats.engine", _best_ns(engine.get_stats, 20000), "ns"),
+        _result("stats.yield_report", _best_ns(engine.get_yield_report, 200) / 1000.0, "us", keys=100),
+        _result("stats.bots", _best_ns(bots, 2000) / 1000.0, "us", bots=100),
+    ]
+
+@benchmark("task_spec")
+def bench_task_spec(quick: bool) -> List[Dict[str, Any]]:
+    """Per-tick parameter resolution with compiled specs"""
+    from benchmarks import bench_task_spec as task_spec
+
+    result = task_spec.run(50000 if quick else 200000)
+    return [_result("task_spec.tick", result["spec_ns_per_tick"], "ns/tick")]
+
+# ========== VISION ==========
+
+def _screen(width: int = 1920, height: int = 1080, seed: int = 0):
+    """Synthetic noisy screenshot with a 48x32 icon pasted at (1200, 700)"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    frame = (rng.random((height, width, 3)) * 90).astype(np.uint8)
+    icon = (rng.random((32, 48, 3)) * 255).astype(np.uint8)
+    frame[700:732, 1200:1248] = icon
+    return frame, icon
+
+def _counter(text: str):
+    """HUD counter image in a made-up blocky font (one random 7x5 pattern per digit)"""
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    font = {str(digit): rng.random((7, 5)) < 0.5 for digit in range(10)}
+    for glyph in font.values():
+        # Solid edge columns keep every glyph one piece wide
+        glyph[:, 0] = glyph[:, -1] = True
+    gap = np.zeros((7, 1), dtype=bool)
+    ink = np.concatenate([part for char in text for part in (font[char], gap)][:-1], axis=1)
+    ink = np.pad(np.kron(ink, np.ones((3, 3), dtype=bool)), 4)
+    image = np.empty(ink.shape + (3,), dtype=np.uint8)
+    image[:] = (30, 60, 90)
+    image[ink] = (250, 240, 200)
+    return image
+
+@benchmark("vision", threshold=0.5)
+def bench_vision(quick: bool) -> List[Dict[str, Any]]:
+    """Template search on a 1080p frame and shared frame fan-out"""
+    from vision.capture import FileCapture
+    from vision.changes import ChangeDetector
+    from vision.frames import FrameService
+    from vision.matching import Template, find
+    from vision.probes import ProbeSet
+    from vision.digits import GlyphBank
+    from vision.states import train
+
+    frame, icon = _screen()
+    template = Template(icon, "icon")
+    roi = (1100, 600, 400, 300)
+    results = [
+        _result("vision.match.full", _best_ms(lambda: find(frame, template), 3 if quick else 10), "ms"),
+        _result("vision.match.roi", _best_ms(lambda: find(frame, template, roi), 10 if quick else 50), "ms"),
+    ]
+
+    # 16 engines reading their own 200x100 strip of one fresh frame per tick
+    clock = SimulatedClock(auto_advance=False)
+    service = FrameService(FileCapture([frame]), interval=0.1, clock=clock)
+    regions = [(100 * i, 50 * i, 200, 100) for i in range(16)]
+    subscriptions = [service.subscribe([region]) for region in regions]
+
+    def tick():
+        clock.advance(1.0)
+        for subscription, region in zip(subscriptions, regions):
+            subscription.frame().gray(region)
+
+    best = _best_ms(tick, 20 if quick else 100)
+    results.append(_result("vision.frames.tick", best, "ms", subscribers=16, grabs=service.grabs))
+
+    # A watched 400x300 region polled on an unchanged frame
+    detector = ChangeDetector((1100, 600, 400, 300))
+    shared = service.frame()
+    detector.check(shared)
+    results.append(_result("vision.change.check", _best_ns(lambda: detector.check(shared), 2000) / 1000.0, "us"))
+
+    probes = ProbeSet({f"probe{i}": {"x": i * 17 % 1920, "y": i * 11 % 1080, "color": [40, 40, 40]} for i in range(100)})
+    results.append(_result("vision.probes.mask", _best_ns(lambda: probes.mask(frame), 5000) / 1000.0, "us", probes=100))
+
+    # Screen state of a full frame against a 4-state model
+    screens = {f"state{i}": [frame // (i + 1)] for i in range(4)}
+    model = train(screens)
+    results.append(_result("vision.states.label", _best_ns(lambda: model.label(frame), 2000) / 1000.0, "us", states=4))
+
+    # A 9-character counter read with a 10-digit bank
+    bank = GlyphBank()
+    bank.calibrate(_counter("0123456789"), "0123456789")
+    counter = _counter("123456789")
+    results.append(_result("vision.digits.read", _best_ns(lambda: bank.value(counter), 2000) / 1000.0, "us",
+                           glyphs=9))
+    return results
+
+# ========== RUNNER ==========
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Get baseline results by name (empty if the file does not exist)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {result["name"]: result for result in document.get("results", [])}
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: Optional[float] = None) -> int:
+    """Annotate results with their baseline and status; returns the number of regressions"""
+    regressions = 0
+    for result in results:
+        reference = baseline.get(result["name"])
+        if reference is None or not reference.get("value"):
+            result["status"] = "new"
+            continue
+        limit = threshold if threshold is not None else result["threshold"]
+        ratio = result["value"] / reference["value"]
+        result["baseline"] = reference["value"]
+        result["ratio"] = round(ratio, 3)
+        if ratio > 1.0 + limit:
+            result["status"] = "regression"
+            regressions += 1
+        elif ratio < 1.0 - limit:
+            result["status"] = "improvement"
+        else:
+            result["status"] = "ok"
+    return regressions
+
+def run(only: Optional[str] = None, quick: bool = False) -> List[Dict[str, Any]]:
+    """Run the selected benchmarks in a scratch working directory"""
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench-") as scratch:
+        os.chdir(scratch)
+        try:
+            for name, (function, threshold) in BENCHMARKS.items():
+                if only and not name.startswith(only):
+                    continue
+                for result in function(quick):
+                    result["threshold"] = threshold
+                    results.append(result)
+        finally:
+            os.chdir(cwd)
+    return results
+
+def main(argv=None) -> int:
+    """Benchmark suite entry point"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--only", help=f"Run benchmarks whose name starts with this ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes and fewer iterations")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline results to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, help="Allowed slowdown for every case (0.25: 25%%)")
+    args = parser.parse_args(argv)
+
+    # Handlers log every simulated action at INFO
+    logging.disable(logging.WARNING)
+    results = run(args.only, args.quick)
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    document = {
+        "suite": "core",
+        "quick": args.quick,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "regressions": regressions,
+        "results": results,
+    }
+    text = json.dumps(document, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding='utf-8')
+    if args.save_baseline:
+        args.baseline.write_text(text + "\n", encoding='utf-8')
+
+    if args.json:
+        print(text)
+    else:
+        for result in results:
+            reference = f"{result['baseline']:>12.3f} {result['ratio']:>6.2f}x" if "baseline" in result else " " * 20
+            print(f"{result['name']:<28}{result['value']:>12.3f} {result['unit']:<9}{reference}  {result['status']}")
+        print(f"{len(results)} results, {regressions} regressions")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,369 @@
+"""
+Roblox Automation Suite - Headless CLI
+Runs game automations from a JSON workspace file without importing the GUI stack
+
+Usage:
+    python -m cli list [--category NAME] [--search TEXT] [--json]
+    python -m cli run WORKSPACE [--duration SECONDS] [--interval SECONDS]
+    python -m cli startup [--runs N]
+    python -m cli train-states DIRECTORY [--game NAME] [--region L T W H] [--output FILE]
+    python -m cli calibrate-digits SCREENSHOT --region L T W H --text TEXT [--game NAME] [--output FILE]
+
+Only ``core`` and ``modules`` are imported, so the CLI starts without Tk and
+works on display-less machines.
+
+Workspace format::
+
+    {
+        "report_interval": 5,
+        "tasks": [
+            {"name": "psx-coins", "game": "Pet Simulator X",
+             "action": "auto_farm_coins", "args": ["Spawn"]},
+            {"name": "garden-water", "game": "Grow a Garden",
+             "config": {"type": "water_plants", "delay": 1.5}, "duration": 600},
+            {"name": "paused", "game": "Doors", "action": "auto_solve", "enabled": false}
+        ]
+    }
+
+While ``run`` is active the workspace file is re-read when it changes: tasks
+that become disabled (or are removed) are stopped and new ones are started.
+A task that ran for its ``duration`` stays stopped until its entry is edited.
+Stats are written to stdout as one JSON object per line.
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.logger import setup_logger
+from core.shutdown import get_shutdown_coordinator
+from modules.game_automation import GameAutomation, GameAutomationManager
+
+logger = logging.getLogger(__name__)
+
+class TaskRunner:
+    """A single workspace task bound to its own automation instance"""
+
+    def __init__(self, name: str, spec: Dict[str, Any], automation: GameAutomation):
+        self.name = name
+        self.spec = spec
+        self.automation = automation
+        self.started_at: Optional[float] = None
+
+    def start(self) -> bool:
+        """Start the task described by the workspace entry"""
+        spec = self.spec
+        if "config" in spec:
+            task_config = {"game": self.automation.game_name, **spec["config"]}
+            started = self.automation.engine.start_automation(task_config)
+        else:
+            action = getattr(self.automation, spec.get("action", "start_farming"), None)
+            if not callable(action):
+                raise ValueError(f"{self.automation.game_name} has no action '{spec.get('action')}'")
+            started = action(*spec.get("args", []), **spec.get("kwargs", {}))
+        if started:
+            self.started_at = time.time()
+        return started
+
+    def stop(self) -> bool:
+        """Stop the task"""
+        return self.automation.engine.stop_automation()
+
+    def request_stop(self) -> bool:
+        """Signal the task to stop without waiting for it"""
+        return self.automation.engine.request_stop()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the task to stop; returns True if it did"""
+        return self.automation.engine.join(timeout)
+
+    def expired(self, now: float) -> bool:
+        """True once the task has run for its configured duration"""
+        duration = self.spec.get("duration")
+        return bool(duration) and self.started_at is not None and now - self.started_at >= duration
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a JSON-serialisable stats record"""
+        engine = self.automation.engine
+        return {
+            "event": "stats",
+            "task": self.name,
+            "game": self.automation.game_name,
+            "state": engine.state.value,
+            "time": time.time(),
+            **engine.get_stats(),
+            "yield": engine.get_yield_report()
+        }
+
+def _emit(record: Dict[str, Any]):
+    """Write one JSON line to stdout"""
+    sys.stdout.write(json.dumps(record, default=str) + "\n")
+    sys.stdout.flush()
+
+def _load_workspace(path: Path) -> Dict[str, Any]:
+    """Load and minimally validate a workspace file"""
+    with open(path, 'r') as f:
+        workspace = json.load(f)
+    tasks = workspace.get("tasks")
+    if not isinstance(tasks, list):
+        raise ValueError(f"{path}: 'tasks' must be a list")
+    for index, task in enumerate(tasks):
+        if "game" not in task:
+            raise ValueError(f"{path}: task #{index} has no 'game'")
+        task.setdefault("name", f"{task['game']}#{index}")
+    return workspace
+
+def _stop_runners(stopping: Dict[str, TaskRunner], reason: str, timeout: float = 5.0):
+    """Stop tasks in parallel: signal all of them, then wait for them against one deadline"""
+    for runner in stopping.values():
+        runner.request_stop()
+    deadline = time.monotonic() + timeout
+    for name, runner in stopping.items():
+        if not runner.join(max(0.0, deadline - time.monotonic())):
+            logger.warning("Task %s did not stop within %.1fs", name, timeout)
+        _emit({"event": "stopped", "task": name, "reason": reason})
+
+def _sync_tasks(workspace: Dict[str, Any], runners: Dict[str, TaskRunner], manager: GameAutomationManager,
+                finished: Optional[Dict[str, Dict[str, Any]]] = None) -> int:
+    """
+    Start enabled tasks that are not running and stop ones that were disabled, removed or edited
+
+    Args:
+        workspace: Loaded workspace
+        runners: Running tasks by name (updated in place)
+        manager: Creates the automation of a new task
+        finished: Entries of tasks that ran for their duration, by name; they
+            are not started again unless their entry changes (updated in place)
+
+    Returns:
+        Number of tasks started
+    """
+    started_count = 0
+    finished = finished if finished is not None else {}
+    wanted = {task["name"]: task for task in workspace["tasks"] if task.get("enabled", True)}
+
+    for name in list(finished):
+        if wanted.get(name) != finished[name]:
+            del finished[name]
+    _stop_runners({name: runners.pop(name) for name in list(runners) if wanted.get(name) != runners[name].spec},
+                  "workspace")
+
+    for name, spec in wanted.items():
+        if name in runners or name in finished:
+            continue
+        runner = TaskRunner(name, spec, manager.create_automation(spec["game"]))
+        try:
+            started = runner.start()
+        except Exception as e:
+            _emit({"event": "error", "task": name, "error": str(e)})
+            continue
+        if started:
+            runners[name] = runner
+            started_count += 1
+            _emit({"event": "started", "task": name, "game": spec["game"]})
+        else:
+            _emit({"event": "error", "task": name, "error": "failed to start"})
+    return started_count
+
+def cmd_list(args) -> int:
+    """List supported games"""
+    manager = GameAutomationManager()
+    if args.search:
+        games = manager.search_games(args.search)
+    elif args.category:
+        games = manager.get_games_by_category(args.category)
+    else:
+        games = manager.list_games()
+    games = sorted(games)
+
+    if args.json:
+        _emit({"games": [
+            {"name": name, "category": manager.get_definition(name).category} for name in games
+        ]})
+    else:
+        for name in games:
+            print(f"{name} ({manager.get_definition(name).category})")
+    return 0
+
+def cmd_run(args) -> int:
+    """
+    Run every enabled task in a workspace concurrently
+
+    Runs until ``--duration`` runs out or Ctrl-C, even while no task is
+    running, so tasks enabled later in the workspace are picked up.
+
+    Returns:
+        0, or 1 if no task ever started
+    """
+    path = Path(args.workspace)
+    workspace = _load_workspace(path)
+    interval = args.interval or workspace.get("report_interval", 5.0)
+    manager = GameAutomationManager()
+    runners: Dict[str, TaskRunner] = {}
+    finished: Dict[str, Dict[str, Any]] = {}
+
+    mtime = path.stat().st_mtime
+    started = _sync_tasks(workspace, runners, manager, finished)
+    deadline = time.time() + args.duration if args.duration else None
+
+    try:
+        while True:
+            time.sleep(interval if deadline is None else max(0.0, min(interval, deadline - time.time())))
+            now = time.time()
+
+            # Pick up workspace edits
+            try:
+                current_mtime = path.stat().st_mtime
+                if current_mtime != mtime:
+                    mtime = current_mtime
+                    workspace = _load_workspace(path)
+                    started += _sync_tasks(workspace, runners, manager, finished)
+            except (OSError, ValueError) as e:
+                _emit({"event": "error", "error": f"workspace reload failed: {e}"})
+
+            for runner in runners.values():
+                _emit(runner.snapshot())
+            expired = {name: runners.pop(name) for name in list(runners) if runners[name].expired(now)}
+            finished.update((name, runner.spec) for name, runner in expired.items())
+            _stop_runners(expired, "duration")
+
+            if deadline and now >= deadline:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Every engine is registered with the coordinator: stop them all in parallel
+        get_shutdown_coordinator().shutdown()
+        for name, runner in runners.items():
+            _emit({**runner.snapshot(), "event": "stopped", "reason": "shutdown"})
+    if not started:
+        _emit({"event": "error", "error": "no task started"})
+        return 1
+    return 0
+
+def _time_import(code: str, runs: int) -> Dict[str, Any]:
+    """Time a fresh interpreter running an import statement"""
+    samples = []
+    root = str(Path(__file__).parent)
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            capture_output=True,
+            text=True
+        )
+        elapsed = (time.perf_counter() - start) * 1000.0
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()
+            return {"ok": False, "error": error[-1] if error else f"exit {result.returncode}"}
+        samples.append(elapsed)
+    return {"ok": True, "median_ms": statistics.median(samples), "min_ms": min(samples), "runs": runs}
+
+def cmd_startup(args) -> int:
+    """Measure interpreter startup of the headless path against the GUI path"""
+    headless = _time_import("import cli", args.runs)
+    gui = _time_import("import customtkinter, gui.main_window", args.runs)
+    record = {"event": "startup", "headless": headless, "gui": gui}
+    if headless.get("ok") and gui.get("ok"):
+        record["speedup"] = gui["median_ms"] / headless["median_ms"]
+    _emit(record)
+    return 0
+
+def cmd_train_states(args) -> int:
+    """Fit a screen state model to folders of labelled screenshots"""
+    from vision.states import train_directory
+    try:
+        model = train_directory(args.directory, tuple(args.region) if args.region else None)
+    except (OSError, ValueError) as e:
+        _emit({"event": "error", "error": f"training failed: {e}"})
+        return 1
+    if args.output:
+        output = Path(args.output)
+    else:
+        output = Path("templates") / args.game / "states.npz" if args.game else Path("templates") / "states.npz"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    model.save(output)
+    _emit({"event": "trained", "output": str(output), "states": model.labels,
+           "radii": [round(float(radius), 3) for radius in model.radii]})
+    return 0
+
+def cmd_calibrate_digits(args) -> int:
+    """Add the glyphs of a HUD counter showing known text to a glyph bank"""
+    from vision.capture import crop, load_image
+    from vision.digits import GlyphBank
+    if args.output:
+        output = Path(args.output)
+    else:
+        output = Path("templates") / args.game / "glyphs.npz" if args.game else Path("templates") / "glyphs.npz"
+    try:
+        bank = GlyphBank.load(output) if output.is_file() else GlyphBank()
+        bank.calibrate(crop(load_image(args.screenshot), tuple(args.region)), args.text)
+    except (OSError, ValueError) as e:
+        _emit({"event": "error", "error": f"calibration failed: {e}"})
+        return 1
+    output.parent.mkdir(parents=True, exist_ok=True)
+    bank.save(output)
+    _emit({"event": "calibrated", "output": str(output), "glyphs": len(bank),
+           "chars": "".join(sorted(set(bank.chars)))})
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Headless Roblox Automation Suite runner")
+    parser.add_argument("--log-level", default=os.environ.get("RAS_LOG_LEVEL", "WARNING"),
+                        help="Logging level (default: WARNING)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = sub.add_parser("list", help="List supported games")
+    list_parser.add_argument("--category", help="Only list games in this category")
+    list_parser.add_argument("--search", help="Only list games whose name contains this text")
+    list_parser.add_argument("--json", action="store_true", help="Print as JSON")
+    list_parser.set_defaults(func=cmd_list)
+
+    run_parser = sub.add_parser("run", help="Run the tasks of a workspace file")
+    run_parser.add_argument("workspace", help="Path to workspace JSON file")
+    run_parser.add_argument("--duration", type=float, help="Stop all tasks after this many seconds")
+    run_parser.add_argument("--interval", type=float, help="Seconds between stats reports")
+    run_parser.set_defaults(func=cmd_run)
+
+    startup_parser = sub.add_parser("startup", help="Compare startup time with the GUI import path")
+    startup_parser.add_argument("--runs", type=int, default=5, help="Interpreter launches per path")
+    startup_parser.set_defaults(func=cmd_startup)
+
+    states_parser = sub.add_parser("train-states", help="Train a screen state model from labelled screenshots")
+    states_parser.add_argument("directory", help="Folder with one subfolder of screenshots per state")
+    states_parser.add_argument("--game", help="Save as this game's model (default: shared by all games)")
+    states_parser.add_argument("--region", type=int, nargs=4, metavar=("LEFT", "TOP", "WIDTH", "HEIGHT"),
+                               help="Only look at this part of the screen")
+    states_parser.add_argument("--output", help="Model file (default: templates/[GAME/]states.npz)")
+    states_parser.set_defaults(func=cmd_train_states)
+
+    digits_parser = sub.add_parser("calibrate-digits", help="Teach the digit reader a HUD font from a screenshot")
+    digits_parser.add_argument("screenshot", help="Screenshot showing a counter with known text")
+    digits_parser.add_argument("--region", type=int, nargs=4, required=True,
+                               metavar=("LEFT", "TOP", "WIDTH", "HEIGHT"), help="Tight box around the counter")
+    digits_parser.add_argument("--text", required=True, help="What the counter shows, e.g. 1,234,567")
+    digits_parser.add_argument("--game", help="Save as this game's glyphs (default: shared by all games)")
+    digits_parser.add_argument("--output", help="Glyph bank file (default: templates/[GAME/]glyphs.npz)")
+    digits_parser.set_defaults(func=cmd_calibrate_digits)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point"""
+    args = build_parser().parse_args(argv)
+    setup_logger(level=getattr(logging, str(args.log_level).upper(), logging.WARNING))
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,41 @@ Automation Engine
 Core automation functionality for Roblox games with full implementation
 """
 
+import functools
 import logging
-import time
 import threading
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from enum import Enum
+from core.yield_tracker import TaskOutcome, YieldTracker, ParameterTuner
+from core.task_spec import TaskSpec, TaskSpecError, compile_task
+from core.config_manager import get_config_service
+from core.clock import Clock, system_clock
+from core.input_backend import InputBackend, screen_backend
+from core.thread_registry import get_thread_registry
+from core.shutdown import get_shutdown_coordinator
 
 logger = logging.getLogger(__name__)
 
+# Seconds between checks of a static watched region
+WATCH_POLL = 0.25
+
+# Garden task types that act only on the plots the garden model picks:
+# task type -> (garden step, most plots per tick or None for all)
+GARDEN_STEPS: Dict[str, Tuple[str, Optional[int]]] = {
+    "plant_seeds": ("plant", 1),
+    "auto_plant_all": ("plant", None),
+    "buy_seeds": ("buy", None),
+    "water_plants": ("water", None),
+    "auto_irrigate": ("water", None),
+    "auto_fertilize": ("fertilize", None),
+    "harvest_crops": ("harvest", None),
+    "auto_harvest_all": ("harvest", None),
+}
+# Seconds a garden handler spends on each plot it works on
+PLOT_ACTION_TIME = 0.05
+# Seconds harvest tasks wait past a ripening time (clock rounding, ripening animation)
+RIPEN_SLACK = 0.1
+
 class AutomationState(Enum):
     """Automation state"""
     IDLE = "idle"
@@ -18,72 +45,281 @@ class AutomationState(Enum):
     PAUSED = "paused"
     STOPPED = "stopped"
 
+# Handlers added at runtime (plugins): task type -> handler(engine, spec)
+_registered_handlers: Dict[str, Callable] = {}
+
+def register_task_handler(task_type: str, handler: Callable):
+    """
+    Register the handler of a task type not built into the engine
+    
+    The handler is called as ``handler(engine, spec)`` on every tick and may
+    return a TaskOutcome. Built-in task types cannot be replaced.
+    """
+    _registered_handlers[task_type] = handler
+
 class AutomationEngine:
     """Core automation engine for Roblox games with full functionality"""
     
-    def __init__(self):
+    def __init__(self, game: Optional[str] = None, clock: Optional[Clock] = None,
+                 input_backend: Optional[InputBackend] = None, environment=None, capture=None, garden=None):
+        """
+        Args:
+            game: Game whose ``game_configs`` overrides apply to started tasks
+            clock: Time source for delays and stats (default: real time)
+            input_backend: Where clicks go (default: the screen)
+            environment: Object whose ``perform(spec, cancel)`` replaces the
+                built-in handlers, e.g. a SimulatedGame. If it also has
+                ``observe_garden()``, garden ticks read the plots from it and
+                pass the picked ones as ``perform(..., plots=...)``.
+            capture: Where ``detect`` and when/unless conditions look
+                (a vision.capture.Capture; default: the screen). Frames
+                are shared with every other engine on the same source.
+            garden: GardenModel the garden tasks plan with (default: the
+                game's shared model, see core.garden.get_garden)
+        """
+        self.game = game
+        self.clock = clock or system_clock
+        self.input_backend = input_backend or screen_backend
+        self.environment = environment
+        self.capture = capture
+        self._subscription = None
+        self._watcher = None
+        self._held_since: Optional[float] = None
         self.state = AutomationState.IDLE
         self.thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
         self.pause_event = threading.Event()
         self.pause_event.set()  # Start unpaused
         self.current_task = None
-        self.stats = {
-            "runtime": 0,
-            "actions_performed": 0,
-            "errors": 0
-        }
+        self.stats = self._empty_stats()
         self.last_action_time = 0
+        self.yield_tracker = YieldTracker()
+        self.tuner: Optional[ParameterTuner] = None
+        self.config_overrides: Dict[str, Any] = {}
+        self._specs: Tuple[Optional[TaskSpec], List[TaskSpec], Dict[str, Optional[TaskSpec]]] = (None, [], {})
+        # Last screen state seen by a task with branches (None: unknown screen)
+        self.screen_state: Optional[str] = None
+        # Last reading of the task's HUD counter, and gains not yet credited to a tick
+        self.counter_value: Optional[float] = None
+        self._counter_gain = 0.0
+        # Garden plot state; environments with a garden report theirs every garden tick
+        self.garden = garden
+        self._garden_view = getattr(environment, "observe_garden", None)
+        # Plots the running garden tick acts on
+        self.plots = None
+        # Set to wake a harvest task early (the garden changed, or a stop)
+        self._garden_wake = threading.Event()
+        self._garden_listener = None
+        get_shutdown_coordinator().register(self, f"AutomationEngine[{game or 'no game'}]")
+        
+        # Task type -> handler. Handlers may return a TaskOutcome (or a dict with
+        # items/currency/xp) describing what the tick produced. The built-in
+        # handlers cannot see the game, so only environment ticks, garden tasks
+        # and tasks reading a HUD "counter" yield anything; other ticks are
+        # recorded with no yield.
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "auto_farm": self._execute_auto_farm,
+            "clicker": self._execute_clicker,
+            "macro": self._execute_macro,
+            "auto_raid": self._execute_auto_raid,
+            "boss_farm": self._execute_boss_farm,
+            "cash_farm": self._execute_cash_farm,
+            "auto_duel": self._execute_auto_duel,
+            "auto_rob": self._execute_auto_rob,
+            "quest_farm": self._execute_quest_farm,
+            "auto_awaken": self._execute_auto_awaken,
+            "demon_farm": self._execute_demon_farm,
+            "breath_train": self._execute_breath_train,
+            "auto_spin": self._execute_auto_spin,
+            "auto_hatch": self._execute_auto_hatch,
+            "coin_farm": self._execute_coin_farm,
+            "auto_trade": self._execute_auto_trade,
+            "wave_farm": self._execute_wave_farm,
+            "auto_summon": self._execute_auto_summon,
+            "auto_upgrade": self._execute_auto_upgrade,
+            "pollen_collect": self._execute_pollen_collect,
+            "honey_convert": self._execute_honey_convert,
+            "auto_mine": self._execute_auto_mine,
+            "auto_sell": self._execute_auto_sell,
+            "age_pets": self._execute_age_pets,
+            "auto_click": self._execute_auto_click,
+            "auto_rebirth": self._execute_auto_rebirth,
+            "auto_cook": self._execute_auto_cook,
+            "auto_serve": self._execute_auto_serve,
+            "auto_collect": self._execute_auto_collect,
+            "auto_complete": self._execute_auto_complete,
+            "auto_run": self._execute_auto_run,
+            "auto_aim": self._execute_auto_aim,
+            "kill_farm": self._execute_kill_farm,
+            "auto_escape": self._execute_auto_escape,
+            "auto_work": self._execute_auto_work,
+            "auto_rp": self._execute_auto_rp,
+            "auto_survive": self._execute_auto_survive,
+            "zombie_kill": self._execute_zombie_kill,
+            "coin_collect": self._execute_coin_collect,
+            "chi_farm": self._execute_chi_farm,
+            "auto_evolve": self._execute_auto_evolve,
+            "power_farm": self._execute_power_farm,
+            "auto_tap": self._execute_auto_tap,
+            "auto_breed": self._execute_auto_breed,
+            "auto_block": self._execute_auto_block,
+            "auto_solve": self._execute_auto_solve,
+            "auto_evade": self._execute_auto_evade,
+            "auto_build": self._execute_auto_build,
+            "auto_win": self._execute_auto_win,
+            "auto_slap": self._execute_auto_slap,
+            "glove_farm": self._execute_glove_farm,
+            "auto_fight": self._execute_auto_fight,
+            "mana_farm": self._execute_mana_farm,
+            "auto_grind": self._execute_auto_grind,
+            "level_farm": self._execute_level_farm,
+            "stand_farm": self._execute_stand_farm,
+            "auto_prestige": self._execute_auto_prestige,
+            "fruit_farm": self._execute_fruit_farm,
+            "auto_quest": self._execute_auto_quest,
+            "full_auto_cycle": self._execute_full_auto_cycle,
+            # Garden automation types
+            "plant_seeds": self._execute_plant_seeds,
+            "water_plants": self._execute_water_plants,
+            "harvest_crops": self._execute_harvest_crops,
+            "auto_fertilize": self._execute_auto_fertilize,
+            "upgrade_garden": self._execute_upgrade_garden,
+            "sell_produce": self._execute_sell_produce,
+            "buy_seeds": self._execute_buy_seeds,
+            "auto_weed": self._execute_auto_weed,
+            "auto_pest_control": self._execute_auto_pest_control,
+            "auto_compost": self._execute_auto_compost,
+            "auto_irrigate": self._execute_auto_irrigate,
+            "auto_prune": self._execute_auto_prune,
+            "auto_harvest_all": self._execute_auto_harvest_all,
+            "auto_plant_all": self._execute_auto_plant_all,
+            "auto_upgrade_tools": self._execute_auto_upgrade_tools,
+            "auto_complete_orders": self._execute_auto_complete_orders,
+            "auto_collect_rewards": self._execute_auto_collect_rewards,
+            "auto_manage_inventory": self._execute_auto_manage_inventory,
+            "auto_optimize_layout": self._execute_auto_optimize_layout
+        }
         
-    def start_automation(self, task_config: Dict[str, Any], callback: Optional[Callable] = None) -> bool:
+    def start_automation(self, task_config: Dict[str, Any], callback: Optional[Callable] = None,
+                         tuner: Optional[ParameterTuner] = None) -> bool:
         """
         Start automation task
         
         Args:
             task_config: Configuration for the automation task
             callback: Optional callback function for updates
+            tuner: Optional bandit tuner overriding task parameters per tick
+                (it learns only from ticks that yield: environment, garden and
+                counter tasks)
             
         Returns:
             True if started successfully
+            
+        Raises:
+            TaskSpecError: If the config (or a tuner arm) does not match the task type's schema
         """
         if self.state == AutomationState.RUNNING:
             logger.warning("Automation already running")
             return False
+        if self.thread is not None and self.thread.is_alive():
+            # A previous run missed its stop deadline; clearing stop_event would revive it
+            logger.warning("Previous automation thread has not exited yet")
+            return False
+        
+        # Pick up handlers registered since the last start
+        for task_type, handler in _registered_handlers.items():
+            if task_type not in self._handlers:
+                self._handlers[task_type] = functools.partial(handler, self)
+        
+        # Compile up front so a bad config fails here rather than on every tick
+        if self.game and not task_config.get("game"):
+            task_config = {**task_config, "game": self.game}
+        overrides = self._read_overrides(task_config)
+        specs = self._compile_specs(task_config, overrides, tuner)
             
         try:
             self.current_task = task_config
+            self.config_overrides = overrides
+            self._specs = specs
             self.stop_event.clear()
             self.pause_event.set()
             self.state = AutomationState.RUNNING
-            self.stats = {"runtime": 0, "actions_performed": 0, "errors": 0}
-            self.last_action_time = time.time()
+            self.stats = self._empty_stats()
+            self._watcher = None
+            self._held_since = None
+            self.screen_state = None
+            self.counter_value = None
+            self._counter_gain = 0.0
+            self.yield_tracker.clear()
+            self.tuner = tuner
+            self.last_action_time = self.clock.time()
             
-            self.thread = threading.Thread(
-                target=self._run_automation,
-                args=(task_config, callback),
-                daemon=True
+            self.thread = get_thread_registry().spawn(
+                self._run_automation,
+                owner=f"AutomationEngine[{self.game or 'no game'}]",
+                purpose=f"{specs[0].type} loop",
+                name=f"engine-{self.game or specs[0].type}",
+                args=(task_config, callback)
             )
-            self.thread.start()
-            logger.info(f"Automation started: {task_config.get('type', 'generic')}")
+            self.clock.add_participant()
+            try:
+                self.thread.start()
+            except BaseException:
+                self.clock.remove_participant()
+                raise
+            logger.info("Automation started: %s", specs[0].type)
             return True
         except Exception as e:
-            logger.error(f"Error starting automation: {e}")
+            logger.error("Error starting automation: %s", e)
             self.state = AutomationState.IDLE
             return False
     
-    def stop_automation(self) -> bool:
-        """Stop automation"""
+    def stop_automation(self, timeout: float = 5.0) -> bool:
+        """
+        Stop automation
+        
+        Delays and handler waits return as soon as the stop is signalled, and a
+        paused loop is woken so it can see the stop.
+        
+        Args:
+            timeout: Seconds to wait for the automation thread to exit
+            
+        Returns:
+            True if the thread exited within the timeout
+        """
         try:
-            self.stop_event.set()
-            self.state = AutomationState.STOPPED
-            if self.thread and self.thread.is_alive():
-                self.thread.join(timeout=5)
+            self.request_stop()
+            if not self.join(timeout):
+                logger.warning("Automation thread did not exit within %.1fs", timeout)
+                return False
             logger.info("Automation stopped")
             return True
         except Exception as e:
-            logger.error(f"Error stopping automation: {e}")
+            logger.error("Error stopping automation: %s", e)
             return False
     
+    def request_stop(self) -> bool:
+        """
+        Signal the automation thread to stop without waiting for it
+        
+        Returns:
+            True if a thread was running
+        """
+        running = self.thread is not None and self.thread.is_alive()
+        self.clock.set(self.stop_event)
+        self.clock.set(self.pause_event)
+        self.clock.set(self._garden_wake)
+        self.state = AutomationState.STOPPED
+        get_thread_registry().stop_requested(self.thread)
+        return running
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the automation thread; returns True if it is not running"""
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join(timeout=timeout)
+            return not self.thread.is_alive()
+        return True
+    
     def pause_automation(self) -> bool:
         """Pause automation"""
         try:
@@ -92,666 +328,1058 @@ class AutomationEngine:
             logger.info("Automation paused")
             return True
         except Exception as e:
-            logger.error(f"Error pausing automation: {e}")
+            logger.error("Error pausing automation: %s", e)
             return False
     
     def resume_automation(self) -> bool:
         """Resume automation"""
         try:
-            self.pause_event.set()
+            self.clock.set(self.pause_event)
             self.state = AutomationState.RUNNING
             logger.info("Automation resumed")
             return True
         except Exception as e:
-            logger.error(f"Error resuming automation: {e}")
+            logger.error("Error resuming automation: %s", e)
             return False
     
     def _run_automation(self, task_config: Dict[str, Any], callback: Optional[Callable] = None):
         """Internal automation loop with full functionality"""
-        start_time = time.time()
+        start_time = self.clock.time()
+        unsubscribe = self._watch_overrides(task_config)
+        worker = get_thread_registry().get()
+        perform = None
+        if self.environment is not None:
+            perform = functools.partial(self.environment.perform, cancel=self.stop_event)
         
         try:
             while not self.stop_event.is_set():
                 # Check if paused
-                self.pause_event.wait()
+                self.clock.wait(self.pause_event)
                 
                 if self.stop_event.is_set():
                     break
                 
-                # Execute automation logic based on task_config
-                task_type = task_config.get("type", "generic")
-                game = task_config.get("game", "Unknown")
+                tick_start = self.clock.monotonic()
+                spec, arm_specs, branches = self._specs
+                if self.tuner:
+                    spec = arm_specs[self.tuner.current_arm]
+                
+                # Watched region static: hold the tick, polling until it changes
+                if spec.watch is not None and not self._watch_changed(spec):
+                    self.stats["runtime"] = int(self.clock.time() - start_time)
+                    self._sleep(min(spec.delay, WATCH_POLL))
+                    continue
+                
+                # HUD counter: read once per tick; reaching stop_at ends the task
+                if spec.counter is not None:
+                    value = self._update_counter(spec)
+                    if spec.stop_at is not None and value is not None and value >= spec.stop_at:
+                        logger.info("[%s] Counter reached %s (stop at %s), stopping %s",
+                                    self.game or spec.type, value, spec.stop_at, spec.type)
+                        self.stop_event.set()
+                        break
                 
-                # Execute specific automation type
-                try:
-                    if task_type == "auto_farm":
-                        self._execute_auto_farm(task_config)
-                    elif task_type == "clicker":
-                        self._execute_clicker(task_config)
-                    elif task_type == "macro":
-                        self._execute_macro(task_config)
-                    elif task_type == "auto_raid":
-                        self._execute_auto_raid(task_config)
-                    elif task_type == "boss_farm":
-                        self._execute_boss_farm(task_config)
-                    elif task_type == "cash_farm":
-                        self._execute_cash_farm(task_config)
-                    elif task_type == "auto_duel":
-                        self._execute_auto_duel(task_config)
-                    elif task_type == "auto_rob":
-                        self._execute_auto_rob(task_config)
-                    elif task_type == "quest_farm":
-                        self._execute_quest_farm(task_config)
-                    elif task_type == "auto_awaken":
-                        self._execute_auto_awaken(task_config)
-                    elif task_type == "demon_farm":
-                        self._execute_demon_farm(task_config)
-                    elif task_type == "breath_train":
-                        self._execute_breath_train(task_config)
-                    elif task_type == "auto_spin":
-                        self._execute_auto_spin(task_config)
-                    elif task_type == "auto_hatch":
-                        self._execute_auto_hatch(task_config)
-                    elif task_type == "coin_farm":
-                        self._execute_coin_farm(task_config)
-                    elif task_type == "auto_trade":
-                        self._execute_auto_trade(task_config)
-                    elif task_type == "wave_farm":
-                        self._execute_wave_farm(task_config)
-                    elif task_type == "auto_summon":
-                        self._execute_auto_summon(task_config)
-                    elif task_type == "auto_upgrade":
-                        self._execute_auto_upgrade(task_config)
-                    elif task_type == "pollen_collect":
-                        self._execute_pollen_collect(task_config)
-                    elif task_type == "honey_convert":
-                        self._execute_honey_convert(task_config)
-                    elif task_type == "auto_mine":
-                        self._execute_auto_mine(task_config)
-                    elif task_type == "auto_sell":
-                        self._execute_auto_sell(task_config)
-                    elif task_type == "age_pets":
-                        self._execute_age_pets(task_config)
-                    elif task_type == "auto_click":
-                        self._execute_auto_click(task_config)
-                    elif task_type == "auto_rebirth":
-                        self._execute_auto_rebirth(task_config)
-                    elif task_type == "auto_cook":
-                        self._execute_auto_cook(task_config)
-                    elif task_type == "auto_serve":
-                        self._execute_auto_serve(task_config)
-                    elif task_type == "auto_collect":
-                        self._execute_auto_collect(task_config)
-                    elif task_type == "auto_complete":
-                        self._execute_auto_complete(task_config)
-                    elif task_type == "auto_run":
-                        self._execute_auto_run(task_config)
-                    elif task_type == "auto_aim":
-                        self._execute_auto_aim(task_config)
-                    elif task_type == "kill_farm":
-                        self._execute_kill_farm(task_config)
-                    elif task_type == "auto_escape":
-                        self._execute_auto_escape(task_config)
-                    elif task_type == "auto_work":
-                        self._execute_auto_work(task_config)
-                    elif task_type == "auto_rp":
-                        self._execute_auto_rp(task_config)
-                    elif task_type == "auto_survive":
-                        self._execute_auto_survive(task_config)
-                    elif task_type == "zombie_kill":
-                        self._execute_zombie_kill(task_config)
-                    elif task_type == "coin_collect":
-                        self._execute_coin_collect(task_config)
-                    elif task_type == "chi_farm":
-                        self._execute_chi_farm(task_config)
-                    elif task_type == "auto_evolve":
-                        self._execute_auto_evolve(task_config)
-                    elif task_type == "power_farm":
-                        self._execute_power_farm(task_config)
-                    elif task_type == "auto_tap":
-                        self._execute_auto_tap(task_config)
-                    elif task_type == "auto_breed":
-                        self._execute_auto_breed(task_config)
-                    elif task_type == "auto_block":
-                        self._execute_auto_block(task_config)
-                    elif task_type == "auto_solve":
-                        self._execute_auto_solve(task_config)
-                    elif task_type == "auto_evade":
-                        self._execute_auto_evade(task_config)
-                    elif task_type == "auto_build":
-                        self._execute_auto_build(task_config)
-                    elif task_type == "auto_win":
-                        self._execute_auto_win(task_config)
-                    elif task_type == "auto_slap":
-                        self._execute_auto_slap(task_config)
-                    elif task_type == "glove_farm":
-                        self._execute_glove_farm(task_config)
-                    elif task_type == "auto_fight":
-                        self._execute_auto_fight(task_config)
-                    elif task_type == "mana_farm":
-                        self._execute_mana_farm(task_config)
-                    elif task_type == "auto_grind":
-                        self._execute_auto_grind(task_config)
-                    elif task_type == "level_farm":
-                        self._execute_level_farm(task_config)
-                    elif task_type == "stand_farm":
-                        self._execute_stand_farm(task_config)
-                    elif task_type == "auto_prestige":
-                        self._execute_auto_prestige(task_config)
-                    elif task_type == "fruit_farm":
-                        self._execute_fruit_farm(task_config)
-                    elif task_type == "auto_quest":
-                        self._execute_auto_quest(task_config)
-                    elif task_type == "full_auto_cycle":
-                        self._execute_full_auto_cycle(task_config)
-                    # Garden automation types
-                    elif task_type == "plant_seeds":
-                        self._execute_plant_seeds(task_config)
-                    elif task_type == "water_plants":
-                        self._execute_water_plants(task_config)
-                    elif task_type == "harvest_crops":
-                        self._execute_harvest_crops(task_config)
-                    elif task_type == "auto_fertilize":
-                        self._execute_auto_fertilize(task_config)
-                    elif task_type == "upgrade_garden":
-                        self._execute_upgrade_garden(task_config)
-                    elif task_type == "sell_produce":
-                        self._execute_sell_produce(task_config)
-                    elif task_type == "buy_seeds":
-                        self._execute_buy_seeds(task_config)
-                    elif task_type == "auto_weed":
-                        self._execute_auto_weed(task_config)
-                    elif task_type == "auto_pest_control":
-                        self._execute_auto_pest_control(task_config)
-                    elif task_type == "auto_compost":
-                        self._execute_auto_compost(task_config)
-                    elif task_type == "auto_irrigate":
-                        self._execute_auto_irrigate(task_config)
-                    elif task_type == "auto_prune":
-                        self._execute_auto_prune(task_config)
-                    elif task_type == "auto_harvest_all":
-                        self._execute_auto_harvest_all(task_config)
-                    elif task_type == "auto_plant_all":
-                        self._execute_auto_plant_all(task_config)
-                    elif task_type == "auto_upgrade_tools":
-                        self._execute_auto_upgrade_tools(task_config)
-                    elif task_type == "auto_complete_orders":
-                        self._execute_auto_complete_orders(task_config)
-                    elif task_type == "auto_collect_rewards":
-                        self._execute_auto_collect_rewards(task_config)
-                    elif task_type == "auto_manage_inventory":
-                        self._execute_auto_manage_inventory(task_config)
-                    elif task_type == "auto_optimize_layout":
-                        self._execute_auto_optimize_layout(task_config)
-                    else:
-                        self._execute_generic(task_config)
-                    
-                    self.stats["actions_performed"] += 1
-                    self.last_action_time = time.time()
-                    
-                except Exception as e:
-                    logger.error(f"Error executing {task_type}: {e}")
-                    self.stats["errors"] += 1
+                # Screen state picks the branch to run this tick (None: wait)
+                task = self._branch(spec, branches) if branches else spec
                 
-                self.stats["runtime"] = int(time.time() - start_time)
+                # Screen preconditions: the tick only waits when they do not hold
+                acted = task is not None and (not (task.when or task.unless) or self._conditions_met(task))
+                outcome = None
+                
+                # Garden tasks act only on the plots that need it, one seed type at a time
+                # (none: the tick waits)
+                self.plots = None
+                groups = None
+                if acted and task.type in GARDEN_STEPS:
+                    groups = self._garden_groups(task)
+                    acted = bool(groups)
+                
+                if acted:
+                    # Execute automation logic based on the compiled spec
+                    handler = perform or self._handlers.get(task.type, self._execute_generic)
+                    try:
+                        if groups is not None:
+                            with_plots = perform is not None and self._garden_view is not None
+                            outcome = self._garden_tick(groups, handler, with_plots)
+                        else:
+                            outcome = TaskOutcome.coerce(handler(task))
+                        if spec.counter is not None:
+                            outcome = self._credit_counter(spec, outcome)
+                        self._record_outcome(task, outcome)
+                        
+                        self.stats["actions_performed"] += 1
+                        self.last_action_time = self.clock.time()
+                        if worker is not None:
+                            worker.heartbeat()
+                        
+                    except Exception as e:
+                        logger.error("Error executing %s: %s", task.type, e)
+                        self.stats["errors"] += 1
+                else:
+                    self.stats["skipped"] += 1
+                
+                self.stats["runtime"] = int(self.clock.time() - start_time)
                 
                 if callback:
                     callback(self.stats)
                 
-                # Delay between actions
-                delay = task_config.get("delay", 1.0)
-                time.sleep(delay)
+                # Delay between actions (cut short by stop); harvests sleep until crops ripen
+                if task is not None and GARDEN_STEPS.get(task.type, ("",))[0] == "harvest":
+                    self._wait_for_harvest(task)
+                else:
+                    self._sleep((task or spec).delay)
+                
+                if self.tuner and acted:
+                    self.tuner.update(outcome, self.clock.monotonic() - tick_start)
                 
         except Exception as e:
-            logger.error(f"Error in automation loop: {e}")
+            logger.error("Error in automation loop: %s", e)
             self.stats["errors"] += 1
         finally:
+            if unsubscribe:
+                unsubscribe()
+            if self._garden_listener is not None:
+                self.garden.remove_listener(self._garden_listener)
+                self._garden_listener = None
+            self._close_frames()
             self.state = AutomationState.IDLE
+            self.clock.remove_participant()
+    
+    @staticmethod
+    def _compile_specs(task_config: Dict[str, Any], overrides: Dict[str, Any], tuner: Optional[ParameterTuner]
+                       ) -> Tuple[TaskSpec, List[TaskSpec], Dict[str, Optional[TaskSpec]]]:
+        """Compile the task spec, one spec per tuner arm and one per screen state branch"""
+        base = {**task_config, **overrides}
+        spec = compile_task(base)
+        arm_specs = [compile_task({**base, **arm}) for arm in tuner.arms] if tuner else []
+        branches: Dict[str, Optional[TaskSpec]] = {}
+        # Branches share the task's game, delay and region unless they set their own
+        shared = {key: base[key] for key in ("game", "delay", "region") if base.get(key) is not None}
+        for state, branch in (spec.branches or {}).items():
+            if branch is None:
+                branches[state] = None
+            elif isinstance(branch, str):
+                branches[state] = compile_task({**shared, "type": branch})
+            elif isinstance(branch, dict) and "branches" not in branch:
+                branches[state] = compile_task({**shared, **branch})
+            else:
+                raise TaskSpecError(f"{spec.type}.branches[{state!r}]: expected a task type, "
+                                    f"a task config without branches, or null, got {branch!r}")
+        return spec, arm_specs, branches
+    
+    @staticmethod
+    def _read_overrides(task_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the ``game_configs`` overrides for a task"""
+        game = task_config.get("game")
+        if not game:
+            return {}
+        return get_config_service().task_overrides(game, task_config.get("type") or "generic")
+    
+    def _watch_overrides(self, task_config: Dict[str, Any]) -> Optional[Callable]:
+        """
+        Follow ``game_configs`` edits (e.g. delay) while the task runs
+        
+        Changed overrides are compiled off the hot loop and swapped in as a
+        whole. Returns the unsubscribe function, or None when the task has no game.
+        """
+        game = task_config.get("game")
+        if not game:
+            return None
+        service = get_config_service()
+        
+        def on_config_changed(_document: Dict[str, Any]):
+            overrides = self._read_overrides(task_config)
+            if overrides == self.config_overrides:
+                return
+            try:
+                specs = self._compile_specs(task_config, overrides, self.tuner)
+            except TaskSpecError as e:
+                logger.error("[%s] Ignoring invalid config overrides: %s", game, e)
+                return
+            logger.info("[%s] Config overrides for %s: %s", game, specs[0].type, overrides)
+            self.config_overrides = overrides
+            # Swap the reference; the loop reads it once per tick
+            self._specs = specs
+        
+        try:
+            unsubscribe = service.subscribe(on_config_changed)
+            on_config_changed({})
+            return unsubscribe
+        except Exception as e:
+            logger.error("Error reading config overrides: %s", e)
+            return None
     
     # ========== CORE AUTOMATION METHODS ==========
     
-    def _execute_auto_farm(self, config: Dict[str, Any]):
+    def _execute_auto_farm(self, spec: TaskSpec):
         """Execute auto-farm logic"""
-        game = config.get("game", "Unknown")
-        fruit_type = config.get("fruit_type", "Any")
-        location = config.get("location", "Default")
-        logger.info(f"[{game}] Farming {fruit_type} at {location}")
+        game = spec.game or "Unknown"
+        fruit_type = spec.fruit_type
+        location = spec.location
+        logger.info("[%s] Farming %s at %s", game, fruit_type, location)
         # Simulate farming action - in real implementation would interact with Roblox
-        time.sleep(0.1)  # Simulate action time
+        self._sleep(0.1)  # Simulate action time
     
-    def _execute_clicker(self, config: Dict[str, Any]):
+    def _execute_clicker(self, spec: TaskSpec):
         """Execute clicker logic"""
         try:
-            import pyautogui
-            position = config.get("position")
-            button = config.get("button", "left")
+            position = spec.position
+            button = spec.button
             if position:
-                pyautogui.click(position[0], position[1], button=button)
-            logger.debug(f"Clicking at {position}")
+                self.input_backend.click(position[0], position[1], button=button)
+            logger.debug("Clicking at %s", position)
         except Exception as e:
-            logger.error(f"Error in clicker: {e}")
+            logger.error("Error in clicker: %s", e)
             raise
     
-    def _execute_macro(self, config: Dict[str, Any]):
+    def _execute_macro(self, spec: TaskSpec):
         """Execute macro logic"""
         logger.debug("Executing macro action")
     
-    def _execute_generic(self, config: Dict[str, Any]):
+    def _execute_generic(self, spec: TaskSpec):
         """Execute generic automation"""
-        game = config.get("game", "Unknown")
-        logger.info(f"[{game}] Executing generic automation")
-        time.sleep(0.1)
+        game = spec.game or "Unknown"
+        logger.info("[%s] Executing generic automation", game)
+        self._sleep(0.1)
     
     # ========== GAME-SPECIFIC AUTOMATION METHODS ==========
     
-    def _execute_auto_raid(self, config: Dict[str, Any]):
+    def _execute_auto_raid(self, spec: TaskSpec):
         """Execute auto-raid"""
-        raid_type = config.get("raid_type", "Normal")
-        logger.info(f"Executing auto-raid: {raid_type}")
-        time.sleep(0.2)
+        raid_type = spec.raid_type
+        logger.info("Executing auto-raid: %s", raid_type)
+        self._sleep(0.2)
     
-    def _execute_boss_farm(self, config: Dict[str, Any]):
+    def _execute_boss_farm(self, spec: TaskSpec):
         """Execute boss farming"""
-        boss = config.get("boss", "Unknown")
-        logger.info(f"Farming boss: {boss}")
-        time.sleep(0.3)
+        boss = spec.boss
+        logger.info("Farming boss: %s", boss)
+        self._sleep(0.3)
     
-    def _execute_cash_farm(self, config: Dict[str, Any]):
+    def _execute_cash_farm(self, spec: TaskSpec):
         """Execute cash farming"""
         logger.info("Farming cash")
-        time.sleep(0.15)
+        self._sleep(0.15)
     
-    def _execute_auto_duel(self, config: Dict[str, Any]):
+    def _execute_auto_duel(self, spec: TaskSpec):
         """Execute auto-duel"""
         logger.info("Auto-dueling")
-        time.sleep(0.3)
+        self._sleep(0.3)
     
-    def _execute_auto_rob(self, config: Dict[str, Any]):
+    def _execute_auto_rob(self, spec: TaskSpec):
         """Execute auto-rob"""
-        location = config.get("location", "Unknown")
-        logger.info(f"Robbing: {location}")
-        time.sleep(0.25)
+        location = spec.location
+        logger.info("Robbing: %s", location)
+        self._sleep(0.25)
     
-    def _execute_quest_farm(self, config: Dict[str, Any]):
+    def _execute_quest_farm(self, spec: TaskSpec):
         """Execute quest farming"""
-        quest = config.get("quest", "Default")
-        logger.info(f"Farming quest: {quest}")
-        time.sleep(0.2)
+        quest = spec.quest
+        logger.info("Farming quest: %s", quest)
+        self._sleep(0.2)
     
-    def _execute_auto_awaken(self, config: Dict[str, Any]):
+    def _execute_auto_awaken(self, spec: TaskSpec):
         """Execute auto-awaken"""
         logger.info("Auto-awakening fruits")
-        time.sleep(0.5)
+        self._sleep(0.5)
     
-    def _execute_demon_farm(self, config: Dict[str, Any]):
+    def _execute_demon_farm(self, spec: TaskSpec):
         """Execute demon farming"""
-        demon = config.get("demon", "Default")
-        logger.info(f"Farming demon: {demon}")
-        time.sleep(0.2)
+        demon = spec.demon
+        logger.info("Farming demon: %s", demon)
+        self._sleep(0.2)
     
-    def _execute_breath_train(self, config: Dict[str, Any]):
+    def _execute_breath_train(self, spec: TaskSpec):
         """Execute breathing training"""
         logger.info("Training breathing style")
-        time.sleep(0.3)
+        self._sleep(0.3)
     
-    def _execute_auto_spin(self, config: Dict[str, Any]):
+    def _execute_auto_spin(self, spec: TaskSpec):
         """Execute auto-spin"""
         logger.info("Auto-spinning for bloodlines")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_auto_hatch(self, config: Dict[str, Any]):
+    def _execute_auto_hatch(self, spec: TaskSpec):
         """Execute auto-hatch"""
-        egg_type = config.get("egg", "Basic")
-        logger.info(f"Auto-hatching {egg_type} eggs")
-        time.sleep(0.15)
+        egg_type = spec.egg
+        logger.info("Auto-hatching %s eggs", egg_type)
+        self._sleep(0.15)
     
-    def _execute_coin_farm(self, config: Dict[str, Any]):
+    def _execute_coin_farm(self, spec: TaskSpec):
         """Execute coin farming"""
-        world = config.get("world", "Default")
-        logger.info(f"Farming coins in {world}")
-        time.sleep(0.2)
+        world = spec.world
+        logger.info("Farming coins in %s", world)
+        self._sleep(0.2)
     
-    def _execute_auto_trade(self, config: Dict[str, Any]):
+    def _execute_auto_trade(self, spec: TaskSpec):
         """Execute auto-trade"""
         logger.info("Auto-trading")
-        time.sleep(0.5)
+        self._sleep(0.5)
     
-    def _execute_wave_farm(self, config: Dict[str, Any]):
+    def _execute_wave_farm(self, spec: TaskSpec):
         """Execute wave farming"""
-        wave_count = config.get("wave_count", 100)
-        logger.info(f"Farming waves: {wave_count}")
-        time.sleep(0.2)
+        wave_count = spec.wave_count
+        logger.info("Farming waves: %s", wave_count)
+        self._sleep(0.2)
     
-    def _execute_auto_summon(self, config: Dict[str, Any]):
+    def _execute_auto_summon(self, spec: TaskSpec):
         """Execute auto-summon"""
         logger.info("Auto-summoning units")
-        time.sleep(0.5)
+        self._sleep(0.5)
     
-    def _execute_auto_upgrade(self, config: Dict[str, Any]):
+    def _execute_auto_upgrade(self, spec: TaskSpec):
         """Execute auto-upgrade"""
         logger.info("Auto-upgrading")
-        time.sleep(0.3)
+        self._sleep(0.3)
     
-    def _execute_pollen_collect(self, config: Dict[str, Any]):
+    def _execute_pollen_collect(self, spec: TaskSpec):
         """Execute pollen collection"""
         logger.info("Collecting pollen")
-        time.sleep(0.15)
+        self._sleep(0.15)
     
-    def _execute_honey_convert(self, config: Dict[str, Any]):
+    def _execute_honey_convert(self, spec: TaskSpec):
         """Execute honey conversion"""
         logger.info("Converting to honey")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_mine(self, config: Dict[str, Any]):
+    def _execute_auto_mine(self, spec: TaskSpec):
         """Execute auto-mining"""
-        ore = config.get("ore", "Default")
-        logger.info(f"Mining {ore}")
-        time.sleep(0.15)
+        ore = spec.ore
+        logger.info("Mining %s", ore)
+        self._sleep(0.15)
     
-    def _execute_auto_sell(self, config: Dict[str, Any]):
+    def _execute_auto_sell(self, spec: TaskSpec):
         """Execute auto-sell"""
         logger.info("Auto-selling items")
-        time.sleep(0.3)
+        self._sleep(0.3)
     
-    def _execute_age_pets(self, config: Dict[str, Any]):
+    def _execute_age_pets(self, spec: TaskSpec):
         """Execute pet aging"""
         logger.info("Aging pets")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_click(self, config: Dict[str, Any]):
+    def _execute_auto_click(self, spec: TaskSpec):
         """Execute auto-click"""
-        cps = config.get("cps", 10)
-        logger.debug(f"Auto-clicking at {cps} CPS")
-        time.sleep(1.0 / cps)
+        cps = spec.cps
+        logger.debug("Auto-clicking at %s CPS", cps)
+        self._sleep(1.0 / cps)
     
-    def _execute_auto_rebirth(self, config: Dict[str, Any]):
+    def _execute_auto_rebirth(self, spec: TaskSpec):
         """Execute auto-rebirth"""
         logger.info("Auto-rebirthing")
-        time.sleep(1.0)
+        self._sleep(1.0)
     
-    def _execute_auto_cook(self, config: Dict[str, Any]):
+    def _execute_auto_cook(self, spec: TaskSpec):
         """Execute auto-cook"""
         logger.info("Auto-cooking food")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_serve(self, config: Dict[str, Any]):
+    def _execute_auto_serve(self, spec: TaskSpec):
         """Execute auto-serve"""
         logger.info("Auto-serving customers")
-        time.sleep(0.15)
+        self._sleep(0.15)
     
-    def _execute_auto_collect(self, config: Dict[str, Any]):
+    def _execute_auto_collect(self, spec: TaskSpec):
         """Execute auto-collect"""
         logger.info("Auto-collecting money")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_auto_complete(self, config: Dict[str, Any]):
+    def _execute_auto_complete(self, spec: TaskSpec):
         """Execute auto-complete"""
         logger.info("Auto-completing tower")
-        time.sleep(0.05)
+        self._sleep(0.05)
     
-    def _execute_auto_run(self, config: Dict[str, Any]):
+    def _execute_auto_run(self, spec: TaskSpec):
         """Execute auto-run"""
         logger.info("Auto-running course")
-        time.sleep(0.03)
+        self._sleep(0.03)
     
-    def _execute_auto_aim(self, config: Dict[str, Any]):
+    def _execute_auto_aim(self, spec: TaskSpec):
         """Execute auto-aim"""
         logger.debug("Auto-aim assist")
-        time.sleep(0.01)
+        self._sleep(0.01)
     
-    def _execute_kill_farm(self, config: Dict[str, Any]):
+    def _execute_kill_farm(self, spec: TaskSpec):
         """Execute kill farming"""
         logger.info("Farming kills")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_escape(self, config: Dict[str, Any]):
+    def _execute_auto_escape(self, spec: TaskSpec):
         """Execute auto-escape"""
         logger.info("Auto-escaping")
-        time.sleep(0.15)
+        self._sleep(0.15)
     
-    def _execute_auto_work(self, config: Dict[str, Any]):
+    def _execute_auto_work(self, spec: TaskSpec):
         """Execute auto-work"""
-        job = config.get("job", "Default")
-        logger.info(f"Auto-working: {job}")
-        time.sleep(0.2)
+        job = spec.job
+        logger.info("Auto-working: %s", job)
+        self._sleep(0.2)
     
-    def _execute_auto_rp(self, config: Dict[str, Any]):
+    def _execute_auto_rp(self, spec: TaskSpec):
         """Execute auto-roleplay"""
         logger.info("Auto-roleplaying")
-        time.sleep(0.5)
+        self._sleep(0.5)
     
-    def _execute_auto_survive(self, config: Dict[str, Any]):
+    def _execute_auto_survive(self, spec: TaskSpec):
         """Execute auto-survive"""
         logger.info("Auto-surviving disasters")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_zombie_kill(self, config: Dict[str, Any]):
+    def _execute_zombie_kill(self, spec: TaskSpec):
         """Execute zombie killing"""
         logger.info("Killing zombies")
-        time.sleep(0.15)
+        self._sleep(0.15)
     
-    def _execute_coin_collect(self, config: Dict[str, Any]):
+    def _execute_coin_collect(self, spec: TaskSpec):
         """Execute coin collection"""
         logger.info("Collecting coins")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_chi_farm(self, config: Dict[str, Any]):
+    def _execute_chi_farm(self, spec: TaskSpec):
         """Execute chi farming"""
         logger.info("Farming chi")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_evolve(self, config: Dict[str, Any]):
+    def _execute_auto_evolve(self, spec: TaskSpec):
         """Execute auto-evolve"""
         logger.info("Auto-evolving pets")
-        time.sleep(0.5)
+        self._sleep(0.5)
     
-    def _execute_power_farm(self, config: Dict[str, Any]):
+    def _execute_power_farm(self, spec: TaskSpec):
         """Execute power farming"""
         logger.info("Farming powers")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_tap(self, config: Dict[str, Any]):
+    def _execute_auto_tap(self, spec: TaskSpec):
         """Execute auto-tap"""
-        cps = config.get("cps", 30)
-        logger.debug(f"Auto-tapping at {cps} CPS")
-        time.sleep(1.0 / cps)
+        cps = spec.cps
+        logger.debug("Auto-tapping at %s CPS", cps)
+        self._sleep(1.0 / cps)
     
-    def _execute_auto_breed(self, config: Dict[str, Any]):
+    def _execute_auto_breed(self, spec: TaskSpec):
         """Execute auto-breed"""
         logger.info("Auto-breeding")
-        time.sleep(1.0)
+        self._sleep(1.0)
     
-    def _execute_auto_block(self, config: Dict[str, Any]):
+    def _execute_auto_block(self, spec: TaskSpec):
         """Execute auto-block"""
         logger.debug("Auto-blocking")
-        time.sleep(0.01)
+        self._sleep(0.01)
     
-    def _execute_auto_solve(self, config: Dict[str, Any]):
+    def _execute_auto_solve(self, spec: TaskSpec):
         """Execute auto-solve"""
         logger.info("Auto-solving puzzles")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_auto_evade(self, config: Dict[str, Any]):
+    def _execute_auto_evade(self, spec: TaskSpec):
         """Execute auto-evade"""
         logger.info("Auto-evading")
-        time.sleep(0.02)
+        self._sleep(0.02)
     
-    def _execute_auto_build(self, config: Dict[str, Any]):
+    def _execute_auto_build(self, spec: TaskSpec):
         """Execute auto-build"""
         logger.info("Auto-building")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_auto_win(self, config: Dict[str, Any]):
+    def _execute_auto_win(self, spec: TaskSpec):
         """Execute auto-win"""
         logger.info("Auto-winning games")
-        time.sleep(0.5)
+        self._sleep(0.5)
     
-    def _execute_auto_slap(self, config: Dict[str, Any]):
+    def _execute_auto_slap(self, spec: TaskSpec):
         """Execute auto-slap"""
         logger.info("Auto-slapping")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_glove_farm(self, config: Dict[str, Any]):
+    def _execute_glove_farm(self, spec: TaskSpec):
         """Execute glove farming"""
         logger.info("Farming gloves")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_fight(self, config: Dict[str, Any]):
+    def _execute_auto_fight(self, spec: TaskSpec):
         """Execute auto-fight"""
         logger.info("Auto-fighting")
-        time.sleep(0.15)
+        self._sleep(0.15)
     
-    def _execute_mana_farm(self, config: Dict[str, Any]):
+    def _execute_mana_farm(self, spec: TaskSpec):
         """Execute mana farming"""
         logger.info("Farming mana")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_grind(self, config: Dict[str, Any]):
+    def _execute_auto_grind(self, spec: TaskSpec):
         """Execute auto-grind"""
         logger.info("Auto-grinding")
-        time.sleep(0.25)
+        self._sleep(0.25)
     
-    def _execute_level_farm(self, config: Dict[str, Any]):
+    def _execute_level_farm(self, spec: TaskSpec):
         """Execute level farming"""
         logger.info("Farming levels")
-        time.sleep(0.3)
+        self._sleep(0.3)
     
-    def _execute_stand_farm(self, config: Dict[str, Any]):
+    def _execute_stand_farm(self, spec: TaskSpec):
         """Execute stand farming"""
         logger.info("Farming stands")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_prestige(self, config: Dict[str, Any]):
+    def _execute_auto_prestige(self, spec: TaskSpec):
         """Execute auto-prestige"""
         logger.info("Auto-prestiging")
-        time.sleep(1.0)
+        self._sleep(1.0)
     
-    def _execute_fruit_farm(self, config: Dict[str, Any]):
+    def _execute_fruit_farm(self, spec: TaskSpec):
         """Execute fruit farming"""
         logger.info("Farming fruits")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_quest(self, config: Dict[str, Any]):
+    def _execute_auto_quest(self, spec: TaskSpec):
         """Execute auto-quest"""
         logger.info("Auto-questing")
-        time.sleep(0.25)
+        self._sleep(0.25)
     
     # ========== GARDEN AUTOMATION METHODS (20+ features) ==========
     
-    def _execute_plant_seeds(self, config: Dict[str, Any]):
-        """Plant seeds in garden"""
-        seed_type = config.get("seed_type", "Default")
-        logger.info(f"Planting {seed_type} seeds")
-        time.sleep(0.2)
-    
-    def _execute_water_plants(self, config: Dict[str, Any]):
-        """Water plants in garden"""
-        logger.info("Watering plants")
-        time.sleep(0.15)
-    
-    def _execute_harvest_crops(self, config: Dict[str, Any]):
-        """Harvest crops from garden"""
-        crop_type = config.get("crop_type", "All")
-        logger.info(f"Harvesting {crop_type} crops")
-        time.sleep(0.2)
-    
-    def _execute_auto_fertilize(self, config: Dict[str, Any]):
-        """Auto-fertilize garden"""
-        fertilizer_type = config.get("fertilizer", "Basic")
-        logger.info(f"Fertilizing with {fertilizer_type}")
-        time.sleep(0.25)
-    
-    def _execute_upgrade_garden(self, config: Dict[str, Any]):
+    def _execute_plant_seeds(self, spec: TaskSpec):
+        """Plant seeds in an empty plot"""
+        return self._tend(spec, "plant", self._tick_plots(spec))
+    
+    def _execute_water_plants(self, spec: TaskSpec):
+        """Water the plants that have dried out"""
+        return self._tend(spec, "water", self._tick_plots(spec))
+    
+    def _execute_harvest_crops(self, spec: TaskSpec):
+        """Harvest the ripe crops"""
+        return self._tend(spec, "harvest", self._tick_plots(spec))
+    
+    def _execute_auto_fertilize(self, spec: TaskSpec):
+        """Fertilize the plants that have not been fertilized"""
+        return self._tend(spec, "fertilize", self._tick_plots(spec))
+    
+    def _execute_upgrade_garden(self, spec: TaskSpec):
         """Upgrade garden plots"""
-        upgrade_type = config.get("upgrade", "Plot Size")
-        logger.info(f"Upgrading garden: {upgrade_type}")
-        time.sleep(0.3)
+        upgrade_type = spec.upgrade
+        logger.info("Upgrading garden: %s", upgrade_type)
+        self._sleep(0.3)
     
-    def _execute_sell_produce(self, config: Dict[str, Any]):
+    def _execute_sell_produce(self, spec: TaskSpec):
         """Sell produce from garden"""
         logger.info("Selling produce")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_buy_seeds(self, config: Dict[str, Any]):
-        """Buy seeds from shop"""
-        seed_type = config.get("seed_type", "Default")
-        logger.info(f"Buying {seed_type} seeds")
-        time.sleep(0.15)
+    def _execute_buy_seeds(self, spec: TaskSpec):
+        """Buy seeds for the plots that need them"""
+        return self._tend(spec, "buy", self._tick_plots(spec))
     
-    def _execute_auto_weed(self, config: Dict[str, Any]):
+    def _execute_auto_weed(self, spec: TaskSpec):
         """Auto-weed garden"""
         logger.info("Removing weeds")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_auto_pest_control(self, config: Dict[str, Any]):
+    def _execute_auto_pest_control(self, spec: TaskSpec):
         """Auto pest control"""
         logger.info("Controlling pests")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_compost(self, config: Dict[str, Any]):
+    def _execute_auto_compost(self, spec: TaskSpec):
         """Auto-compost materials"""
         logger.info("Creating compost")
-        time.sleep(0.25)
+        self._sleep(0.25)
     
-    def _execute_auto_irrigate(self, config: Dict[str, Any]):
-        """Auto-irrigate garden"""
-        logger.info("Irrigating garden")
-        time.sleep(0.2)
+    def _execute_auto_irrigate(self, spec: TaskSpec):
+        """Auto-irrigate the plants that have dried out"""
+        return self._tend(spec, "water", self._tick_plots(spec))
     
-    def _execute_auto_prune(self, config: Dict[str, Any]):
+    def _execute_auto_prune(self, spec: TaskSpec):
         """Auto-prune plants"""
         logger.info("Pruning plants")
-        time.sleep(0.15)
+        self._sleep(0.15)
     
-    def _execute_auto_harvest_all(self, config: Dict[str, Any]):
-        """Auto-harvest all crops"""
-        logger.info("Harvesting all crops")
-        time.sleep(0.3)
+    def _execute_auto_harvest_all(self, spec: TaskSpec):
+        """Auto-harvest all ripe crops"""
+        return self._tend(spec, "harvest", self._tick_plots(spec))
     
-    def _execute_auto_plant_all(self, config: Dict[str, Any]):
-        """Auto-plant all available plots"""
-        seed_type = config.get("seed_type", "Best Available")
-        logger.info(f"Planting all plots with {seed_type}")
-        time.sleep(0.4)
+    def _execute_auto_plant_all(self, spec: TaskSpec):
+        """Auto-plant all empty plots"""
+        return self._tend(spec, "plant", self._tick_plots(spec))
     
-    def _execute_auto_upgrade_tools(self, config: Dict[str, Any]):
+    def _execute_auto_upgrade_tools(self, spec: TaskSpec):
         """Auto-upgrade gardening tools"""
-        tool_type = config.get("tool", "All")
-        logger.info(f"Upgrading {tool_type} tools")
-        time.sleep(0.3)
+        tool_type = spec.tool
+        logger.info("Upgrading %s tools", tool_type)
+        self._sleep(0.3)
     
-    def _execute_auto_complete_orders(self, config: Dict[str, Any]):
+    def _execute_auto_complete_orders(self, spec: TaskSpec):
         """Auto-complete garden orders"""
         logger.info("Completing garden orders")
-        time.sleep(0.25)
+        self._sleep(0.25)
     
-    def _execute_auto_collect_rewards(self, config: Dict[str, Any]):
+    def _execute_auto_collect_rewards(self, spec: TaskSpec):
         """Auto-collect garden rewards"""
         logger.info("Collecting garden rewards")
-        time.sleep(0.1)
+        self._sleep(0.1)
     
-    def _execute_auto_manage_inventory(self, config: Dict[str, Any]):
+    def _execute_auto_manage_inventory(self, spec: TaskSpec):
         """Auto-manage garden inventory"""
         logger.info("Managing garden inventory")
-        time.sleep(0.2)
+        self._sleep(0.2)
     
-    def _execute_auto_optimize_layout(self, config: Dict[str, Any]):
+    def _execute_auto_optimize_layout(self, spec: TaskSpec):
         """Auto-optimize garden layout"""
         logger.info("Optimizing garden layout")
-        time.sleep(0.3)
+        self._sleep(0.3)
     
-    def _execute_full_auto_cycle(self, config: Dict[str, Any]):
+    def _execute_full_auto_cycle(self, spec: TaskSpec):
         """Execute full automation cycle for garden"""
         logger.info("Running full auto cycle: harvest -> plant -> water -> fertilize")
-        # Simulate full cycle
-        self._execute_auto_harvest_all(config)
-        time.sleep(0.1)
-        self._execute_auto_plant_all(config)
-        time.sleep(0.1)
-        self._execute_water_plants(config)
-        time.sleep(0.1)
-        self._execute_auto_fertilize(config)
+        harvested = 0
+        for step in ("harvest", "plant", "water", "fertilize"):
+            for task, plots in self._garden_groups(spec, step):
+                harvested += self._tend(task, step, plots).items
+                self._garden_done(task, plots, step)
+        return TaskOutcome(items=harvested)
+    
+    # ========== GARDEN ==========
+    
+    def _garden_model(self):
+        """Get the garden model (the game's shared one unless one was given)"""
+        if self.garden is None:
+            from core.garden import get_garden
+            self.garden = get_garden(self.game)
+        return self.garden
+    
+    def _garden_plots(self, spec: TaskSpec, step: Optional[str] = None):
+        """
+        Pick the plots a garden tick acts on
+        
+        Args:
+            spec: Garden task
+            step: Garden step (default: the task type's, see GARDEN_STEPS)
+        
+        Returns:
+            Plot indices (empty when no plot needs the step now; every plot
+            until the garden is observed, see GardenModel.select)
+        """
+        limit = None
+        if step is None:
+            step, limit = GARDEN_STEPS[spec.type]
+        garden = self._garden_model()
+        with garden.lock:
+            now = self.clock.time()
+            if self._garden_view is not None:
+                garden.observe(now=now, **self._garden_view())
+            plots = garden.select(step, now, crop=getattr(spec, "crop_type", None))
+        return plots[:limit] if limit is not None else plots
+    
+    def _garden_groups(self, spec: TaskSpec, step: Optional[str] = None) -> List[Tuple[TaskSpec, Any]]:
+        """
+        Pick the plots a garden tick acts on, split by seed type
+        
+        Planting and buying with seed_type "Best Available" ask the garden
+        planner which crop goes in each plot; buying skips plots the seeds
+        on hand already cover.
+        
+        Returns:
+            (task with the group's seed type, plot indices) per group; empty
+            when no plot needs the step now
+        """
+        plots = self._garden_plots(spec, step)
+        step = step or GARDEN_STEPS[spec.type][0]
+        if not plots.size:
+            return []
+        if step not in ("plant", "buy"):
+            return [(spec, plots)]
+        
+        from core.garden import FERTILIZERS
+        from core.garden_planner import BEST_AVAILABLE, get_planner
+        garden = self._garden_model()
+        with garden.lock:
+            stock = dict(garden.seeds) if garden.seeds is not None else None
+            budget = garden.currency
+        if spec.seed_type == BEST_AVAILABLE:
+            # Planting only uses seeds on hand (when they are known); buying spends the money
+            if step == "plant":
+                budget = 0.0 if stock is not None else None
+            elif budget is None and spec.counter is not None and spec.counter_stat == "currency":
+                budget = self.counter_value
+            factor = FERTILIZERS.get(getattr(spec, "fertilizer", None), 1.0)
+            crops = get_planner(self.game).allocate(plots.size, spec.horizon, budget, stock, factor)
+        else:
+            crops = [spec.seed_type] * plots.size
+        if step == "buy" and stock:
+            for index, crop in enumerate(crops):
+                if stock.get(crop, 0) > 0:
+                    stock[crop] -= 1
+                    crops[index] = None
+        
+        groups: Dict[str, List[int]] = {}
+        for index, crop in enumerate(crops):
+            if crop is not None:
+                groups.setdefault(crop, []).append(index)
+        return [(spec if crop == spec.seed_type else spec.replace(seed_type=crop), plots[indices])
+                for crop, indices in groups.items()]
+    
+    def _garden_tick(self, groups: List[Tuple[TaskSpec, Any]], handler: Callable,
+                     with_plots: bool) -> Optional[TaskOutcome]:
+        """
+        Run a garden tick's handler on each group of plots, recording each in the model
+        
+        Args:
+            groups: From ``_garden_groups``
+            handler: Built-in handler or environment ``perform``
+            with_plots: Pass the group's plots to the handler (environments with a garden view)
+        """
+        outcome = None
+        for task, plots in groups:
+            self.plots = plots
+            result = TaskOutcome.coerce(handler(task, plots=plots.tolist()) if with_plots else handler(task))
+            self._garden_done(task, plots)
+            if outcome is None or result is None:
+                outcome = outcome or result
+            else:
+                outcome = TaskOutcome(items=outcome.items + result.items, currency=outcome.currency + result.currency,
+                                      xp=outcome.xp + result.xp)
+        return outcome
+    
+    def _wait_for_harvest(self, spec: TaskSpec):
+        """
+        Sleep until the next harvest is due
+        
+        The garden model's ripening times say when that is; changes that make
+        a crop ripen sooner (planting, watering, fertilizer, observations)
+        wake the task to recompute it. With nothing planted it waits the
+        task's delay, in case crops are planted where the model cannot see,
+        and until the garden has been observed it only ever waits the delay.
+        """
+        garden = self._garden_model()
+        if garden.observed is None:
+            self._sleep(spec.delay)
+            return
+        while not self.stop_event.is_set():
+            self._garden_wake.clear()
+            with garden.lock:
+                if self._garden_listener is None:
+                    self._garden_listener = functools.partial(self.clock.set, self._garden_wake)
+                    garden.add_listener(self._garden_listener)
+                due = garden.next_harvest(spec.harvest_window, getattr(spec, "crop_type", None))
+            now = self.clock.time()
+            if due is not None and due <= now:
+                # Ripe crops a failed tick left behind: retry after the delay
+                self._sleep(spec.delay)
+                return
+            wait = spec.delay if due is None else due - now + RIPEN_SLACK
+            if not self.clock.wait(self._garden_wake, wait):
+                return
+    
+    def _tick_plots(self, spec: TaskSpec):
+        """Plots the running tick picked, or a fresh pick when a handler is called directly"""
+        return self.plots if self.plots is not None else self._garden_plots(spec)
+    
+    def _garden_done(self, spec: TaskSpec, plots, step: Optional[str] = None):
+        """Record a garden step done on ``plots`` in the model"""
+        garden = self._garden_model()
+        with garden.lock:
+            garden.apply(step or GARDEN_STEPS[spec.type][0], plots, self.clock.time(),
+                         crop=getattr(spec, "seed_type", None), fertilizer=getattr(spec, "fertilizer", None))
+    
+    def _tend(self, spec: TaskSpec, step: str, plots) -> TaskOutcome:
+        """Work on the given plots, one after the other"""
+        if step == "plant":
+            logger.info("Planting %s seeds in %d plots", spec.seed_type, plots.size)
+        elif step == "buy":
+            logger.info("Buying %d %s seeds", plots.size, spec.seed_type)
+        elif step == "water":
+            logger.info("Watering %d plants", plots.size)
+        elif step == "fertilize":
+            logger.info("Fertilizing %d plants with %s", plots.size, spec.fertilizer)
+        else:
+            logger.info("Harvesting %d crops", plots.size)
+        self._sleep(PLOT_ACTION_TIME * plots.size)
+        return TaskOutcome(items=int(plots.size) if step == "harvest" else 0)
+    
+    def _sleep(self, seconds: float):
+        """Wait on the engine's clock; returns early once the engine is stopped"""
+        self.clock.wait(self.stop_event, seconds)
+    
+    # ========== SCREEN STATE ==========
+    
+    def _frames(self):
+        """
+        Get this engine's subscription to the shared frame service
+        
+        Vision is imported on first use (it loads NumPy). Engines on one
+        capture source share its frames: one grab per interval in total.
+        """
+        if self._subscription is None:
+            from vision.frames import get_frame_service
+            spec = self._specs[0]
+            region = spec.region if spec is not None else None
+            self._subscription = get_frame_service(self.capture, clock=self.clock).subscribe([region])
+        return self._subscription
+    
+    def _close_frames(self):
+        """Stop contributing regions to the shared capture"""
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+    
+    def detect(self, name: str, region: Optional[Tuple[int, int, int, int]] = None,
+               threshold: Optional[float] = None):
+        """
+        Look for a named template on screen
+        
+        Handlers call this to act on what is visible (a boss, a full
+        inventory, a ripe crop) instead of acting blindly.
+        
+        Args:
+            name: Template name in the template library (game folder first)
+            region: (left, top, width, height) to search (default: the task's region)
+            threshold: Minimum match score (default: the template's)
+            
+        Returns:
+            The best vision.matching.Match, or None if it is not visible
+            
+        Raises:
+            KeyError: If the template does not exist
+        """
+        from vision.templates import get_template_library
+        template = get_template_library().get(name, game=self.game)
+        subscription = self._frames()
+        if region is None and self._specs[0] is not None:
+            region = self._specs[0].region
+        subscription.add(region)
+        return subscription.frame().find(template, region, threshold)
+    
+    def detect_all(self, names: List[str], region: Optional[Tuple[int, int, int, int]] = None,
+                   threshold: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Look for several named templates on the same frame
+        
+        Large batches are matched in the shared process pool rather than in
+        this engine's thread.
+        
+        Args:
+            names: Template names in the template library
+            region: (left, top, width, height) to search (default: the task's region)
+            threshold: Minimum match score (default: each template's)
+            
+        Returns:
+            Name -> best vision.matching.Match, or None where not visible
+            
+        Raises:
+            KeyError: If a template does not exist
+        """
+        from vision.pool import get_match_pool
+        from vision.templates import get_template_library
+        library = get_template_library()
+        templates = [library.get(name, game=self.game) for name in dict.fromkeys(names)]
+        subscription = self._frames()
+        if region is None and self._specs[0] is not None:
+            region = self._specs[0].region
+        subscription.add(region)
+        found = get_match_pool().find_many(subscription.frame(), templates, region, threshold)
+        return {name: (found[name][0] if found[name] else None) for name in dict.fromkeys(names)}
+    
+    def probe(self) -> Dict[str, bool]:
+        """
+        Check every pixel probe of this engine's game on the current frame
+        
+        All probes are read with one vectorized index into the shared frame,
+        so asking for one or fifty costs the same.
+        
+        Returns:
+            Probe name -> whether its pixel has the expected colour
+        """
+        from vision.templates import get_template_library
+        probes = get_template_library().probes(self.game)
+        if not len(probes):
+            return {}
+        subscription = self._frames()
+        subscription.add(probes.region)
+        frame = subscription.frame()
+        return probes.check(frame.rgb, frame.origin)
+    
+    def classify(self) -> Optional[str]:
+        """
+        Label the current screen with this engine's game's state model
+        
+        Returns:
+            State name, or None if there is no model or the screen is unlike
+            every state it was trained on
+        """
+        from vision.templates import get_template_library
+        model = get_template_library().states(self.game)
+        if model is None:
+            return None
+        subscription = self._frames()
+        subscription.add(model.region)
+        return model.label(subscription.frame().crop(model.region))
+    
+    def _branch(self, spec: TaskSpec, branches: Dict[str, Optional[TaskSpec]]) -> Optional[TaskSpec]:
+        """
+        Pick the spec to run for the current screen state
+        
+        States without a branch (and unknown screens) run the task itself; a
+        failed classification does too, so a broken capture does not stall it.
+        A counter at or above ``full_at`` picks the "full" branch before the
+        screen is looked at.
+        """
+        if ("full" in branches and spec.full_at is not None and self.counter_value is not None
+                and self.counter_value >= spec.full_at):
+            return branches["full"]
+        try:
+            state = self.classify()
+        except Exception as e:
+            logger.error("Error classifying the screen for %s: %s", spec.type, e)
+            self.stats["errors"] += 1
+            return spec
+        if state != self.screen_state:
+            logger.info("[%s] Screen state: %s", self.game or spec.type, state or "unknown")
+            self.screen_state = state
+        if state is None or state not in branches:
+            return spec
+        return branches[state]
+    
+    def read_counter(self, region: Tuple[int, int, int, int]) -> Optional[float]:
+        """
+        Read a number shown on screen (coins, pollen, level)
+        
+        Args:
+            region: (left, top, width, height) tightly around the number
+            
+        Returns:
+            The value, or None if it could not be read
+            
+        Raises:
+            KeyError: If the game has no calibrated glyph bank
+        """
+        from vision.templates import get_template_library
+        bank = get_template_library().glyphs(self.game)
+        if bank is None:
+            raise KeyError(f"No glyph bank for {self.game or 'shared templates'}; calibrate one first")
+        subscription = self._frames()
+        subscription.add(region)
+        return bank.value(subscription.frame().crop(region))
+    
+    def _update_counter(self, spec: TaskSpec) -> Optional[float]:
+        """
+        Read the task's counter, keeping the last good value
+        
+        Increases since the last reading are banked for the next acted tick;
+        decreases (selling, spending) are not counted.
+        """
+        try:
+            value = self.read_counter(spec.counter)
+        except Exception as e:
+            logger.error("Error reading counter for %s: %s", spec.type, e)
+            self.stats["errors"] += 1
+            return None
+        if value is None:
+            return None
+        if self.counter_value is not None and value > self.counter_value:
+            self._counter_gain += value - self.counter_value
+        self.counter_value = value
+        return value
+    
+    def _credit_counter(self, spec: TaskSpec, outcome: Optional[TaskOutcome]) -> TaskOutcome:
+        """
+        Replace the counted stat of a tick's outcome with the counter's gain
+        
+        The screen updates after the action, so a tick is credited with what
+        the counter gained since the previous tick read it.
+        """
+        outcome = outcome or TaskOutcome()
+        gain = self._counter_gain
+        self._counter_gain = 0.0
+        setattr(outcome, spec.counter_stat, int(gain) if spec.counter_stat == "items" else gain)
+        return outcome
+    
+    def _conditions_met(self, spec: TaskSpec) -> bool:
+        """
+        Check a spec's when/unless names (a failed check counts as not met)
+        
+        Each is a comma-separated list of pixel probe or template names; probes
+        are checked first and all at once, templates only when needed (and
+        as one pooled batch when there are many of them).
+        """
+        try:
+            wanted = [name.strip() for name in (spec.when or "").split(",") if name.strip()]
+            banned = [name.strip() for name in (spec.unless or "").split(",") if name.strip()]
+            from vision.templates import get_template_library
+            probe_set = get_template_library().probes(self.game)
+            probes = self.probe() if any(name in probe_set for name in wanted + banned) else {}
+            templates = [name for name in wanted + banned if name not in probe_set]
+            from vision.pool import MIN_POOL_TEMPLATES
+            matched = self.detect_all(templates) if len(set(templates)) >= MIN_POOL_TEMPLATES else {}
+            
+            def visible(name: str) -> bool:
+                if name in probes:
+                    return probes[name]
+                if name in matched:
+                    return matched[name] is not None
+                return self.detect(name) is not None
+            
+            return all(visible(name) for name in wanted) and not any(visible(name) for name in banned)
+        except Exception as e:
+            logger.error("Error checking screen conditions for %s: %s", spec.type, e)
+            self.stats["errors"] += 1
+            return False
+    
+    def _watch_changed(self, spec: TaskSpec) -> bool:
+        """
+        Check whether a spec's watched region changed since the last action
+        
+        The first check, a change, or ``watch_timeout`` seconds of holding
+        release the tick. A failed check releases it too, so a broken capture
+        degrades to acting on the timer.
+        """
+        from vision.changes import DEFAULT_THRESHOLD, ChangeDetector
+        now = self.clock.monotonic()
+        detector = self._watcher
+        if detector is None or detector.region != spec.watch:
+            detector = self._watcher = ChangeDetector(spec.watch, spec.watch_threshold or DEFAULT_THRESHOLD)
+        try:
+            subscription = self._frames()
+            subscription.add(spec.watch)
+            changed = detector.check(subscription.frame())
+        except Exception as e:
+            logger.error("Error watching %s for %s: %s", spec.watch, spec.type, e)
+            self.stats["errors"] += 1
+            changed = True
+        if not changed and spec.watch_timeout is not None and self._held_since is not None:
+            changed = now - self._held_since >= spec.watch_timeout
+        if changed:
+            detector.accept()
+            self._held_since = None
+        elif self._held_since is None:
+            self._held_since = now
+            self.stats["deferred"] += 1
+        return changed
+    
+    def _record_outcome(self, spec: TaskSpec, outcome: Optional[TaskOutcome]):
+        """Account a tick's outcome in the stats and the rolling yield tracker"""
+        if outcome is not None:
+            self.stats["items"] += outcome.items
+            self.stats["currency"] += outcome.currency
+            self.stats["xp"] += outcome.xp
+        self.yield_tracker.record(spec.type, spec.param_key, outcome, now=self.clock.time())
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """Get a fresh statistics dict"""
+        return {
+            "runtime": 0,
+            "actions_performed": 0,
+            "skipped": 0,
+            "deferred": 0,
+            "errors": 0,
+            "items": 0,
+            "currency": 0.0,
+            "xp": 0.0
+        }
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current automation statistics"""
         return self.stats.copy()
+    
+    def get_yield_report(self) -> List[Dict[str, Any]]:
+        """Get rolling yield-per-hour per task type and parameter set"""
+        return self.yield_tracker.report(now=self.clock.time())
@@ -4,10 +4,13 @@ Framework for creating and managing Roblox bots
 """
 
 import logging
-import time
 import threading
+import time
 from typing import Dict, Any, List, Optional
 from enum import Enum
+from core.clock import Clock, system_clock
+from core.thread_registry import get_thread_registry
+from core.shutdown import get_shutdown_coordinator
 
 logger = logging.getLogger(__name__)
 
@@ -22,38 +25,73 @@ class BotType(Enum):
 class Bot:
     """Individual bot instance"""
     
-    def __init__(self, bot_id: str, bot_type: BotType, config: Dict[str, Any]):
+    def __init__(self, bot_id: str, bot_type: BotType, config: Dict[str, Any], clock: Optional[Clock] = None):
         self.bot_id = bot_id
         self.bot_type = bot_type
         self.config = config
         self.is_active = False
+        self.clock = clock or system_clock
+        self.stop_event = threading.Event()
         self.thread: Optional[threading.Thread] = None
         self.stats = {
             "visits": 0,
             "runtime": 0,
             "errors": 0
         }
+        get_shutdown_coordinator().register(self, f"Bot[{bot_id}]")
         
     def start(self):
         """Start bot"""
         if self.is_active:
             return False
+        if self.thread is not None and self.thread.is_alive():
+            logger.warning("Bot %s: previous thread has not exited yet", self.bot_id)
+            return False
+        self.stop_event.clear()
         self.is_active = True
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self.thread.start()
+        self.thread = get_thread_registry().spawn(
+            self._run, owner="BotFramework", purpose=f"{self.bot_type.value} loop", name=f"bot-{self.bot_id}"
+        )
+        self.clock.add_participant()
+        try:
+            self.thread.start()
+        except BaseException:
+            self.clock.remove_participant()
+            raise
+        return True
+    
+    def stop(self, timeout: float = 5.0) -> bool:
+        """Stop bot; returns True if its thread exited within ``timeout`` seconds"""
+        self.request_stop()
+        if not self.join(timeout):
+            logger.warning("Bot %s did not exit within %.1fs", self.bot_id, timeout)
+            return False
         return True
     
-    def stop(self):
-        """Stop bot"""
+    def request_stop(self) -> bool:
+        """Signal the bot to stop without waiting; returns True if its thread was running"""
+        running = self.thread is not None and self.thread.is_alive()
         self.is_active = False
-        if self.thread:
-            self.thread.join(timeout=5)
+        self.clock.set(self.stop_event)
+        get_thread_registry().stop_requested(self.thread)
+        return running
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the bot's thread; returns True if it is not running"""
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join(timeout=timeout)
+            return not self.thread.is_alive()
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bot statistics"""
+        return self.stats.copy()
     
     def _run(self):
         """Bot execution loop"""
-        start_time = time.time()
+        start_time = self.clock.time()
         try:
-            while self.is_active:
+            while not self.stop_event.is_set():
                 if self.bot_type == BotType.VISIT_BOT:
                     self._visit_game()
                 elif self.bot_type == BotType.SERVER_BOT:
@@ -61,20 +99,23 @@ class Bot:
                 elif self.bot_type == BotType.FOLLOW_BOT:
                     self._follow_user()
                 else:
-                    time.sleep(1)
+                    self.clock.wait(self.stop_event, 1)
                 
-                self.stats["runtime"] = int(time.time() - start_time)
-                time.sleep(self.config.get("delay", 5))
+                self.stats["runtime"] = int(self.clock.time() - start_time)
+                self.clock.wait(self.stop_event, self.config.get("delay", 5))
         except Exception as e:
-            logger.error(f"Error in bot {self.bot_id}: {e}")
+            logger.error("Error in bot %s: %s", self.bot_id, e)
             self.stats["errors"] += 1
+        finally:
+            self.is_active = False
+            self.clock.remove_participant()
     
     def _visit_game(self):
         """Visit a game"""
         game_id = self.config.get("game_id")
         if game_id:
             # Implementation would use Roblox API
-            logger.info(f"Bot {self.bot_id} visiting game {game_id}")
+            logger.info("Bot %s visiting game %s", self.bot_id, game_id)
             self.stats["visits"] += 1
     
     def _join_server(self):
@@ -82,25 +123,26 @@ class Bot:
         game_id = self.config.get("game_id")
         server_id = self.config.get("server_id")
         if game_id:
-            logger.info(f"Bot {self.bot_id} joining server {server_id} in game {game_id}")
+            logger.info("Bot %s joining server %s in game %s", self.bot_id, server_id, game_id)
     
     def _follow_user(self):
         """Follow a user"""
         user_id = self.config.get("user_id")
         if user_id:
-            logger.info(f"Bot {self.bot_id} following user {user_id}")
+            logger.info("Bot %s following user %s", self.bot_id, user_id)
 
 class BotFramework:
     """Manages multiple bot instances"""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
         self.bots: Dict[str, Bot] = {}
+        self.clock = clock or system_clock
         
     def create_bot(self, bot_id: str, bot_type: BotType, config: Dict[str, Any]) -> Bot:
         """Create a new bot"""
-        bot = Bot(bot_id, bot_type, config)
+        bot = Bot(bot_id, bot_type, config, clock=self.clock)
         self.bots[bot_id] = bot
-        logger.info(f"Created bot {bot_id} of type {bot_type.value}")
+        logger.info("Created bot %s of type %s", bot_id, bot_type.value)
         return bot
     
     def start_bot(self, bot_id: str) -> bool:
@@ -116,6 +158,23 @@ class BotFramework:
             return True
         return False
     
+    def stop_all(self, timeout: float = 5.0) -> List[str]:
+        """
+        Stop every bot, signalling all of them before waiting on any
+        
+        Args:
+            timeout: Seconds shared by all bots, not per bot
+            
+        Returns:
+            IDs of bots whose threads did not exit in time
+        """
+        running = [bot for bot in self.bots.values() if bot.request_stop()]
+        deadline = time.monotonic() + timeout
+        missed = [bot.bot_id for bot in running if not bot.join(max(0.0, deadline - time.monotonic()))]
+        if missed:
+            logger.warning("Bots did not exit within %.1fs: %s", timeout, ", ".join(missed))
+        return missed
+    
     def remove_bot(self, bot_id: str) -> bool:
         """Remove a bot"""
         if bot_id in self.bots:
@@ -131,6 +190,6 @@ class BotFramework:
     def get_bot_stats(self, bot_id: str) -> Optional[Dict[str, Any]]:
         """Get bot statistics"""
         if bot_id in self.bots:
-            return self.bots[bot_id].stats.copy()
+            return self.bots[bot_id].get_stats()
         return None
 
@@ -0,0 +1,293 @@
+"""
+Clock
+Injectable time source for the engine, bots and macros
+
+Everything that decides *when* something happens asks a ``Clock`` instead of
+calling ``time.time()``/``time.sleep()`` directly. ``SystemClock`` is the
+real thing. ``SimulatedClock`` keeps virtual time that jumps straight to the
+next sleeper's wake-up, so hours of delays and backoff run in milliseconds.
+
+Threads that sleep on a simulated clock are released one at a time in
+(wake time, arrival) order, which makes runs repeatable. A thread must be
+announced with ``add_participant()`` before it starts (and removed when it
+ends) so the clock knows to wait for it before moving time on.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class Clock:
+    """Source of time; the base implementation is real time"""
+
+    def time(self) -> float:
+        """Get wall-clock time in seconds since the epoch"""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Get a monotonic time in seconds, for measuring intervals"""
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        """Block the calling thread for ``seconds``"""
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        """Wait until ``event`` is set or ``timeout`` passes; returns whether it is set"""
+        return event.wait(timeout)
+
+    def set(self, event: threading.Event):
+        """Set an event, waking threads waiting on it through this clock"""
+        event.set()
+
+    def add_participant(self):
+        """Announce a thread that will sleep on this clock (call before starting it)"""
+
+    def remove_participant(self):
+        """Retire a thread announced with ``add_participant`` (call as it exits)"""
+
+class SystemClock(Clock):
+    """The real clock"""
+
+system_clock = SystemClock()
+
+# Real seconds between checks of an event a simulated waiter is blocked on.
+# ``SimulatedClock.set`` wakes waiters at once; polling only catches events
+# set directly with ``event.set()``
+_EVENT_POLL = 0.05
+
+class _Sleeper:
+    """A thread blocked on a simulated clock"""
+
+    __slots__ = ("wake", "seq", "event", "cond", "released", "cancelled")
+
+    def __init__(self, wake: float, seq: int, event: Optional[threading.Event], cond: threading.Condition):
+        self.wake = wake
+        self.seq = seq
+        self.event = event
+        self.cond = cond
+        self.released = False
+        self.cancelled = False
+
+    def __lt__(self, other: "_Sleeper") -> bool:
+        return (self.wake, self.seq) < (other.wake, other.seq)
+
+class SimulatedClock(Clock):
+    """
+    Virtual time that advances instantly
+
+    With ``auto_advance`` (the default) time jumps to the earliest wake-up
+    as soon as every participant is blocked, so code simply runs to
+    completion as fast as it can. With ``auto_advance=False`` time only
+    moves when a driver calls ``advance()``/``run_for()``, which lets a test
+    or what-if script stop at an exact virtual time and inspect state.
+    """
+
+    def __init__(self, start: float = 0.0, auto_advance: bool = True, settle_timeout: float = 5.0):
+        """
+        Args:
+            start: Initial virtual time (what ``time()`` returns)
+            auto_advance: Advance whenever every participant is blocked
+            settle_timeout: Real seconds ``advance()`` waits for a released thread to block again
+        """
+        self._now = float(start)
+        self._start = self._now
+        self.auto_advance = auto_advance
+        self.settle_timeout = settle_timeout
+        self._lock = threading.Lock()
+        # Notified when a participant blocks or leaves; each sleeper has its own condition
+        self._changed = threading.Condition(self._lock)
+        self._sleepers: List[_Sleeper] = []
+        self._cancelled = 0
+        self._seq = itertools.count()
+        self._participants = 0
+        self._blocked = 0
+        self._closed = False
+
+    # ========== CLOCK ==========
+
+    def time(self) -> float:
+        """Get the virtual time"""
+        return self._now
+
+    def monotonic(self) -> float:
+        """Get the virtual time (virtual time never goes backwards)"""
+        return self._now
+
+    def sleep(self, seconds: float):
+        """Block until virtual time reaches now + ``seconds``"""
+        self._block(seconds, None)
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        """Wait until ``event`` is set or ``timeout`` virtual seconds pass"""
+        if event.is_set():
+            return True
+        self._block(timeout, event)
+        return event.is_set()
+
+    def set(self, event: threading.Event):
+        """Set an event and wake the threads waiting on it"""
+        event.set()
+        with self._lock:
+            # Count the waiters as running right away: if the setter blocks
+            # before they notice, time must not move past their wake-up
+            for sleeper in [entry for entry in self._sleepers if entry.event is event]:
+                if not sleeper.released and not sleeper.cancelled:
+                    self._cancel(sleeper)
+                    sleeper.released = True
+                    self._blocked -= 1
+                    sleeper.cond.notify()
+            self._changed.notify_all()
+
+    def add_participant(self):
+        """Announce a thread; time will not move while it runs"""
+        with self._lock:
+            self._participants += 1
+
+    def remove_participant(self):
+        """Retire a thread and let time move on without it"""
+        with self._lock:
+            self._participants = max(0, self._participants - 1)
+            self._changed.notify_all()
+            self._maybe_advance()
+
+    # ========== SIMULATION ==========
+
+    @property
+    def elapsed(self) -> float:
+        """Virtual seconds since the clock was created"""
+        return self._now - self._start
+
+    def pending(self) -> int:
+        """Get the number of threads blocked on the clock"""
+        with self._lock:
+            return self._blocked
+
+    def advance(self, seconds: float):
+        """
+        Move virtual time forward by ``seconds``, releasing sleepers in order
+
+        Each released thread runs until it blocks on the clock again before
+        the next one is released. Intended for ``auto_advance=False``.
+        """
+        self.advance_to(self._now + max(0.0, seconds))
+
+    def run_for(self, seconds: float):
+        """Alias of ``advance`` reading better in what-if scripts"""
+        self.advance(seconds)
+
+    def advance_to(self, target: float):
+        """Move virtual time forward to ``target``"""
+        with self._lock:
+            while True:
+                self._settle()
+                sleeper = self._next_sleeper()
+                if sleeper is None or sleeper.wake > target:
+                    self._now = max(self._now, target)
+                    return
+                self._release(sleeper)
+
+    def run_until(self, predicate: Callable[[], bool], limit: float, step: float = 1.0) -> bool:
+        """
+        Advance in ``step`` increments until ``predicate()`` is true
+
+        Returns False if ``limit`` virtual seconds pass first.
+        """
+        deadline = self._now + limit
+        while not predicate():
+            if self._now >= deadline:
+                return False
+            self.advance_to(min(deadline, self._now + step))
+        return True
+
+    def close(self):
+        """Release every sleeper and let all later sleeps return immediately"""
+        with self._lock:
+            self._closed = True
+            for sleeper in self._sleepers:
+                if not sleeper.cancelled and not sleeper.released:
+                    sleeper.released = True
+                    self._blocked -= 1
+                    sleeper.cond.notify()
+            self._sleepers.clear()
+            self._cancelled = 0
+            self._changed.notify_all()
+
+    # ========== INTERNALS ==========
+
+    def _block(self, seconds: Optional[float], event: Optional[threading.Event]):
+        """Sleep until released by the clock (or until ``event`` is set)"""
+        with self._lock:
+            if self._closed:
+                return
+            wake = float("inf") if seconds is None else self._now + max(0.0, seconds)
+            sleeper = _Sleeper(wake, next(self._seq), event, threading.Condition(self._lock))
+            heapq.heappush(self._sleepers, sleeper)
+            self._blocked += 1
+            self._changed.notify_all()
+            self._maybe_advance()
+            while not sleeper.released:
+                if event is not None and event.is_set():
+                    self._cancel(sleeper)
+                    self._blocked -= 1
+                    self._changed.notify_all()
+                    return
+                sleeper.cond.wait(_EVENT_POLL if event is not None else None)
+
+    def _next_sleeper(self) -> Optional[_Sleeper]:
+        """Get the earliest live sleeper with a finite wake time (lock held)"""
+        while self._sleepers and self._sleepers[0].cancelled:
+            heapq.heappop(self._sleepers)
+            self._cancelled -= 1
+        if not self._sleepers or self._sleepers[0].wake == float("inf"):
+            return None
+        return self._sleepers[0]
+
+    def _cancel(self, sleeper: _Sleeper):
+        """Drop a waiter whose event was set (lock held)"""
+        sleeper.cancelled = True
+        self._cancelled += 1
+        # Cancelled entries are skipped when they reach the top, but untimed
+        # waits never do; rebuild once they make up half of the heap
+        if self._cancelled * 2 > len(self._sleepers):
+            self._sleepers = [entry for entry in self._sleepers if not entry.cancelled]
+            heapq.heapify(self._sleepers)
+            self._cancelled = 0
+
+    def _release(self, sleeper: _Sleeper):
+        """Move time to a sleeper's wake-up and let it run (lock held)"""
+        if self._sleepers and self._sleepers[0] is sleeper:
+            heapq.heappop(self._sleepers)
+        if sleeper.wake != float("inf"):
+            self._now = max(self._now, sleeper.wake)
+        sleeper.released = True
+        self._blocked -= 1
+        sleeper.cond.notify()
+
+    def _quiet(self) -> bool:
+        """True when every participant is blocked on the clock (lock held)"""
+        return self._blocked >= self._participants
+
+    def _maybe_advance(self):
+        """Release the next sleeper if nobody else can run (lock held)"""
+        if self.auto_advance and not self._closed and self._quiet():
+            sleeper = self._next_sleeper()
+            if sleeper is not None:
+                self._release(sleeper)
+
+    def _settle(self):
+        """Wait until every participant is blocked again (lock held)"""
+        deadline = time.monotonic() + self.settle_timeout
+        while not self._quiet():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("Simulated clock: %d participant(s) still running after %.1fs",
+                               self._participants - self._blocked, self.settle_timeout)
+                return
+            self._changed.wait(remaining)
@@ -1,71 +1,307 @@
 """
 Configuration Manager
 Handles loading and saving of user configuration
+
+A single process-wide ConfigService caches the configuration document,
+writes it atomically (temp file + rename) with debounced batched saves, and
+polls the file's mtime so external edits are pushed to subscribers.
 """
 
+import copy
 import json
+import logging
 import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Optional
+from core.thread_registry import get_thread_registry
+from core.shutdown import get_shutdown_coordinator
 
-class ConfigManager:
-    """Manages application configuration"""
-    
-    def __init__(self):
-        self.config_dir = Path("config")
+logger = logging.getLogger(__name__)
+
+ConfigListener = Callable[[Dict[str, Any]], None]
+
+def _default_config() -> Dict[str, Any]:
+    """Get default configuration"""
+    return {
+        "api_key": "YOUR_API_KEY_HERE",
+        "api_secret": "YOUR_SECRET_HERE",
+        "roblox_cookie": "",
+        "auto_start": False,
+        "theme": "dark",
+        "window_size": {"width": 1200, "height": 800},
+        "shutdown_timeout": 5.0,
+        "features": {
+            "script_executor": True,
+            "auto_farm": True,
+            "macro": True,
+            "visit_bot": True,
+            "server_bot": False
+        },
+        "game_configs": {}
+    }
+
+class ConfigService:
+    """Process-wide cached configuration document with atomic, debounced saves"""
+
+    def __init__(self, config_dir: Path = Path("config"), save_delay: float = 0.5, poll_interval: float = 1.0):
+        self.config_dir = Path(config_dir)
         self.config_file = self.config_dir / "config.json"
         self.template_file = self.config_dir / "config_template.json"
-        self.config_dir.mkdir(exist_ok=True)
-        
-    def load_config(self) -> Dict[str, Any]:
-        """Load configuration from file or create default"""
+        self.save_delay = save_delay
+        self.poll_interval = poll_interval
+        self._lock = threading.RLock()
+        self._document: Optional[Dict[str, Any]] = None
+        self._mtime: Optional[tuple] = None
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._listeners: List[ConfigListener] = []
+        self._watcher: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+
+    # ========== READING ==========
+
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        """Load the document from disk once (lock held)"""
+        if self._document is None:
+            self._document = self._read_from_disk()
+        return self._document
+
+    def _read_from_disk(self) -> Dict[str, Any]:
+        """Read config.json, creating it from the template on first run"""
         if self.config_file.exists():
             try:
                 with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                    document = json.load(f)
+                self._mtime = self._signature()
+                return document
             except Exception as e:
-                print(f"Error loading config: {e}")
-                return self._get_default_config()
-        else:
-            # Create from template if exists
-            if self.template_file.exists():
+                logger.error("Error loading config: %s", e)
+                return _default_config()
+
+        # Create from template if exists
+        if self.template_file.exists():
+            try:
+                with open(self.template_file, 'r') as f:
+                    document = json.load(f)
+                # Save as actual config
+                self._write(document)
+                return document
+            except Exception:
+                pass
+        return _default_config()
+
+    def load(self) -> Dict[str, Any]:
+        """Get a private copy of the configuration document"""
+        with self._lock:
+            return copy.deepcopy(self._ensure_loaded())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a top-level value (a copy, for mutable values)"""
+        with self._lock:
+            return copy.deepcopy(self._ensure_loaded().get(key, default))
+
+    def task_overrides(self, game: Optional[str], task_type: str) -> Dict[str, Any]:
+        """
+        Get task config overrides from ``game_configs``
+
+        ``game_configs[game]["delay"]`` applies to every task of the game and
+        ``game_configs[game][task_type]`` (a dict) to one task type.
+        """
+        if not game:
+            return {}
+        with self._lock:
+            game_config = self._ensure_loaded().get("game_configs", {}).get(game)
+            if not isinstance(game_config, dict):
+                return {}
+            overrides = {}
+            if "delay" in game_config:
+                overrides["delay"] = game_config["delay"]
+            task_config = game_config.get(task_type)
+            if isinstance(task_config, dict):
+                overrides.update(copy.deepcopy(task_config))
+            return overrides
+
+    # ========== WRITING ==========
+
+    def update(self, changes: Dict[str, Any]):
+        """Merge top-level changes into the document and schedule a save"""
+        with self._lock:
+            self._ensure_loaded().update(copy.deepcopy(changes))
+            self._mark_dirty()
+        self._notify()
+
+    def replace(self, document: Dict[str, Any]):
+        """Replace the whole document and schedule a save"""
+        with self._lock:
+            self._document = copy.deepcopy(document)
+            self._mark_dirty()
+        self._notify()
+
+    def _mark_dirty(self):
+        """Debounce: (re)start the save timer so bursts of changes are written once (lock held)"""
+        self._dirty = True
+        self._cancel_save()
+        self._save_timer = threading.Timer(self.save_delay, self.flush)
+        self._save_timer.daemon = True
+        get_thread_registry().register(self._save_timer, owner="ConfigService", purpose="debounced config save",
+                                       name="config-save")
+        self._save_timer.start()
+
+    def _cancel_save(self):
+        """Cancel the pending save timer, if any (lock held)"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            get_thread_registry().stop_requested(self._save_timer)
+            self._save_timer = None
+
+    def flush(self) -> bool:
+        """Write pending changes now"""
+        with self._lock:
+            self._cancel_save()
+            if not self._dirty:
+                return True
+            try:
+                self._write(self._document)
+                self._dirty = False
+                return True
+            except Exception as e:
+                logger.error("Error saving config: %s", e)
+                return False
+
+    def _write(self, document: Dict[str, Any]):
+        """Atomically write the document: temp file in the same directory, fsync, rename"""
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=self.config_dir)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(document, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_file)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._mtime = self._signature()
+
+    def _signature(self):
+        """Get (mtime_ns, size) of config.json; size catches edits within the mtime resolution"""
+        stat = self.config_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    # ========== CHANGE NOTIFICATIONS ==========
+
+    def subscribe(self, listener: ConfigListener) -> Callable[[], None]:
+        """
+        Call ``listener(document)`` whenever the configuration changes
+
+        Starts the file watcher on first use. Returns a function that removes
+        the listener. Listeners run on the thread that made the change (the
+        watcher thread for edits made outside the app) and receive a copy.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._listeners.append(listener)
+        self.start_watching()
+
+        def unsubscribe():
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+        return unsubscribe
+
+    def _notify(self):
+        """Push the current document to every listener"""
+        with self._lock:
+            listeners = list(self._listeners)
+            document = copy.deepcopy(self._document)
+        for listener in listeners:
+            try:
+                listener(document)
+            except Exception as e:
+                logger.error("Error in config listener: %s", e)
+
+    def start_watching(self):
+        """Start polling config.json's mtime for external edits"""
+        with self._lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._watch_stop.clear()
+            self._watcher = get_thread_registry().spawn(
+                self._watch, owner="ConfigService", purpose="config.json change polling", name="config-watcher"
+            )
+            self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the file watcher"""
+        self._watch_stop.set()
+        get_thread_registry().stop_requested(self._watcher)
+        if self._watcher is not None:
+            self._watcher.join(timeout=self.poll_interval * 2)
+            self._watcher = None
+
+    def _watch(self):
+        """Reload and notify when the file changes on disk"""
+        while not self._watch_stop.wait(self.poll_interval):
+            try:
+                mtime = self._signature()
+            except OSError:
+                continue
+            with self._lock:
+                if mtime == self._mtime or self._dirty:
+                    continue
                 try:
-                    with open(self.template_file, 'r') as f:
-                        config = json.load(f)
-                    # Save as actual config
-                    with open(self.config_file, 'w') as f:
-                        json.dump(config, f, indent=4)
-                    return config
-                except Exception:
-                    pass
-            return self._get_default_config()
-    
+                    with open(self.config_file, 'r') as f:
+                        document = json.load(f)
+                except (OSError, ValueError):
+                    # Mid-write by another program; retry on the next poll
+                    continue
+                self._document = document
+                self._mtime = mtime
+            logger.info("Configuration reloaded from %s", self.config_file)
+            self._notify()
+
+    def close(self):
+        """Flush pending changes and stop watching"""
+        self.stop_watching()
+        self.flush()
+
+_service: Optional[ConfigService] = None
+_service_lock = threading.Lock()
+
+def get_config_service() -> ConfigService:
+    """Get the process-wide configuration service"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ConfigService()
+            service = _service
+            get_shutdown_coordinator().add_flush("ConfigService", lambda remaining: service.close())
+        return _service
+
+class ConfigManager:
+    """Manages application configuration"""
+
+    def __init__(self):
+        self.service = get_config_service()
+        self.config_dir = self.service.config_dir
+        self.config_file = self.service.config_file
+        self.template_file = self.service.template_file
+        self.config_dir.mkdir(exist_ok=True)
+
+    def load_config(self) -> Dict[str, Any]:
+        """Load configuration (served from the shared in-memory cache)"""
+        return self.service.load()
+
     def save_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to file"""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
-            return True
-        except Exception as e:
-            print(f"Error saving config: {e}")
-            return False
-    
+        self.service.replace(config)
+        return self.service.flush()
+
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
-        return {
-            "api_key": "YOUR_API_KEY_HERE",
-            "api_secret": "YOUR_SECRET_HERE",
-            "roblox_cookie": "",
-            "auto_start": False,
-            "theme": "dark",
-            "window_size": {"width": 1200, "height": 800},
-            "features": {
-                "script_executor": True,
-                "auto_farm": True,
-                "macro": True,
-                "visit_bot": True,
-                "server_bot": False
-            },
-            "game_configs": {}
-        }
-
+        return _default_config()
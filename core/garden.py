@@ -0,0 +1,374 @@
+"""
+Garden Model
+Per-plot state of a Grow a Garden farm, kept as NumPy arrays
+
+Every plot has a stage (empty, growing, ripe), the crop in it, a moisture
+level, the fertilizer it got and the time it ripens, one array each. The
+engine updates the model from what its garden tasks did (planting sets the
+ripening time from the crop's grow time, fertilizer and watering shorten it)
+and from observations (``observe``: stages read off the screen, or the
+simulated game's own state), and asks it which plots need planting,
+watering, fertilizing or harvesting right now, so a tick only touches those.
+It also keeps the money and seeds on hand when they are known, which the
+planner (``core.garden_planner``) plans purchases with.
+
+Ripening times also go on a min-heap, so the next harvest is known without
+scanning the garden: harvest tasks sleep until it (``next_harvest``) instead
+of polling, and are woken early by listeners when a change to the garden
+makes a crop ripen sooner.
+
+Times are seconds on the engine's clock (``clock.time()``).
+"""
+
+import heapq
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+# Crop -> seed price, grow time (seconds) and produce price
+CROPS: Dict[str, Dict[str, float]] = {
+    "Carrot": {"seed_price": 10.0, "grow_time": 60.0, "sell_price": 18.0},
+    "Strawberry": {"seed_price": 50.0, "grow_time": 240.0, "sell_price": 110.0},
+    "Blueberry": {"seed_price": 120.0, "grow_time": 480.0, "sell_price": 290.0},
+    "Tomato": {"seed_price": 300.0, "grow_time": 900.0, "sell_price": 780.0},
+    "Watermelon": {"seed_price": 900.0, "grow_time": 1800.0, "sell_price": 2500.0},
+}
+# Grow time assumed for crops missing from the table
+DEFAULT_GROW_TIME = 300.0
+# Fertilizer -> fraction of the remaining grow time left after applying it
+FERTILIZERS: Dict[str, float] = {"Basic": 0.9, "Advanced": 0.8, "Premium": 0.7, "Mega": 0.6, "Ultra": 0.5}
+# Fraction of the remaining grow time watering a dry plot saves
+WATER_BOOST = 0.1
+# Seconds a watered plot stays moist (its moisture falls from 1 to 0)
+DRY_TIME = 60.0
+DEFAULT_PLOTS = 12
+
+EMPTY, GROWING, RIPE = 0, 1, 2
+STAGE_NAMES = ("empty", "growing", "ripe")
+
+class GardenModel:
+    """Stage, crop, moisture, fertilizer and ripening time of every plot"""
+
+    def __init__(self, plots: int = DEFAULT_PLOTS, crops: Optional[Dict[str, Dict[str, float]]] = None):
+        """
+        Args:
+            plots: Number of plots
+            crops: Crop table (default: ``CROPS``)
+        """
+        self.crops = {name: dict(stats) for name, stats in (crops if crops is not None else CROPS).items()}
+        self.crop_names: List[str] = list(self.crops)
+        self._grow_times = np.array([self.crops[name]["grow_time"] for name in self.crop_names], dtype=np.float64)
+        self.stage = np.zeros(plots, dtype=np.int8)
+        # Index into crop_names (-1: none)
+        self.crop = np.full(plots, -1, dtype=np.int16)
+        self.moisture = np.zeros(plots, dtype=np.float32)
+        # 1 + index into FERTILIZERS of the fertilizer applied this growth (0: none)
+        self.fertilizer = np.zeros(plots, dtype=np.int8)
+        self.ripe_at = np.full(plots, np.inf)
+        self._watered_at = np.full(plots, -np.inf)
+        # Time of the last observation (None: never observed, so the model
+        # does not know the garden and engines act on every plot)
+        self.observed: Optional[float] = None
+        # Money and seeds per crop on hand (None: unknown)
+        self.currency: Optional[float] = None
+        self.seeds: Optional[Dict[str, int]] = None
+        # Held by engines around each read-and-update (several tasks share a game's model)
+        self.lock = threading.RLock()
+        # (ripe_at, plot) min-heap; an entry is stale once the plot's ripe_at changed
+        self._deadlines: List[Tuple[float, int]] = []
+        # Called when the next ripening time moves earlier
+        self._listeners: List[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        return len(self.stage)
+
+    def _index(self, crop: Optional[str]) -> int:
+        """Index of a crop name; unknown crops are added with the default grow time"""
+        if crop is None:
+            return -1
+        try:
+            return self.crop_names.index(crop)
+        except ValueError:
+            self.crop_names.append(crop)
+            self._grow_times = np.append(self._grow_times, DEFAULT_GROW_TIME)
+            return len(self.crop_names) - 1
+
+    def grow_time(self, crop: Optional[str]) -> float:
+        """Seconds a crop takes to ripen"""
+        index = self._index(crop)
+        return float(self._grow_times[index]) if index >= 0 else DEFAULT_GROW_TIME
+
+    def set_crop(self, crop: str, **stats: float):
+        """Add a crop or change its seed_price, grow_time or sell_price"""
+        self.crops.setdefault(crop, {"seed_price": 0.0, "grow_time": DEFAULT_GROW_TIME, "sell_price": 0.0})
+        self.crops[crop].update(stats)
+        index = self._index(crop)
+        self._grow_times[index] = self.crops[crop]["grow_time"]
+
+    def resize(self, plots: int):
+        """Change the number of plots (new plots start empty)"""
+        extra = plots - len(self.stage)
+        if extra <= 0:
+            for name in ("stage", "crop", "moisture", "fertilizer", "ripe_at", "_watered_at"):
+                setattr(self, name, getattr(self, name)[:plots].copy())
+            return
+        self.stage = np.concatenate((self.stage, np.zeros(extra, dtype=np.int8)))
+        self.crop = np.concatenate((self.crop, np.full(extra, -1, dtype=np.int16)))
+        self.moisture = np.concatenate((self.moisture, np.zeros(extra, dtype=np.float32)))
+        self.fertilizer = np.concatenate((self.fertilizer, np.zeros(extra, dtype=np.int8)))
+        self.ripe_at = np.concatenate((self.ripe_at, np.full(extra, np.inf)))
+        self._watered_at = np.concatenate((self._watered_at, np.full(extra, -np.inf)))
+
+    def advance(self, now: float):
+        """Bring the stage and moisture arrays up to ``now`` (queries do not need it)"""
+        self.stage[(self.stage == GROWING) & (self.ripe_at <= now)] = RIPE
+        self.moisture[:] = np.clip(1.0 - (now - self._watered_at) / DRY_TIME, 0.0, 1.0)
+
+    # ========== QUERIES ==========
+    # Read from ripe_at and the watering times directly: a few array operations
+    # per query, and the stored stages may lag behind the clock
+
+    def _growing(self, now: float) -> np.ndarray:
+        """Mask of the plots still growing at ``now``"""
+        return (self.stage == GROWING) & (self.ripe_at > now)
+
+    def to_plant(self, now: float) -> np.ndarray:
+        """Indices of the empty plots"""
+        return np.flatnonzero(self.stage == EMPTY)
+
+    def to_water(self, now: float) -> np.ndarray:
+        """Indices of the growing plots that have dried out"""
+        return np.flatnonzero(self._growing(now) & (self._watered_at <= now - DRY_TIME))
+
+    def to_buy(self, now: float) -> np.ndarray:
+        """Plots that need seeds (empty, or ripe and about to be)"""
+        return np.flatnonzero(~self._growing(now))
+
+    def to_fertilize(self, now: float) -> np.ndarray:
+        """Indices of the growing plots without fertilizer"""
+        return np.flatnonzero(self._growing(now) & (self.fertilizer == 0))
+
+    def to_harvest(self, now: float, crop: Optional[str] = None) -> np.ndarray:
+        """Indices of the ripe plots (of one crop, unless ``crop`` is None or "All")"""
+        # Empty plots ripen at infinity
+        ripe = self.ripe_at <= now
+        if crop not in (None, "All"):
+            ripe &= self.crop == self._index(crop)
+        return np.flatnonzero(ripe)
+
+    def next_ripening(self) -> Optional[float]:
+        """Earliest ripening time of a planted plot (None if nothing is planted)"""
+        deadlines = self._deadlines
+        while deadlines:
+            ripe_at, plot = deadlines[0]
+            if plot < len(self.ripe_at) and self.ripe_at[plot] == ripe_at:
+                return ripe_at
+            heapq.heappop(deadlines)
+        return None
+
+    def next_harvest(self, window: float = 0.0, crop: Optional[str] = None) -> Optional[float]:
+        """
+        When to harvest next
+
+        Args:
+            window: Wait up to this many seconds past the first ripening for
+                more crops to ripen, and harvest them together
+            crop: Only consider this crop (None or "All": every crop)
+
+        Returns:
+            Time the batch is ripe (possibly already past), or None if nothing
+            is planted
+        """
+        ripe_at = self.ripe_at
+        if crop not in (None, "All"):
+            ripe_at = ripe_at[self.crop == self._index(crop)]
+            first = float(ripe_at.min()) if ripe_at.size and np.isfinite(ripe_at.min()) else None
+        else:
+            first = self.next_ripening()
+        if first is None or window <= 0.0:
+            return first
+        return float(ripe_at[ripe_at <= first + window].max())
+
+    def add_listener(self, callback: Callable[[], None]):
+        """Call ``callback`` (lock held) whenever a crop will ripen sooner than the next one did"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]):
+        """Stop calling a listener added with ``add_listener``"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def select(self, step: str, now: float, crop: Optional[str] = None) -> np.ndarray:
+        """
+        Plots a garden step should act on now
+
+        Args:
+            step: "plant", "buy", "water", "fertilize" or "harvest"
+            now: Current time
+            crop: Only harvest this crop
+
+        Returns:
+            Plot indices; every plot until the garden is observed, since
+            then the model cannot tell which plots need the step
+        """
+        if self.observed is None:
+            return np.arange(len(self.stage))
+        if step == "harvest":
+            return self.to_harvest(now, crop)
+        return getattr(self, f"to_{step}")(now)
+
+    def counts(self, now: float) -> Dict[str, int]:
+        """Number of plots in each stage"""
+        self.advance(now)
+        totals = np.bincount(self.stage, minlength=len(STAGE_NAMES))
+        return {name: int(total) for name, total in zip(STAGE_NAMES, totals)}
+
+    # ========== UPDATES ==========
+
+    def planted(self, plots: np.ndarray, crop: Optional[str], now: float):
+        """Record seeds planted in ``plots``"""
+        index = self._index(crop)
+        self.stage[plots] = GROWING
+        self.crop[plots] = index
+        self.fertilizer[plots] = 0
+        self._watered_at[plots] = -np.inf
+        self.moisture[plots] = 0.0
+        self.ripe_at[plots] = now + (self._grow_times[index] if index >= 0 else DEFAULT_GROW_TIME)
+        self._schedule(plots)
+        if self.seeds is not None and crop is not None:
+            self.seeds[crop] = max(self.seeds.get(crop, 0) - len(plots), 0)
+
+    def bought(self, plots: np.ndarray, crop: Optional[str]):
+        """Record a seed bought for each of ``plots`` (seeds are counted from the first purchase on)"""
+        if crop not in self.crops:
+            return
+        if self.seeds is None:
+            self.seeds = {}
+        self.seeds[crop] = self.seeds.get(crop, 0) + len(plots)
+        if self.currency is not None:
+            self.currency = max(self.currency - self.crops.get(crop, {}).get("seed_price", 0.0) * len(plots), 0.0)
+
+    def watered(self, plots: np.ndarray, now: float):
+        """Record ``plots`` watered; dry growing plots ripen sooner"""
+        plots = np.asarray(plots, dtype=np.intp)
+        dry = plots[self._growing(now)[plots] & (self._watered_at[plots] <= now - DRY_TIME)]
+        self.ripe_at[dry] -= (self.ripe_at[dry] - now) * WATER_BOOST
+        self._schedule(dry)
+        self._watered_at[plots] = now
+        self.moisture[plots] = 1.0
+
+    def fertilized(self, plots: np.ndarray, fertilizer: str, now: float):
+        """Record ``fertilizer`` applied to ``plots`` (once per growth)"""
+        plots = np.asarray(plots, dtype=np.intp)
+        fresh = plots[self._growing(now)[plots] & (self.fertilizer[plots] == 0)]
+        names = list(FERTILIZERS)
+        level = names.index(fertilizer) + 1 if fertilizer in FERTILIZERS else 1
+        self.ripe_at[fresh] = now + (self.ripe_at[fresh] - now) * FERTILIZERS.get(fertilizer, 1.0)
+        self.fertilizer[fresh] = level
+        self._schedule(fresh)
+
+    def harvested(self, plots: np.ndarray):
+        """Record ``plots`` harvested (they are empty again)"""
+        self.stage[plots] = EMPTY
+        self.crop[plots] = -1
+        self.fertilizer[plots] = 0
+        self.ripe_at[plots] = np.inf
+        self._watered_at[plots] = -np.inf
+        self.moisture[plots] = 0.0
+
+    def apply(self, step: str, plots: np.ndarray, now: float, crop: Optional[str] = None,
+              fertilizer: Optional[str] = None):
+        """Record a garden step done on ``plots`` (see ``select``)"""
+        if step == "plant":
+            self.planted(plots, crop, now)
+        elif step == "buy":
+            self.bought(plots, crop)
+        elif step == "water":
+            self.watered(plots, now)
+        elif step == "fertilize":
+            self.fertilized(plots, fertilizer or "Basic", now)
+        elif step == "harvest":
+            self.harvested(plots)
+        else:
+            raise ValueError(f"Unknown garden step {step!r}")
+
+    def observe(self, stages: Sequence[int], now: float, remaining: Optional[Sequence[float]] = None,
+                crops: Optional[Sequence[Optional[str]]] = None, moisture: Optional[Sequence[float]] = None,
+                currency: Optional[float] = None, seeds: Optional[Dict[str, int]] = None):
+        """
+        Correct the model with what the garden actually looks like
+
+        Args:
+            stages: Stage of every plot (EMPTY, GROWING or RIPE); a different
+                number of plots resizes the model
+            now: Time of the observation
+            remaining: Seconds until each plot ripens (NaN: unknown)
+            crops: Crop in each plot (None: unknown or empty)
+            moisture: Moisture of each plot (0-1)
+            currency: Money on hand
+            seeds: Seeds on hand per crop
+        """
+        stages = np.asarray(stages, dtype=np.int8)
+        if len(stages) != len(self.stage):
+            self.resize(len(stages))
+        self.advance(now)
+        before = self.ripe_at.copy()
+        self.harvested(np.flatnonzero(stages == EMPTY))
+
+        ripe = stages == RIPE
+        self.stage[ripe] = RIPE
+        self.ripe_at[ripe] = np.minimum(self.ripe_at[ripe], now)
+
+        growing = stages == GROWING
+        if crops is not None:
+            seen = np.array([self._index(crop) for crop in crops], dtype=np.int16)
+            known = (stages != EMPTY) & (seen >= 0)
+            self.crop[known] = seen[known]
+        # Growing where the model had nothing growing: estimate from the crop's grow time
+        new = growing & (self.stage != GROWING)
+        grow_times = np.where(self.crop[new] >= 0, self._grow_times[self.crop[new]], DEFAULT_GROW_TIME)
+        self.ripe_at[new] = now + grow_times
+        self.stage[growing] = GROWING
+        if remaining is not None:
+            remaining = np.asarray(remaining, dtype=np.float64)
+            timed = growing & np.isfinite(remaining)
+            self.ripe_at[timed] = now + np.maximum(remaining[timed], 0.0)
+        if moisture is not None:
+            moisture = np.clip(np.asarray(moisture, dtype=np.float64), 0.0, 1.0)
+            self._watered_at[:] = now - (1.0 - moisture) * DRY_TIME
+            self.moisture[:] = moisture
+        self.observed = now
+        if currency is not None:
+            self.currency = float(currency)
+        if seeds is not None:
+            self.seeds = dict(seeds)
+        self._schedule(np.flatnonzero((self.ripe_at != before) & np.isfinite(self.ripe_at)))
+
+    def _schedule(self, plots: np.ndarray):
+        """Push the ripening times of ``plots`` onto the deadline heap"""
+        plots = np.asarray(plots, dtype=np.intp)
+        if not plots.size:
+            return
+        first = self.next_ripening()
+        deadlines = self._deadlines
+        for ripe_at, plot in zip(self.ripe_at[plots].tolist(), plots.tolist()):
+            heapq.heappush(deadlines, (ripe_at, plot))
+        # Re-timed plots leave stale entries behind; rebuild once they pile up
+        if len(deadlines) > 4 * len(self.ripe_at) + 64:
+            planted = np.flatnonzero(np.isfinite(self.ripe_at))
+            deadlines[:] = list(zip(self.ripe_at[planted].tolist(), planted.tolist()))
+            heapq.heapify(deadlines)
+        if first is None or deadlines[0][0] < first:
+            for callback in list(self._listeners):
+                callback()
+
+_gardens: Dict[Optional[str], GardenModel] = {}
+_gardens_lock = threading.Lock()
+
+def get_garden(game: Optional[str] = None) -> GardenModel:
+    """Get the process-wide garden model of a game (shared by all its engines)"""
+    with _gardens_lock:
+        garden = _gardens.get(game)
+        if garden is None:
+            garden = _gardens[game] = GardenModel()
+        return garden
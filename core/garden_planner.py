@@ -0,0 +1,228 @@
+"""
+Garden Planner
+Profit-maximizing choice of the crops to plant and the seeds to buy
+
+A plot grows one crop after another. The most one plot can earn in the next
+T seconds is an unbounded knapsack over time,
+
+    best[T] = max(best[T - 1], max over crops c of best[T - grow_c] + sell_c - seed_c)
+
+filled on a grid of ``RESOLUTION`` seconds, where the crop taken for a span
+is the one planted first. Of equally good choices the crop that earns most
+per second wins, so a plan redone every tick does not keep putting a long
+crop off behind short ones that fill the same time. The table is kept and only
+extended when a longer horizon is asked for; it is rebuilt when a price or
+grow time in the crop table changes (the table is compared on every call,
+so editing the shared crop dict is enough to re-plan).
+
+Deciding what goes into the plots that are free now is a second knapsack,
+over plots and money: a crop is worth its first harvest plus the best use of
+the rest of the horizon, seeds in stock cost nothing, and bought seeds must
+fit the budget. Results are cached until an input changes.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from core.garden import CROPS, get_garden
+
+# Seconds per step of the time grid
+RESOLUTION = 10.0
+# Budget steps of the allocation knapsack (seed prices are rounded up to a step)
+BUDGET_STEPS = 400
+DEFAULT_HORIZON = 3600.0
+# Seed type that asks the planner to choose
+BEST_AVAILABLE = "Best Available"
+
+class GardenPlanner:
+    """Plans plantings and seed purchases over a crop table"""
+
+    def __init__(self, crops: Optional[Dict[str, Dict[str, float]]] = None, resolution: float = RESOLUTION):
+        """
+        Args:
+            crops: Crop -> seed_price, grow_time (seconds) and sell_price; the
+                dict is read on every call, so later edits are picked up
+            resolution: Seconds per step of the time grid
+        """
+        self.crops = crops if crops is not None else dict(CROPS)
+        self.resolution = resolution
+        self._signature: Tuple = ()
+        self._names: List[str] = []
+        self._profits = np.zeros(0)
+        self._costs = np.zeros(0)
+        self._grow = np.zeros(0)
+        # Grow-time factor -> (best profit per horizon step, crop to plant first, -1: wait)
+        self._tables: Dict[float, Tuple[np.ndarray, np.ndarray]] = {}
+        self._allocations: Dict[Tuple, List[Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        """Rebuild the crop arrays if the crop table changed (lock held)"""
+        signature = tuple((name, stats["seed_price"], stats["grow_time"], stats["sell_price"])
+                          for name, stats in self.crops.items())
+        if signature == self._signature:
+            return
+        self._signature = signature
+        # Fastest earners first: the searches below keep the first of equal choices
+        signature = sorted(signature, key=lambda crop: -(crop[3] - crop[1]) / max(crop[2], 1e-9))
+        self._names = [name for name, _, _, _ in signature]
+        self._costs = np.array([seed for _, seed, _, _ in signature], dtype=np.float64)
+        self._profits = np.array([sell - seed for _, seed, _, sell in signature], dtype=np.float64)
+        self._grow = np.array([grow for _, _, grow, _ in signature], dtype=np.float64)
+        self._tables.clear()
+        self._allocations.clear()
+
+    def _durations(self, factor: float) -> np.ndarray:
+        """Grow time of each crop in steps, rounded up so a crop is never planned ready early"""
+        return np.maximum(np.ceil(self._grow * factor / self.resolution - 1e-9), 1).astype(np.intp)
+
+    def _table(self, steps: int, factor: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-plot DP table covering at least ``steps`` steps (lock held)"""
+        best, first = self._tables.get(factor, (np.zeros(1), np.full(1, -1, dtype=np.intp)))
+        if len(best) > steps:
+            return best, first
+        durations = self._durations(factor)
+        start = len(best)
+        size = max(steps + 1, 2 * start)
+        best = np.concatenate((best, np.zeros(size - start)))
+        first = np.concatenate((first, np.full(size - start, -1, dtype=np.intp)))
+        profits = self._profits
+        for step in range(start, size):
+            value, choice = best[step - 1], -1
+            candidates = np.where(durations <= step, best[np.maximum(step - durations, 0)] + profits, -np.inf)
+            index = int(np.argmax(candidates))
+            # Plant now rather than wait when both do as well
+            if candidates[index] >= value:
+                value, choice = float(candidates[index]), index
+            best[step] = value
+            first[step] = choice
+        self._tables[factor] = (best, first)
+        return best, first
+
+    def _horizon_steps(self, horizon: float) -> int:
+        return max(0, int(horizon // self.resolution))
+
+    def profit(self, horizon: float = DEFAULT_HORIZON, factor: float = 1.0) -> float:
+        """Most one plot can earn in ``horizon`` seconds (grow times scaled by ``factor``)"""
+        with self._lock:
+            self._refresh()
+            steps = self._horizon_steps(horizon)
+            return float(self._table(steps, factor)[0][steps])
+
+    def schedule(self, horizon: float = DEFAULT_HORIZON, factor: float = 1.0) -> List[Tuple[float, str]]:
+        """
+        Best sequence of crops for one plot
+
+        Returns:
+            (seconds from now, crop) of each planting
+        """
+        with self._lock:
+            self._refresh()
+            steps = self._horizon_steps(horizon)
+            best, first = self._table(steps, factor)
+            durations = self._durations(factor)
+            # first[] holds the crop to plant first with that many steps left; walk it forwards
+            plan, step = [], steps
+            while step > 0:
+                index = int(first[step])
+                if index < 0:
+                    step -= 1
+                    continue
+                plan.append(((steps - step) * self.resolution, self._names[index]))
+                step -= int(durations[index])
+            return plan
+
+    def allocate(self, plots: int, horizon: float = DEFAULT_HORIZON, budget: Optional[float] = None,
+                 stock: Optional[Dict[str, int]] = None, factor: float = 1.0) -> List[Optional[str]]:
+        """
+        Choose the crop to plant in each of ``plots`` free plots
+
+        Args:
+            plots: Number of free plots
+            horizon: Seconds to plan for
+            budget: Money for seeds not in stock (None: unlimited)
+            stock: Seeds on hand per crop (they cost nothing)
+            factor: Grow-time multiplier (fertilizer)
+
+        Returns:
+            A crop (or None: leave empty) per plot, most valuable first
+        """
+        stock = {name: count for name, count in (stock or {}).items() if count > 0}
+        with self._lock:
+            self._refresh()
+            if budget is not None:
+                budget = float(int(max(budget, 0.0)))
+            steps = self._horizon_steps(horizon)
+            key = (plots, steps, budget, tuple(sorted(stock.items())), factor)
+            cached = self._allocations.get(key)
+            if cached is None:
+                cached = self._allocate(plots, steps, budget, stock, factor)
+                if len(self._allocations) > 256:
+                    self._allocations.clear()
+                self._allocations[key] = cached
+            return list(cached)
+
+    def _allocate(self, plots: int, steps: int, budget: Optional[float],
+                  stock: Dict[str, int], factor: float) -> List[Optional[str]]:
+        """Knapsack of crops over the free plots and the budget (lock held)"""
+        if plots <= 0 or not self._names:
+            return [None] * max(plots, 0)
+        best, _ = self._table(steps, factor)
+        durations = self._durations(factor)
+        # Value of planting each crop now: its harvest plus the best use of the time after it
+        values = np.where(durations <= steps, self._profits + best[np.maximum(steps - durations, 0)], -np.inf)
+        values = np.where(values > 0, values, -np.inf)
+        if budget is None:
+            index = int(np.argmax(values))
+            return [self._names[index] if np.isfinite(values[index]) else None] * plots
+
+        # Money is planned in steps of the budget (no budget: only seeds in stock)
+        unit = budget / BUDGET_STEPS
+        levels = BUDGET_STEPS if unit > 0 else 0
+        costs = (np.ceil(self._costs / unit - 1e-9).astype(np.intp) if unit > 0
+                 else np.where(self._costs > 0, levels + 1, 0).astype(np.intp))
+        # value[p, b]: best value of p plots with b budget steps; counts[c][p, b]: plants of crop c
+        value = np.zeros((plots + 1, levels + 1))
+        counts: List[np.ndarray] = []
+        for index, name in enumerate(self._names):
+            if not np.isfinite(values[index]):
+                counts.append(np.zeros((plots + 1, levels + 1), dtype=np.intp))
+                continue
+            free = stock.get(name, 0)
+            updated = value.copy()
+            chosen = np.zeros((plots + 1, levels + 1), dtype=np.intp)
+            for k in range(1, plots + 1):
+                spend = max(0, k - free) * int(costs[index])
+                if spend > levels:
+                    break
+                # Plant k of this crop on top of the best use of the remaining plots and money
+                candidate = value[:plots + 1 - k, :levels + 1 - spend] + k * values[index]
+                target = updated[k:, spend:]
+                better = candidate > target
+                target[better] = candidate[better]
+                chosen[k:, spend:][better] = k
+            value = updated
+            counts.append(chosen)
+
+        # Walk the choices back from the full garden and budget
+        plan: List[Optional[str]] = []
+        p, b = plots, levels
+        for index in range(len(self._names) - 1, -1, -1):
+            k = int(counts[index][p, b])
+            if k:
+                plan.extend([self._names[index]] * k)
+                p -= k
+                b -= max(0, k - stock.get(self._names[index], 0)) * int(costs[index])
+        plan.sort(key=lambda name: -values[self._names.index(name)])
+        return plan + [None] * (plots - len(plan))
+
+_planners: Dict[Optional[str], GardenPlanner] = {}
+_planners_lock = threading.Lock()
+
+def get_planner(game: Optional[str] = None) -> GardenPlanner:
+    """Get the process-wide planner of a game (it plans over the game's garden crop table)"""
+    with _planners_lock:
+        planner = _planners.get(game)
+        if planner is None:
+            planner = _planners[game] = GardenPlanner(get_garden(game).crops)
+        return planner
@@ -0,0 +1,64 @@
+"""
+Input Backend
+Where mouse and keyboard actions go
+
+The engine and the macro player send clicks, key presses and mouse moves
+through an ``InputBackend`` rather than calling pyautogui directly, so they
+can drive something other than the screen (e.g. ``SimulatedGame``).
+"""
+
+import threading
+from typing import Optional, Tuple
+
+class InputBackend:
+    """Target of mouse and keyboard actions"""
+
+    def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left"):
+        """Click at (x, y), or at the current position when omitted"""
+        raise NotImplementedError
+
+    def press(self, key: str):
+        """Press and release a key"""
+        raise NotImplementedError
+
+    def move_to(self, x: int, y: int):
+        """Move the mouse to (x, y)"""
+        raise NotImplementedError
+
+    def position(self) -> Tuple[int, int]:
+        """Get the current mouse position"""
+        raise NotImplementedError
+
+class PyAutoGUIBackend(InputBackend):
+    """The real screen, through pyautogui"""
+
+    def __init__(self, failsafe: bool = True, pause: float = 0.1):
+        self.failsafe = failsafe
+        self.pause = pause
+        self._pyautogui = None
+        self._lock = threading.Lock()
+
+    def _get(self):
+        """Import and configure pyautogui on first use (it is slow to import and needs a display)"""
+        if self._pyautogui is None:
+            with self._lock:
+                if self._pyautogui is None:
+                    import pyautogui
+                    pyautogui.FAILSAFE = self.failsafe
+                    pyautogui.PAUSE = self.pause
+                    self._pyautogui = pyautogui
+        return self._pyautogui
+
+    def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left"):
+        self._get().click(x, y, button=button)
+
+    def press(self, key: str):
+        self._get().press(key)
+
+    def move_to(self, x: int, y: int):
+        self._get().moveTo(x, y)
+
+    def position(self) -> Tuple[int, int]:
+        return tuple(self._get().position())
+
+screen_backend = PyAutoGUIBackend()
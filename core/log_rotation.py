@@ -0,0 +1,307 @@
+"""
+Log Rotation
+Size- and time-based log segments with background gzip compression,
+retention and an index of segment start times for fast tail reads
+"""
+
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from logging.handlers import BaseRotatingHandler
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional
+from core.thread_registry import get_thread_registry
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.jsonl"
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_TAIL_BLOCK = 64 * 1024
+
+def parse_line_time(line: str) -> Optional[float]:
+    """Get the epoch time of a line written with the default log format, if it has one"""
+    # '2025-01-31 13:05:31,668 - name - LEVEL - message'
+    if len(line) < 23 or line[4] != "-" or line[19] != ",":
+        return None
+    try:
+        stamp = datetime.strptime(line[:19], _TIMESTAMP_FORMAT)
+        return time.mktime(stamp.timetuple()) + int(line[20:23]) / 1000.0
+    except ValueError:
+        return None
+
+class LogIndex:
+    """Append-only JSON-lines index of rotated segments: name, start and end time"""
+
+    def __init__(self, log_dir: Path):
+        self.path = log_dir / INDEX_FILE
+        self._lock = threading.Lock()
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Get all index entries ordered by start time"""
+        with self._lock:
+            return self._read()
+
+    def append(self, entry: Dict[str, Any]):
+        """Record a rotated segment"""
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def prune(self, select: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Atomically rewrite the index with the entries ``select`` keeps
+
+        The read and the rewrite hold the lock, so a segment appended by a
+        rollover in the meantime is not lost.
+
+        Returns:
+            The dropped entries
+        """
+        with self._lock:
+            entries = self._read()
+            keep = select(entries)
+            if len(keep) == len(entries):
+                return []
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                for entry in keep:
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(tmp_path, self.path)
+        kept_names = {entry["name"] for entry in keep}
+        return [entry for entry in entries if entry["name"] not in kept_names]
+
+    def _read(self) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        entries = []
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+        entries.sort(key=lambda entry: entry["start"])
+        return entries
+
+def segment_path(log_dir: Path, name: str) -> Optional[Path]:
+    """Resolve a segment name to its compressed or still-uncompressed file"""
+    for suffix in (".log.gz", ".log"):
+        path = log_dir / (name + suffix)
+        if path.exists():
+            return path
+    return None
+
+class _Compressor:
+    """Background thread that gzips rotated segments and applies retention"""
+
+    def __init__(self, handler: "SegmentedFileHandler"):
+        self.handler = handler
+        self.jobs: queue.Queue = queue.Queue()
+        self.thread = get_thread_registry().spawn(
+            self._run, owner="SegmentedFileHandler", purpose="log segment compression", name="log-compressor"
+        )
+        self.thread.start()
+
+    def submit(self, path: Path):
+        self.jobs.put(path)
+
+    def close(self, timeout: float = 10.0):
+        self.jobs.put(None)
+        get_thread_registry().stop_requested(self.thread)
+        self.thread.join(timeout=timeout)
+
+    def _run(self):
+        while True:
+            path = self.jobs.get()
+            if path is None:
+                return
+            try:
+                if path.exists():
+                    with open(path, 'rb') as src, gzip.open(str(path) + ".gz", 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                    os.remove(path)
+                self.handler.apply_retention()
+            except Exception as e:
+                # Never log through the pipeline from inside it (nor onto stdout, which the CLI writes JSON to)
+                sys.stderr.write(f"Log compression failed for {path}: {e}\n")
+
+class SegmentedFileHandler(BaseRotatingHandler):
+    """
+    Writes ``<prefix>.log`` and rolls it over by size and by time
+
+    A rotated segment is renamed to ``<prefix>_<start>.log``, recorded in the
+    index with its start and end time, then gzipped in the background.
+    Retention keeps at most ``backup_count`` segments no older than
+    ``max_age_days``.
+    """
+
+    def __init__(self, log_dir: Path, prefix: str = "app", max_bytes: int = 10 * 1024 * 1024,
+                 interval: Optional[float] = None, midnight: bool = True,
+                 backup_count: int = 50, max_age_days: Optional[float] = 14, compress: bool = True):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.midnight = midnight
+        self.backup_count = backup_count
+        self.max_age_days = max_age_days
+        self.index = LogIndex(self.log_dir)
+        super().__init__(str(self.log_dir / f"{prefix}.log"), mode='a', encoding='utf-8', delay=False)
+        self.segment_start = self._existing_start()
+        self.rollover_at = self._next_rollover(self.segment_start)
+        self._compressor = _Compressor(self) if compress else None
+
+    def _existing_start(self) -> float:
+        """Get the start time of an existing active file (its first record)"""
+        path = Path(self.baseFilename)
+        try:
+            if path.stat().st_size > 0:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    first = parse_line_time(f.readline())
+                return first if first is not None else path.stat().st_mtime
+        except OSError:
+            pass
+        return time.time()
+
+    def _next_rollover(self, start: float) -> Optional[float]:
+        """Get the time at which the segment started at ``start`` must roll over"""
+        candidates = []
+        if self.interval:
+            candidates.append(start + self.interval)
+        if self.midnight:
+            day = datetime.fromtimestamp(start).date() + timedelta(days=1)
+            candidates.append(time.mktime(datetime(day.year, day.month, day.day).timetuple()))
+        return min(candidates) if candidates else None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Roll over when the segment is too large or its time window has ended"""
+        if self.rollover_at is not None and record.created >= self.rollover_at:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.stream.tell() >= self.max_bytes:
+                return True
+        return False
+
+    def doRollover(self):
+        """Close the active file, move it to a named segment and start a new one"""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        now = time.time()
+        active = Path(self.baseFilename)
+        if active.exists() and active.stat().st_size > 0:
+            base = f"{self.prefix}_{datetime.fromtimestamp(self.segment_start).strftime('%Y%m%d-%H%M%S')}"
+            name = base
+            suffix = 1
+            while segment_path(self.log_dir, name) is not None:
+                name = f"{base}.{suffix}"
+                suffix += 1
+            target = self.log_dir / f"{name}.log"
+            os.replace(active, target)
+            self.index.append({"name": name, "start": self.segment_start, "end": now,
+                               "bytes": target.stat().st_size})
+            if self._compressor:
+                self._compressor.submit(target)
+            else:
+                self.apply_retention()
+
+        self.segment_start = now
+        self.rollover_at = self._next_rollover(now)
+        self.stream = self._open()
+
+    def apply_retention(self):
+        """Delete segments beyond the count limit or older than the age limit"""
+        def select(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            keep = entries
+            if self.max_age_days is not None:
+                cutoff = time.time() - self.max_age_days * 86400
+                keep = [entry for entry in keep if entry["end"] >= cutoff]
+            if self.backup_count and len(keep) > self.backup_count:
+                keep = keep[-self.backup_count:]
+            return keep
+
+        for entry in self.index.prune(select):
+            path = segment_path(self.log_dir, entry["name"])
+            if path is not None:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+
+    def close(self):
+        """Close the active file and wait for pending compression"""
+        super().close()
+        if self._compressor:
+            self._compressor.close()
+            self._compressor = None
+
+def _tail_plain(path: Path, cutoff: float) -> List[str]:
+    """Read lines at or after ``cutoff`` by scanning an uncompressed file backwards"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        buffer = b""
+        while position > 0:
+            step = min(_TAIL_BLOCK, position)
+            position -= step
+            f.seek(position)
+            buffer = f.read(step) + buffer
+            lines = buffer.split(b"\n")
+            # The first line may be partial unless we reached the start of the file
+            complete = lines if position == 0 else lines[1:]
+            stamps = [parse_line_time(line.decode('utf-8', 'replace')) for line in complete[:64]]
+            if any(stamp is not None and stamp < cutoff for stamp in stamps):
+                break
+        text = buffer.decode('utf-8', 'replace')
+    return _filter_lines(text.splitlines(), cutoff)
+
+def _filter_lines(lines: List[str], cutoff: float) -> List[str]:
+    """Keep records at or after ``cutoff`` together with their continuation lines"""
+    result = []
+    keep = False
+    for line in lines:
+        stamp = parse_line_time(line)
+        if stamp is not None:
+            keep = stamp >= cutoff
+        if keep and line:
+            result.append(line)
+    return result
+
+def read_recent(seconds: float, log_dir: Path = Path("logs"), prefix: str = "app") -> List[str]:
+    """
+    Get log lines from the last ``seconds`` seconds
+
+    The segment index is used to skip every segment that ended before the
+    cutoff; the active file is read backwards so only its tail is touched.
+    """
+    log_dir = Path(log_dir)
+    cutoff = time.time() - seconds
+    lines: List[str] = []
+
+    for entry in LogIndex(log_dir).entries():
+        if entry["end"] < cutoff:
+            continue
+        path = segment_path(log_dir, entry["name"])
+        if path is None:
+            continue
+        if path.suffix == ".gz":
+            with gzip.open(path, 'rt', encoding='utf-8', errors='replace') as f:
+                lines.extend(_filter_lines(f.read().splitlines(), cutoff))
+        else:
+            lines.extend(_tail_plain(path, cutoff))
+
+    active = log_dir / f"{prefix}.log"
+    if active.exists():
+        lines.extend(_tail_plain(active, cutoff))
+    return lines
@@ -1,39 +1,213 @@
 """
 Logging utility
+Asynchronous, rate-limited logging pipeline
+
+Records are put on an in-process queue by a QueueHandler attached to the root
+logger, so worker threads never block on file or console I/O. A single
+QueueListener thread formats and writes them. Repeats of the same message
+template from the same logger are rate limited and collapsed into
+"repeated N times" summaries.
 """
 
+import atexit
 import logging
-import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from datetime import datetime
+from typing import Dict, Optional, Tuple
+from core.log_rotation import SegmentedFileHandler
+from core.thread_registry import get_thread_registry
+from core.shutdown import FLUSH_ORDER_LOGGING, get_shutdown_coordinator
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["RateLimitedQueueHandler"] = None
+_atexit_registered = False
+
+class RateLimitedQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted and rate limits repeats
+
+    Each (logger, level, message template) key may emit ``rate`` records per
+    ``per`` seconds. Further records in the window are counted, and the count
+    is reported as a single summary record when the window closes.
+    """
+
+    def __init__(self, log_queue, rate: int = 5, per: float = 10.0):
+        super().__init__(log_queue)
+        self.rate = rate
+        self.per = per
+        # key -> [window_start, emitted, suppressed, template record]
+        self._windows: Dict[Tuple, list] = {}
+        self._windows_lock = threading.Lock()
+        self._next_sweep = time.monotonic() + per
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass records through untouched; formatting happens on the listener thread"""
+        return record
+
+    def emit(self, record: logging.LogRecord):
+        """Enqueue a record unless its key is over the rate limit"""
+        if self.rate <= 0:
+            self.enqueue(record)
+            return
+
+        now = time.monotonic()
+        key = (record.name, record.levelno, record.msg if isinstance(record.msg, str) else repr(type(record.msg)))
+        summary = None
+        with self._windows_lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.per:
+                if window is not None and window[2]:
+                    summary = self._summary(window)
+                window = self._windows[key] = [now, 0, 0, record]
+            if window[1] < self.rate:
+                window[1] += 1
+                allowed = True
+            else:
+                window[2] += 1
+                allowed = False
+            expired = self._sweep(now) if now >= self._next_sweep else []
+
+        try:
+            if summary is not None:
+                self.enqueue(summary)
+            if allowed:
+                self.enqueue(record)
+            for stale in expired:
+                self.enqueue(stale)
+        except Exception:
+            self.handleError(record)
+
+    def _summary(self, window: list) -> logging.LogRecord:
+        """Build the 'repeated N times' record for a closed window"""
+        template = window[3]
+        return logging.makeLogRecord({
+            "name": template.name,
+            "levelno": template.levelno,
+            "levelname": template.levelname,
+            "pathname": template.pathname,
+            "lineno": template.lineno,
+            "msg": "Previous message repeated %d more times in %gs: %s",
+            "args": (window[2], self.per, template.msg)
+        })
+
+    def _sweep(self, now: float) -> list:
+        """Close expired windows; returns summaries for keys that went quiet (lock held)"""
+        self._next_sweep = now + self.per
+        summaries = []
+        for key, window in list(self._windows.items()):
+            if now - window[0] >= self.per:
+                if window[2]:
+                    summaries.append(self._summary(window))
+                del self._windows[key]
+        return summaries
+
+    def flush_summaries(self):
+        """Emit summaries for every window that suppressed records"""
+        with self._windows_lock:
+            summaries = [self._summary(window) for window in self._windows.values() if window[2]]
+            self._windows.clear()
+        for summary in summaries:
+            self.enqueue(summary)
+
+def setup_logger(name: str = "RobloxAutomation", level: int = logging.INFO,
+                 rate: int = 5, per: float = 10.0, max_bytes: int = 10 * 1024 * 1024,
+                 backup_count: int = 50, max_age_days: Optional[float] = 14) -> logging.Logger:
+    """
+    Setup and configure logging (safe to call more than once)
+
+    The queue handler is installed on the root logger so module loggers
+    (``core.*``, ``modules.*``, ``gui.*``) share the same pipeline. Repeated
+    calls only update the level and rate limit.
+
+    Args:
+        name: Name of the application logger to return
+        level: Logging level for the application
+        rate: Records allowed per message key per window (0 disables limiting)
+        per: Rate limit window in seconds
+        max_bytes: Size at which logs/app.log rolls over to a compressed segment
+        backup_count: Maximum number of rotated segments kept
+        max_age_days: Rotated segments older than this are deleted
+    """
+    global _listener, _queue_handler, _atexit_registered
+
+    with _lock:
+        root = logging.getLogger()
+        if _listener is None:
+            # File handler: rolls over by size and at midnight, gzips old segments
+            file_handler = SegmentedFileHandler(
+                Path("logs"),
+                max_bytes=max_bytes,
+                backup_count=backup_count,
+                max_age_days=max_age_days
+            )
+
+            # Console handler
+            console_handler = logging.StreamHandler()
+
+            # Formatter
+            formatter = logging.Formatter(LOG_FORMAT)
+            file_handler.setFormatter(formatter)
+            console_handler.setFormatter(formatter)
+
+            log_queue = queue.SimpleQueue()
+            _queue_handler = RateLimitedQueueHandler(log_queue, rate=rate, per=per)
+            root.addHandler(_queue_handler)
+            _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+            _listener.start()
+            if getattr(_listener, "_thread", None) is not None:
+                get_thread_registry().register(_listener._thread, owner="logger", purpose="log record writing",
+                                               name="log-listener")
+            if not _atexit_registered:
+                atexit.register(shutdown_logging)
+                get_shutdown_coordinator().add_flush("logging", shutdown_logging, order=FLUSH_ORDER_LOGGING)
+                _atexit_registered = True
+
+        _queue_handler.rate = rate
+        _queue_handler.per = per
+        root.setLevel(level)
+        for handler in _listener.handlers:
+            handler.setLevel(level)
 
-def setup_logger(name: str = "RobloxAutomation", level: int = logging.INFO) -> logging.Logger:
-    """Setup and configure logger"""
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
-    # Create logs directory
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    
-    # File handler
-    log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(level)
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
     return logger
 
+def shutdown_logging(timeout: Optional[float] = None) -> bool:
+    """
+    Flush pending summaries, drain the queue and close the log handlers
+
+    Args:
+        timeout: Seconds to wait for the listener to drain (None waits for all)
+
+    Returns:
+        False if the listener was still writing when the timeout passed
+    """
+    global _listener, _queue_handler
+
+    with _lock:
+        if _listener is None:
+            return True
+        _queue_handler.flush_summaries()
+        logging.getLogger().removeHandler(_queue_handler)
+        thread = getattr(_listener, "_thread", None)
+        get_thread_registry().stop_requested(thread)
+        drained = True
+        if timeout is None or thread is None:
+            _listener.stop()
+        else:
+            _listener.enqueue_sentinel()
+            thread.join(timeout)
+            drained = not thread.is_alive()
+            _listener._thread = None
+        if drained:
+            for handler in _listener.handlers:
+                handler.close()
+        _listener = None
+        _queue_handler = None
+        return drained
@@ -29,14 +29,14 @@ class ScriptExecutor:
             True if execution started successfully
         """
         try:
-            logger.info(f"Executing script (length: {len(script_content)} chars)")
+            logger.info("Executing script (length: %s chars)", len(script_content))
             # In a real implementation, this would interface with Roblox
             # For now, we'll simulate the execution
             self.current_script = script_content
             self.is_running = True
             return True
         except Exception as e:
-            logger.error(f"Error executing script: {e}")
+            logger.error("Error executing script: %s", e)
             return False
     
     def stop_execution(self) -> bool:
@@ -47,7 +47,7 @@ class ScriptExecutor:
             logger.info("Script execution stopped")
             return True
         except Exception as e:
-            logger.error(f"Error stopping script: {e}")
+            logger.error("Error stopping script: %s", e)
             return False
     
     def load_script_file(self, file_path: str) -> Optional[str]:
@@ -56,7 +56,7 @@ class ScriptExecutor:
             with open(file_path, 'r', encoding='utf-8') as f:
                 return f.read()
         except Exception as e:
-            logger.error(f"Error loading script file: {e}")
+            logger.error("Error loading script file: %s", e)
             return None
     
     def save_script(self, script_content: str, file_path: str) -> bool:
@@ -66,6 +66,6 @@ class ScriptExecutor:
                 f.write(script_content)
             return True
         except Exception as e:
-            logger.error(f"Error saving script: {e}")
+            logger.error("Error saving script: %s", e)
             return False
 
@@ -0,0 +1,143 @@
+"""
+Shutdown Coordinator
+Stops every registered component in parallel against one deadline
+
+Engines, bots and the macro recorder register themselves when they are
+created (held weakly, so registering never keeps anything alive). A component
+provides ``request_stop() -> bool``, which signals it without waiting and
+returns whether it had anything running, and ``join(timeout) -> bool``, which
+waits for it to finish.
+
+``shutdown()`` signals every component first and only then waits, so the
+total time is bounded by the slowest component rather than the sum of their
+stop timeouts. Afterwards it logs the final stats of the components that were
+running and runs the flush hooks (configuration, then logging) with whatever
+time is left.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Flush hook order: lower runs first. Logging closes last so the report is written.
+FLUSH_ORDER_DEFAULT = 50
+FLUSH_ORDER_LOGGING = 100
+
+class ShutdownCoordinator:
+    """Registry of stoppable components and flush hooks"""
+
+    def __init__(self):
+        self._components: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+        self._flushes: List[Tuple[int, str, Callable[[float], Any]]] = []
+        self._lock = threading.Lock()
+        self._report: Optional[Dict[str, Any]] = None
+
+    def register(self, component, name: str):
+        """
+        Register a component to stop on shutdown
+
+        Args:
+            component: Object with ``request_stop()`` and ``join(timeout)``
+            name: Label used in the shutdown report
+        """
+        with self._lock:
+            self._components[component] = name
+
+    def unregister(self, component):
+        """Forget a component (it is forgotten anyway once garbage collected)"""
+        with self._lock:
+            self._components.pop(component, None)
+
+    def add_flush(self, name: str, flush: Callable[[float], Any], order: int = FLUSH_ORDER_DEFAULT):
+        """
+        Register a hook run after the components have stopped
+
+        Args:
+            name: Label used in the shutdown report
+            flush: Called with the seconds left before the deadline; returning
+                False counts as missing the deadline
+            order: Hooks run in ascending order
+        """
+        with self._lock:
+            self._flushes = [entry for entry in self._flushes if entry[1] != name]
+            self._flushes.append((order, name, flush))
+            self._flushes.sort(key=lambda entry: entry[0])
+
+    @property
+    def done(self) -> bool:
+        """True once shutdown() has run"""
+        return self._report is not None
+
+    def shutdown(self, timeout: float = 5.0) -> Dict[str, Any]:
+        """
+        Stop everything and flush (only the first call does anything)
+
+        Args:
+            timeout: Seconds for the whole shutdown, shared by all components
+
+        Returns:
+            Report with ``stopped``, ``missed`` (names that did not finish by
+            the deadline), ``errors`` (name -> message) and ``elapsed`` seconds
+        """
+        with self._lock:
+            if self._report is not None:
+                return self._report
+            components = list(self._components.items())
+            flushes = list(self._flushes)
+            self._report = report = {"stopped": [], "missed": [], "errors": {}, "elapsed": 0.0}
+
+        start = time.monotonic()
+        deadline = start + timeout
+
+        # Signal everything before waiting on anything
+        running = []
+        for component, name in components:
+            try:
+                if component.request_stop():
+                    running.append((component, name))
+            except Exception as e:
+                report["errors"][name] = str(e)
+
+        for component, name in running:
+            try:
+                finished = component.join(max(0.0, deadline - time.monotonic()))
+            except Exception as e:
+                report["errors"][name] = str(e)
+                continue
+            report["stopped" if finished else "missed"].append(name)
+
+        for component, name in running:
+            get_stats = getattr(component, "get_stats", None)
+            if get_stats is not None:
+                logger.info("Final stats for %s: %s", name, get_stats())
+
+        report["elapsed"] = round(time.monotonic() - start, 3)
+        if report["missed"]:
+            logger.warning("Shutdown deadline of %.1fs missed by: %s", timeout, ", ".join(report["missed"]))
+        for name, message in report["errors"].items():
+            logger.error("Error stopping %s: %s", name, message)
+        logger.info("Stopped %s components in %.2fs", len(report["stopped"]), report["elapsed"])
+
+        for _, name, flush in flushes:
+            try:
+                if flush(max(0.0, deadline - time.monotonic())) is False:
+                    report["missed"].append(name)
+            except Exception as e:
+                report["errors"][name] = str(e)
+        report["elapsed"] = round(time.monotonic() - start, 3)
+        return report
+
+_coordinator: Optional[ShutdownCoordinator] = None
+_coordinator_lock = threading.Lock()
+
+def get_shutdown_coordinator() -> ShutdownCoordinator:
+    """Get the process-wide shutdown coordinator"""
+    global _coordinator
+    with _coordinator_lock:
+        if _coordinator is None:
+            _coordinator = ShutdownCoordinator()
+        return _coordinator
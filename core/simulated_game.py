@@ -0,0 +1,345 @@
+"""
+Simulated Game
+Offline stand-in for a running game, for benchmarks and tests
+
+``SimulatedGame`` keeps a small game state (currency, XP, inventory and
+garden plots) and applies each task type's effect to it after a configurable
+response latency, failing a configurable fraction of actions. It is both an
+engine environment (``AutomationEngine(environment=...)`` calls
+``perform(spec)`` instead of the built-in handlers) and an ``InputBackend``
+(clicks earn currency), so pipelines run end to end without a screen.
+Garden tasks can be limited to some plots (``perform(spec, plots=...)``), and
+``observe_garden`` reports every plot's state, the money and the seeds in
+stock the way the engine's garden model (``core.garden``) stores them.
+
+Latencies are slept on the game's clock; with a ``SimulatedClock`` an hour of
+play takes well under a second and, with a fixed seed, always produces the
+same result.
+"""
+
+import random
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+from core.clock import Clock, system_clock
+from core.garden import CROPS, DRY_TIME, EMPTY, FERTILIZERS, GROWING, RIPE, WATER_BOOST
+from core.input_backend import InputBackend
+from core.task_spec import TaskSpec
+from core.yield_tracker import TaskOutcome
+
+class ActionFailed(RuntimeError):
+    """The simulated game rejected an action (injected failure)"""
+
+class Plot:
+    """One garden plot"""
+
+    __slots__ = ("crop", "ready_at", "watered_at", "fertilized")
+
+    def __init__(self):
+        self.crop: Optional[str] = None
+        self.ready_at = 0.0
+        self.watered_at = float("-inf")
+        self.fertilized = False
+
+class SimulatedGame(InputBackend):
+    """Local game model driven by the engine or by input actions"""
+
+    def __init__(self, clock: Optional[Clock] = None, plots: int = 12, currency: float = 100.0,
+                 latency: float = 0.1, latencies: Optional[Dict[str, float]] = None, jitter: float = 0.25,
+                 failure_rate: float = 0.0, failure_rates: Optional[Dict[str, float]] = None,
+                 contention: float = 0.0, farm_reward: float = 5.0, click_value: float = 0.5,
+                 seed: Optional[int] = 0):
+        """
+        Args:
+            clock: Clock the latencies are slept on
+            plots: Number of garden plots
+            currency: Starting currency
+            latency: Median response latency in seconds
+            latencies: Per-task-type median latencies
+            jitter: Spread of the (log-normal) latency distribution
+            failure_rate: Fraction of actions that fail
+            failure_rates: Per-task-type failure rates
+            contention: Latency increase per other action in flight (0.5: +50% each)
+            farm_reward: Currency earned by task types without a specific effect
+            click_value: Currency earned per click
+            seed: Random seed (None: unseeded)
+        """
+        self.clock = clock or system_clock
+        self.latency = latency
+        self.latencies = dict(latencies or {})
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_rates = dict(failure_rates or {})
+        self.contention = contention
+        self.farm_reward = farm_reward
+        self.click_value = click_value
+        self.currency = float(currency)
+        self.xp = 0.0
+        self.inventory: Counter = Counter()
+        self.plots: List[Plot] = [Plot() for _ in range(plots)]
+        self.clicks = 0
+        self.keys: Counter = Counter()
+        self.mouse: Tuple[int, int] = (0, 0)
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._in_flight = 0
+        self._actions: Counter = Counter()
+        self._failures: Counter = Counter()
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._effects = {
+            "plant_seeds": self._plant_one,
+            "auto_plant_all": self._plant_all,
+            "buy_seeds": self._buy_seeds,
+            "harvest_crops": self._harvest,
+            "auto_harvest_all": self._harvest,
+            "sell_produce": self._sell,
+            "auto_sell": self._sell,
+            "water_plants": self._water,
+            "auto_irrigate": self._water,
+            "auto_fertilize": self._fertilize,
+            "full_auto_cycle": self._full_cycle,
+            "clicker": self._click_task,
+            "auto_click": self._click_task,
+            "auto_tap": self._click_task,
+        }
+
+    # ========== ENGINE ENVIRONMENT ==========
+
+    def perform(self, spec: TaskSpec, cancel: Optional[threading.Event] = None,
+                plots: Optional[List[int]] = None) -> Optional[TaskOutcome]:
+        """
+        Carry out one tick of a task
+
+        Waits the action's latency on the clock, then applies the task type's
+        effect. Returns what the action produced.
+
+        Args:
+            spec: Task to perform
+            cancel: Event that cuts the latency short (the action is then dropped)
+            plots: Indices of the plots a garden task works on (default: all)
+
+        Raises:
+            ActionFailed: For an injected failure
+        """
+        task_type = spec.type
+        with self._lock:
+            self._in_flight += 1
+            latency = self._sample_latency(task_type)
+            failed = self._random.random() < self.failure_rates.get(task_type, self.failure_rate)
+        start = self.clock.monotonic()
+        try:
+            if cancel is not None:
+                if self.clock.wait(cancel, latency):
+                    return None
+            else:
+                self.clock.sleep(latency)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        with self._lock:
+            self._latencies[task_type].append(self.clock.monotonic() - start)
+            self._actions[task_type] += 1
+            if failed:
+                self._failures[task_type] += 1
+                raise ActionFailed(f"{task_type} failed")
+            before = (self.currency, self.xp)
+            targets = self.plots if plots is None else [self.plots[i] for i in plots if 0 <= i < len(self.plots)]
+            items = self._effects.get(task_type, self._farm)(spec, targets)
+            return TaskOutcome(items=items or 0, currency=self.currency - before[0], xp=self.xp - before[1])
+
+    def _sample_latency(self, task_type: str) -> float:
+        """Draw an action's latency (lock held)"""
+        median = self.latencies.get(task_type, self.latency)
+        if median <= 0:
+            return 0.0
+        latency = median * self._random.lognormvariate(0.0, self.jitter) if self.jitter else median
+        return latency * (1.0 + self.contention * (self._in_flight - 1))
+
+    # ========== TASK EFFECTS (lock held) ==========
+
+    def _farm(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        self.currency += self.farm_reward
+        self.xp += 1.0
+        return 0
+
+    def _click_task(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        position = getattr(spec, "position", None) or self.mouse
+        self.click(position[0], position[1])
+        return 0
+
+    def _pick_crop(self, seed_type: Optional[str]) -> Optional[str]:
+        """Resolve "Best Available"/"Default" to the most valuable crop with seeds in stock"""
+        if seed_type in CROPS:
+            return seed_type if self.inventory["seeds:" + seed_type] else None
+        stocked = [crop for crop in CROPS if self.inventory["seeds:" + crop]]
+        return max(stocked, key=lambda crop: CROPS[crop]["sell_price"], default=None)
+
+    def _plant(self, seed_type: Optional[str], plots: List[Plot], limit: int) -> int:
+        planted = 0
+        now = self.clock.time()
+        for plot in plots:
+            if planted >= limit:
+                break
+            if plot.crop is not None:
+                continue
+            crop = self._pick_crop(seed_type)
+            if crop is None:
+                break
+            self.inventory["seeds:" + crop] -= 1
+            plot.crop = crop
+            plot.ready_at = now + CROPS[crop]["grow_time"]
+            plot.watered_at = float("-inf")
+            plot.fertilized = False
+            planted += 1
+        self.xp += planted
+        return 0
+
+    def _plant_one(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        return self._plant(getattr(spec, "seed_type", None), plots, 1)
+
+    def _plant_all(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        return self._plant(getattr(spec, "seed_type", None), plots, len(plots))
+
+    def _buy_seeds(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        """Spend up to half the currency on seeds, one per plot at most"""
+        seed_type = getattr(spec, "seed_type", None)
+        if seed_type not in CROPS:
+            affordable = [crop for crop in CROPS if CROPS[crop]["seed_price"] <= self.currency / 2]
+            seed_type = max(affordable, key=lambda crop: CROPS[crop]["sell_price"], default="Carrot")
+        price = CROPS[seed_type]["seed_price"]
+        count = min(len(plots), int(self.currency // 2 // price)) or (1 if self.currency >= price else 0)
+        self.currency -= count * price
+        self.inventory["seeds:" + seed_type] += count
+        return 0
+
+    def _harvest(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        crop_type = getattr(spec, "crop_type", "All")
+        now = self.clock.time()
+        harvested = 0
+        for plot in plots:
+            if plot.crop is None or plot.ready_at > now:
+                continue
+            if crop_type not in (None, "All") and plot.crop != crop_type:
+                continue
+            self.inventory["produce:" + plot.crop] += 1
+            plot.crop = None
+            harvested += 1
+        self.xp += harvested
+        return harvested
+
+    def _sell(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        for key in [key for key in self.inventory if key.startswith("produce:")]:
+            self.currency += self.inventory[key] * CROPS[key[8:]]["sell_price"]
+            del self.inventory[key]
+        return 0
+
+    def _water(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        """Cut 10% off the remaining time of growing plots that have dried out"""
+        now = self.clock.time()
+        for plot in plots:
+            if plot.crop is not None and plot.ready_at > now and now - plot.watered_at >= DRY_TIME:
+                plot.ready_at -= (plot.ready_at - now) * WATER_BOOST
+            plot.watered_at = now
+        return 0
+
+    def _fertilize(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        """Shorten the remaining time of growing plots not fertilized yet"""
+        factor = FERTILIZERS.get(getattr(spec, "fertilizer", None), 1.0)
+        now = self.clock.time()
+        for plot in plots:
+            if plot.crop is not None and plot.ready_at > now and not plot.fertilized:
+                plot.ready_at = now + (plot.ready_at - now) * factor
+                plot.fertilized = True
+        return 0
+
+    def _full_cycle(self, spec: TaskSpec, plots: List[Plot]) -> int:
+        harvested = self._harvest(spec, plots)
+        self._sell(spec, plots)
+        if not any(key.startswith("seeds:") and count for key, count in self.inventory.items()):
+            self._buy_seeds(spec, plots)
+        self._plant_all(spec, plots)
+        self._water(spec, plots)
+        return harvested
+
+    # ========== GARDEN VIEW ==========
+
+    def observe_garden(self) -> Dict[str, List[Any]]:
+        """
+        Get every plot's state, as ``GardenModel.observe`` takes it
+
+        Returns:
+            Dict of per-plot ``stages``, ``remaining`` seconds to ripen,
+            ``crops`` and ``moisture``, plus the ``currency`` and the
+            ``seeds`` in stock per crop
+        """
+        with self._lock:
+            now = self.clock.time()
+            stages, remaining, crops, moisture = [], [], [], []
+            for plot in self.plots:
+                if plot.crop is None:
+                    stages.append(EMPTY)
+                else:
+                    stages.append(RIPE if plot.ready_at <= now else GROWING)
+                remaining.append(max(plot.ready_at - now, 0.0) if plot.crop is not None else float("nan"))
+                crops.append(plot.crop)
+                moisture.append(min(max(1.0 - (now - plot.watered_at) / DRY_TIME, 0.0), 1.0))
+            seeds = {key[6:]: count for key, count in self.inventory.items() if key.startswith("seeds:")}
+            return {"stages": stages, "remaining": remaining, "crops": crops, "moisture": moisture,
+                    "currency": self.currency, "seeds": seeds}
+
+    # ========== INPUT BACKEND ==========
+
+    def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left"):
+        with self._lock:
+            if x is not None and y is not None:
+                self.mouse = (x, y)
+            self.clicks += 1
+            self.currency += self.click_value
+
+    def press(self, key: str):
+        with self._lock:
+            self.keys[key] += 1
+
+    def move_to(self, x: int, y: int):
+        with self._lock:
+            self.mouse = (x, y)
+
+    def position(self) -> Tuple[int, int]:
+        return self.mouse
+
+    # ========== STATISTICS ==========
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current game state"""
+        with self._lock:
+            now = self.clock.time()
+            return {
+                "currency": round(self.currency, 2),
+                "xp": self.xp,
+                "inventory": {key: count for key, count in self.inventory.items() if count},
+                "plots_growing": sum(1 for plot in self.plots if plot.crop is not None and plot.ready_at > now),
+                "plots_ripe": sum(1 for plot in self.plots if plot.crop is not None and plot.ready_at <= now),
+                "clicks": self.clicks,
+            }
+
+    def action_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-task-type action counts, failures and latency percentiles (seconds)"""
+        with self._lock:
+            stats = {}
+            for task_type, latencies in self._latencies.items():
+                ordered = sorted(latencies)
+                stats[task_type] = {
+                    "actions": self._actions[task_type],
+                    "failures": self._failures[task_type],
+                    "p50": _percentile(ordered, 0.50),
+                    "p99": _percentile(ordered, 0.99),
+                    "max": ordered[-1] if ordered else 0.0,
+                }
+            return stats
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
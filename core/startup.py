@@ -0,0 +1,60 @@
+"""
+Startup Timeline
+Records named milestones from process start to an interactive window
+"""
+
+import logging
+import time
+from typing import List, Tuple, Optional
+
+logger = logging.getLogger(__name__)
+
+def _process_start() -> Tuple[float, str]:
+    """Get the perf_counter value at which the process started, if it can be known"""
+    now = time.perf_counter()
+    try:
+        import psutil
+        age = time.time() - psutil.Process().create_time()
+        return now - max(0.0, age), "process"
+    except Exception:
+        return now, "timeline import"
+
+class StartupTimeline:
+    """Milestones relative to process start, logged once startup completes"""
+
+    def __init__(self):
+        self.origin, self.origin_label = _process_start()
+        self.marks: List[Tuple[str, float]] = []
+        self._logged = False
+
+    def mark(self, name: str, at: Optional[float] = None):
+        """Record a milestone (first occurrence of a name wins)"""
+        if any(existing == name for existing, _ in self.marks):
+            return
+        at = time.perf_counter() if at is None else at
+        self.marks.append((name, (at - self.origin) * 1000.0))
+
+    def elapsed_ms(self, name: str) -> Optional[float]:
+        """Get milliseconds from origin to a milestone"""
+        for existing, ms in self.marks:
+            if existing == name:
+                return ms
+        return None
+
+    def summary(self) -> str:
+        """Format the timeline as 'name +delta (total)' steps"""
+        parts = []
+        previous = 0.0
+        for name, ms in self.marks:
+            parts.append(f"{name} +{ms - previous:.0f}ms ({ms:.0f}ms)")
+            previous = ms
+        return f"from {self.origin_label} start: " + " -> ".join(parts)
+
+    def log(self):
+        """Log the timeline once"""
+        if self._logged:
+            return
+        self._logged = True
+        logger.info("Startup timeline %s", self.summary())
+
+timeline = StartupTimeline()
@@ -0,0 +1,306 @@
+"""
+Task Specs
+Task configs compiled once into immutable, validated objects
+
+Each task type has a schema of fields (type, default, range, choices).
+``compile_task`` checks a raw config dict against it and builds a
+``__slots__`` object, so handlers read attributes instead of calling
+``config.get`` with string keys on every tick, and a misspelt option fails
+at start instead of silently falling back to its default.
+"""
+
+import difflib
+import hashlib
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, Type
+from core.yield_tracker import param_key
+
+class TaskSpecError(ValueError):
+    """A task config does not match its task type's schema"""
+
+_TUPLE_NAMES = {2: "an (x, y) point", 4: "a (left, top, width, height) region"}
+
+class Field:
+    """Schema of a single task option"""
+
+    __slots__ = ("name", "kind", "default", "minimum", "maximum", "choices", "length")
+
+    def __init__(self, name: str, kind: type, default: Any = None, minimum: Optional[float] = None,
+                 maximum: Optional[float] = None, choices: Optional[Tuple[Any, ...]] = None,
+                 length: int = 2):
+        """
+        Args:
+            name: Config key
+            kind: str, int, float, bool, tuple for an (x, y) point, or dict
+                for a mapping of names (stored read-only)
+            default: Value when the key is missing or None (None: optional)
+            minimum: Inclusive lower bound for numbers
+            maximum: Inclusive upper bound for numbers
+            choices: Allowed values
+            length: Number of values of a tuple (4: a (left, top, width, height) region)
+        """
+        self.name = name
+        self.kind = kind
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.choices = tuple(choices) if choices is not None else None
+        self.length = length
+
+    def convert(self, task_type: str, value: Any) -> Any:
+        """Validate a raw value and convert it to the field's type"""
+        if value is None:
+            return self.default
+        where = f"{task_type}.{self.name}"
+        kind = self.kind
+        if kind is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TaskSpecError(f"{where}: expected a number, got {value!r}")
+            value = float(value)
+        elif kind is int:
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TaskSpecError(f"{where}: expected an integer, got {value!r}")
+        elif kind is tuple:
+            if (not isinstance(value, (list, tuple)) or len(value) != self.length
+                    or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value)):
+                expected = _TUPLE_NAMES.get(self.length, f"{self.length} numbers")
+                raise TaskSpecError(f"{where}: expected {expected}, got {value!r}")
+            value = tuple(value)
+        elif kind is dict:
+            if not isinstance(value, Mapping) or not all(isinstance(key, str) for key in value):
+                raise TaskSpecError(f"{where}: expected a mapping of names, got {value!r}")
+            return MappingProxyType(dict(value))
+        elif not isinstance(value, kind):
+            raise TaskSpecError(f"{where}: expected {kind.__name__}, got {value!r}")
+
+        if self.minimum is not None and value < self.minimum:
+            raise TaskSpecError(f"{where}: must be >= {self.minimum}, got {value!r}")
+        if self.maximum is not None and value > self.maximum:
+            raise TaskSpecError(f"{where}: must be <= {self.maximum}, got {value!r}")
+        if self.choices is not None and value not in self.choices:
+            choices = ", ".join(repr(choice) for choice in self.choices)
+            raise TaskSpecError(f"{where}: must be one of {choices}, got {value!r}")
+        return value
+
+# Options every task type accepts. "when"/"unless" name screen templates
+# (see vision.templates) that must / must not be visible for a tick to act,
+# and "region" is the part of the screen the task looks at. A "watch" region
+# holds each tick until it changes on screen (at most "watch_timeout" seconds).
+# "branches" maps screen states (see vision.states) to the task to run instead
+# while that screen is showing: a task type, a task config, or None to wait.
+# "counter" is a HUD number read each tick (see vision.digits): its gains are
+# credited to "counter_stat", the task stops once it reaches "stop_at", and
+# the "full" branch runs while it is at or above "full_at".
+COMMON_FIELDS = (
+    Field("type", str, "generic"),
+    Field("game", str),
+    Field("delay", float, 1.0, minimum=0.0),
+    Field("when", str),
+    Field("unless", str),
+    Field("region", tuple, length=4),
+    Field("watch", tuple, length=4),
+    Field("watch_threshold", float, minimum=0.0),
+    Field("watch_timeout", float, minimum=0.0),
+    Field("branches", dict),
+    Field("counter", tuple, length=4),
+    Field("counter_stat", str, "currency", choices=("items", "currency", "xp")),
+    Field("stop_at", float),
+    Field("full_at", float),
+)
+
+class TaskSpec:
+    """
+    Base class of compiled task configs
+
+    Subclasses are created by ``define_spec`` with one slot per schema field.
+    Instances are immutable; ``param_key`` (of ``params()``) is computed once for yield tracking.
+    """
+
+    __slots__ = ("type", "game", "delay", "when", "unless", "region", "watch", "watch_threshold", "watch_timeout",
+                 "branches", "counter", "counter_stat", "stop_at", "full_at", "extra", "param_key")
+
+    fields: Tuple[Field, ...] = COMMON_FIELDS
+    allow_extra = False
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def compile(cls, task_config: Dict[str, Any]) -> "TaskSpec":
+        """Validate a raw config against this spec's schema"""
+        task_type = task_config.get("type") or "generic"
+        names = {field.name for field in cls.fields}
+        unknown = [key for key in task_config if key not in names]
+        if unknown and not cls.allow_extra:
+            raise TaskSpecError(_unknown_message(task_type, unknown[0], names))
+
+        spec = object.__new__(cls)
+        assign = object.__setattr__
+        for field in cls.fields:
+            assign(spec, field.name, field.convert(task_type, task_config.get(field.name)))
+        assign(spec, "type", task_type)
+        assign(spec, "extra", MappingProxyType({key: task_config[key] for key in unknown}))
+        assign(spec, "param_key", param_key(spec.params()))
+        return spec
+
+    def params(self) -> Dict[str, Any]:
+        """
+        Get the options that parameterise the task, for yield tracking
+
+        These are the task type's own options and the common ones changed
+        from their default, so configs differing only in unset common
+        options share a key.
+        """
+        result = {}
+        for index, field in enumerate(self.fields):
+            value = getattr(self, field.name)
+            if value is None or (index < len(COMMON_FIELDS) and value == field.default):
+                continue
+            result[field.name] = value
+        result.update(self.extra)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the spec back as a plain config dict (unset optional fields omitted)"""
+        result = {}
+        for field in self.fields:
+            value = getattr(self, field.name)
+            if value is not None:
+                result[field.name] = value
+        result.update(self.extra)
+        return result
+
+    def replace(self, **changes) -> "TaskSpec":
+        """Get a recompiled copy with some options changed"""
+        return compile_task({**self.to_dict(), **changes})
+
+    def __repr__(self) -> str:
+        options = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"{type(self).__name__}({options})"
+
+_SPECS: Dict[str, Type[TaskSpec]] = {}
+# schema_signature() result, reset whenever a task type is registered
+_signature: Optional[str] = None
+
+def _unknown_message(task_type: str, key: str, names) -> str:
+    """Build the error for an option the schema does not know"""
+    message = f"{task_type}: unknown option {key!r}"
+    close = difflib.get_close_matches(key, names, n=1)
+    if close:
+        message += f" (did you mean {close[0]!r}?)"
+    return message + f"; valid options: {', '.join(sorted(names))}"
+
+def define_spec(task_type: str, *fields: Field, allow_extra: bool = False) -> Type[TaskSpec]:
+    """
+    Register the schema of a task type
+
+    Args:
+        task_type: Value of the config's "type" key
+        fields: Options beyond the common type/game/delay
+        allow_extra: Keep unknown options in ``spec.extra`` instead of failing
+    """
+    class_name = "".join(part.title() for part in task_type.split("_")) + "Spec"
+    spec_class = type(class_name, (TaskSpec,), {
+        "__slots__": tuple(field.name for field in fields),
+        "__doc__": f"Compiled config of a '{task_type}' task",
+        "fields": COMMON_FIELDS + tuple(fields),
+        "allow_extra": allow_extra,
+    })
+    global _signature
+    _SPECS[task_type] = spec_class
+    _signature = None
+    return spec_class
+
+def get_spec_class(task_type: str) -> Type[TaskSpec]:
+    """Get the spec class of a task type (unregistered types use the generic spec)"""
+    return _SPECS.get(task_type, GenericSpec)
+
+def schema_signature() -> str:
+    """
+    Get a hash of every registered task type's schema
+
+    Caches of configs validated against the schemas (the game catalogue) key
+    on it, so changing a field's type, default, range or choices rebuilds them.
+    """
+    global _signature
+    if _signature is not None:
+        return _signature
+    digest = hashlib.sha1()
+    for task_type in sorted(_SPECS):
+        spec_class = _SPECS[task_type]
+        digest.update(repr((task_type, spec_class.allow_extra, [
+            (field.name, field.kind.__name__, field.default, field.minimum, field.maximum, field.choices, field.length)
+            for field in spec_class.fields
+        ])).encode())
+    _signature = digest.hexdigest()
+    return _signature
+
+def compile_task(task_config: Dict[str, Any]) -> TaskSpec:
+    """
+    Compile a raw task config dict
+
+    Raises:
+        TaskSpecError: If an option is unknown, of the wrong type or out of range
+    """
+    if isinstance(task_config, TaskSpec):
+        return task_config
+    if not isinstance(task_config, dict):
+        raise TaskSpecError(f"Task config must be a dict, got {type(task_config).__name__}")
+    return get_spec_class(task_config.get("type") or "generic").compile(task_config)
+
+# ========== BUILT-IN TASK TYPES ==========
+
+GenericSpec = define_spec("generic", allow_extra=True)
+
+define_spec("auto_farm", Field("fruit_type", str, "Any"), Field("location", str, "Default"))
+define_spec("clicker",
+            Field("position", tuple),
+            Field("button", str, "left", choices=("left", "right", "middle")),
+            Field("interval", float, minimum=0.0),
+            Field("duration", float, minimum=0.0))
+define_spec("auto_raid", Field("raid_type", str, "Normal"))
+define_spec("boss_farm", Field("boss", str, "Unknown"))
+define_spec("auto_rob", Field("location", str, "Unknown"))
+define_spec("quest_farm", Field("quest", str, "Default"))
+define_spec("demon_farm", Field("demon", str, "Default"))
+define_spec("auto_hatch", Field("egg", str, "Basic"))
+define_spec("coin_farm", Field("world", str, "Default"))
+define_spec("wave_farm", Field("wave_count", int, 100, minimum=1))
+define_spec("auto_mine", Field("ore", str, "Default"))
+define_spec("auto_click", Field("cps", float, 10.0, minimum=0.1, maximum=1000.0))
+define_spec("auto_work", Field("job", str, "Default"))
+define_spec("auto_tap", Field("cps", float, 30.0, minimum=0.1, maximum=1000.0))
+# "horizon": seconds ahead the garden planner plans for when seed_type is "Best Available"
+define_spec("plant_seeds", Field("seed_type", str, "Default"), Field("horizon", float, 3600.0, minimum=0.0))
+# "harvest_window": after the first crop ripens, wait this many seconds for others to harvest together
+define_spec("harvest_crops", Field("crop_type", str, "All"), Field("harvest_window", float, 0.0, minimum=0.0))
+define_spec("auto_fertilize", Field("fertilizer", str, "Basic"))
+define_spec("upgrade_garden", Field("upgrade", str, "Plot Size"))
+define_spec("buy_seeds", Field("seed_type", str, "Default"), Field("horizon", float, 3600.0, minimum=0.0))
+define_spec("auto_plant_all", Field("seed_type", str, "Best Available"), Field("horizon", float, 3600.0, minimum=0.0))
+define_spec("auto_upgrade_tools", Field("tool", str, "All"))
+define_spec("auto_harvest_all", Field("harvest_window", float, 0.0, minimum=0.0))
+define_spec("full_auto_cycle", Field("seed_type", str, "Best Available"), Field("fertilizer", str, "Basic"),
+            Field("horizon", float, 3600.0, minimum=0.0))
+
+# Task types without options of their own
+for _task_type in (
+    "macro", "cash_farm", "auto_duel", "auto_awaken", "breath_train", "auto_spin",
+    "auto_trade", "auto_summon", "auto_upgrade", "pollen_collect", "honey_convert",
+    "auto_sell", "age_pets", "auto_rebirth", "auto_cook", "auto_serve", "auto_collect",
+    "auto_complete", "auto_run", "auto_aim", "kill_farm", "auto_escape", "auto_rp",
+    "auto_survive", "zombie_kill", "coin_collect", "chi_farm", "auto_evolve", "power_farm",
+    "auto_breed", "auto_block", "auto_solve", "auto_evade", "auto_build", "auto_win",
+    "auto_slap", "glove_farm", "auto_fight", "mana_farm", "auto_grind", "level_farm",
+    "stand_farm", "auto_prestige", "fruit_farm", "auto_quest", "water_plants",
+    "sell_produce", "auto_weed", "auto_pest_control", "auto_compost", "auto_irrigate",
+    "auto_prune", "auto_complete_orders", "auto_collect_rewards",
+    "auto_manage_inventory", "auto_optimize_layout",
+):
+    define_spec(_task_type)
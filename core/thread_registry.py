@@ -0,0 +1,191 @@
+"""
+Thread Registry
+Every worker thread with its name, owner and purpose
+
+Engines, bots and services register the threads they start. The registry
+reports which are alive, how much CPU each has used (from psutil when it is
+installed, otherwise from ``time.thread_time`` samples the workers take
+themselves) and which are zombies: still running longer than ``grace``
+seconds after their owner asked them to stop.
+"""
+
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+# Seconds a worker may keep running after its stop was requested
+ZOMBIE_GRACE = 5.0
+
+class WorkerInfo:
+    """A registered thread"""
+
+    __slots__ = ("thread", "name", "owner", "purpose", "registered_at", "stop_requested_at",
+                 "cpu_time", "cpu_sampled_at", "_last_cpu", "_last_sample")
+
+    def __init__(self, thread: threading.Thread, name: str, owner: str, purpose: str):
+        self.thread = thread
+        self.name = name
+        self.owner = owner
+        self.purpose = purpose
+        self.registered_at = time.monotonic()
+        self.stop_requested_at: Optional[float] = None
+        # Reported by the worker itself when psutil is unavailable
+        self.cpu_time: Optional[float] = None
+        self.cpu_sampled_at: Optional[float] = None
+        # Previous snapshot, for CPU percentages
+        self._last_cpu: Optional[float] = None
+        self._last_sample: Optional[float] = None
+
+    def heartbeat(self):
+        """Record the calling (worker) thread's CPU time"""
+        self.cpu_time = time.thread_time()
+        self.cpu_sampled_at = time.monotonic()
+
+class ThreadRegistry:
+    """Registered worker threads, for diagnostics and shutdown"""
+
+    def __init__(self, grace: float = ZOMBIE_GRACE):
+        self.grace = grace
+        self._workers: Dict[int, WorkerInfo] = {}
+        self._lock = threading.Lock()
+        self._registrations = 0
+        self._process = None
+        self._process_checked = False
+
+    def register(self, thread: threading.Thread, owner: str, purpose: str, name: Optional[str] = None) -> WorkerInfo:
+        """
+        Track a thread (before or after it starts)
+
+        Args:
+            thread: The worker thread; it is renamed to ``name`` when given
+            owner: Who started it, e.g. "AutomationEngine[Blox Fruits]"
+            purpose: What it does, e.g. "auto_farm loop"
+            name: Thread name shown in logs and the Resources tab
+        """
+        if name:
+            thread.name = name
+        info = WorkerInfo(thread, thread.name, owner, purpose)
+        with self._lock:
+            self._workers[id(thread)] = info
+            self._registrations += 1
+            if self._registrations % 64 == 0:
+                self._prune()
+        return info
+
+    def spawn(self, target, owner: str, purpose: str, name: str, args: tuple = (),
+              daemon: bool = True) -> threading.Thread:
+        """Create and register a thread (not started)"""
+        thread = threading.Thread(target=target, args=args, name=name, daemon=daemon)
+        self.register(thread, owner, purpose)
+        return thread
+
+    def get(self, thread: Optional[threading.Thread] = None) -> Optional[WorkerInfo]:
+        """Get a thread's registration (default: the calling thread's)"""
+        thread = thread or threading.current_thread()
+        return self._workers.get(id(thread))
+
+    def stop_requested(self, thread: Optional[threading.Thread]):
+        """Note that a worker was asked to stop; it becomes a zombie if it outlives the grace period"""
+        if thread is None:
+            return
+        info = self._workers.get(id(thread))
+        if info is not None and info.stop_requested_at is None:
+            info.stop_requested_at = time.monotonic()
+
+    def _prune(self):
+        """Forget threads that have exited (lock held)"""
+        for key in [key for key, info in self._workers.items()
+                    if info.thread.ident is not None and not info.thread.is_alive()]:
+            del self._workers[key]
+
+    def _get_process(self):
+        """Get the psutil process on first use (None if psutil is not installed)"""
+        if not self._process_checked:
+            self._process_checked = True
+            try:
+                import psutil
+                self._process = psutil.Process()
+            except Exception:
+                self._process = None
+        return self._process
+
+    def _cpu_times(self) -> Dict[int, float]:
+        """Get CPU seconds per native thread id from psutil (empty without it)"""
+        process = self._get_process()
+        if process is None:
+            return {}
+        try:
+            return {thread.id: thread.user_time + thread.system_time for thread in process.threads()}
+        except Exception:
+            return {}
+
+    def zombies(self) -> List[WorkerInfo]:
+        """Get workers still alive longer than the grace period after their stop"""
+        now = time.monotonic()
+        with self._lock:
+            return [info for info in self._workers.values()
+                    if info.stop_requested_at is not None and now - info.stop_requested_at > self.grace
+                    and info.thread.is_alive()]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Get one record per live thread, registered or not
+
+        ``cpu_percent`` is measured since the previous snapshot, so call this
+        at a steady, low rate.
+        """
+        now = time.monotonic()
+        cpu_times = self._cpu_times()
+        with self._lock:
+            self._prune()
+            workers = {info.thread.ident: info for info in self._workers.values() if info.thread.ident is not None}
+        records = []
+        for thread in threading.enumerate():
+            info = workers.get(thread.ident)
+            cpu = cpu_times.get(thread.native_id)
+            record = {
+                "name": thread.name,
+                "owner": info.owner if info else "unregistered",
+                "purpose": info.purpose if info else "",
+                "daemon": thread.daemon,
+                "age": round(now - info.registered_at, 1) if info else None,
+                "cpu_seconds": None,
+                "cpu_percent": None,
+                "zombie": False,
+            }
+            if info is not None:
+                if cpu is None:
+                    cpu = info.cpu_time
+                if info._last_cpu is not None and cpu is not None and now > info._last_sample:
+                    record["cpu_percent"] = round(100.0 * (cpu - info._last_cpu) / (now - info._last_sample), 1)
+                info._last_cpu, info._last_sample = cpu, now
+                record["zombie"] = (info.stop_requested_at is not None
+                                    and now - info.stop_requested_at > self.grace)
+            if cpu is not None:
+                record["cpu_seconds"] = round(cpu, 3)
+            records.append(record)
+        return records
+
+    def process_stats(self) -> Dict[str, Any]:
+        """Get process-wide thread count, CPU and memory (CPU/memory need psutil)"""
+        stats: Dict[str, Any] = {"threads": threading.active_count(), "registered": len(self._workers),
+                                 "cpu_percent": None, "rss_mb": None}
+        process = self._get_process()
+        if process is not None:
+            try:
+                stats["cpu_percent"] = process.cpu_percent(interval=None)
+                stats["rss_mb"] = round(process.memory_info().rss / (1024 * 1024), 1)
+            except Exception:
+                pass
+        return stats
+
+_registry: Optional[ThreadRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_thread_registry() -> ThreadRegistry:
+    """Get the process-wide thread registry"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ThreadRegistry()
+        return _registry
@@ -0,0 +1,237 @@
+"""
+Yield Tracker
+Outcome accounting for automation handlers and bandit tuning of task parameters
+"""
+
+import itertools
+import logging
+import random
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Config keys that identify a task rather than parameterise it
+_NON_PARAM_KEYS = ("type", "game")
+
+class TaskOutcome:
+    """Structured result of a single handler tick"""
+
+    __slots__ = ("items", "currency", "xp")
+
+    def __init__(self, items: int = 0, currency: float = 0.0, xp: float = 0.0):
+        self.items = items
+        self.currency = currency
+        self.xp = xp
+
+    @classmethod
+    def coerce(cls, result: Any) -> Optional["TaskOutcome"]:
+        """Convert a handler return value (None, dict or TaskOutcome) to an outcome"""
+        if result is None or isinstance(result, cls):
+            return result
+        if isinstance(result, dict):
+            return cls(
+                items=result.get("items", 0),
+                currency=result.get("currency", 0.0),
+                xp=result.get("xp", 0.0)
+            )
+        raise TypeError(f"Handler returned unsupported outcome: {result!r}")
+
+    def value(self, weights: Dict[str, float]) -> float:
+        """Collapse the outcome to a single score using per-field weights"""
+        return (self.items * weights.get("items", 1.0)
+                + self.currency * weights.get("currency", 1.0)
+                + self.xp * weights.get("xp", 1.0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get outcome as a plain dict"""
+        return {"items": self.items, "currency": self.currency, "xp": self.xp}
+
+def param_key(task_config: Dict[str, Any]) -> Tuple:
+    """Build a hashable key for the parameter set of a task config"""
+    key = []
+    for name in sorted(task_config):
+        if name in _NON_PARAM_KEYS:
+            continue
+        value = task_config[name]
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        key.append((name, value))
+    return tuple(key)
+
+class _YieldWindow:
+    """Rolling sums of outcomes for one task type and parameter set"""
+
+    __slots__ = ("entries", "items", "currency", "xp", "ticks", "first_seen")
+
+    def __init__(self, now: float):
+        self.entries: deque = deque()
+        self.items = 0
+        self.currency = 0.0
+        self.xp = 0.0
+        self.ticks = 0
+        self.first_seen = now
+
+    def add(self, now: float, outcome: TaskOutcome):
+        self.entries.append((now, outcome.items, outcome.currency, outcome.xp))
+        self.items += outcome.items
+        self.currency += outcome.currency
+        self.xp += outcome.xp
+        self.ticks += 1
+
+    def evict(self, cutoff: float):
+        entries = self.entries
+        while entries and entries[0][0] < cutoff:
+            _, items, currency, xp = entries.popleft()
+            self.items -= items
+            self.currency -= currency
+            self.xp -= xp
+            self.ticks -= 1
+
+class YieldTracker:
+    """Rolling yield-per-hour per task type and parameter set"""
+
+    def __init__(self, window: float = 3600.0, weights: Optional[Dict[str, float]] = None):
+        self.window = window
+        self.weights = weights or {"items": 1.0, "currency": 1.0, "xp": 1.0}
+        self._windows: Dict[Tuple[str, Tuple], _YieldWindow] = {}
+
+    def record(self, task_type: str, key: Tuple, outcome: Optional[TaskOutcome],
+               now: Optional[float] = None):
+        """Record the outcome of one tick (None counts as a tick with no yield)"""
+        now = time.time() if now is None else now
+        window = self._windows.get((task_type, key))
+        if window is None:
+            window = self._windows[(task_type, key)] = _YieldWindow(now)
+        window.add(now, outcome or TaskOutcome())
+        window.evict(now - self.window)
+
+    def yield_per_hour(self, task_type: str, key: Tuple,
+                       now: Optional[float] = None) -> Dict[str, float]:
+        """Get the rolling per-hour rates for one task type and parameter set"""
+        window = self._windows.get((task_type, key))
+        if window is None:
+            return {"items": 0.0, "currency": 0.0, "xp": 0.0, "value": 0.0}
+        now = time.time() if now is None else now
+        window.evict(now - self.window)
+        span = min(self.window, now - window.first_seen)
+        scale = 3600.0 / span if span > 0 else 0.0
+        rates = {
+            "items": window.items * scale,
+            "currency": window.currency * scale,
+            "xp": window.xp * scale
+        }
+        rates["value"] = (rates["items"] * self.weights.get("items", 1.0)
+                          + rates["currency"] * self.weights.get("currency", 1.0)
+                          + rates["xp"] * self.weights.get("xp", 1.0))
+        return rates
+
+    def report(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Get yield-per-hour for every tracked task type and parameter set"""
+        now = time.time() if now is None else now
+        rows = []
+        for (task_type, key), window in self._windows.items():
+            rows.append({
+                "type": task_type,
+                "params": dict(key),
+                "ticks": window.ticks,
+                "per_hour": self.yield_per_hour(task_type, key, now)
+            })
+        rows.sort(key=lambda row: row["per_hour"]["value"], reverse=True)
+        return rows
+
+    def clear(self):
+        """Drop all recorded outcomes"""
+        self._windows.clear()
+
+class ParameterTuner:
+    """
+    Epsilon-greedy multi-armed bandit over candidate task parameters
+
+    Every combination of the candidate values is an arm. An arm is held for
+    ``pulls_per_arm`` ticks so that the reward (yield per hour, including the
+    delay between ticks) is measured over more than a single noisy action.
+    """
+
+    def __init__(self, candidates: Dict[str, List[Any]], epsilon: float = 0.3,
+                 decay: float = 0.97, min_epsilon: float = 0.02, pulls_per_arm: int = 5,
+                 weights: Optional[Dict[str, float]] = None, seed: Optional[int] = None):
+        if not candidates or not all(candidates.values()):
+            raise ValueError("ParameterTuner needs at least one value per candidate parameter")
+        names = sorted(candidates)
+        self.arms: List[Dict[str, Any]] = [
+            dict(zip(names, values))
+            for values in itertools.product(*(candidates[name] for name in names))
+        ]
+        self.epsilon = epsilon
+        self.decay = decay
+        self.min_epsilon = min_epsilon
+        self.pulls_per_arm = max(1, pulls_per_arm)
+        self.weights = weights or {"items": 1.0, "currency": 1.0, "xp": 1.0}
+        self._rng = random.Random(seed)
+        self._means = [0.0] * len(self.arms)
+        self._counts = [0] * len(self.arms)
+        self._untried = list(range(len(self.arms)))
+        self._current = self._untried.pop(0)
+        self._pull_ticks = 0
+        self._pull_value = 0.0
+        self._pull_elapsed = 0.0
+
+    @property
+    def current_arm(self) -> int:
+        """Index into ``arms`` of the arm being held"""
+        return self._current
+
+    def select(self) -> Dict[str, Any]:
+        """Get the parameter overrides for the next tick"""
+        return self.arms[self._current]
+
+    def update(self, outcome: Optional[TaskOutcome], elapsed: float):
+        """Feed back the outcome of a tick and the wall time it took"""
+        if outcome is not None:
+            self._pull_value += outcome.value(self.weights)
+        self._pull_elapsed += elapsed
+        self._pull_ticks += 1
+        if self._pull_ticks < self.pulls_per_arm:
+            return
+
+        reward = self._pull_value * 3600.0 / self._pull_elapsed if self._pull_elapsed > 0 else 0.0
+        arm = self._current
+        self._counts[arm] += 1
+        self._means[arm] += (reward - self._means[arm]) / self._counts[arm]
+        self._pull_ticks = 0
+        self._pull_value = 0.0
+        self._pull_elapsed = 0.0
+        self._current = self._next_arm()
+
+    def _next_arm(self) -> int:
+        """Pick the next arm to hold"""
+        if self._untried:
+            return self._untried.pop(0)
+        explore = self._rng.random() < self.epsilon
+        self.epsilon = max(self.min_epsilon, self.epsilon * self.decay)
+        if explore:
+            return self._rng.randrange(len(self.arms))
+        return self._best_index()
+
+    def _best_index(self) -> int:
+        return max(range(len(self.arms)), key=lambda i: (self._counts[i] > 0, self._means[i]))
+
+    @property
+    def converged(self) -> bool:
+        """True once every arm was tried and exploration has decayed to its floor"""
+        return not self._untried and self.epsilon <= self.min_epsilon
+
+    def best(self) -> Dict[str, Any]:
+        """Get the best-yielding parameter set seen so far"""
+        return dict(self.arms[self._best_index()])
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Get the estimated yield per hour of every arm"""
+        return [
+            {"params": dict(arm), "pulls": self._counts[i], "value_per_hour": self._means[i]}
+            for i, arm in enumerate(self.arms)
+        ]
@@ -4,16 +4,25 @@ Modern GUI using CustomTkinter with enhanced styling
 """
 
 import customtkinter as ctk
+import importlib
 import logging
 from typing import Dict, Any
-from gui.tabs.script_executor_tab import ScriptExecutorTab
-from gui.tabs.automation_tab import AutomationTab
-from gui.tabs.bot_tab import BotTab
-from gui.tabs.macro_tab import MacroTab
-from gui.tabs.settings_tab import SettingsTab
+from core.startup import timeline
+from core.shutdown import get_shutdown_coordinator
 
 logger = logging.getLogger(__name__)
 
+# (key, tab title, module, class). Tab modules are imported and their widgets
+# built only when the tab is first selected.
+TAB_SPECS = [
+    ("executor", "📜 Script Executor", "gui.tabs.script_executor_tab", "ScriptExecutorTab"),
+    ("automation", "🤖 Automation", "gui.tabs.automation_tab", "AutomationTab"),
+    ("bot", "🚀 Bots", "gui.tabs.bot_tab", "BotTab"),
+    ("macro", "⌨️ Macro/Clicker", "gui.tabs.macro_tab", "MacroTab"),
+    ("resources", "📊 Resources", "gui.tabs.resources_tab", "ResourcesTab"),
+    ("settings", "⚙️ Settings", "gui.tabs.settings_tab", "SettingsTab"),
+]
+
 class MainWindow(ctk.CTk):
     """Main application window with enhanced UI"""
     
@@ -71,12 +80,15 @@ class MainWindow(ctk.CTk):
             content_frame,
             corner_radius=10,
             border_width=2,
-            border_color=("#3B8ED0", "#1F6AA5")
+            border_color=("#3B8ED0", "#1F6AA5"),
+            command=self._on_tab_selected
         )
         self.tabview.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         
         # Create tabs
         self.tabs = {}
+        self.tab_instances: Dict[str, Any] = {}
+        self._placeholders: Dict[str, Any] = {}
         self._create_tabs()
         
         # Enhanced status bar
@@ -94,6 +106,13 @@ class MainWindow(ctk.CTk):
         )
         self.status_label.grid(row=0, column=0, sticky="ew", padx=15, pady=10)
         
+        # First paint, then build the visible tab once the event loop is idle
+        self._map_binding = self.bind("<Map>", self._on_first_map, add="+")
+        
+        # Stop engines, bots and the recorder before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        timeline.mark("window_constructed")
         logger.info("Main window initialized with enhanced UI")
     
     def _center_window(self):
@@ -106,26 +125,77 @@ class MainWindow(ctk.CTk):
         self.geometry(f'{width}x{height}+{x}+{y}')
     
     def _create_tabs(self):
-        """Create all tabs with icons"""
-        # Script Executor Tab
-        self.tabs["executor"] = self.tabview.add("📜 Script Executor")
-        ScriptExecutorTab(self.tabs["executor"], self)
-        
-        # Automation Tab
-        self.tabs["automation"] = self.tabview.add("🤖 Automation")
-        AutomationTab(self.tabs["automation"], self)
-        
-        # Bot Tab
-        self.tabs["bot"] = self.tabview.add("🚀 Bots")
-        BotTab(self.tabs["bot"], self)
-        
-        # Macro Tab
-        self.tabs["macro"] = self.tabview.add("⌨️ Macro/Clicker")
-        MacroTab(self.tabs["macro"], self)
-        
-        # Settings Tab
-        self.tabs["settings"] = self.tabview.add("⚙️ Settings")
-        SettingsTab(self.tabs["settings"], self)
+        """Create tab frames with lightweight placeholders"""
+        for key, title, _, _ in TAB_SPECS:
+            frame = self.tabview.add(title)
+            self.tabs[key] = frame
+            frame.grid_columnconfigure(0, weight=1)
+            frame.grid_rowconfigure(0, weight=1)
+            placeholder = ctk.CTkLabel(
+                frame,
+                text="Loading...",
+                font=ctk.CTkFont(size=12),
+                text_color="gray"
+            )
+            placeholder.grid(row=0, column=0)
+            self._placeholders[key] = placeholder
+    
+    def _on_first_map(self, event):
+        """Record first paint and schedule construction of the visible tab"""
+        if event.widget is not self:
+            return
+        self.unbind("<Map>", self._map_binding)
+        timeline.mark("first_paint")
+        self.after_idle(self._on_startup_idle)
+    
+    def _on_startup_idle(self):
+        """Build the initially selected tab and log the startup timeline"""
+        self._on_tab_selected()
+        self.update_idletasks()
+        timeline.mark("interactive")
+        timeline.log()
+    
+    def _on_tab_selected(self):
+        """Build the selected tab the first time it is shown"""
+        title = self.tabview.get()
+        for key, tab_title, _, _ in TAB_SPECS:
+            if tab_title == title:
+                self._ensure_tab(key)
+                break
+    
+    def _ensure_tab(self, key: str):
+        """Import a tab's module and construct its widgets if not done yet"""
+        if key in self.tab_instances:
+            return self.tab_instances[key]
+        
+        _, title, module_name, class_name = next(spec for spec in TAB_SPECS if spec[0] == key)
+        frame = self.tabs[key]
+        try:
+            module = importlib.import_module(module_name)
+            tab_class = getattr(module, class_name)
+            frame.grid_rowconfigure(0, weight=0)
+            self.tab_instances[key] = tab_class(frame, self)
+        except Exception as e:
+            logger.error("Error building tab %s: %s", title, e)
+            self._placeholders[key].configure(text=f"✗ Failed to load: {e}", text_color="red")
+            self.update_status(f"Failed to load {title}", "error")
+            return None
+        
+        self._placeholders.pop(key).destroy()
+        timeline.mark(f"tab_{key}_built")
+        logger.debug("Built tab %s", title)
+        return self.tab_instances[key]
+    
+    def _on_close(self):
+        """Stop every registered component in parallel, flush, then close"""
+        self.update_status("Shutting down...", "warning")
+        self.update_idletasks()
+        for tab in self.tab_instances.values():
+            stop_updates = getattr(tab, "stop_updates", None)
+            if stop_updates is not None:
+                stop_updates()
+        get_shutdown_coordinator().shutdown(timeout=self.config.get("shutdown_timeout", 5.0))
+        self.destroy()
     
     def update_status(self, message: str, status_type: str = "info"):
         """Update status bar with color coding"""
@@ -149,4 +219,4 @@ class MainWindow(ctk.CTk):
             text=f"{icon} {message}",
             text_color=color
         )
-        logger.debug(f"Status ({status_type}): {message}")
+        logger.debug("Status (%s): %s", status_type, message)
@@ -5,7 +5,9 @@ Enhanced interface for game automation with search and categories
 
 import customtkinter as ctk
 import logging
+from typing import Optional
 from modules.game_automation import GameAutomationManager
+from modules.plugins import PluginError
 from core.automation_engine import AutomationState
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,8 @@ class AutomationTab:
         self.game_manager = GameAutomationManager()
         self.current_automation = None
         self.config_vars = {}
+        # Pending after() job of the stats refresh
+        self._after_job: Optional[str] = None
         
         # Configure grid
         parent.grid_columnconfigure(0, weight=1)
@@ -204,7 +208,13 @@ class AutomationTab:
         
         self.config_vars = {}
         game_name = self.game_var.get()
-        automation = self.game_manager.get_automation(game_name)
+        try:
+            # Imports the game's plugin on first selection
+            automation = self.game_manager.get_automation(game_name)
+        except PluginError as e:
+            logger.error("%s", e)
+            self.main_window.update_status(str(e), "error")
+            return
         
         # Game info header
         info_frame = ctk.CTkFrame(self.options_scroll, corner_radius=5)
@@ -216,412 +226,34 @@ class AutomationTab:
             font=ctk.CTkFont(size=14, weight="bold")
         ).pack(padx=15, pady=10)
         
-        # Create game-specific options for ALL games
-        row = 0
-        
-        # ========== FIGHTING GAMES ==========
-        if game_name == "Blox Fruits":
-            self._create_option_row("Fruit Type:", "fruit", ["Any"] + automation.fruits, row)
-            row += 1
-            self._create_option_row("Location:", "location", automation.farming_locations, row)
-            row += 1
-            self._create_option_row("Raid Type:", "raid", ["Normal", "Elite", "Legendary"], row)
-            row += 1
-            self._create_button_row("▶ Start Fruit Farming", lambda: self._start_blox_fruits(), row)
-            row += 1
-            self._create_button_row("⚔ Auto Raid", lambda: automation.auto_raid(self.config_vars.get("raid", ctk.StringVar(value="Normal")).get()), row)
-            row += 1
-            self._create_button_row("👑 Boss Farm", lambda: automation.auto_boss_farm("Raid Boss"), row)
-        
-        elif game_name == "Da Hood":
-            self._create_option_row("Automation Type:", "type", ["Cash Farm", "Auto Duel", "Auto Rob"], row)
-            row += 1
-            self._create_option_row("Rob Location:", "rob_loc", ["Bank", "Gas Station", "Jewelry Store"], row)
-            row += 1
-            self._create_button_row("▶ Start Automation", lambda: self._start_da_hood(), row)
-        
-        elif game_name == "King Legacy":
-            self._create_option_row("Quest Type:", "quest", ["Bandit", "Marine", "Boss", "Raid"], row)
-            row += 1
-            self._create_option_row("Sea:", "sea", ["First Sea", "Second Sea", "Third Sea"], row)
-            row += 1
-            self._create_button_row("⚔ Farm Quests", lambda: automation.farm_quests(self.config_vars.get("quest", ctk.StringVar(value="Bandit")).get()), row)
-            row += 1
-            self._create_button_row("✨ Auto Awaken", lambda: automation.auto_awaken(), row)
-        
-        elif game_name == "Project Slayers":
-            self._create_option_row("Demon Type:", "demon", ["Lower Moon", "Upper Moon", "Muzan"], row)
-            row += 1
-            self._create_option_row("Breathing Style:", "breath", ["Water", "Thunder", "Flame", "Wind"], row)
-            row += 1
-            self._create_button_row("👹 Farm Demons", lambda: automation.farm_demons(self.config_vars.get("demon", ctk.StringVar(value="Lower Moon")).get()), row)
-            row += 1
-            self._create_button_row("💨 Auto Train Breathing", lambda: automation.auto_breath(), row)
-        
-        elif game_name == "Shindo Life":
-            self._create_option_row("Quest Type:", "quest", ["Daily", "Weekly", "Boss"], row)
-            row += 1
-            self._create_button_row("⚔ Farm Quests", lambda: automation.farm_quests(), row)
-            row += 1
-            self._create_button_row("🎰 Auto Spin Bloodlines", lambda: automation.auto_spin(), row)
-        
-        elif game_name == "Ninja Legends":
-            self._create_option_row("Chi Type:", "chi", ["Normal", "Golden", "Rainbow"], row)
-            row += 1
-            self._create_button_row("⚡ Farm Chi", lambda: automation.farm_chi(), row)
-            row += 1
-            self._create_button_row("✨ Auto Evolve Pets", lambda: automation.auto_evolve(), row)
-        
-        elif game_name == "Super Power Fighting Simulator":
-            self._create_option_row("Power Type:", "power", ["Basic", "Advanced", "Legendary"], row)
-            row += 1
-            self._create_button_row("💪 Farm Powers", lambda: automation.farm_powers(), row)
-        
-        elif game_name == "Your Bizarre Adventure":
-            self._create_option_row("Stand Type:", "stand", ["Common", "Uncommon", "Rare", "Epic", "Legendary"], row)
-            row += 1
-            self._create_button_row("⭐ Farm Stands", lambda: automation.farm_stands(), row)
-            row += 1
-            self._create_button_row("⬆ Auto Prestige", lambda: automation.auto_prestige(), row)
-        
-        elif game_name == "A One Piece Game":
-            self._create_option_row("Fruit Type:", "fruit", ["Paramecia", "Zoan", "Logia"], row)
-            row += 1
-            self._create_button_row("🍎 Farm Devil Fruits", lambda: automation.farm_fruits(), row)
-            row += 1
-            self._create_button_row("⚔ Auto Raid", lambda: automation.auto_raid(), row)
-        
-        elif game_name == "Grand Piece Online":
-            self._create_option_row("Fruit Type:", "fruit", ["Common", "Uncommon", "Rare", "Legendary"], row)
-            row += 1
-            self._create_button_row("🍎 Farm Devil Fruits", lambda: automation.farm_fruits(), row)
-            row += 1
-            self._create_button_row("📜 Auto Quest", lambda: automation.auto_quest(), row)
-        
-        elif game_name == "Slap Battles":
-            self._create_option_row("Glove Type:", "glove", ["Default", "Golden", "Custom"], row)
-            row += 1
-            self._create_button_row("👋 Auto Slap", lambda: automation.auto_slap(), row)
-            row += 1
-            self._create_button_row("🧤 Farm Gloves", lambda: automation.farm_gloves(), row)
-        
-        elif game_name == "Ability Wars":
-            self._create_option_row("Ability Type:", "ability", ["Common", "Rare", "Epic", "Legendary"], row)
-            row += 1
-            self._create_button_row("⚔ Auto Fight", lambda: automation.auto_fight(), row)
-        
-        # ========== SIMULATOR GAMES ==========
-        elif game_name == "Pet Simulator X":
-            self._create_option_row("Egg Type:", "egg", ["Basic", "Golden", "Rainbow", "Dark Matter"], row)
-            row += 1
-            self._create_option_row("World:", "world", ["Spawn", "Forest", "Desert", "Volcano", "Tech World"], row)
-            row += 1
-            self._create_button_row("🥚 Auto Hatch Eggs", lambda: automation.auto_hatch(self.config_vars.get("egg", ctk.StringVar(value="Basic")).get()), row)
-            row += 1
-            self._create_button_row("💰 Farm Coins", lambda: automation.auto_farm_coins(self.config_vars.get("world", ctk.StringVar(value="Spawn")).get()), row)
-            row += 1
-            self._create_button_row("🔄 Auto Trade", lambda: automation.auto_trade(), row)
-        
-        elif game_name == "Pet Simulator 99":
-            self._create_option_row("Egg Type:", "egg", ["Starter", "Golden", "Rainbow"], row)
-            row += 1
-            self._create_button_row("🥚 Auto Hatch", lambda: automation.auto_hatch(), row)
-            row += 1
-            self._create_button_row("💰 Farm Coins", lambda: automation.farm_coins(), row)
-        
-        elif game_name == "Anime Adventures":
-            self._create_option_row("Wave Count:", "waves", ["50", "100", "200", "500", "Infinite"], row)
-            row += 1
-            self._create_option_row("Difficulty:", "difficulty", ["Easy", "Normal", "Hard", "Extreme"], row)
-            row += 1
-            self._create_button_row("🌊 Auto Farm Waves", lambda: automation.auto_farm_waves(int(self.config_vars.get("waves", ctk.StringVar(value="100")).get() or 100)), row)
-            row += 1
-            self._create_button_row("🎰 Auto Summon", lambda: automation.auto_summon(), row)
-            row += 1
-            self._create_button_row("⬆ Auto Upgrade Units", lambda: automation.auto_upgrade(), row)
-        
-        elif game_name == "Bee Swarm Simulator":
-            self._create_option_row("Field Type:", "field", ["Sunflower", "Dandelion", "Mushroom", "Blue Flower"], row)
-            row += 1
-            self._create_button_row("🌸 Collect Pollen", lambda: automation.auto_collect_pollen(), row)
-            row += 1
-            self._create_button_row("🍯 Convert Honey", lambda: automation.auto_convert_honey(), row)
-        
-        elif game_name == "Mining Simulator 2":
-            self._create_option_row("Ore Type:", "ore", ["Copper", "Iron", "Gold", "Diamond", "Mythic"], row)
-            row += 1
-            self._create_button_row("⛏ Auto Mine", lambda: automation.auto_mine(self.config_vars.get("ore", ctk.StringVar(value="Copper")).get()), row)
-            row += 1
-            self._create_button_row("💰 Auto Sell Ores", lambda: automation.auto_sell(), row)
-        
-        elif game_name == "Adopt Me":
-            self._create_option_row("Pet Type:", "pet", ["Common", "Uncommon", "Rare", "Ultra-Rare", "Legendary"], row)
-            row += 1
-            self._create_button_row("🐾 Auto Age Pets", lambda: automation.auto_age_pets(), row)
-            row += 1
-            self._create_button_row("🔄 Auto Trade", lambda: automation.auto_trade(), row)
-        
-        elif game_name == "Clicker Simulator":
-            self._create_option_row("CPS:", "cps", ["10", "20", "30", "50", "100"], row)
-            row += 1
-            self._create_button_row("🖱 Auto Click", lambda: automation.auto_click(int(self.config_vars.get("cps", ctk.StringVar(value="20")).get())), row)
-            row += 1
-            self._create_button_row("⬆ Auto Rebirth", lambda: automation.auto_rebirth(), row)
-        
-        elif game_name == "Tapping Legends X":
-            self._create_option_row("CPS:", "cps", ["20", "30", "50", "100"], row)
-            row += 1
-            self._create_button_row("👆 Auto Tap", lambda: automation.auto_tap(int(self.config_vars.get("cps", ctk.StringVar(value="30")).get())), row)
-        
-        # ========== TOWER DEFENSE ==========
-        elif game_name == "All Star Tower Defense":
-            self._create_option_row("Wave Count:", "waves", ["50", "100", "200", "Infinite"], row)
-            row += 1
-            self._create_button_row("🌊 Auto Farm Waves", lambda: automation.auto_wave_farm(), row)
-            row += 1
-            self._create_button_row("🎰 Auto Summon", lambda: automation.auto_summon(), row)
-        
-        elif game_name == "Tower Defense Simulator":
-            self._create_option_row("Difficulty:", "difficulty", ["Easy", "Normal", "Hard", "Molten"], row)
-            row += 1
-            self._create_button_row("🌊 Auto Wave Farm", lambda: automation.auto_wave_farm(), row)
-        
-        # ========== TYCOON GAMES ==========
-        elif game_name == "Restaurant Tycoon 2":
-            self._create_option_row("Food Type:", "food", ["Burger", "Pizza", "Sushi", "Dessert"], row)
-            row += 1
-            self._create_button_row("👨‍🍳 Auto Cook", lambda: automation.auto_cook(), row)
-            row += 1
-            self._create_button_row("🍽 Auto Serve", lambda: automation.auto_serve(), row)
-        
-        elif game_name == "Theme Park Tycoon":
-            self._create_option_row("Ride Type:", "ride", ["Roller Coaster", "Ferris Wheel", "Carousel"], row)
-            row += 1
-            self._create_button_row("💰 Auto Collect Money", lambda: automation.auto_collect(), row)
-            row += 1
-            self._create_button_row("⬆ Auto Upgrade Rides", lambda: automation.auto_upgrade(), row)
-        
-        # ========== OBBIES ==========
-        elif game_name == "Tower of Hell":
-            self._create_option_row("Difficulty:", "difficulty", ["Easy", "Normal", "Hard", "Extreme"], row)
-            row += 1
-            self._create_button_row("🏃 Auto Complete Tower", lambda: automation.auto_complete(), row)
-        
-        elif game_name == "Speed Run 4":
-            self._create_option_row("Course:", "course", ["Beginner", "Intermediate", "Advanced", "Expert"], row)
-            row += 1
-            self._create_button_row("🏃 Auto Run Course", lambda: automation.auto_run(), row)
-        
-        elif game_name == "Evade":
-            self._create_option_row("Difficulty:", "difficulty", ["Easy", "Normal", "Hard"], row)
-            row += 1
-            self._create_button_row("🏃 Auto Evade", lambda: automation.auto_evade(), row)
-        
-        # ========== FPS GAMES ==========
-        elif game_name == "Arsenal":
-            self._create_option_row("Mode:", "mode", ["Standard", "Competitive", "Gun Rotation"], row)
-            row += 1
-            self._create_button_row("🎯 Auto Aim Assist", lambda: automation.auto_aim(), row)
-        
-        elif game_name == "Phantom Forces":
-            self._create_option_row("Weapon Type:", "weapon", ["Assault Rifle", "SMG", "Sniper", "Pistol"], row)
-            row += 1
-            self._create_button_row("⚔ Farm Kills", lambda: automation.auto_farm_kills(), row)
-        
-        # ========== ADVENTURE GAMES ==========
-        elif game_name == "Jailbreak":
-            self._create_option_row("Rob Location:", "location", ["Bank", "Jewelry Store", "Gas Station", "Museum"], row)
-            row += 1
-            self._create_button_row("💰 Auto Rob", lambda: automation.auto_rob(self.config_vars.get("location", ctk.StringVar(value="Bank")).get()), row)
-            row += 1
-            self._create_button_row("🏃 Auto Escape Prison", lambda: automation.auto_escape(), row)
-        
-        elif game_name == "Mad City":
-            self._create_option_row("Rob Type:", "rob", ["Bank", "Jewelry Store", "Gas Station"], row)
-            row += 1
-            self._create_button_row("💰 Auto Rob", lambda: automation.auto_rob(), row)
-        
-        elif game_name == "Dragon Adventures":
-            self._create_option_row("Dragon Type:", "dragon", ["Common", "Uncommon", "Rare", "Legendary"], row)
-            row += 1
-            self._create_button_row("🐉 Auto Breed Dragons", lambda: automation.auto_breed(), row)
-            row += 1
-            self._create_button_row("💰 Farm Coins", lambda: automation.farm_coins(), row)
-        
-        # ========== LIFE GAMES ==========
-        elif game_name == "Welcome to Bloxburg":
-            self._create_option_row("Job:", "job", ["Pizza Delivery", "Cashier", "Hairdresser", "Mechanic"], row)
-            row += 1
-            self._create_button_row("💼 Auto Work", lambda: automation.auto_work(self.config_vars.get("job", ctk.StringVar(value="Pizza Delivery")).get()), row)
-        
-        elif game_name == "Brookhaven":
-            self._create_option_row("Roleplay Type:", "rp", ["Family", "School", "Hospital", "Police"], row)
-            row += 1
-            self._create_button_row("🎭 Auto Roleplay", lambda: automation.auto_roleplay(), row)
-        
-        elif game_name == "MeepCity":
-            self._create_option_row("Job:", "job", ["Pizza Delivery", "Cashier"], row)
-            row += 1
-            self._create_button_row("💼 Auto Work", lambda: automation.auto_work(), row)
-        
-        # ========== SURVIVAL GAMES ==========
-        elif game_name == "Natural Disaster Survival":
-            self._create_option_row("Disaster Type:", "disaster", ["Tornado", "Flood", "Earthquake", "Blizzard"], row)
-            row += 1
-            self._create_button_row("🌪 Auto Survive", lambda: automation.auto_survive(), row)
-        
-        elif game_name == "Zombie Rush":
-            self._create_option_row("Wave:", "wave", ["1", "10", "25", "50", "100"], row)
-            row += 1
-            self._create_button_row("🧟 Kill Zombies", lambda: automation.auto_kill_zombies(), row)
-            row += 1
-            self._create_button_row("💰 Collect Coins", lambda: automation.auto_collect_coins(), row)
-        
-        # ========== HORROR GAMES ==========
-        elif game_name == "Doors":
-            self._create_option_row("Difficulty:", "difficulty", ["Easy", "Normal", "Hard", "Extreme"], row)
-            row += 1
-            self._create_button_row("🔓 Auto Solve Puzzles", lambda: automation.auto_solve(), row)
-        
-        elif game_name == "Rainbow Friends":
-            self._create_option_row("Chapter:", "chapter", ["Chapter 1", "Chapter 2", "Chapter 3"], row)
-            row += 1
-            self._create_button_row("🏃 Auto Escape", lambda: automation.auto_escape(), row)
-        
-        elif game_name == "Piggy":
-            self._create_option_row("Chapter:", "chapter", ["Chapter 1", "Chapter 2", "Chapter 3", "Chapter 4"], row)
-            row += 1
-            self._create_button_row("🏃 Auto Escape", lambda: automation.auto_escape(), row)
-        
-        # ========== OTHER GAMES ==========
-        elif game_name == "Build A Boat":
-            self._create_option_row("Build Type:", "build", ["Speed", "Defense", "Attack"], row)
-            row += 1
-            self._create_button_row("🚢 Auto Build", lambda: automation.auto_build(), row)
-            row += 1
-            self._create_button_row("💰 Farm Coins", lambda: automation.farm_coins(), row)
-        
-        elif game_name == "Murder Mystery 2":
-            self._create_option_row("Mode:", "mode", ["Classic", "Assassin", "Hardcore"], row)
-            row += 1
-            self._create_button_row("🎯 Auto Win", lambda: automation.auto_win(), row)
-        
-        elif game_name == "Blade Ball":
-            self._create_option_row("Difficulty:", "difficulty", ["Easy", "Normal", "Hard"], row)
-            row += 1
-            self._create_button_row("⚔ Auto Block", lambda: automation.auto_block(), row)
-        
-        elif game_name == "Rogue Lineage":
-            self._create_option_row("Class:", "class", ["Mage", "Warrior", "Assassin"], row)
-            row += 1
-            self._create_button_row("💫 Farm Mana", lambda: automation.farm_mana(), row)
-            row += 1
-            self._create_button_row("⚔ Auto Grind", lambda: automation.auto_grind(), row)
-        
-        elif game_name == "Deepwoken":
-            self._create_option_row("Build Type:", "build", ["Mage", "Warrior", "Hybrid"], row)
-            row += 1
-            self._create_button_row("⬆ Farm Levels", lambda: automation.farm_levels(), row)
-        
-        elif game_name == "World Zero":
-            self._create_option_row("Quest Type:", "quest", ["Main", "Side", "Daily"], row)
-            row += 1
-            self._create_button_row("📜 Farm Quests", lambda: automation.farm_quests(), row)
-        
-        elif game_name == "Anime Fighting Simulator":
-            self._create_option_row("Training Type:", "training", ["Strength", "Speed", "Chakra"], row)
-            row += 1
-            self._create_button_row("⚡ Farm Chi", lambda: automation.farm_chi(), row)
-            row += 1
-            self._create_button_row("💪 Auto Train", lambda: automation.auto_train(), row)
-        
-        elif game_name == "Grow a Garden":
-            # 20+ automation features for Grow a Garden
-            self._create_option_row("Seed Type:", "seed", ["Best Available"] + automation.seed_types, row)
-            row += 1
-            self._create_option_row("Fertilizer Type:", "fertilizer", automation.fertilizer_types, row)
-            row += 1
-            self._create_option_row("Tool Type:", "tool", automation.tool_types, row)
-            row += 1
-            self._create_button_row("🌱 Plant Seeds", lambda: automation.plant_seeds(self.config_vars.get("seed", ctk.StringVar(value="Best Available")).get()), row)
-            row += 1
-            self._create_button_row("💧 Water Plants", lambda: automation.water_plants(), row)
-            row += 1
-            self._create_button_row("🌾 Harvest Crops", lambda: automation.harvest_crops("All"), row)
-            row += 1
-            self._create_button_row("🌿 Auto Fertilize", lambda: automation.auto_fertilize(self.config_vars.get("fertilizer", ctk.StringVar(value="Basic")).get()), row)
-            row += 1
-            self._create_button_row("⬆ Upgrade Garden", lambda: automation.upgrade_garden("Plot Size"), row)
-            row += 1
-            self._create_button_row("💰 Sell Produce", lambda: automation.sell_produce(), row)
-            row += 1
-            self._create_button_row("🛒 Buy Seeds", lambda: automation.buy_seeds(self.config_vars.get("seed", ctk.StringVar(value="Best Available")).get()), row)
-            row += 1
-            self._create_button_row("🌾 Auto Weed", lambda: automation.auto_weed(), row)
-            row += 1
-            self._create_button_row("🐛 Pest Control", lambda: automation.auto_pest_control(), row)
-            row += 1
-            self._create_button_row("♻ Auto Compost", lambda: automation.auto_compost(), row)
-            row += 1
-            self._create_button_row("💦 Auto Irrigate", lambda: automation.auto_irrigate(), row)
-            row += 1
-            self._create_button_row("✂ Auto Prune", lambda: automation.auto_prune(), row)
-            row += 1
-            self._create_button_row("🌾 Harvest All", lambda: automation.auto_harvest_all(), row)
-            row += 1
-            self._create_button_row("🌱 Plant All Plots", lambda: automation.auto_plant_all(self.config_vars.get("seed", ctk.StringVar(value="Best Available")).get()), row)
-            row += 1
-            self._create_button_row("🔧 Upgrade Tools", lambda: automation.auto_upgrade_tools(self.config_vars.get("tool", ctk.StringVar(value="All")).get()), row)
-            row += 1
-            self._create_button_row("📋 Complete Orders", lambda: automation.auto_complete_orders(), row)
-            row += 1
-            self._create_button_row("🎁 Collect Rewards", lambda: automation.auto_collect_rewards(), row)
-            row += 1
-            self._create_button_row("📦 Manage Inventory", lambda: automation.auto_manage_inventory(), row)
-            row += 1
-            self._create_button_row("📐 Optimize Layout", lambda: automation.auto_optimize_layout(), row)
-            row += 1
-            self._create_button_row("🔄 Full Auto Cycle", lambda: automation.full_auto_cycle(), row)
-        
-        else:
+        # Game-specific rows come from the game's definition
+        definition = automation.definition
+        if definition is None:
             # Fallback for any unlisted games
-            self._create_option_row("Automation Mode:", "mode", ["Farming", "Grinding", "Collecting"], row)
-            row += 1
-            self._create_button_row("▶ Start Generic Automation", lambda: automation.start_farming({}), row)
+            self._create_option_row("Automation Mode:", "mode", ["Farming", "Grinding", "Collecting"], 0)
+            self._create_button_row("▶ Start Generic Automation", lambda: automation.start_farming({}), 1)
+            return
+        
+        for row, entry in enumerate(definition.ui):
+            if "var" in entry:
+                self._create_option_row(entry["label"], entry["var"], entry["values"], row)
+            else:
+                self._create_button_row(entry["button"], self._make_action_command(automation, entry), row)
     
-    def _start_blox_fruits(self):
-        """Start Blox Fruits automation"""
-        automation = self.game_manager.get_automation("Blox Fruits")
-        config = {
-            "fruit_type": self.config_vars.get("fruit", ctk.StringVar(value="Any")).get(),
-            "location": self.config_vars.get("location", ctk.StringVar(value="First Sea")).get()
-        }
-        automation.farm_fruits(config["fruit_type"], config["location"])
-        self.current_automation = automation
-        self.start_btn.configure(state="disabled")
-        self.pause_btn.configure(state="normal")
-        self.stop_btn.configure(state="normal")
-        self.progress_bar.set(0.5)
-        self.progress_label.configure(text="Status: Running - Blox Fruits", text_color="green")
-        self.main_window.update_status("Blox Fruits automation started", "success")
-    
-    def _start_da_hood(self):
-        """Start Da Hood automation"""
-        automation = self.game_manager.get_automation("Da Hood")
-        auto_type = self.config_vars.get("type", ctk.StringVar(value="Cash Farm")).get()
-        if auto_type == "Cash Farm":
-            automation.auto_farm_cash()
-        elif auto_type == "Auto Duel":
-            automation.auto_duel()
-        else:
-            automation.auto_rob()
-        self.current_automation = automation
-        self.start_btn.configure(state="disabled")
-        self.pause_btn.configure(state="normal")
-        self.stop_btn.configure(state="normal")
-        self.progress_bar.set(0.5)
-        self.progress_label.configure(text="Status: Running - Da Hood", text_color="green")
-        self.main_window.update_status("Da Hood automation started", "success")
+    def _make_action_command(self, automation, entry: dict):
+        """Build the command of a definition button: its action called with literal or option values"""
+        def command():
+            if "action_by" in entry:
+                choice = self.config_vars[entry["action_by"]].get()
+                action = entry["actions"][choice]
+            else:
+                action = entry["action"]
+            args = [
+                self.config_vars[arg[1:]].get() if isinstance(arg, str) and arg.startswith("$") else arg
+                for arg in entry.get("args", [])
+            ]
+            return automation.run_action(action, *args)
+        return command
     
     def _create_option_row(self, label_text: str, var_key: str, options: list, row: int):
         """Create a labeled option row"""
@@ -670,7 +302,7 @@ class AutomationTab:
                 self.progress_label.configure(text=f"Status: Running - {game_name}", text_color="green")
                 self.main_window.update_status(f"{button_text} started for {game_name}", "success")
             except Exception as e:
-                logger.error(f"Error executing automation: {e}")
+                logger.error("Error executing automation: %s", e)
                 self.main_window.update_status(f"Error: {str(e)}", "error")
         
         button = ctk.CTkButton(
@@ -694,25 +326,9 @@ class AutomationTab:
         game_name = self.game_var.get()
         automation = self.game_manager.get_automation(game_name)
         
-        # Most games use button-based automation, but some use the main Start button
-        # This handles games that don't have specific button handlers
-        
-        # Games that use generic start_farming
-        generic_games = [
-            "King Legacy", "Project Slayers", "Shindo Life", "Ninja Legends",
-            "Super Power Fighting Simulator", "Your Bizarre Adventure", "A One Piece Game",
-            "Grand Piece Online", "Slap Battles", "Ability Wars", "Pet Simulator 99",
-            "Bee Swarm Simulator", "Mining Simulator 2", "Adopt Me", "Clicker Simulator",
-            "Tapping Legends X", "All Star Tower Defense", "Tower Defense Simulator",
-            "Restaurant Tycoon 2", "Theme Park Tycoon", "Tower of Hell", "Speed Run 4",
-            "Evade", "Arsenal", "Phantom Forces", "Mad City", "Dragon Adventures",
-            "Welcome to Bloxburg", "Brookhaven", "MeepCity", "Natural Disaster Survival",
-            "Zombie Rush", "Doors", "Rainbow Friends", "Piggy", "Build A Boat",
-            "Murder Mystery 2", "Blade Ball", "Rogue Lineage", "Deepwoken", "World Zero",
-            "Anime Fighting Simulator", "Grow a Garden"
-        ]
-        
-        if game_name in generic_games:
+        # Most games use button-based automation; games whose definition
+        # enables the main Start button run generic start_farming
+        if automation.definition is not None and automation.definition.start_button:
             automation.start_farming({})
             self.current_automation = automation
             self.start_btn.configure(state="disabled")
@@ -761,4 +377,10 @@ class AutomationTab:
             self.stats_label.configure(
                 text=f"Runtime: {runtime}s | Actions: {actions} | Errors: {errors}"
             )
-        self.parent.after(1000, self._update_stats)
+        self._after_job = self.parent.after(1000, self._update_stats)
+    
+    def stop_updates(self):
+        """Cancel the periodic stats refresh"""
+        if self._after_job is not None:
+            self.parent.after_cancel(self._after_job)
+            self._after_job = None
@@ -5,6 +5,7 @@ Enhanced interface for managing bots
 
 import customtkinter as ctk
 import logging
+from typing import Dict
 from core.bot_framework import BotFramework, BotType
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,8 @@ class BotTab:
         self.parent = parent
         self.main_window = main_window
         self.bot_framework = BotFramework()
+        # Pending after() job per refresh loop
+        self._after_jobs: Dict[str, str] = {}
         
         # Configure grid
         parent.grid_columnconfigure(0, weight=1)
@@ -255,8 +258,9 @@ class BotTab:
                 )
                 remove_btn.pack(side="left", padx=3)
         
-        # Schedule next update
-        self.parent.after(2000, self._update_bots_list)
+        # Schedule next update (replaces the pending one, so calls from
+        # create/remove do not start extra refresh loops)
+        self._schedule("bots_list", 2000, self._update_bots_list)
     
     def start_bot(self, bot_id: str):
         """Start a bot"""
@@ -283,4 +287,17 @@ class BotTab:
         self.stats_label.configure(
             text=f"📊 Total Bots: {total_bots} | 🟢 Active: {active_bots} | ⚫ Inactive: {inactive_bots}"
         )
-        self.parent.after(1000, self._update_stats)
+        self._schedule("stats", 1000, self._update_stats)
+    
+    def _schedule(self, name: str, delay_ms: int, callback):
+        """Run ``callback`` after ``delay_ms``, cancelling the loop's pending run"""
+        job = self._after_jobs.pop(name, None)
+        if job is not None:
+            self.parent.after_cancel(job)
+        self._after_jobs[name] = self.parent.after(delay_ms, callback)
+    
+    def stop_updates(self):
+        """Cancel the periodic refreshes"""
+        for job in self._after_jobs.values():
+            self.parent.after_cancel(job)
+        self._after_jobs.clear()
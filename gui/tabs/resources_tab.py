@@ -0,0 +1,109 @@
+"""
+Resources Tab
+Live view of worker threads, their owners and CPU use
+"""
+
+import customtkinter as ctk
+import logging
+from typing import Dict, Optional
+from core.thread_registry import get_thread_registry
+
+logger = logging.getLogger(__name__)
+
+# Refresh interval; the snapshot walks every thread, so keep it low
+REFRESH_MS = 3000
+
+class ResourcesTab:
+    """Thread and resource registry panel"""
+
+    def __init__(self, parent, main_window):
+        self.parent = parent
+        self.main_window = main_window
+        self.registry = get_thread_registry()
+        self._after_job: Optional[str] = None
+
+        # Configure grid
+        parent.grid_columnconfigure(0, weight=1)
+        parent.grid_rowconfigure(1, weight=1)
+
+        # Summary
+        summary_frame = ctk.CTkFrame(parent, corner_radius=10)
+        summary_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+        summary_frame.grid_columnconfigure(0, weight=1)
+
+        self.summary_label = ctk.CTkLabel(
+            summary_frame,
+            text="📊 Collecting...",
+            anchor="w",
+            font=ctk.CTkFont(size=12, weight="bold")
+        )
+        self.summary_label.grid(row=0, column=0, sticky="ew", padx=15, pady=10)
+
+        self.zombie_label = ctk.CTkLabel(
+            summary_frame,
+            text="",
+            anchor="w",
+            font=ctk.CTkFont(size=12),
+            text_color="orange"
+        )
+        self.zombie_label.grid(row=1, column=0, sticky="ew", padx=15, pady=(0, 10))
+
+        # Thread table
+        self.table = ctk.CTkTextbox(
+            parent,
+            font=ctk.CTkFont(family="Consolas", size=11),
+            wrap="none"
+        )
+        self.table.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
+        self.table.configure(state="disabled")
+
+        self._refresh()
+
+    def _is_visible(self) -> bool:
+        """True while this tab is the selected one"""
+        try:
+            return self.parent.winfo_ismapped()
+        except Exception:
+            return False
+
+    def _refresh(self):
+        """Redraw from a registry snapshot (skipped while the tab is hidden)"""
+        if self._is_visible():
+            try:
+                self._render(self.registry.snapshot(), self.registry.process_stats())
+            except Exception as e:
+                logger.error("Error refreshing resources: %s", e)
+        self._after_job = self.parent.after(REFRESH_MS, self._refresh)
+
+    def _render(self, records, process: Dict):
+        """Fill the summary and the thread table"""
+        cpu = f"{process['cpu_percent']:.0f}%" if process["cpu_percent"] is not None else "n/a"
+        rss = f"{process['rss_mb']:.0f} MB" if process["rss_mb"] is not None else "n/a"
+        self.summary_label.configure(
+            text=f"📊 Threads: {process['threads']} | Registered: {process['registered']} | CPU: {cpu} | Memory: {rss}"
+        )
+        zombies = [record["name"] for record in records if record["zombie"]]
+        self.zombie_label.configure(
+            text=f"⚠ Still running after stop: {', '.join(zombies)}" if zombies else ""
+        )
+
+        lines = [f"{'Thread':<28}{'Owner':<34}{'Purpose':<30}{'CPU s':>9}{'CPU %':>8}{'Age s':>9}"]
+        records = sorted(records, key=lambda record: (record["owner"] == "unregistered", record["owner"], record["name"]))
+        for record in records:
+            cpu_seconds = f"{record['cpu_seconds']:.2f}" if record["cpu_seconds"] is not None else "-"
+            cpu_percent = f"{record['cpu_percent']:.1f}" if record["cpu_percent"] is not None else "-"
+            age = f"{record['age']:.0f}" if record["age"] is not None else "-"
+            name = ("⚠ " if record["zombie"] else "") + record["name"]
+            lines.append(f"{name[:27]:<28}{record['owner'][:33]:<34}{record['purpose'][:29]:<30}"
+                         f"{cpu_seconds:>9}{cpu_percent:>8}{age:>9}")
+
+        self.table.configure(state="normal")
+        self.table.delete("1.0", "end")
+        self.table.insert("1.0", "\n".join(lines))
+        self.table.configure(state="disabled")
+
+    def stop_updates(self):
+        """Cancel the periodic refresh"""
+        if self._after_job is not None:
+            self.parent.after_cancel(self._after_job)
+            self._after_job = None
@@ -5,7 +5,7 @@ Application settings and configuration
 
 import customtkinter as ctk
 import logging
-from core.config_manager import ConfigManager
+from core.config_manager import get_config_service
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +15,8 @@ class SettingsTab:
     def __init__(self, parent, main_window):
         self.parent = parent
         self.main_window = main_window
-        self.config_manager = ConfigManager()
-        self.config = self.config_manager.load_config()
+        self.config_service = get_config_service()
+        self.config = self.config_service.load()
         
         # Configure grid
         parent.grid_columnconfigure(0, weight=1)
@@ -33,7 +33,7 @@ class SettingsTab:
         self.api_key_entry.grid(row=1, column=1, sticky="ew", padx=10, pady=5)
         self.api_key_entry.insert(0, self.config.get("api_key", ""))
         
-        ctk.CTkLabel(api_frame, text="API Secret:"YOUR_SECRET_HERE"w", padx=10, pady=5)
+        ctk.CTkLabel(api_frame, text="API Secret:").grid(row=2, column=0, sticky="w", padx=10, pady=5)
         self.api_secret_entry = ctk.CTkEntry(api_frame, show="*")
         self.api_secret_entry.grid(row=2, column=1, sticky="ew", padx=10, pady=5)
         self.api_secret_entry.insert(0, self.config.get("api_secret", ""))
@@ -107,7 +107,11 @@ class SettingsTab:
         for feature_name, var in self.feature_vars.items():
             self.config["features"][feature_name] = var.get()
         
-        if self.config_manager.save_config(self.config):
+        self.config_service.update({
+            key: self.config[key]
+            for key in ("api_key", "api_secret", "roblox_cookie", "theme", "features")
+        })
+        if self.config_service.flush():
             self.main_window.update_status("Settings saved successfully")
             logger.info("Settings saved")
 
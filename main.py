@@ -12,11 +12,14 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from core.startup import timeline
+
 try:
     import customtkinter as ctk
     from gui.main_window import MainWindow
-    from core.config_manager import ConfigManager
+    from core.config_manager import get_config_service
     from core.logger import setup_logger
+    from core.shutdown import get_shutdown_coordinator
 except ImportError as e:
     print(f"Missing dependencies: {e}")
     print("Please install requirements: pip install -r requirements.txt")
@@ -25,20 +28,28 @@ except ImportError as e:
 def main():
     """Main entry point for the application"""
     # Setup logging
+    timeline.mark("imports_done")
     logger = setup_logger()
     logger.info("Starting Roblox Automation Suite")
     
-    # Load configuration
-    config_manager = ConfigManager()
-    config = config_manager.load_config()
+    # Load configuration (shared with the tabs through the config service)
+    config = get_config_service().load()
     
     # Initialize GUI
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
     
     app = MainWindow(config)
+    timeline.mark("mainloop_entered")
     app.mainloop()
+    
+    # Stop anything still running and write debounced config changes (no-op
+    # if the window's close handler already did)
+    get_shutdown_coordinator().shutdown()
 
 if __name__ == "__main__":
+    # Template matching workers are spawned processes; frozen builds need this
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
 
@@ -1,21 +1,60 @@
 """
 Game-Specific Automation Modules
 Automation scripts for 50+ popular Roblox games
+
+Games are defined as data in modules/games (see modules.game_catalog) or by
+plugins (see modules.plugins). A definition's actions become methods and its
+option lists attributes, so
+``manager.get_automation("Blox Fruits").farm_fruits("Bomb", "First Sea")``
+and ``.fruits`` work without a class per game.
 """
 
 import logging
 from typing import Dict, Any, Optional, List
 from core.automation_engine import AutomationEngine
+from core.yield_tracker import ParameterTuner
+from modules.game_catalog import GameDefinition, get_catalog
+from modules.plugins import get_plugin_registry
 
 logger = logging.getLogger(__name__)
 
 class GameAutomation:
     """Base class for game-specific automation"""
     
-    def __init__(self, game_name: str, category: str = "General"):
+    def __init__(self, game_name: str, category: str = "General", definition: Optional[GameDefinition] = None):
         self.game_name = game_name
         self.category = category
-        self.engine = AutomationEngine()
+        self.definition = definition
+        self.engine = AutomationEngine(game=game_name)
+    
+    @classmethod
+    def from_definition(cls, definition: GameDefinition) -> "GameAutomation":
+        """Create the automation of a catalogue game"""
+        return cls(definition.name, definition.category, definition)
+    
+    def __getattr__(self, name: str):
+        """Expose the definition's actions as methods and option lists as attributes"""
+        definition = self.__dict__.get("definition")
+        if definition is not None:
+            if name in definition.actions:
+                def action(*args, **kwargs) -> bool:
+                    return self.run_action(name, *args, **kwargs)
+                action.__name__ = name
+                action.__doc__ = definition.actions[name]["doc"]
+                return action
+            if name in definition.options:
+                return definition.options[name]
+        raise AttributeError(f"{type(self).__name__} for {self.__dict__.get('game_name')!r} has no attribute {name!r}")
+    
+    def list_actions(self) -> List[str]:
+        """Get the names of the game's actions"""
+        return list(self.definition.actions) if self.definition else []
+    
+    def run_action(self, name: str, *args, **kwargs) -> bool:
+        """Start one of the game's actions, e.g. run_action("auto_hatch", "Golden")"""
+        if self.definition is None or name not in self.definition.actions:
+            raise AttributeError(f"{self.game_name} has no action '{name}'")
+        return self.start_farming(self.definition.build_config(name, args, kwargs))
         
     def start_farming(self, config: Dict[str, Any]) -> bool:
         """Start farming automation"""
@@ -29,798 +68,23 @@ class GameAutomation:
     def stop_farming(self) -> bool:
         """Stop farming automation"""
         return self.engine.stop_automation()
-
-# ========== FIGHTING/COMBAT GAMES ==========
-
-class BloxFruitsAutomation(GameAutomation):
-    """Blox Fruits automation"""
-    
-    def __init__(self):
-        super().__init__("Blox Fruits", "Fighting")
-        self.farming_locations = ["First Sea", "Second Sea", "Third Sea"]
-        self.fruits = ["Bomb", "Spike", "Chop", "Spring", "Kilo", "Spin", "Bird: Falcon", 
-                       "Smoke", "Flame", "Ice", "Sand", "Dark", "Diamond", "Light", "Rubber",
-                       "Barrier", "Magma", "Quake", "Blizzard", "Gravity", "Dough", "Shadow",
-                       "Venom", "Control", "Spirit", "Dragon", "Leopard", "Mammoth", "Sound",
-                       "Phoenix", "Rumble", "Pain", "Blizzard", "Spider"]
-    
-    def farm_fruits(self, fruit_type: str, location: str) -> bool:
-        """Farm specific fruits"""
-        config = {"fruit_type": fruit_type, "location": location, "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_raid(self, raid_type: str) -> bool:
-        """Auto-raid functionality"""
-        config = {"type": "auto_raid", "raid_type": raid_type, "delay": 5.0}
-        return self.engine.start_automation(config)
-    
-    def auto_boss_farm(self, boss_name: str) -> bool:
-        """Auto-farm bosses"""
-        config = {"type": "boss_farm", "boss": boss_name, "delay": 3.0}
-        return self.engine.start_automation(config)
-
-class DaHoodAutomation(GameAutomation):
-    """Da Hood automation"""
-    
-    def __init__(self):
-        super().__init__("Da Hood", "Fighting")
-    
-    def auto_farm_cash(self) -> bool:
-        """Auto-farm cash"""
-        config = {"type": "cash_farm", "delay": 1.5}
-        return self.start_farming(config)
-    
-    def auto_duel(self) -> bool:
-        """Auto-duel functionality"""
-        config = {"type": "auto_duel", "delay": 3.0}
-        return self.engine.start_automation(config)
-    
-    def auto_rob(self) -> bool:
-        """Auto-rob stores"""
-        config = {"type": "auto_rob", "delay": 2.0}
-        return self.engine.start_automation(config)
-
-class KingLegacyAutomation(GameAutomation):
-    """King Legacy automation"""
-    
-    def __init__(self):
-        super().__init__("King Legacy", "Fighting")
-    
-    def farm_quests(self, quest_type: str) -> bool:
-        """Auto-farm quests"""
-        config = {"type": "quest_farm", "quest": quest_type, "delay": 2.5}
-        return self.start_farming(config)
-    
-    def auto_awaken(self) -> bool:
-        """Auto-awaken fruits"""
-        config = {"type": "auto_awaken", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-class ProjectSlayersAutomation(GameAutomation):
-    """Project Slayers automation"""
-    
-    def __init__(self):
-        super().__init__("Project Slayers", "Fighting")
-    
-    def farm_demons(self, demon_type: str) -> bool:
-        """Farm demons"""
-        config = {"type": "demon_farm", "demon": demon_type, "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_breath(self) -> bool:
-        """Auto-train breathing"""
-        config = {"type": "breath_train", "delay": 3.0}
-        return self.engine.start_automation(config)
-
-class ShindoLifeAutomation(GameAutomation):
-    """Shindo Life automation"""
-    
-    def __init__(self):
-        super().__init__("Shindo Life", "Fighting")
-    
-    def farm_quests(self) -> bool:
-        """Auto-farm quests"""
-        config = {"type": "quest_farm", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_spin(self) -> bool:
-        """Auto-spin for bloodlines"""
-        config = {"type": "auto_spin", "delay": 1.0}
-        return self.engine.start_automation(config)
-
-# ========== SIMULATOR GAMES ==========
-
-class PetSimulatorXAutomation(GameAutomation):
-    """Pet Simulator X automation"""
-    
-    def __init__(self):
-        super().__init__("Pet Simulator X", "Simulator")
-    
-    def auto_hatch(self, egg_type: str) -> bool:
-        """Auto-hatch eggs"""
-        config = {"type": "auto_hatch", "egg": egg_type, "delay": 1.0}
-        return self.engine.start_automation(config)
-    
-    def auto_farm_coins(self, world: str) -> bool:
-        """Auto-farm coins"""
-        config = {"type": "coin_farm", "world": world, "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_trade(self) -> bool:
-        """Auto-trade pets"""
-        config = {"type": "auto_trade", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-class AnimeAdventuresAutomation(GameAutomation):
-    """Anime Adventures automation"""
-    
-    def __init__(self):
-        super().__init__("Anime Adventures", "Tower Defense")
-    
-    def auto_farm_waves(self, wave_count: int = 100) -> bool:
-        """Auto-farm waves"""
-        config = {"type": "wave_farm", "wave_count": wave_count, "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_summon(self) -> bool:
-        """Auto-summon units"""
-        config = {"type": "auto_summon", "delay": 5.0}
-        return self.engine.start_automation(config)
-    
-    def auto_upgrade(self) -> bool:
-        """Auto-upgrade units"""
-        config = {"type": "auto_upgrade", "delay": 3.0}
-        return self.engine.start_automation(config)
-
-class BeeSwarmSimulatorAutomation(GameAutomation):
-    """Bee Swarm Simulator automation"""
-    
-    def __init__(self):
-        super().__init__("Bee Swarm Simulator", "Simulator")
-    
-    def auto_collect_pollen(self) -> bool:
-        """Auto-collect pollen"""
-        config = {"type": "pollen_collect", "delay": 1.5}
-        return self.start_farming(config)
-    
-    def auto_convert_honey(self) -> bool:
-        """Auto-convert to honey"""
-        config = {"type": "honey_convert", "delay": 2.0}
-        return self.engine.start_automation(config)
-
-class MiningSimulator2Automation(GameAutomation):
-    """Mining Simulator 2 automation"""
-    
-    def __init__(self):
-        super().__init__("Mining Simulator 2", "Simulator")
-    
-    def auto_mine(self, ore_type: str) -> bool:
-        """Auto-mine ores"""
-        config = {"type": "auto_mine", "ore": ore_type, "delay": 1.0}
-        return self.start_farming(config)
-    
-    def auto_sell(self) -> bool:
-        """Auto-sell ores"""
-        config = {"type": "auto_sell", "delay": 3.0}
-        return self.engine.start_automation(config)
-
-class AdoptMeAutomation(GameAutomation):
-    """Adopt Me automation"""
-    
-    def __init__(self):
-        super().__init__("Adopt Me", "Simulator")
-    
-    def auto_age_pets(self) -> bool:
-        """Auto-age pets"""
-        config = {"type": "age_pets", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_trade(self) -> bool:
-        """Auto-trade pets"""
-        config = {"type": "auto_trade", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-class ClickerSimulatorAutomation(GameAutomation):
-    """Clicker Simulator automation"""
-    
-    def __init__(self):
-        super().__init__("Clicker Simulator", "Simulator")
-    
-    def auto_click(self, cps: int = 20) -> bool:
-        """Auto-click"""
-        config = {"type": "auto_click", "cps": cps, "delay": 1.0/cps}
-        return self.start_farming(config)
-    
-    def auto_rebirth(self) -> bool:
-        """Auto-rebirth"""
-        config = {"type": "auto_rebirth", "delay": 10.0}
-        return self.engine.start_automation(config)
-
-# ========== TYCOON GAMES ==========
-
-class RestaurantTycoon2Automation(GameAutomation):
-    """Restaurant Tycoon 2 automation"""
-    
-    def __init__(self):
-        super().__init__("Restaurant Tycoon 2", "Tycoon")
-    
-    def auto_cook(self) -> bool:
-        """Auto-cook food"""
-        config = {"type": "auto_cook", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_serve(self) -> bool:
-        """Auto-serve customers"""
-        config = {"type": "auto_serve", "delay": 1.5}
-        return self.engine.start_automation(config)
-
-class ThemeParkTycoonAutomation(GameAutomation):
-    """Theme Park Tycoon automation"""
-    
-    def __init__(self):
-        super().__init__("Theme Park Tycoon", "Tycoon")
-    
-    def auto_collect(self) -> bool:
-        """Auto-collect money"""
-        config = {"type": "auto_collect", "delay": 1.0}
-        return self.start_farming(config)
-    
-    def auto_upgrade(self) -> bool:
-        """Auto-upgrade rides"""
-        config = {"type": "auto_upgrade", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-# ========== OBBIES/PARKOUR ==========
-
-class TowerOfHellAutomation(GameAutomation):
-    """Tower of Hell automation"""
-    
-    def __init__(self):
-        super().__init__("Tower of Hell", "Obby")
-    
-    def auto_complete(self) -> bool:
-        """Auto-complete tower"""
-        config = {"type": "auto_complete", "delay": 0.5}
-        return self.start_farming(config)
-
-class SpeedRun4Automation(GameAutomation):
-    """Speed Run 4 automation"""
-    
-    def __init__(self):
-        super().__init__("Speed Run 4", "Obby")
-    
-    def auto_run(self) -> bool:
-        """Auto-run course"""
-        config = {"type": "auto_run", "delay": 0.3}
-        return self.start_farming(config)
-
-# ========== MORE GAMES ==========
-
-class ArsenalAutomation(GameAutomation):
-    """Arsenal automation"""
-    
-    def __init__(self):
-        super().__init__("Arsenal", "FPS")
-    
-    def auto_aim(self) -> bool:
-        """Auto-aim assist"""
-        config = {"type": "auto_aim", "delay": 0.1}
-        return self.engine.start_automation(config)
-
-class PhantomForcesAutomation(GameAutomation):
-    """Phantom Forces automation"""
-    
-    def __init__(self):
-        super().__init__("Phantom Forces", "FPS")
-    
-    def auto_farm_kills(self) -> bool:
-        """Auto-farm kills"""
-        config = {"type": "kill_farm", "delay": 2.0}
-        return self.start_farming(config)
-
-class JailbreakAutomation(GameAutomation):
-    """Jailbreak automation"""
-    
-    def __init__(self):
-        super().__init__("Jailbreak", "Adventure")
-    
-    def auto_rob(self, location: str) -> bool:
-        """Auto-rob locations"""
-        config = {"type": "auto_rob", "location": location, "delay": 3.0}
-        return self.start_farming(config)
-    
-    def auto_escape(self) -> bool:
-        """Auto-escape prison"""
-        config = {"type": "auto_escape", "delay": 2.0}
-        return self.engine.start_automation(config)
-
-class MadCityAutomation(GameAutomation):
-    """Mad City automation"""
-    
-    def __init__(self):
-        super().__init__("Mad City", "Adventure")
-    
-    def auto_rob(self) -> bool:
-        """Auto-rob"""
-        config = {"type": "auto_rob", "delay": 2.5}
-        return self.start_farming(config)
-
-class WelcomeToBloxburgAutomation(GameAutomation):
-    """Welcome to Bloxburg automation"""
-    
-    def __init__(self):
-        super().__init__("Welcome to Bloxburg", "Life")
-    
-    def auto_work(self, job: str) -> bool:
-        """Auto-work"""
-        config = {"type": "auto_work", "job": job, "delay": 2.0}
-        return self.start_farming(config)
-
-class BrookhavenAutomation(GameAutomation):
-    """Brookhaven automation"""
-    
-    def __init__(self):
-        super().__init__("Brookhaven", "Life")
-    
-    def auto_roleplay(self) -> bool:
-        """Auto-roleplay"""
-        config = {"type": "auto_rp", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-class MeepCityAutomation(GameAutomation):
-    """MeepCity automation"""
-    
-    def __init__(self):
-        super().__init__("MeepCity", "Life")
-    
-    def auto_work(self) -> bool:
-        """Auto-work"""
-        config = {"type": "auto_work", "delay": 2.0}
-        return self.start_farming(config)
-
-class NaturalDisasterSurvivalAutomation(GameAutomation):
-    """Natural Disaster Survival automation"""
-    
-    def __init__(self):
-        super().__init__("Natural Disaster Survival", "Survival")
-    
-    def auto_survive(self) -> bool:
-        """Auto-survive disasters"""
-        config = {"type": "auto_survive", "delay": 1.0}
-        return self.start_farming(config)
-
-class ZombieRushAutomation(GameAutomation):
-    """Zombie Rush automation"""
-    
-    def __init__(self):
-        super().__init__("Zombie Rush", "Survival")
-    
-    def auto_kill_zombies(self) -> bool:
-        """Auto-kill zombies"""
-        config = {"type": "zombie_kill", "delay": 1.5}
-        return self.start_farming(config)
-    
-    def auto_collect_coins(self) -> bool:
-        """Auto-collect coins"""
-        config = {"type": "coin_collect", "delay": 1.0}
-        return self.engine.start_automation(config)
-
-class NinjaLegendsAutomation(GameAutomation):
-    """Ninja Legends automation"""
-    
-    def __init__(self):
-        super().__init__("Ninja Legends", "Fighting")
-    
-    def farm_chi(self) -> bool:
-        """Farm chi"""
-        config = {"type": "chi_farm", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_evolve(self) -> bool:
-        """Auto-evolve pets"""
-        config = {"type": "auto_evolve", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-class SuperPowerFightingSimulatorAutomation(GameAutomation):
-    """Super Power Fighting Simulator automation"""
-    
-    def __init__(self):
-        super().__init__("Super Power Fighting Simulator", "Fighting")
-    
-    def farm_powers(self) -> bool:
-        """Farm powers"""
-        config = {"type": "power_farm", "delay": 2.0}
-        return self.start_farming(config)
-
-class AllStarTowerDefenseAutomation(GameAutomation):
-    """All Star Tower Defense automation"""
-    
-    def __init__(self):
-        super().__init__("All Star Tower Defense", "Tower Defense")
-    
-    def auto_wave_farm(self) -> bool:
-        """Auto-farm waves"""
-        config = {"type": "wave_farm", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_summon(self) -> bool:
-        """Auto-summon units"""
-        config = {"type": "auto_summon", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-class TappingLegendsXAutomation(GameAutomation):
-    """Tapping Legends X automation"""
-    
-    def __init__(self):
-        super().__init__("Tapping Legends X", "Clicker")
-    
-    def auto_tap(self, cps: int = 30) -> bool:
-        """Auto-tap"""
-        config = {"type": "auto_tap", "cps": cps, "delay": 1.0/cps}
-        return self.start_farming(config)
-
-class AnimeFightingSimulatorAutomation(GameAutomation):
-    """Anime Fighting Simulator automation"""
-    
-    def __init__(self):
-        super().__init__("Anime Fighting Simulator", "Fighting")
-    
-    def farm_chi(self) -> bool:
-        """Farm chi"""
-        config = {"type": "chi_farm", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_train(self) -> bool:
-        """Auto-train"""
-        config = {"type": "auto_train", "delay": 3.0}
-        return self.engine.start_automation(config)
-
-class DragonAdventuresAutomation(GameAutomation):
-    """Dragon Adventures automation"""
-    
-    def __init__(self):
-        super().__init__("Dragon Adventures", "Adventure")
-    
-    def auto_breed(self) -> bool:
-        """Auto-breed dragons"""
-        config = {"type": "auto_breed", "delay": 10.0}
-        return self.engine.start_automation(config)
-    
-    def farm_coins(self) -> bool:
-        """Farm coins"""
-        config = {"type": "coin_farm", "delay": 2.0}
-        return self.start_farming(config)
-
-class PetSimulator99Automation(GameAutomation):
-    """Pet Simulator 99 automation"""
-    
-    def __init__(self):
-        super().__init__("Pet Simulator 99", "Simulator")
-    
-    def auto_hatch(self) -> bool:
-        """Auto-hatch eggs"""
-        config = {"type": "auto_hatch", "delay": 1.0}
-        return self.engine.start_automation(config)
-    
-    def farm_coins(self) -> bool:
-        """Farm coins"""
-        config = {"type": "coin_farm", "delay": 2.0}
-        return self.start_farming(config)
-
-class BladeBallAutomation(GameAutomation):
-    """Blade Ball automation"""
-    
-    def __init__(self):
-        super().__init__("Blade Ball", "Sports")
-    
-    def auto_block(self) -> bool:
-        """Auto-block ball"""
-        config = {"type": "auto_block", "delay": 0.1}
-        return self.engine.start_automation(config)
-
-class DoorsAutomation(GameAutomation):
-    """Doors automation"""
-    
-    def __init__(self):
-        super().__init__("Doors", "Horror")
-    
-    def auto_solve(self) -> bool:
-        """Auto-solve puzzles"""
-        config = {"type": "auto_solve", "delay": 1.0}
-        return self.start_farming(config)
-
-class RainbowFriendsAutomation(GameAutomation):
-    """Rainbow Friends automation"""
-    
-    def __init__(self):
-        super().__init__("Rainbow Friends", "Horror")
-    
-    def auto_escape(self) -> bool:
-        """Auto-escape"""
-        config = {"type": "auto_escape", "delay": 1.5}
-        return self.start_farming(config)
-
-class PiggyAutomation(GameAutomation):
-    """Piggy automation"""
-    
-    def __init__(self):
-        super().__init__("Piggy", "Horror")
-    
-    def auto_escape(self) -> bool:
-        """Auto-escape"""
-        config = {"type": "auto_escape", "delay": 2.0}
-        return self.start_farming(config)
-
-class EvadeAutomation(GameAutomation):
-    """Evade automation"""
-    
-    def __init__(self):
-        super().__init__("Evade", "Obby")
-    
-    def auto_evade(self) -> bool:
-        """Auto-evade"""
-        config = {"type": "auto_evade", "delay": 0.2}
-        return self.start_farming(config)
-
-class BuildABoatAutomation(GameAutomation):
-    """Build A Boat automation"""
-    
-    def __init__(self):
-        super().__init__("Build A Boat", "Building")
-    
-    def auto_build(self) -> bool:
-        """Auto-build"""
-        config = {"type": "auto_build", "delay": 1.0}
-        return self.engine.start_automation(config)
-    
-    def farm_coins(self) -> bool:
-        """Farm coins"""
-        config = {"type": "coin_farm", "delay": 2.0}
-        return self.start_farming(config)
-
-class MurderMystery2Automation(GameAutomation):
-    """Murder Mystery 2 automation"""
-    
-    def __init__(self):
-        super().__init__("Murder Mystery 2", "Mystery")
-    
-    def auto_win(self) -> bool:
-        """Auto-win games"""
-        config = {"type": "auto_win", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-class TowerDefenseSimulatorAutomation(GameAutomation):
-    """Tower Defense Simulator automation"""
-    
-    def __init__(self):
-        super().__init__("Tower Defense Simulator", "Tower Defense")
-    
-    def auto_wave_farm(self) -> bool:
-        """Auto-farm waves"""
-        config = {"type": "wave_farm", "delay": 2.0}
-        return self.start_farming(config)
-
-class SlapBattlesAutomation(GameAutomation):
-    """Slap Battles automation"""
-    
-    def __init__(self):
-        super().__init__("Slap Battles", "Fighting")
-    
-    def auto_slap(self) -> bool:
-        """Auto-slap"""
-        config = {"type": "auto_slap", "delay": 1.0}
-        return self.start_farming(config)
-    
-    def farm_gloves(self) -> bool:
-        """Farm gloves"""
-        config = {"type": "glove_farm", "delay": 2.0}
-        return self.engine.start_automation(config)
-
-class AbilityWarsAutomation(GameAutomation):
-    """Ability Wars automation"""
-    
-    def __init__(self):
-        super().__init__("Ability Wars", "Fighting")
-    
-    def auto_fight(self) -> bool:
-        """Auto-fight"""
-        config = {"type": "auto_fight", "delay": 1.5}
-        return self.start_farming(config)
-
-class RogueLineageAutomation(GameAutomation):
-    """Rogue Lineage automation"""
-    
-    def __init__(self):
-        super().__init__("Rogue Lineage", "RPG")
-    
-    def farm_mana(self) -> bool:
-        """Farm mana"""
-        config = {"type": "mana_farm", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_grind(self) -> bool:
-        """Auto-grind"""
-        config = {"type": "auto_grind", "delay": 2.5}
-        return self.engine.start_automation(config)
-
-class DeepwokenAutomation(GameAutomation):
-    """Deepwoken automation"""
-    
-    def __init__(self):
-        super().__init__("Deepwoken", "RPG")
-    
-    def farm_levels(self) -> bool:
-        """Farm levels"""
-        config = {"type": "level_farm", "delay": 3.0}
-        return self.start_farming(config)
-
-class WorldZeroAutomation(GameAutomation):
-    """World Zero automation"""
-    
-    def __init__(self):
-        super().__init__("World Zero", "RPG")
-    
-    def farm_quests(self) -> bool:
-        """Farm quests"""
-        config = {"type": "quest_farm", "delay": 2.0}
-        return self.start_farming(config)
-
-class YourBizarreAdventureAutomation(GameAutomation):
-    """Your Bizarre Adventure automation"""
     
-    def __init__(self):
-        super().__init__("Your Bizarre Adventure", "Fighting")
-    
-    def farm_stands(self) -> bool:
-        """Farm stands"""
-        config = {"type": "stand_farm", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_prestige(self) -> bool:
-        """Auto-prestige"""
-        config = {"type": "auto_prestige", "delay": 10.0}
-        return self.engine.start_automation(config)
-
-class AOnePieceGameAutomation(GameAutomation):
-    """A One Piece Game automation"""
-    
-    def __init__(self):
-        super().__init__("A One Piece Game", "Fighting")
-    
-    def farm_fruits(self) -> bool:
-        """Farm devil fruits"""
-        config = {"type": "fruit_farm", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_raid(self) -> bool:
-        """Auto-raid"""
-        config = {"type": "auto_raid", "delay": 5.0}
-        return self.engine.start_automation(config)
-
-class GrandPieceOnlineAutomation(GameAutomation):
-    """Grand Piece Online automation"""
-    
-    def __init__(self):
-        super().__init__("Grand Piece Online", "Fighting")
-    
-    def farm_fruits(self) -> bool:
-        """Farm devil fruits"""
-        config = {"type": "fruit_farm", "delay": 2.0}
-        return self.start_farming(config)
-    
-    def auto_quest(self) -> bool:
-        """Auto-quest"""
-        config = {"type": "auto_quest", "delay": 2.5}
-        return self.engine.start_automation(config)
-
-class GrowAGardenAutomation(GameAutomation):
-    """Grow a Garden automation with 20+ features"""
-    
-    def __init__(self):
-        super().__init__("Grow a Garden", "Simulator")
-        self.seed_types = ["Carrot", "Tomato", "Corn", "Potato", "Wheat", "Strawberry", "Blueberry", "Pumpkin", "Watermelon", "Pepper", "Lettuce", "Cabbage", "Onion", "Garlic", "Peas", "Beans", "Sunflower", "Rose", "Tulip", "Lavender"]
-        self.fertilizer_types = ["Basic", "Advanced", "Premium", "Mega", "Ultra"]
-        self.tool_types = ["Watering Can", "Hoe", "Shovel", "Pruner", "Sprayer", "All Tools"]
-    
-    def plant_seeds(self, seed_type: str) -> bool:
-        """Plant seeds"""
-        config = {"type": "plant_seeds", "seed_type": seed_type, "delay": 2.0}
-        return self.engine.start_automation(config)
-    
-    def water_plants(self) -> bool:
-        """Water all plants"""
-        config = {"type": "water_plants", "delay": 1.5}
-        return self.engine.start_automation(config)
-    
-    def harvest_crops(self, crop_type: str = "All") -> bool:
-        """Harvest crops"""
-        config = {"type": "harvest_crops", "crop_type": crop_type, "delay": 2.0}
-        return self.engine.start_automation(config)
-    
-    def auto_fertilize(self, fertilizer_type: str = "Basic") -> bool:
-        """Auto-fertilize garden"""
-        config = {"type": "auto_fertilize", "fertilizer": fertilizer_type, "delay": 2.5}
-        return self.engine.start_automation(config)
-    
-    def upgrade_garden(self, upgrade_type: str = "Plot Size") -> bool:
-        """Upgrade garden"""
-        config = {"type": "upgrade_garden", "upgrade": upgrade_type, "delay": 3.0}
-        return self.engine.start_automation(config)
-    
-    def sell_produce(self) -> bool:
-        """Sell produce"""
-        config = {"type": "sell_produce", "delay": 2.0}
-        return self.engine.start_automation(config)
-    
-    def buy_seeds(self, seed_type: str) -> bool:
-        """Buy seeds"""
-        config = {"type": "buy_seeds", "seed_type": seed_type, "delay": 1.5}
-        return self.engine.start_automation(config)
-    
-    def auto_weed(self) -> bool:
-        """Auto-weed garden"""
-        config = {"type": "auto_weed", "delay": 1.0}
-        return self.engine.start_automation(config)
-    
-    def auto_pest_control(self) -> bool:
-        """Auto pest control"""
-        config = {"type": "auto_pest_control", "delay": 2.0}
-        return self.engine.start_automation(config)
-    
-    def auto_compost(self) -> bool:
-        """Auto-compost"""
-        config = {"type": "auto_compost", "delay": 2.5}
-        return self.engine.start_automation(config)
-    
-    def auto_irrigate(self) -> bool:
-        """Auto-irrigate"""
-        config = {"type": "auto_irrigate", "delay": 2.0}
-        return self.engine.start_automation(config)
-    
-    def auto_prune(self) -> bool:
-        """Auto-prune plants"""
-        config = {"type": "auto_prune", "delay": 1.5}
-        return self.engine.start_automation(config)
-    
-    def auto_harvest_all(self) -> bool:
-        """Auto-harvest all crops"""
-        config = {"type": "auto_harvest_all", "delay": 3.0}
-        return self.engine.start_automation(config)
-    
-    def auto_plant_all(self, seed_type: str = "Best Available") -> bool:
-        """Auto-plant all plots"""
-        config = {"type": "auto_plant_all", "seed_type": seed_type, "delay": 4.0}
-        return self.engine.start_automation(config)
-    
-    def auto_upgrade_tools(self, tool_type: str = "All") -> bool:
-        """Auto-upgrade tools"""
-        config = {"type": "auto_upgrade_tools", "tool": tool_type, "delay": 3.0}
-        return self.engine.start_automation(config)
-    
-    def auto_complete_orders(self) -> bool:
-        """Auto-complete garden orders"""
-        config = {"type": "auto_complete_orders", "delay": 2.5}
-        return self.engine.start_automation(config)
-    
-    def auto_collect_rewards(self) -> bool:
-        """Auto-collect rewards"""
-        config = {"type": "auto_collect_rewards", "delay": 1.0}
-        return self.engine.start_automation(config)
-    
-    def auto_manage_inventory(self) -> bool:
-        """Auto-manage inventory"""
-        config = {"type": "auto_manage_inventory", "delay": 2.0}
-        return self.engine.start_automation(config)
-    
-    def auto_optimize_layout(self) -> bool:
-        """Auto-optimize garden layout"""
-        config = {"type": "auto_optimize_layout", "delay": 3.0}
-        return self.engine.start_automation(config)
-    
-    def full_auto_cycle(self) -> bool:
-        """Full automation cycle: harvest, plant, water, fertilize"""
-        config = {"type": "full_auto_cycle", "delay": 1.0}
-        return self.engine.start_automation(config)
+    def start_tuning(self, config: Dict[str, Any], candidates: Dict[str, List[Any]], **tuner_options) -> bool:
+        """
+        Start a task with a bandit tuner exploring candidate parameter values
+        
+        Rewards are the yield per hour of each arm, so the task must yield:
+        run it against a simulated environment, make it a garden task, or
+        give it a HUD ``counter``.
+        
+        Args:
+            config: Base task config, e.g. {"type": "coin_farm", "world": "Spawn", "delay": 2.0}
+            candidates: Values to explore per parameter, e.g. {"delay": [1.0, 2.0], "world": [...]}
+            tuner_options: Extra ParameterTuner options (epsilon, pulls_per_arm, ...)
+        """
+        task_config = {"game": self.game_name, **config}
+        tuner = ParameterTuner(candidates, **tuner_options)
+        return self.engine.start_automation(task_config, tuner=tuner)
 
 class GenericGameAutomation(GameAutomation):
     """Generic game automation for any Roblox game"""
@@ -837,47 +101,53 @@ class GameAutomationManager:
     """Manages all game automation modules"""
     
     def __init__(self):
-        self.automations: Dict[str, GameAutomation] = {}
+        self.catalog = get_catalog()
+        self.plugins = get_plugin_registry()
+        self.games: Dict[str, GameDefinition] = dict(self.catalog.games)
+        for game_name, (plugin, definition) in self.plugins.games.items():
+            if game_name in self.games:
+                logger.warning("Plugin %s redefines built-in game %s; keeping the built-in", plugin.name, game_name)
+                continue
+            self.games[game_name] = definition
         self.categories: Dict[str, List[str]] = {}
-        self._initialize_games()
-    
-    def _initialize_games(self):
-        """Initialize all 50+ game automation modules"""
-        games = [
-            BloxFruitsAutomation(), DaHoodAutomation(), KingLegacyAutomation(),
-            ProjectSlayersAutomation(), ShindoLifeAutomation(), PetSimulatorXAutomation(),
-            AnimeAdventuresAutomation(), BeeSwarmSimulatorAutomation(), MiningSimulator2Automation(),
-            AdoptMeAutomation(), ClickerSimulatorAutomation(), RestaurantTycoon2Automation(),
-            ThemeParkTycoonAutomation(), TowerOfHellAutomation(), SpeedRun4Automation(),
-            ArsenalAutomation(), PhantomForcesAutomation(), JailbreakAutomation(),
-            MadCityAutomation(), WelcomeToBloxburgAutomation(), BrookhavenAutomation(),
-            MeepCityAutomation(), NaturalDisasterSurvivalAutomation(), ZombieRushAutomation(),
-            NinjaLegendsAutomation(), SuperPowerFightingSimulatorAutomation(), AllStarTowerDefenseAutomation(),
-            TappingLegendsXAutomation(), AnimeFightingSimulatorAutomation(), DragonAdventuresAutomation(),
-            PetSimulator99Automation(), BladeBallAutomation(), DoorsAutomation(),
-            RainbowFriendsAutomation(), PiggyAutomation(), EvadeAutomation(),
-            BuildABoatAutomation(), MurderMystery2Automation(), TowerDefenseSimulatorAutomation(),
-            SlapBattlesAutomation(), AbilityWarsAutomation(), RogueLineageAutomation(),
-            DeepwokenAutomation(), WorldZeroAutomation(), YourBizarreAdventureAutomation(),
-            AOnePieceGameAutomation(), GrandPieceOnlineAutomation(), GrowAGardenAutomation()
-        ]
-        
-        for game in games:
-            self.automations[game.game_name] = game
-            category = game.category
-            if category not in self.categories:
-                self.categories[category] = []
-            self.categories[category].append(game.game_name)
+        for definition in self.games.values():
+            self.categories.setdefault(definition.category, []).append(definition.name)
+        # Created on first use
+        self.automations: Dict[str, GameAutomation] = {}
     
     def get_automation(self, game_name: str) -> Optional[GameAutomation]:
         """Get automation module for a game"""
-        if game_name in self.automations:
-            return self.automations[game_name]
-        return GenericGameAutomation(game_name)
+        automation = self.automations.get(game_name)
+        if automation is None:
+            automation = self.create_automation(game_name)
+            if game_name in self.games:
+                self.automations[game_name] = automation
+        return automation
+    
+    def create_automation(self, game_name: str) -> GameAutomation:
+        """
+        Create a new automation instance (with its own engine) for a game
+        
+        A plugin game's plugin is imported here, the first time it is needed.
+        
+        Raises:
+            PluginError: If the game's plugin fails to load
+        """
+        definition = self.games.get(game_name)
+        if definition is None:
+            return GenericGameAutomation(game_name)
+        automation_class = GameAutomation
+        if game_name not in self.catalog.games:
+            automation_class = self.plugins.automation_class(game_name) or GameAutomation
+        return automation_class.from_definition(definition)
+    
+    def get_definition(self, game_name: str) -> Optional[GameDefinition]:
+        """Get a game's definition without creating its automation"""
+        return self.games.get(game_name)
     
     def list_games(self) -> List[str]:
         """List all supported games"""
-        return list(self.automations.keys())
+        return list(self.games)
     
     def get_games_by_category(self, category: str) -> List[str]:
         """Get games by category"""
@@ -890,4 +160,4 @@ class GameAutomationManager:
     def search_games(self, query: str) -> List[str]:
         """Search games by name"""
         query_lower = query.lower()
-        return [name for name in self.automations.keys() if query_lower in name.lower()]
+        return [name for name in self.games if query_lower in name.lower()]
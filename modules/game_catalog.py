@@ -0,0 +1,265 @@
+"""
+Game Catalogue
+Game definitions loaded from the JSON files in modules/games
+
+Each file holds ``{"games": [...]}``. A game definition has a name, a
+category, option lists, actions (task type, parameters and default delay)
+and the rows the Automation tab shows for it. The validated definitions are
+pickled to cache/game_catalog.pickle together with the size and mtime of every
+source file and a hash of the task schemas they were validated against, so
+later starts skip parsing and validation until a file or a schema changes.
+"""
+
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from core.task_spec import get_spec_class, schema_signature
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent / "games"
+CACHE_FILE = Path("cache") / "game_catalog.pickle"
+
+# Bump when the compiled format changes so stale caches are rebuilt
+CATALOG_VERSION = 1
+
+_PARAM_KINDS = {"int": int, "float": float, "str": str}
+
+class CatalogError(ValueError):
+    """A game definition file is malformed"""
+
+class GameDefinition:
+    """Validated definition of one game"""
+
+    __slots__ = ("name", "category", "options", "actions", "ui", "start_button", "source")
+
+    def __init__(self, name: str, category: str, options: Dict[str, List[Any]],
+                 actions: Dict[str, Dict[str, Any]], ui: List[Dict[str, Any]],
+                 start_button: bool = True, source: str = ""):
+        self.name = name
+        self.category = category
+        self.options = options
+        self.actions = actions
+        self.ui = ui
+        self.start_button = start_button
+        self.source = source
+
+    def build_config(self, action_name: str, args: Tuple = (), kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Bind arguments to an action's parameters and build its task config
+
+        Raises:
+            TypeError: If the arguments do not match the action's parameters
+        """
+        action = self.actions[action_name]
+        params = action["params"]
+        kwargs = kwargs or {}
+        if len(args) > len(params):
+            raise TypeError(f"{action_name}() takes {len(params)} arguments but {len(args)} were given")
+        values = {param["name"]: value for param, value in zip(params, args)}
+        for name, value in kwargs.items():
+            if name in values:
+                raise TypeError(f"{action_name}() got multiple values for argument '{name}'")
+            if not any(param["name"] == name for param in params):
+                raise TypeError(f"{action_name}() got an unexpected keyword argument '{name}'")
+            values[name] = value
+
+        config = {"type": action["type"]}
+        for param in params:
+            if param["name"] in values:
+                value = values[param["name"]]
+            elif "default" in param:
+                value = param["default"]
+            else:
+                raise TypeError(f"{action_name}() missing required argument '{param['name']}'")
+            kind = _PARAM_KINDS.get(param.get("kind"))
+            if kind is not None:
+                value = kind(value)
+            config[param["key"]] = value
+
+        if action.get("rate"):
+            # Delay follows a rate option, e.g. clicks per second
+            config["delay"] = 1.0 / config[action["rate"]]
+        else:
+            config["delay"] = action["delay"]
+        return config
+
+class GameCatalog:
+    """All game definitions, by name and by category"""
+
+    def __init__(self, games: List[GameDefinition]):
+        self.games: Dict[str, GameDefinition] = {game.name: game for game in games}
+        self.categories: Dict[str, List[str]] = {}
+        for game in games:
+            self.categories.setdefault(game.category, []).append(game.name)
+
+    def get(self, name: str) -> Optional[GameDefinition]:
+        """Get a game definition by name"""
+        return self.games.get(name)
+
+    def names(self) -> List[str]:
+        """Get all game names in definition order"""
+        return list(self.games)
+
+# ========== COMPILING ==========
+
+def _fail(source: str, where: str, message: str):
+    raise CatalogError(f"{source}: {where}: {message}")
+
+def _compile_action(source: str, game: str, name: str, raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one action and fill in defaults"""
+    where = f"{game}.{name}"
+    if not isinstance(raw, dict):
+        _fail(source, where, "action must be an object")
+    task_type = raw.get("type", "auto_farm")
+    params = []
+    for param in raw.get("params", []):
+        if not isinstance(param, dict) or not isinstance(param.get("name"), str):
+            _fail(source, where, f"parameter must be an object with a name: {param!r}")
+        if param.get("kind") is not None and param["kind"] not in _PARAM_KINDS:
+            _fail(source, where, f"unknown parameter kind {param['kind']!r}")
+        params.append({"key": param["name"], **param})
+
+    spec_class = get_spec_class(task_type)
+    if not spec_class.allow_extra:
+        known = {field.name for field in spec_class.fields}
+        for param in params:
+            if param["key"] not in known:
+                _fail(source, where, f"'{task_type}' tasks have no option {param['key']!r}")
+
+    action = {"doc": raw.get("doc", ""), "type": task_type, "params": params}
+    if "rate" in raw:
+        if not any(param["key"] == raw["rate"] for param in params):
+            _fail(source, where, f"rate option {raw['rate']!r} is not a parameter")
+        action["rate"] = raw["rate"]
+    else:
+        delay = raw.get("delay", 1.0)
+        if isinstance(delay, bool) or not isinstance(delay, (int, float)) or delay < 0:
+            _fail(source, where, f"delay must be a non-negative number, got {delay!r}")
+        action["delay"] = float(delay)
+    return action
+
+def _compile_ui(source: str, game: str, rows: List[Any], options: Dict[str, List[Any]],
+                actions: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Validate the Automation tab rows of a game"""
+    compiled = []
+    for index, row in enumerate(rows):
+        where = f"{game}.ui[{index}]"
+        if not isinstance(row, dict):
+            _fail(source, where, "row must be an object")
+        if "var" in row:
+            if row.get("options") is not None and row["options"] not in options:
+                _fail(source, where, f"unknown option list {row['options']!r}")
+            values = list(row.get("values", [])) + list(options.get(row.get("options"), []))
+            compiled.append({"label": row.get("label", ""), "var": row["var"], "values": [str(v) for v in values]})
+        elif "button" in row:
+            targets = list(row["actions"].values()) if "action_by" in row else [row.get("action")]
+            for target in targets:
+                if target not in actions:
+                    _fail(source, where, f"unknown action {target!r}")
+            compiled.append(dict(row))
+        else:
+            _fail(source, where, "row needs a 'var' or a 'button'")
+    return compiled
+
+def compile_game(source: str, raw: Dict[str, Any]) -> GameDefinition:
+    """Validate one game definition"""
+    name = raw.get("name")
+    if not isinstance(name, str) or not name:
+        _fail(source, "game", f"missing name: {raw!r}")
+    options = raw.get("options", {})
+    if not all(isinstance(values, list) for values in options.values()):
+        _fail(source, name, "options must map names to lists")
+    actions = {
+        action_name: _compile_action(source, name, action_name, action)
+        for action_name, action in raw.get("actions", {}).items()
+    }
+    ui = _compile_ui(source, name, raw.get("ui", []), options, actions)
+    return GameDefinition(name, raw.get("category", "General"), options, actions, ui,
+                          bool(raw.get("start_button", True)), source)
+
+def compile_catalog(data_dir: Path = DATA_DIR) -> List[GameDefinition]:
+    """Parse and validate every definition file"""
+    games: List[GameDefinition] = []
+    seen: Dict[str, str] = {}
+    for path in sorted(Path(data_dir).glob("*.json")):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+        except ValueError as e:
+            raise CatalogError(f"{path.name}: {e}") from e
+        for raw in document.get("games", []):
+            game = compile_game(path.name, raw)
+            if game.name in seen:
+                _fail(path.name, game.name, f"already defined in {seen[game.name]}")
+            seen[game.name] = path.name
+            games.append(game)
+    return games
+
+# ========== CACHING ==========
+
+def _sources_signature(data_dir: Path) -> Tuple:
+    """Get the task schema hash and (file, mtime, size) of every definition file"""
+    signature: List[Any] = [schema_signature()]
+    for path in sorted(Path(data_dir).glob("*.json")):
+        stat = path.stat()
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def _read_cache(cache_file: Path, signature: Tuple) -> Optional[List[GameDefinition]]:
+    """Get cached definitions if they were compiled from the current sources"""
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable game catalogue cache: %s", e)
+        return None
+    if cached.get("version") != CATALOG_VERSION or cached.get("sources") != signature:
+        return None
+    return cached["games"]
+
+def _write_cache(cache_file: Path, signature: Tuple, games: List[GameDefinition]):
+    """Atomically write the compiled catalogue"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".catalog-", dir=cache_file.parent)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({"version": CATALOG_VERSION, "sources": signature, "games": games}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        # A read-only install still works, it just recompiles every start
+        logger.warning("Could not write game catalogue cache: %s", e)
+
+def load_catalog(data_dir: Path = DATA_DIR, cache_file: Path = CACHE_FILE) -> GameCatalog:
+    """Load the catalogue from the cache, recompiling it if any source changed"""
+    start = time.perf_counter()
+    signature = _sources_signature(data_dir)
+    games = _read_cache(cache_file, signature)
+    origin = "cache"
+    if games is None:
+        games = compile_catalog(data_dir)
+        _write_cache(cache_file, signature, games)
+        origin = "sources"
+    logger.debug("Loaded %d game definitions from %s in %.1fms",
+                 len(games), origin, (time.perf_counter() - start) * 1000.0)
+    return GameCatalog(games)
+
+_catalog: Optional[GameCatalog] = None
+_catalog_lock = threading.Lock()
+
+def get_catalog() -> GameCatalog:
+    """Get the process-wide game catalogue"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = load_catalog()
+        return _catalog
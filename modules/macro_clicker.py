@@ -4,23 +4,23 @@ Automated clicking and macro functionality
 """
 
 import logging
-import time
 import threading
-import pyautogui
 from typing import Dict, Any, Optional, Tuple
 from core.automation_engine import AutomationEngine
+from core.clock import Clock, system_clock
+from core.input_backend import InputBackend, screen_backend
+from core.shutdown import get_shutdown_coordinator
 
 logger = logging.getLogger(__name__)
 
 class MacroClicker:
     """Macro and clicker automation"""
     
-    def __init__(self):
-        self.engine = AutomationEngine()
+    def __init__(self, clock: Optional[Clock] = None, backend: Optional[InputBackend] = None):
+        self.backend = backend or screen_backend
+        self.engine = AutomationEngine(clock=clock, input_backend=self.backend)
         self.click_positions: list = []
         self.is_clicking = False
-        pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
     
     def start_clicking(self, config: Dict[str, Any]) -> bool:
         """
@@ -37,7 +37,7 @@ class MacroClicker:
         try:
             position = config.get("position", "current")
             if position == "current":
-                position = pyautogui.position()
+                position = self.backend.position()
             
             interval = config.get("interval")
             if not interval:
@@ -56,7 +56,7 @@ class MacroClicker:
             self.is_clicking = True
             return self.engine.start_automation(task_config, self._click_callback)
         except Exception as e:
-            logger.error(f"Error starting clicker: {e}")
+            logger.error("Error starting clicker: %s", e)
             return False
     
     def stop_clicking(self) -> bool:
@@ -70,9 +70,9 @@ class MacroClicker:
     
     def record_click_position(self) -> Tuple[int, int]:
         """Record current mouse position"""
-        pos = pyautogui.position()
+        pos = self.backend.position()
         self.click_positions.append(pos)
-        logger.info(f"Recorded click position: {pos}")
+        logger.info("Recorded click position: %s", pos)
         return pos
     
     def clear_positions(self):
@@ -82,27 +82,34 @@ class MacroClicker:
 class MacroRecorder:
     """Records and plays back macros"""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None, backend: Optional[InputBackend] = None):
+        self.clock = clock or system_clock
+        self.backend = backend or screen_backend
         self.is_recording = False
         self.macro_actions: list = []
         self.start_time: Optional[float] = None
+        self.is_playing = False
+        self.stop_event = threading.Event()
+        self._finished = threading.Event()
+        self._finished.set()
+        get_shutdown_coordinator().register(self, "MacroRecorder")
         
     def start_recording(self):
         """Start recording macro"""
         self.is_recording = True
         self.macro_actions = []
-        self.start_time = time.time()
+        self.start_time = self.clock.time()
         logger.info("Macro recording started")
     
     def stop_recording(self):
         """Stop recording macro"""
         self.is_recording = False
-        logger.info(f"Macro recording stopped. Recorded {len(self.macro_actions)} actions")
+        logger.info("Macro recording stopped. Recorded %s actions", len(self.macro_actions))
     
     def record_action(self, action_type: str, data: Dict[str, Any]):
         """Record an action"""
         if self.is_recording:
-            timestamp = time.time() - (self.start_time or 0)
+            timestamp = self.clock.time() - (self.start_time or 0)
             self.macro_actions.append({
                 "type": action_type,
                 "timestamp": timestamp,
@@ -110,38 +117,61 @@ class MacroRecorder:
             })
     
     def play_macro(self, actions: Optional[list] = None) -> bool:
-        """Play back a macro"""
+        """Play back a macro (returns False if it was stopped part way)"""
         actions_to_play = actions or self.macro_actions
         if not actions_to_play:
             logger.warning("No macro actions to play")
             return False
         
+        self.stop_event.clear()
+        self._finished.clear()
+        self.is_playing = True
         try:
-            for action in actions_to_play:
+            backend = self.backend
+            last = len(actions_to_play) - 1
+            for index, action in enumerate(actions_to_play):
+                if self.stop_event.is_set():
+                    logger.info("Macro playback stopped")
+                    return False
                 action_type = action.get("type")
                 data = action.get("data", {})
                 
                 if action_type == "click":
-                    pyautogui.click(data.get("x"), data.get("y"), button=data.get("button", "left"))
+                    backend.click(data.get("x"), data.get("y"), button=data.get("button", "left"))
                 elif action_type == "key":
-                    pyautogui.press(data.get("key"))
+                    backend.press(data.get("key"))
                 elif action_type == "move":
-                    pyautogui.moveTo(data.get("x"), data.get("y"))
+                    backend.move_to(data.get("x"), data.get("y"))
                 elif action_type == "delay":
-                    time.sleep(data.get("duration", 0.1))
+                    self.clock.wait(self.stop_event, data.get("duration", 0.1))
                 
                 # Wait for next action timing
-                if action != actions_to_play[-1]:
-                    next_action = actions_to_play[actions_to_play.index(action) + 1]
+                if index < last:
+                    next_action = actions_to_play[index + 1]
                     delay = next_action.get("timestamp", 0) - action.get("timestamp", 0)
                     if delay > 0:
-                        time.sleep(delay)
+                        self.clock.wait(self.stop_event, delay)
             
             logger.info("Macro playback completed")
             return True
         except Exception as e:
-            logger.error(f"Error playing macro: {e}")
+            logger.error("Error playing macro: %s", e)
             return False
+        finally:
+            self.is_playing = False
+            self._finished.set()
+    
+    def request_stop(self) -> bool:
+        """Stop recording and interrupt playback; returns True if either was in progress"""
+        busy = self.is_recording or self.is_playing
+        if self.is_recording:
+            self.stop_recording()
+        self.clock.set(self.stop_event)
+        return busy
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for an interrupted playback to return"""
+        return self._finished.wait(timeout)
     
     def save_macro(self, file_path: str) -> bool:
         """Save macro to file"""
@@ -149,10 +179,10 @@ class MacroRecorder:
         try:
             with open(file_path, 'w') as f:
                 json.dump(self.macro_actions, f, indent=2)
-            logger.info(f"Macro saved to {file_path}")
+            logger.info("Macro saved to %s", file_path)
             return True
         except Exception as e:
-            logger.error(f"Error saving macro: {e}")
+            logger.error("Error saving macro: %s", e)
             return False
     
     def load_macro(self, file_path: str) -> bool:
@@ -161,9 +191,9 @@ class MacroRecorder:
         try:
             with open(file_path, 'r') as f:
                 self.macro_actions = json.load(f)
-            logger.info(f"Macro loaded from {file_path}")
+            logger.info("Macro loaded from %s", file_path)
             return True
         except Exception as e:
-            logger.error(f"Error loading macro: {e}")
+            logger.error("Error loading macro: %s", e)
             return False
 
@@ -0,0 +1,369 @@
+"""
+Plugins
+Discovery and lazy loading of third-party game modules
+
+Plugins come from two places:
+
+- ``plugins/<name>/plugin.json`` next to an importable package ``plugins/<name>``
+- installed distributions exposing an entry point in the
+  ``roblox_automation.plugins`` group and shipping ``plugin.json`` in the
+  entry point's top-level package
+
+A manifest names the plugin, its entry point (``"module:function"``) and its
+games in the same format as modules/games. Discovery only reads manifests;
+the validated results are cached in cache/plugins.pickle keyed by each
+manifest's mtime and size (and, for entry points, the mtimes of the
+sys.path directories), so startup with many plugins does not re-parse them.
+A plugin's code is imported the first time one of its games is selected,
+when its entry function is called with a ``PluginContext``.
+
+Example manifest::
+
+    {
+        "name": "fishing-games",
+        "version": "1.0",
+        "entry": "fishing_games:register",
+        "games": [
+            {"name": "Fisch", "category": "Simulator",
+             "actions": {"auto_fish": {"type": "auto_fish", "params": [{"name": "bait"}], "delay": 2.0}},
+             "ui": [{"button": "🎣 Auto Fish", "action": "auto_fish", "args": ["Worm"]}]}
+        ]
+    }
+"""
+
+import importlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from core.automation_engine import register_task_handler
+from core.task_spec import Field, define_spec
+from modules.game_catalog import GameDefinition, CatalogError, compile_game
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_DIR = Path("plugins")
+MANIFEST = "plugin.json"
+ENTRY_POINT_GROUP = "roblox_automation.plugins"
+CACHE_FILE = Path("cache") / "plugins.pickle"
+
+# Bump when the cached format changes
+CACHE_VERSION = 1
+
+class PluginError(Exception):
+    """A plugin could not be discovered or loaded"""
+
+class PluginInfo:
+    """Manifest data of a discovered plugin"""
+
+    __slots__ = ("name", "version", "source", "location", "entry", "games", "automations")
+
+    def __init__(self, name: str, version: str, source: str, location: Optional[str],
+                 entry: Optional[str], games: List[GameDefinition], automations: Dict[str, str]):
+        self.name = name
+        self.version = version
+        self.source = source
+        self.location = location
+        self.entry = entry
+        self.games = games
+        self.automations = automations
+
+class PluginContext:
+    """API handed to a plugin's entry function"""
+
+    def __init__(self, plugin: PluginInfo):
+        self.plugin = plugin
+
+    def register_task(self, task_type: str, handler: Callable, *fields: Field, allow_extra: bool = False):
+        """
+        Add a task type: its option schema and its handler
+
+        Args:
+            task_type: Value of the task config's "type"
+            handler: Called as ``handler(engine, spec)`` on every tick; may return a TaskOutcome
+            fields: Options beyond type/game/delay
+            allow_extra: Accept options not in the schema
+        """
+        define_spec(task_type, *fields, allow_extra=allow_extra)
+        register_task_handler(task_type, handler)
+
+def _resolve(target: str):
+    """Import ``module:attribute``"""
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute) if attribute else module
+
+def _parse_manifest(document: Dict[str, Any], source: str, location: Optional[str],
+                    default_name: str, entry: Optional[str] = None) -> PluginInfo:
+    """Validate a manifest document"""
+    if not isinstance(document, dict):
+        raise PluginError(f"{source}: manifest must be an object")
+    games = []
+    automations = {}
+    for raw in document.get("games", []):
+        try:
+            game = compile_game(source, raw)
+        except CatalogError as e:
+            raise PluginError(str(e)) from e
+        games.append(game)
+        if raw.get("automation"):
+            automations[game.name] = raw["automation"]
+    return PluginInfo(
+        name=document.get("name", default_name),
+        version=str(document.get("version", "0")),
+        source=source,
+        location=location,
+        entry=document.get("entry", entry),
+        games=games,
+        automations=automations
+    )
+
+def _stat_signature(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+def _entry_points(group: str) -> List[Any]:
+    """Get the entry points of a group (``entry_points(group=...)`` needs Python 3.10+)"""
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=group))
+    return list(entry_points.get(group, []))
+
+def _entry_point_dist(entry_point) -> Optional[Any]:
+    """Get the distribution shipping an entry point (``EntryPoint.dist`` needs Python 3.10+)"""
+    dist = getattr(entry_point, "dist", None)
+    if dist is not None:
+        return dist
+    for dist in metadata.distributions():
+        if any(candidate.name == entry_point.name and candidate.value == entry_point.value
+               for candidate in dist.entry_points):
+            return dist
+    return None
+
+class PluginRegistry:
+    """Discovered plugins and the games they provide"""
+
+    def __init__(self, plugin_dir: Path = PLUGIN_DIR, cache_file: Path = CACHE_FILE,
+                 use_entry_points: bool = True):
+        self.plugin_dir = Path(plugin_dir)
+        self.cache_file = Path(cache_file)
+        self.use_entry_points = use_entry_points
+        self.plugins: Dict[str, PluginInfo] = {}
+        self.games: Dict[str, Tuple[PluginInfo, GameDefinition]] = {}
+        self.errors: Dict[str, str] = {}
+        self._loaded: Dict[str, bool] = {}
+        self._lock = threading.RLock()
+
+    # ========== DISCOVERY ==========
+
+    def discover(self) -> List[PluginInfo]:
+        """Find plugins, reusing cached manifests that have not changed"""
+        start = time.perf_counter()
+        cache = self._read_cache()
+        new_cache = {"version": CACHE_VERSION, "dirs": {}, "entry_points": None}
+        found: List[PluginInfo] = []
+        reused = 0
+
+        for manifest_path in self._plugin_manifests():
+            key = str(manifest_path)
+            try:
+                signature = _stat_signature(manifest_path)
+            except OSError:
+                continue
+            cached = cache["dirs"].get(key)
+            if cached is not None and cached[0] == signature:
+                info = cached[1]
+                reused += 1
+            else:
+                try:
+                    with open(manifest_path, 'r', encoding='utf-8') as f:
+                        document = json.load(f)
+                    info = _parse_manifest(document, key, str(manifest_path.parent.parent),
+                                           manifest_path.parent.name)
+                except (OSError, ValueError, PluginError) as e:
+                    self.errors[key] = str(e)
+                    logger.error("Skipping plugin %s: %s", key, e)
+                    continue
+            new_cache["dirs"][key] = (signature, info)
+            found.append(info)
+
+        if self.use_entry_points:
+            signature = self._path_signature()
+            cached = cache.get("entry_points")
+            if cached is not None and cached[0] == signature:
+                entry_plugins = cached[1]
+                reused += len(entry_plugins)
+            else:
+                try:
+                    entry_plugins = self._entry_point_plugins()
+                except Exception as e:
+                    # A broken installed distribution must not take the built-in games down with it
+                    self.errors["entry points"] = str(e)
+                    logger.error("Could not list plugin entry points: %s", e)
+                    entry_plugins, signature = [], None
+            new_cache["entry_points"] = (signature, entry_plugins) if signature is not None else None
+            found.extend(entry_plugins)
+
+        self._write_cache(new_cache)
+        with self._lock:
+            for info in found:
+                self._add(info)
+        logger.debug("Discovered %d plugins (%d cached) in %.1fms",
+                     len(found), reused, (time.perf_counter() - start) * 1000.0)
+        return found
+
+    def _plugin_manifests(self) -> List[Path]:
+        """Get plugin.json of every plugin directory"""
+        if not self.plugin_dir.is_dir():
+            return []
+        manifests = []
+        with os.scandir(self.plugin_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and not entry.name.startswith((".", "_")):
+                    manifest = Path(entry.path) / MANIFEST
+                    if manifest.is_file():
+                        manifests.append(manifest)
+        return sorted(manifests)
+
+    @staticmethod
+    def _path_signature() -> Tuple:
+        """Get mtimes of the sys.path directories; installing a distribution changes one"""
+        signature = []
+        for entry in sys.path:
+            try:
+                signature.append((entry, os.stat(entry or ".").st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(signature)
+
+    def _entry_point_plugins(self) -> List[PluginInfo]:
+        """Read manifests shipped by installed distributions, without importing them"""
+        plugins = []
+        for entry_point in _entry_points(ENTRY_POINT_GROUP):
+            source = f"entry point {entry_point.name} ({entry_point.value})"
+            try:
+                plugins.append(self._entry_point_plugin(entry_point, source))
+            except Exception as e:
+                self.errors[source] = str(e)
+                logger.error("Skipping plugin %s: %s", source, e)
+        return plugins
+
+    def _entry_point_plugin(self, entry_point, source: str) -> PluginInfo:
+        """
+        Read the manifest of one entry point's distribution
+
+        Raises:
+            PluginError: If the manifest is invalid
+        """
+        document: Dict[str, Any] = {}
+        # "package.module:function [extras]"; EntryPoint.module is Python 3.9+
+        package = entry_point.value.split(":")[0].strip().split(".")[0]
+        dist = _entry_point_dist(entry_point)
+        for file in (dist.files or []) if dist else []:
+            parts = Path(str(file)).parts
+            if len(parts) == 2 and parts[0] == package and parts[1] == MANIFEST:
+                try:
+                    document = json.loads(file.read_text(encoding='utf-8'))
+                except (OSError, ValueError) as e:
+                    self.errors[source] = str(e)
+                    logger.error("Unreadable manifest for %s: %s", source, e)
+                break
+        else:
+            logger.warning("Plugin %s ships no %s; its games are unknown until loaded", source, MANIFEST)
+        return _parse_manifest(document, source, None, entry_point.name, entry_point.value)
+
+    def _add(self, info: PluginInfo):
+        """Index a plugin's games (lock held)"""
+        if info.name in self.plugins:
+            logger.warning("Plugin %s from %s shadows one from %s", info.name, info.source,
+                           self.plugins[info.name].source)
+        self.plugins[info.name] = info
+        for game in info.games:
+            self.games[game.name] = (info, game)
+
+    def _read_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cache = pickle.load(f)
+            if cache.get("version") == CACHE_VERSION:
+                return cache
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Ignoring unreadable plugin cache: %s", e)
+        return {"version": CACHE_VERSION, "dirs": {}, "entry_points": None}
+
+    def _write_cache(self, cache: Dict[str, Any]):
+        """Atomically write the discovery cache"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".plugins-", dir=self.cache_file.parent)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            logger.warning("Could not write plugin cache: %s", e)
+
+    # ========== LOADING ==========
+
+    def load(self, plugin: PluginInfo):
+        """
+        Import a plugin and call its entry function (once)
+
+        Raises:
+            PluginError: If the import or the entry function fails
+        """
+        with self._lock:
+            if self._loaded.get(plugin.name):
+                return
+            start = time.perf_counter()
+            try:
+                if plugin.location and plugin.location not in sys.path:
+                    sys.path.insert(0, plugin.location)
+                if plugin.entry:
+                    _resolve(plugin.entry)(PluginContext(plugin))
+            except Exception as e:
+                self.errors[plugin.name] = str(e)
+                raise PluginError(f"Plugin {plugin.name} failed to load: {e}") from e
+            self._loaded[plugin.name] = True
+            logger.info("Loaded plugin %s %s in %.1fms", plugin.name, plugin.version,
+                        (time.perf_counter() - start) * 1000.0)
+
+    def is_loaded(self, name: str) -> bool:
+        """True once a plugin's code has been imported"""
+        return self._loaded.get(name, False)
+
+    def game(self, game_name: str) -> Optional[Tuple[PluginInfo, GameDefinition]]:
+        """Get the plugin and definition of a plugin game"""
+        return self.games.get(game_name)
+
+    def automation_class(self, game_name: str):
+        """Load the game's plugin and get its custom automation class, if it names one"""
+        plugin, _ = self.games[game_name]
+        self.load(plugin)
+        target = plugin.automations.get(game_name)
+        if not target:
+            return None
+        try:
+            return _resolve(target)
+        except Exception as e:
+            raise PluginError(f"Plugin {plugin.name}: cannot import {target}: {e}") from e
+
+_registry: Optional[PluginRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_plugin_registry() -> PluginRegistry:
+    """Get the process-wide plugin registry, discovering plugins on first use"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = PluginRegistry()
+            _registry.discover()
+        return _registry
@@ -0,0 +1 @@
+"""Behaviour tests for Roblox Automation Suite's pure, headless pieces"""
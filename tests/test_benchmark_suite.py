@@ -0,0 +1,37 @@
+"""Benchmark suite comparison and the macro playback it fixed"""
+
+import json
+from benchmarks.suite import compare, load_baseline
+from core.clock import SimulatedClock
+from core.simulated_game import SimulatedGame
+from modules.macro_clicker import MacroRecorder
+
+def result(name: str, value: float, threshold: float = 0.25):
+    return {"name": name, "value": value, "unit": "ms", "threshold": threshold}
+
+def test_compare_flags_slowdowns_beyond_the_threshold():
+    baseline = {"a": {"value": 10.0}, "b": {"value": 10.0}, "c": {"value": 10.0}, "d": {"value": 0.0}}
+    results = [result("a", 12.5), result("b", 12.6), result("c", 7.0), result("d", 1.0), result("e", 1.0)]
+    assert compare(results, baseline) == 1
+    assert [r["status"] for r in results] == ["ok", "regression", "improvement", "new", "new"]
+    assert results[1]["ratio"] == 1.26 and results[1]["baseline"] == 10.0
+
+def test_threshold_override():
+    results = [result("a", 11.0, threshold=0.5)]
+    assert compare(results, {"a": {"value": 10.0}}, threshold=0.05) == 1
+
+def test_load_baseline(tmp_path):
+    assert load_baseline(tmp_path / "missing.json") == {}
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"results": [result("a", 1.0)]}))
+    assert load_baseline(path)["a"]["value"] == 1.0
+
+def test_repeated_identical_actions_keep_their_timing():
+    clock = SimulatedClock()
+    game = SimulatedGame(clock)
+    click = {"type": "click", "data": {"x": 1, "y": 2}}
+    actions = [{**click, "timestamp": 0.0}, {**click, "timestamp": 0.0}, {**click, "timestamp": 5.0}]
+    recorder = MacroRecorder(clock=clock, backend=game)
+    assert recorder.play_macro(actions)
+    assert game.clicks == 3
+    assert clock.time() == 5.0
@@ -0,0 +1,90 @@
+"""Headless runner: workspace sync and the run command"""
+
+import json
+import cli
+from core.shutdown import ShutdownCoordinator
+
+class FakeEngine:
+    def __init__(self, log):
+        self.log = log
+        self.running = False
+
+    def start_automation(self, task_config):
+        self.running = True
+        self.log.append(("start", task_config["type"]))
+        return True
+
+    def request_stop(self):
+        self.log.append(("signal", self.running))
+        running, self.running = self.running, False
+        return running
+
+    def join(self, timeout=None):
+        self.log.append(("join",))
+        return True
+
+class FakeAutomation:
+    def __init__(self, game_name, log):
+        self.game_name = game_name
+        self.engine = FakeEngine(log)
+
+class FakeManager:
+    def __init__(self):
+        self.log = []
+
+    def create_automation(self, game_name):
+        return FakeAutomation(game_name, self.log)
+
+def workspace(*tasks):
+    return {"tasks": [{"name": name, "game": "Doors", "config": {"type": task_type}, **options}
+                      for name, task_type, options in tasks]}
+
+def test_sync_starts_enabled_tasks(capsys):
+    manager, runners = FakeManager(), {}
+    started = cli._sync_tasks(workspace(("a", "macro", {}), ("b", "macro", {"enabled": False})), runners, manager)
+    assert started == 1
+    assert list(runners) == ["a"]
+    assert json.loads(capsys.readouterr().out) == {"event": "started", "task": "a", "game": "Doors"}
+
+def test_sync_stops_edited_tasks_signalling_all_before_joining():
+    manager, runners = FakeManager(), {}
+    cli._sync_tasks(workspace(("a", "macro", {}), ("b", "macro", {})), runners, manager)
+    manager.log.clear()
+    cli._sync_tasks(workspace(("a", "auto_spin", {}), ("b", "auto_spin", {})), runners, manager)
+    assert manager.log[:4] == [("signal", True), ("signal", True), ("join",), ("join",)]
+    assert manager.log[4:] == [("start", "auto_spin"), ("start", "auto_spin")]
+
+def test_sync_keeps_finished_tasks_stopped_until_edited():
+    manager, runners = FakeManager(), {}
+    document = workspace(("a", "macro", {"duration": 5}))
+    cli._sync_tasks(document, runners, manager)
+    finished = {"a": runners.pop("a").spec}
+    assert cli._sync_tasks(document, runners, manager, finished) == 0
+    assert not runners
+    assert cli._sync_tasks(workspace(("a", "macro", {"duration": 9})), runners, manager, finished) == 1
+    assert not finished
+
+def run(tmp_path, monkeypatch, document, *argv):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cli, "get_shutdown_coordinator", ShutdownCoordinator)
+    path = tmp_path / "workspace.json"
+    path.write_text(json.dumps(document))
+    args = cli.build_parser().parse_args(["run", str(path), *argv])
+    return args.func(args)
+
+def events(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+def test_run_fails_when_nothing_starts(tmp_path, monkeypatch, capsys):
+    code = run(tmp_path, monkeypatch, workspace(("a", "macro", {"enabled": False})),
+               "--duration", "0.1", "--interval", "0.05")
+    assert code == 1
+    assert events(capsys)[-1] == {"event": "error", "error": "no task started"}
+
+def test_run_stops_a_task_after_its_duration(tmp_path, monkeypatch, capsys):
+    document = workspace(("a", "macro", {"duration": 0.1}))
+    document["tasks"][0]["config"]["delay"] = 0.01
+    code = run(tmp_path, monkeypatch, document, "--duration", "0.5", "--interval", "0.05")
+    assert code == 0
+    kinds = [(record["event"], record.get("reason")) for record in events(capsys) if record["event"] != "stats"]
+    assert kinds == [("started", None), ("stopped", "duration")]
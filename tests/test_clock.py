@@ -0,0 +1,115 @@
+"""Simulated clock: virtual time, manual advancing and sleeper ordering"""
+
+import threading
+from core.clock import SimulatedClock
+
+def worker(clock: SimulatedClock, body, start: bool = True) -> threading.Thread:
+    """Create a thread announced to the clock"""
+    def run():
+        try:
+            body()
+        finally:
+            clock.remove_participant()
+    clock.add_participant()
+    thread = threading.Thread(target=run, daemon=True)
+    if start:
+        thread.start()
+    return thread
+
+def test_sleep_jumps_to_the_wake_up():
+    clock = SimulatedClock(start=100.0)
+    clock.sleep(3600.0)
+    assert clock.time() == 3700.0
+    assert clock.elapsed == 3600.0
+
+def interleaving() -> list:
+    clock = SimulatedClock()
+    log = []
+
+    def sleeper(name, delays):
+        def body():
+            for delay in delays:
+                clock.sleep(delay)
+                log.append((clock.time(), name))
+        return body
+
+    # Announce every thread before any starts, or time moves on without the later ones
+    threads = [worker(clock, sleeper("a", [5.0, 5.0]), start=False),
+               worker(clock, sleeper("b", [3.0, 3.0, 4.0]), start=False)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5.0)
+    return log
+
+def test_sleepers_wake_in_time_then_arrival_order():
+    log = interleaving()
+    # At 10.0 "a" wins: it went to sleep (at 5.0) before "b" did (at 6.0)
+    assert log == [(3.0, "b"), (5.0, "a"), (6.0, "b"), (10.0, "a"), (10.0, "b")]
+    assert all(interleaving() == log for _ in range(5))
+
+def test_manual_advance_releases_only_due_sleepers():
+    clock = SimulatedClock(auto_advance=False)
+    woke = []
+    thread = worker(clock, lambda: (clock.sleep(10.0), woke.append(clock.time())))
+    clock.advance(4.0)
+    assert clock.time() == 4.0 and not woke
+    assert clock.pending() == 1
+    clock.run_for(6.0)
+    thread.join(5.0)
+    assert woke == [10.0]
+    clock.advance_to(2.0)
+    assert clock.time() == 10.0
+
+def test_run_until():
+    clock = SimulatedClock(auto_advance=False)
+    assert clock.run_until(lambda: clock.time() >= 5.0, limit=10.0)
+    assert clock.time() == 5.0
+    assert not clock.run_until(lambda: False, limit=3.0)
+    assert clock.time() == 8.0
+
+def test_set_wakes_a_waiter_before_its_timeout():
+    clock = SimulatedClock(auto_advance=False)
+    event = threading.Event()
+    results = []
+    thread = worker(clock, lambda: results.append(clock.wait(event, 60.0)))
+    clock.advance(1.0)
+    clock.set(event)
+    thread.join(5.0)
+    assert results == [True]
+    assert clock.time() == 1.0
+
+def test_wait_times_out_in_virtual_time():
+    clock = SimulatedClock()
+    assert clock.wait(threading.Event(), 30.0) is False
+    assert clock.time() == 30.0
+
+def test_close_releases_sleepers():
+    clock = SimulatedClock(auto_advance=False)
+    thread = worker(clock, lambda: clock.sleep(1000.0))
+    clock.advance(0.0)
+    clock.close()
+    thread.join(5.0)
+    assert not thread.is_alive()
+    clock.sleep(50.0)
+
+def test_set_wakes_the_waiter_before_time_moves_on():
+    clock = SimulatedClock()
+    event = threading.Event()
+    woke = []
+
+    def waiter():
+        clock.wait(event, 1000.0)
+        woke.append(clock.time())
+
+    def setter():
+        clock.sleep(10.0)
+        clock.set(event)
+        clock.sleep(500.0)
+
+    threads = [worker(clock, waiter, start=False), worker(clock, setter, start=False)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5.0)
+    assert woke == [10.0]
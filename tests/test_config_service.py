@@ -0,0 +1,68 @@
+"""Config service: atomic writes, debounced saves and hot reload"""
+
+import json
+import os
+import threading
+import pytest
+from core.config_manager import ConfigService
+from core.thread_registry import get_thread_registry
+
+@pytest.fixture
+def service(tmp_path):
+    result = ConfigService(tmp_path, save_delay=0.05, poll_interval=0.02)
+    yield result
+    result.close()
+
+def read(service):
+    with open(service.config_file) as f:
+        return json.load(f)
+
+def test_first_run_copies_the_template(tmp_path):
+    (tmp_path / "config_template.json").write_text(json.dumps({"theme": "light"}))
+    service = ConfigService(tmp_path)
+    assert service.get("theme") == "light"
+    assert read(service) == {"theme": "light"}
+
+def test_changes_are_saved_once_after_the_delay(service, monkeypatch):
+    writes = []
+    write = service._write
+    monkeypatch.setattr(service, "_write", lambda document: (writes.append(dict(document)), write(document)))
+    for size in (1, 2, 3):
+        service.update({"size": size})
+    assert not writes
+    timer = service._save_timer
+    assert get_thread_registry().get(timer).name == "config-save"
+    timer.join(1.0)
+    assert [document["size"] for document in writes] == [3]
+    assert read(service)["size"] == 3
+
+def test_a_failed_write_keeps_the_old_file(service, tmp_path):
+    service.update({"theme": "dark"})
+    assert service.flush()
+    service.update({"bad": object()})
+    assert not service.flush()
+    assert read(service)["theme"] == "dark"
+    assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
+
+def test_external_edits_reach_subscribers(service):
+    service.update({"theme": "dark"})
+    service.flush()
+    received = threading.Event()
+    documents = []
+    service.subscribe(lambda document: (documents.append(document), received.set()))
+    edited = {**read(service), "theme": "light"}
+    with open(service.config_file, "w") as f:
+        json.dump(edited, f)
+    stat = os.stat(service.config_file)
+    os.utime(service.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert received.wait(2.0)
+    assert documents[-1]["theme"] == "light"
+    assert service.get("theme") == "light"
+
+def test_unsubscribe(service):
+    documents = []
+    unsubscribe = service.subscribe(documents.append)
+    service.update({"a": 1})
+    unsubscribe()
+    service.update({"a": 2})
+    assert [document["a"] for document in documents] == [1]
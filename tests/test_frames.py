@@ -0,0 +1,55 @@
+"""FrameService: shared grabs and the buffers frames are read from"""
+
+import numpy as np
+from core.clock import SimulatedClock
+from vision.frames import FrameService
+
+class CountingCapture:
+    """Capture returning a frame filled with the number of the grab"""
+
+    def __init__(self):
+        self.grabs = 0
+
+    def grab(self, region=None):
+        self.grabs += 1
+        width, height = (region[2], region[3]) if region is not None else (16, 12)
+        return np.full((height, width, 3), self.grabs % 256, dtype=np.uint8)
+
+def service(interval: float = 1.0):
+    clock = SimulatedClock(auto_advance=False)
+    return FrameService(CountingCapture(), interval=interval, clock=clock), clock
+
+def test_callers_within_the_interval_share_a_frame():
+    frames, clock = service()
+    subscription = frames.subscribe()
+    first = subscription.frame()
+    assert subscription.frame() is first
+    clock.advance(1.0)
+    assert subscription.frame() is not first
+    assert frames.grabs == 2
+
+def test_held_frame_survives_later_grabs():
+    frames, clock = service(interval=0.0)
+    subscription = frames.subscribe()
+    held = subscription.frame()
+    gray = held.gray()
+    for _ in range(3):
+        clock.advance(1.0)
+        subscription.frame()
+    assert (held.rgb == 1).all()
+    assert (held.gray() == gray).all()
+
+def test_released_slots_are_reused():
+    frames, clock = service(interval=0.0)
+    subscription = frames.subscribe()
+    for _ in range(10):
+        clock.advance(1.0)
+        subscription.frame()
+    assert len(frames._slots) <= 2
+
+def test_frame_covers_the_union_of_regions():
+    frames, _ = service()
+    frames.subscribe([(2, 3, 4, 4)])
+    subscription = frames.subscribe([(4, 5, 6, 2)])
+    frame = subscription.frame()
+    assert frame.region == (2, 3, 8, 4)
@@ -0,0 +1,80 @@
+"""Game catalogue: compiling definitions and the compiled cache"""
+
+import json
+import os
+import pytest
+from modules import game_catalog
+from modules.game_catalog import CatalogError, compile_game, load_catalog
+
+CLICKER = {
+    "name": "Clicker", "category": "Clicker",
+    "actions": {
+        "click": {"type": "auto_click", "params": [{"name": "cps", "kind": "float", "default": 10}], "rate": "cps"},
+        "mine": {"type": "auto_mine", "params": [{"name": "ore"}], "delay": 2},
+    },
+    "ui": [{"label": "Ore:", "var": "ore", "values": ["Iron"]}, {"button": "Mine", "action": "mine", "args": ["$ore"]}],
+}
+
+def test_build_config_binds_arguments():
+    game = compile_game("test.json", CLICKER)
+    assert game.build_config("mine", ("Gold",)) == {"type": "auto_mine", "ore": "Gold", "delay": 2.0}
+    assert game.build_config("click", kwargs={"cps": 4}) == {"type": "auto_click", "cps": 4.0, "delay": 0.25}
+    with pytest.raises(TypeError):
+        game.build_config("mine")
+    with pytest.raises(TypeError):
+        game.build_config("mine", ("Gold",), {"ore": "Iron"})
+
+@pytest.mark.parametrize("change, message", [
+    ({"actions": {"mine": {"type": "auto_mine", "params": [{"name": "depth"}]}}}, "have no option 'depth'"),
+    ({"actions": {"mine": {"type": "auto_mine", "delay": -1}}}, "delay must be a non-negative number"),
+    ({"ui": [{"button": "Go", "action": "fly"}]}, "unknown action 'fly'"),
+    ({"name": ""}, "missing name"),
+])
+def test_invalid_definitions_fail(change, message):
+    with pytest.raises(CatalogError) as error:
+        compile_game("test.json", {**CLICKER, **change})
+    assert message in str(error.value)
+
+def write(data_dir, games, name="clicker.json"):
+    (data_dir / name).write_text(json.dumps({"games": games}))
+
+def test_duplicate_names_fail(tmp_path):
+    write(tmp_path, [CLICKER], "a.json")
+    write(tmp_path, [CLICKER], "b.json")
+    with pytest.raises(CatalogError):
+        load_catalog(tmp_path, tmp_path / "cache.pickle")
+
+def test_cache_is_reused_until_a_source_or_schema_changes(tmp_path, monkeypatch):
+    data_dir, cache_file = tmp_path / "games", tmp_path / "cache.pickle"
+    data_dir.mkdir()
+    write(data_dir, [CLICKER])
+    compiled = []
+    compile_catalog = game_catalog.compile_catalog
+    monkeypatch.setattr(game_catalog, "compile_catalog",
+                        lambda directory: compiled.append(directory) or compile_catalog(directory))
+
+    assert load_catalog(data_dir, cache_file).names() == ["Clicker"]
+    assert load_catalog(data_dir, cache_file).names() == ["Clicker"]
+    assert len(compiled) == 1
+
+    write(data_dir, [CLICKER, {**CLICKER, "name": "Clicker 2"}])
+    stat = os.stat(data_dir / "clicker.json")
+    os.utime(data_dir / "clicker.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_catalog(data_dir, cache_file).names() == ["Clicker", "Clicker 2"]
+    assert len(compiled) == 2
+
+    monkeypatch.setattr(game_catalog, "schema_signature", lambda: "changed")
+    load_catalog(data_dir, cache_file)
+    assert len(compiled) == 3
+
+def test_built_in_catalogue_compiles():
+    games = game_catalog.compile_catalog()
+    assert len(games) >= 48
+    assert len({game.name for game in games}) == len(games)
+
+def test_registering_a_task_type_changes_the_schema_signature():
+    from core.task_spec import Field, define_spec, schema_signature
+    before = schema_signature()
+    assert schema_signature() == before
+    define_spec("catalog_test_task", Field("depth", int, 1))
+    assert schema_signature() != before
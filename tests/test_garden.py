@@ -0,0 +1,30 @@
+"""GardenModel: which plots a garden step acts on"""
+
+import numpy as np
+from core.garden import EMPTY, GROWING, RIPE, GardenModel
+
+def test_unobserved_garden_selects_every_plot():
+    garden = GardenModel(plots=4)
+    for step in ("plant", "buy", "water", "fertilize", "harvest"):
+        assert garden.select(step, 0.0).tolist() == [0, 1, 2, 3]
+
+def test_observed_garden_selects_plots_needing_the_step():
+    garden = GardenModel(plots=4)
+    garden.observe([EMPTY, GROWING, RIPE, EMPTY], now=10.0)
+    assert garden.observed == 10.0
+    assert garden.select("harvest", 10.0).tolist() == [2]
+    assert garden.select("plant", 10.0).tolist() == [0, 3]
+
+def test_observing_another_plot_count_resizes():
+    garden = GardenModel(plots=4)
+    garden.observe([RIPE] * 6, now=0.0)
+    assert len(garden) == 6
+    assert garden.select("harvest", 0.0).tolist() == list(range(6))
+
+def test_planted_plot_ripens_after_its_grow_time():
+    garden = GardenModel(plots=2)
+    garden.observe([EMPTY, EMPTY], now=0.0)
+    garden.apply("plant", np.array([0]), 0.0, crop="Carrot")
+    ripe_at = garden.grow_time("Carrot")
+    assert garden.select("harvest", ripe_at - 1.0).tolist() == []
+    assert garden.select("harvest", ripe_at).tolist() == [0]
@@ -0,0 +1,43 @@
+"""GardenPlanner: plantings and seed purchases over the default crop table"""
+
+from core.garden import CROPS
+from core.garden_planner import GardenPlanner
+
+def planner() -> GardenPlanner:
+    return GardenPlanner({name: dict(stats) for name, stats in CROPS.items()})
+
+def test_unlimited_budget_plants_the_best_crop_everywhere():
+    assert planner().allocate(12, 3600) == ["Watermelon"] * 12
+
+def test_no_budget_and_no_stock_plants_nothing():
+    assert planner().allocate(12, 3600, budget=0) == [None] * 12
+
+def test_budget_limits_the_seeds_bought():
+    plan = planner().allocate(12, 3600, budget=100)
+    assert plan == ["Carrot"] * 10 + [None] * 2
+
+def test_seeds_in_stock_are_free():
+    plan = planner().allocate(12, 3600, budget=0, stock={"Carrot": 3, "Tomato": 2})
+    assert plan == ["Tomato"] * 2 + ["Carrot"] * 3 + [None] * 7
+
+def test_zero_horizon_plants_nothing():
+    assert planner().allocate(4, 0) == [None] * 4
+    assert planner().schedule(0) == []
+
+def test_no_plots():
+    assert planner().allocate(0, 3600) == []
+
+def test_schedule():
+    assert planner().schedule(3600) == [(0.0, "Watermelon"), (1800.0, "Watermelon")]
+    assert planner().schedule(1000) == [(0.0, "Tomato"), (900.0, "Carrot")]
+    assert planner().schedule(50) == []
+
+def test_profit_matches_schedule():
+    plan = planner()
+    assert plan.profit(3600) == 2 * (CROPS["Watermelon"]["sell_price"] - CROPS["Watermelon"]["seed_price"])
+
+def test_editing_the_crop_table_replans():
+    plan = planner()
+    assert plan.allocate(3, 3600) == ["Watermelon"] * 3
+    plan.crops["Carrot"]["sell_price"] = 10000.0
+    assert plan.allocate(3, 3600) == ["Carrot"] * 3
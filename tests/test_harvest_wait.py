@@ -0,0 +1,75 @@
+"""Harvest tasks sleep until the garden model says crops ripen"""
+
+import threading
+import numpy as np
+from core.automation_engine import RIPEN_SLACK, AutomationEngine
+from core.clock import SimulatedClock
+from core.garden import EMPTY, GROWING, GardenModel
+from core.task_spec import compile_task
+
+def harvest_engine(observed: bool = True):
+    clock = SimulatedClock()
+    garden = GardenModel(plots=2)
+    if observed:
+        garden.observe([EMPTY, EMPTY], now=0.0)
+    return AutomationEngine(clock=clock, garden=garden), clock, garden
+
+def test_unobserved_garden_waits_the_delay():
+    engine, clock, garden = harvest_engine(observed=False)
+    engine._wait_for_harvest(compile_task({"type": "auto_harvest_all", "delay": 7.0}))
+    assert clock.elapsed == 7.0
+
+def test_waits_until_the_crop_ripens():
+    engine, clock, garden = harvest_engine()
+    garden.planted(np.array([0]), "Carrot", 0.0)
+    engine._wait_for_harvest(compile_task({"type": "auto_harvest_all", "delay": 1.0}))
+    assert clock.elapsed == 60.0 + RIPEN_SLACK
+
+def test_harvest_window_waits_for_the_batch():
+    engine, clock, garden = harvest_engine()
+    garden.planted(np.array([0]), "Carrot", 0.0)
+    garden.planted(np.array([1]), "Strawberry", 0.0)
+    engine._wait_for_harvest(compile_task({"type": "harvest_crops", "harvest_window": 300.0}))
+    assert clock.elapsed == 240.0 + RIPEN_SLACK
+
+def test_nothing_planted_waits_the_delay():
+    engine, clock, garden = harvest_engine()
+    engine._wait_for_harvest(compile_task({"type": "auto_harvest_all", "delay": 5.0}))
+    assert clock.elapsed == 5.0
+
+def test_planting_a_sooner_crop_wakes_the_wait():
+    engine, clock, garden = harvest_engine()
+    garden.planted(np.array([0]), "Watermelon", 0.0)
+    spec = compile_task({"type": "auto_harvest_all", "delay": 1.0})
+    done = []
+
+    def waiter():
+        try:
+            engine._wait_for_harvest(spec)
+            done.append(clock.time())
+        finally:
+            clock.remove_participant()
+
+    def planter():
+        try:
+            clock.sleep(10.0)
+            with garden.lock:
+                garden.planted(np.array([1]), "Carrot", clock.time())
+        finally:
+            clock.remove_participant()
+
+    threads = [threading.Thread(target=waiter, daemon=True), threading.Thread(target=planter, daemon=True)]
+    for thread in threads:
+        clock.add_participant()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5.0)
+    assert done == [10.0 + 60.0 + RIPEN_SLACK]
+
+def test_stop_ends_the_wait():
+    engine, clock, garden = harvest_engine()
+    garden.planted(np.array([0]), "Watermelon", 0.0)
+    engine.stop_event.set()
+    engine._wait_for_harvest(compile_task({"type": "auto_harvest_all"}))
+    assert clock.elapsed == 0.0
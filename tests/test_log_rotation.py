@@ -0,0 +1,90 @@
+"""Segmented log files: rotation, compression, retention, index and tail reads"""
+
+import logging
+import threading
+import time
+from core.log_rotation import LogIndex, SegmentedFileHandler, read_recent, segment_path
+from core.logger import LOG_FORMAT
+
+def handler(log_dir, **options) -> SegmentedFileHandler:
+    options = {"midnight": False, "compress": False, **options}
+    result = SegmentedFileHandler(log_dir, **options)
+    result.setFormatter(logging.Formatter(LOG_FORMAT))
+    return result
+
+def emit(target: SegmentedFileHandler, message: str, created: float = None):
+    record = logging.makeLogRecord({"name": "core.test", "levelno": logging.INFO, "levelname": "INFO",
+                                    "msg": message})
+    if created is not None:
+        record.created = created
+        record.msecs = (created % 1) * 1000
+    target.handle(record)
+
+def test_rolls_over_by_size(tmp_path):
+    target = handler(tmp_path, max_bytes=300)
+    for i in range(20):
+        emit(target, f"message {i:02d} " + "x" * 40)
+    target.close()
+    entries = LogIndex(tmp_path).entries()
+    assert len(entries) >= 3
+    assert all(segment_path(tmp_path, entry["name"]).suffix == ".log" for entry in entries)
+    assert (tmp_path / "app.log").stat().st_size < 300 + 100
+
+def test_rolls_over_by_time(tmp_path):
+    now = time.time()
+    target = handler(tmp_path, max_bytes=0, interval=60.0)
+    emit(target, "first", now)
+    emit(target, "second", now + 1)
+    emit(target, "later", now + 120)
+    target.close()
+    (entry,) = LogIndex(tmp_path).entries()
+    assert "second" in segment_path(tmp_path, entry["name"]).read_text()
+    assert "later" in (tmp_path / "app.log").read_text()
+
+def test_segments_are_gzipped(tmp_path):
+    target = handler(tmp_path, max_bytes=200, compress=True)
+    for i in range(10):
+        emit(target, "y" * 60)
+    target.close()
+    entries = LogIndex(tmp_path).entries()
+    assert entries
+    assert all(segment_path(tmp_path, entry["name"]).name.endswith(".log.gz") for entry in entries)
+    assert not list(tmp_path.glob("app_*.log"))
+
+def test_retention_keeps_the_newest_segments(tmp_path):
+    target = handler(tmp_path, max_bytes=100, backup_count=2)
+    for i in range(12):
+        emit(target, "z" * 80)
+    target.close()
+    entries = LogIndex(tmp_path).entries()
+    assert len(entries) == 2
+    assert len(list(tmp_path.glob("app_*"))) == 2
+
+def test_prune_does_not_lose_a_concurrent_append(tmp_path):
+    index = LogIndex(tmp_path)
+    for i in range(3):
+        index.append({"name": f"s{i}", "start": i, "end": i})
+    appender = threading.Thread(target=index.append, args=({"name": "new", "start": 9, "end": 9},))
+
+    def select(entries):
+        appender.start()
+        appender.join(0.1)
+        return entries[-1:]
+
+    dropped = index.prune(select)
+    appender.join()
+    assert [entry["name"] for entry in dropped] == ["s0", "s1"]
+    assert [entry["name"] for entry in index.entries()] == ["s2", "new"]
+
+def test_read_recent_skips_old_lines(tmp_path):
+    now = time.time()
+    target = handler(tmp_path, max_bytes=0, compress=True)
+    emit(target, "old", now - 3600)
+    target.doRollover()
+    emit(target, "recent segment", now - 30)
+    target.doRollover()
+    emit(target, "active", now)
+    target.close()
+    assert len(LogIndex(tmp_path).entries()) == 2
+    lines = read_recent(60, log_dir=tmp_path)
+    assert [line.rsplit(" - ", 1)[1] for line in lines] == ["recent segment", "active"]
@@ -0,0 +1,69 @@
+"""Rate-limited logging pipeline"""
+
+import logging
+import queue
+import time
+from core.logger import RateLimitedQueueHandler, setup_logger, shutdown_logging
+
+def record(msg: str, *args, name: str = "core.test", level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+def drain(log_queue) -> list:
+    records = []
+    while not log_queue.empty():
+        records.append(log_queue.get_nowait())
+    return records
+
+def test_repeats_of_a_template_are_limited_and_summarized():
+    log_queue = queue.SimpleQueue()
+    handler = RateLimitedQueueHandler(log_queue, rate=3, per=60.0)
+    for i in range(10):
+        handler.emit(record("Clicked %s", i))
+    assert [r.getMessage() for r in drain(log_queue)] == ["Clicked 0", "Clicked 1", "Clicked 2"]
+    handler.flush_summaries()
+    (summary,) = drain(log_queue)
+    assert summary.getMessage() == "Previous message repeated 7 more times in 60s: Clicked %s"
+
+def test_keys_are_limited_separately():
+    log_queue = queue.SimpleQueue()
+    handler = RateLimitedQueueHandler(log_queue, rate=1, per=60.0)
+    handler.emit(record("A %s", 1))
+    handler.emit(record("A %s", 2))
+    handler.emit(record("B %s", 1))
+    handler.emit(record("A %s", 1, name="gui.test"))
+    handler.emit(record("A %s", 1, level=logging.ERROR))
+    assert len(drain(log_queue)) == 4
+
+def test_a_new_window_reports_the_last_one():
+    log_queue = queue.SimpleQueue()
+    handler = RateLimitedQueueHandler(log_queue, rate=1, per=0.05)
+    handler.emit(record("Tick"))
+    handler.emit(record("Tick"))
+    time.sleep(0.06)
+    handler.emit(record("Tick"))
+    messages = [r.getMessage() for r in drain(log_queue)]
+    assert messages == ["Tick", "Previous message repeated 1 more times in 0.05s: Tick", "Tick"]
+
+def test_zero_rate_disables_limiting():
+    log_queue = queue.SimpleQueue()
+    handler = RateLimitedQueueHandler(log_queue, rate=0)
+    for _ in range(20):
+        handler.emit(record("Tick"))
+    assert len(drain(log_queue)) == 20
+
+def test_setup_and_shutdown_are_idempotent(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = logging.getLogger()
+    level = root.level
+    try:
+        setup_logger(level=logging.INFO)
+        setup_logger(level=logging.INFO, rate=2)
+        handlers = [h for h in root.handlers if isinstance(h, RateLimitedQueueHandler)]
+        assert len(handlers) == 1 and handlers[0].rate == 2
+        logging.getLogger("core.test").info("Written %s", "once")
+    finally:
+        assert shutdown_logging() is True
+        root.setLevel(level)
+    assert shutdown_logging() is True
+    assert not [h for h in root.handlers if isinstance(h, RateLimitedQueueHandler)]
+    assert "Written once" in (tmp_path / "logs" / "app.log").read_text()
@@ -0,0 +1,55 @@
+"""Template matching: exact copies are found at every pyramid level"""
+
+import numpy as np
+import pytest
+from vision.matching import Template, find, find_all
+
+def smooth_frame(rng: np.random.Generator, height: int = 240, width: int = 320, cell: int = 4) -> np.ndarray:
+    """Random noise on a coarse grid, bilinearly upsampled"""
+    noise = rng.random((height // cell + 2, width // cell + 2))
+    ys = np.linspace(0.0, noise.shape[0] - 1.001, height)
+    xs = np.linspace(0.0, noise.shape[1] - 1.001, width)
+    y0, x0 = ys.astype(int), xs.astype(int)
+    fy, fx = (ys - y0)[:, None], (xs - x0)[None, :]
+    top = noise[y0][:, x0] * (1 - fx) + noise[y0][:, x0 + 1] * fx
+    bottom = noise[y0 + 1][:, x0] * (1 - fx) + noise[y0 + 1][:, x0 + 1] * fx
+    return ((top * (1 - fy) + bottom * fy) * 255).astype(np.float32)
+
+@pytest.mark.parametrize("size, levels", [(32, 2), (64, 3)])
+@pytest.mark.parametrize("cell", [3, 4, 6])
+def test_exact_copy_is_found(size, levels, cell):
+    misses = []
+    for seed in range(60):
+        rng = np.random.default_rng(seed)
+        frame = smooth_frame(rng, cell=cell)
+        y = int(rng.integers(0, frame.shape[0] - size))
+        x = int(rng.integers(0, frame.shape[1] - size))
+        template = Template(frame[y:y + size, x:x + size].copy())
+        assert template.levels == levels
+        match = find(frame, template)
+        if match is None or (match.x, match.y) != (x, y):
+            misses.append((seed, (x, y), match))
+    assert misses == []
+
+def test_false_coarse_peak_does_not_hide_the_match():
+    rng = np.random.default_rng(1)
+    frame = np.kron(rng.random((30, 40)), np.ones((8, 8))).astype(np.float32) * 100
+    pattern = (rng.random((32, 32)) * 255).astype(np.float32)
+    # Same 4x4 block means as the pattern (a perfect level-2 match), different detail
+    noise = rng.normal(0.0, 120.0, (8, 4, 8, 4))
+    noise -= noise.mean(axis=(1, 3), keepdims=True)
+    frame[40:72, 40:72] = pattern + noise.reshape(32, 32)
+    frame[150:182, 202:234] = pattern
+    template = Template(pattern)
+    assert template.levels == 2
+    match = find(frame, template)
+    assert match is not None and (match.x, match.y) == (202, 150)
+
+def test_find_all_returns_separate_copies():
+    rng = np.random.default_rng(7)
+    frame = smooth_frame(rng)
+    template = Template(frame[100:132, 50:82].copy())
+    frame[20:52, 200:232] = frame[100:132, 50:82]
+    matches = find_all(frame, template, max_matches=5)
+    assert sorted((match.x, match.y) for match in matches[:2]) == [(50, 100), (200, 20)]
+    assert all(match.score >= template.threshold for match in matches)
@@ -0,0 +1,57 @@
+"""PluginRegistry: manifests of installed distributions"""
+
+import json
+from importlib import metadata
+import pytest
+from modules import plugins
+from modules.plugins import ENTRY_POINT_GROUP, PluginRegistry
+
+MANIFEST = {
+    "name": "fish", "version": "1.0", "entry": "fishpkg:register",
+    "games": [{"name": "Fisch", "category": "Simulator",
+               "actions": {"auto_fish": {"type": "auto_fish", "delay": 2.0}}, "ui": []}],
+}
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """A sys.path entry with a distribution exposing a plugin entry point"""
+    site = tmp_path / "site"
+    package = site / "fishpkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("def register(ctx): pass\n")
+    (package / "plugin.json").write_text(json.dumps(MANIFEST))
+    info = site / "fishpkg-1.0.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text("Metadata-Version: 2.1\nName: fishpkg\nVersion: 1.0\n")
+    (info / "entry_points.txt").write_text(f"[{ENTRY_POINT_GROUP}]\nfish = fishpkg:register\n")
+    (info / "RECORD").write_text("fishpkg/__init__.py,,\nfishpkg/plugin.json,,\nfishpkg-1.0.dist-info/METADATA,,\n")
+    monkeypatch.syspath_prepend(str(site))
+    return tmp_path
+
+def registry(root) -> PluginRegistry:
+    return PluginRegistry(plugin_dir=root / "plugins", cache_file=root / "plugins.pickle")
+
+def test_entry_point_manifest_is_read(site):
+    plugin_registry = registry(site)
+    found = plugin_registry.discover()
+    assert [plugin.name for plugin in found] == ["fish"]
+    assert "Fisch" in plugin_registry.games
+    assert not plugin_registry.errors
+
+def test_entry_points_with_the_old_dict_api(site, monkeypatch):
+    # Python 3.8/3.9: entry_points() is a dict of group -> entry points without .dist
+    groups = {}
+    for dist in metadata.distributions():
+        for entry_point in dist.entry_points:
+            groups.setdefault(entry_point.group, []).append(
+                metadata.EntryPoint(entry_point.name, entry_point.value, entry_point.group))
+    monkeypatch.setattr(plugins.metadata, "entry_points", lambda: groups)
+    assert [plugin.name for plugin in registry(site).discover()] == ["fish"]
+
+def test_broken_entry_point_listing_is_recorded(site, monkeypatch):
+    def broken():
+        raise RuntimeError("bad metadata")
+    monkeypatch.setattr(plugins.metadata, "entry_points", broken)
+    plugin_registry = registry(site)
+    assert plugin_registry.discover() == []
+    assert plugin_registry.errors["entry points"] == "bad metadata"
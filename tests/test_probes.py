@@ -0,0 +1,61 @@
+"""ProbeSet: pixel checks at the edges of the image and of the tolerance"""
+
+import numpy as np
+import pytest
+from vision.probes import ProbeSet
+
+RED = (200, 30, 30)
+
+def image(width: int = 8, height: int = 6) -> np.ndarray:
+    pixels = np.zeros((height, width, 3), dtype=np.uint8)
+    pixels[...] = RED
+    return pixels
+
+def test_probes_on_the_image_edges_hit():
+    probes = ProbeSet()
+    probes.add("top_left", 0, 0, RED, tolerance=0)
+    probes.add("bottom_right", 7, 5, RED, tolerance=0)
+    assert probes.hits(image()).tolist() == [True, True]
+
+def test_probes_outside_the_image_miss():
+    probes = ProbeSet()
+    probes.add("right", 8, 0, RED)
+    probes.add("below", 0, 6, RED)
+    probes.add("left", -1, 0, RED)
+    probes.add("inside", 3, 3, RED)
+    assert probes.hits(image()).tolist() == [False, False, False, True]
+
+def test_origin_shifts_probes_into_the_image():
+    probes = ProbeSet({"point": {"x": 105, "y": 52, "color": RED}})
+    assert probes.hits(image(), origin=(100, 50)).tolist() == [True]
+    assert probes.hits(image(), origin=(0, 0)).tolist() == [False]
+    assert probes.hits(image(), origin=(106, 50)).tolist() == [False]
+
+def test_tolerance_is_inclusive():
+    probes = ProbeSet()
+    probes.add("exact", 1, 1, (210, 30, 30), tolerance=10)
+    probes.add("over", 2, 2, (211, 30, 30), tolerance=10)
+    assert probes.check(image()) == {"exact": True, "over": False}
+
+def test_mask_bits_follow_names():
+    probes = ProbeSet()
+    probes.add("a", 0, 0, RED)
+    probes.add("b", 100, 100, RED)
+    probes.add("c", 1, 1, RED)
+    assert probes.mask(image()) == probes.bits(["a", "c"]) == 0b101
+
+def test_add_replaces_a_probe():
+    probes = ProbeSet()
+    probes.add("a", 100, 100, RED)
+    probes.add("a", 0, 0, RED)
+    assert len(probes) == 1
+    assert probes.check(image()) == {"a": True}
+
+def test_merged_prefers_the_other_set():
+    mine = ProbeSet({"a": {"x": 0, "y": 0, "color": (0, 0, 0)}})
+    theirs = ProbeSet({"a": {"x": 0, "y": 0, "color": RED}, "b": {"x": 1, "y": 1, "color": RED}})
+    assert mine.merged(theirs).check(image()) == {"a": True, "b": True}
+
+def test_color_needs_three_channels():
+    with pytest.raises(ValueError):
+        ProbeSet().add("bad", 0, 0, (1, 2))
@@ -0,0 +1,86 @@
+"""Parallel component stops, flush hooks and the shutdown report"""
+
+import gc
+import threading
+import time
+from core.shutdown import ShutdownCoordinator
+
+class Component:
+    """Stoppable stand-in that records calls into a shared log"""
+
+    def __init__(self, name, log, finishes=True, running=True):
+        self.name = name
+        self.log = log
+        self.finishes = finishes
+        self.running = running
+        self.stopped = threading.Event()
+
+    def request_stop(self):
+        self.log.append(("signal", self.name))
+        if self.finishes:
+            self.stopped.set()
+        return self.running
+
+    def join(self, timeout):
+        self.log.append(("join", self.name))
+        return self.stopped.wait(timeout)
+
+def test_signals_everything_before_joining():
+    log = []
+    coordinator = ShutdownCoordinator()
+    components = [Component(name, log) for name in ("a", "b", "c")]
+    for component in components:
+        coordinator.register(component, component.name)
+    report = coordinator.shutdown(timeout=1.0)
+    assert [kind for kind, _ in log] == ["signal"] * 3 + ["join"] * 3
+    assert sorted(report["stopped"]) == ["a", "b", "c"]
+    assert report["missed"] == [] and report["errors"] == {}
+
+def test_one_deadline_is_shared_by_all_components():
+    log = []
+    coordinator = ShutdownCoordinator()
+    hung = [Component(f"hung{index}", log, finishes=False) for index in range(3)]
+    idle = Component("idle", log, running=False)
+    for component in hung + [idle]:
+        coordinator.register(component, component.name)
+    start = time.monotonic()
+    report = coordinator.shutdown(timeout=0.2)
+    assert time.monotonic() - start < 0.5
+    assert sorted(report["missed"]) == ["hung0", "hung1", "hung2"]
+    assert ("join", "idle") not in log
+
+def test_flushes_run_in_order_and_report_misses():
+    order = []
+    coordinator = ShutdownCoordinator()
+    coordinator.add_flush("logging", lambda left: order.append("logging"), order=100)
+    coordinator.add_flush("config", lambda left: order.append("config") or False, order=10)
+    coordinator.add_flush("broken", lambda left: 1 / 0, order=50)
+    report = coordinator.shutdown(timeout=1.0)
+    assert order == ["config", "logging"]
+    assert report["missed"] == ["config"]
+    assert "broken" in report["errors"]
+
+def test_only_the_first_shutdown_acts():
+    log = []
+    coordinator = ShutdownCoordinator()
+    component = Component("a", log)
+    coordinator.register(component, "a")
+    first = coordinator.shutdown(timeout=1.0)
+    assert coordinator.done
+    assert coordinator.shutdown(timeout=1.0) is first
+    assert log == [("signal", "a"), ("join", "a")]
+
+def test_components_are_held_weakly_and_errors_reported():
+    class Broken(Component):
+        def request_stop(self):
+            raise RuntimeError("boom")
+
+    log = []
+    coordinator = ShutdownCoordinator()
+    coordinator.register(Component("gone", log), "gone")
+    broken = Broken("broken", log)
+    coordinator.register(broken, "broken")
+    gc.collect()
+    report = coordinator.shutdown(timeout=1.0)
+    assert log == []
+    assert report["errors"] == {"broken": "boom"}
@@ -0,0 +1,77 @@
+"""Simulated game: engine environment and input backend round trips"""
+
+import threading
+import pytest
+from core.automation_engine import AutomationEngine
+from core.clock import SimulatedClock
+from core.garden import EMPTY, GROWING, RIPE, CROPS
+from core.simulated_game import ActionFailed, SimulatedGame
+from core.task_spec import compile_task
+from modules.macro_clicker import MacroClicker
+
+def test_clicker_clicks_reach_the_game():
+    clock = SimulatedClock(auto_advance=False)
+    game = SimulatedGame(clock, currency=0.0)
+    game.move_to(40, 50)
+    clicker = MacroClicker(clock=clock, backend=game)
+    assert clicker.start_clicking({"interval": 1.0})
+    clock.run_for(9.5)
+    clicker.stop_clicking()
+    assert game.clicks == 10
+    assert game.position() == (40, 50)
+    assert game.currency == 10 * game.click_value
+
+def test_engine_records_what_the_environment_produced():
+    clock = SimulatedClock(auto_advance=False)
+    game = SimulatedGame(clock, currency=0.0, latency=0.0)
+    engine = AutomationEngine(clock=clock, environment=game)
+    assert engine.start_automation({"type": "coin_farm", "delay": 2.0})
+    clock.run_for(59.0)
+    engine.stop_automation()
+    stats = engine.get_stats()
+    assert stats["actions_performed"] == 30
+    assert stats["currency"] == game.currency == 30 * game.farm_reward
+    (row,) = engine.get_yield_report()
+    assert row["type"] == "coin_farm" and row["ticks"] == 30
+
+def test_garden_round_trip():
+    clock = SimulatedClock()
+    game = SimulatedGame(clock, plots=3, currency=100.0, latency=0.0)
+    game.perform(compile_task({"type": "buy_seeds", "seed_type": "Carrot"}))
+    game.perform(compile_task({"type": "auto_plant_all", "seed_type": "Carrot"}), plots=[0, 2])
+    view = game.observe_garden()
+    assert view["stages"] == [GROWING, EMPTY, GROWING]
+    assert view["crops"] == ["Carrot", None, "Carrot"]
+    assert view["seeds"] == {"Carrot": 1}
+    clock.sleep(CROPS["Carrot"]["grow_time"])
+    assert game.observe_garden()["stages"] == [RIPE, EMPTY, RIPE]
+    outcome = game.perform(compile_task({"type": "harvest_crops"}))
+    assert outcome.items == 2
+    sold = game.perform(compile_task({"type": "sell_produce"}))
+    assert sold.currency == 2 * CROPS["Carrot"]["sell_price"]
+
+def test_injected_failures_raise():
+    game = SimulatedGame(SimulatedClock(), failure_rate=1.0, latency=0.0)
+    with pytest.raises(ActionFailed):
+        game.perform(compile_task({"type": "coin_farm"}))
+    assert game.action_stats()["coin_farm"]["failures"] == 1
+
+def test_cancel_drops_the_action():
+    clock = SimulatedClock()
+    game = SimulatedGame(clock, latency=5.0)
+    cancel = threading.Event()
+    cancel.set()
+    assert game.perform(compile_task({"type": "coin_farm"}), cancel=cancel) is None
+    assert game.currency == 100.0
+
+def test_same_seed_same_run():
+    def play():
+        clock = SimulatedClock()
+        game = SimulatedGame(clock, failure_rate=0.3, seed=42)
+        for _ in range(50):
+            try:
+                game.perform(compile_task({"type": "coin_farm"}))
+            except ActionFailed:
+                pass
+        return game.snapshot(), clock.time()
+    assert play() == play()
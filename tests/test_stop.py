@@ -0,0 +1,66 @@
+"""Stopping engines and bots promptly, without leaking threads"""
+
+import threading
+import time
+from core.automation_engine import AutomationEngine, register_task_handler
+from core.bot_framework import BotFramework, BotType
+from core.clock import SimulatedClock
+
+def test_stop_cuts_a_long_delay_short():
+    engine = AutomationEngine()
+    assert engine.start_automation({"type": "macro", "delay": 60.0})
+    start = time.monotonic()
+    assert engine.stop_automation(timeout=2.0)
+    assert time.monotonic() - start < 1.0
+
+def test_stop_wakes_a_paused_loop():
+    engine = AutomationEngine()
+    assert engine.start_automation({"type": "macro", "delay": 0.01})
+    engine.pause_automation()
+    time.sleep(0.05)
+    assert engine.stop_automation(timeout=2.0)
+    assert not engine.thread.is_alive()
+
+def test_start_refuses_while_the_last_thread_is_alive():
+    gate = threading.Event()
+    register_task_handler("test_blocking", lambda engine, spec: gate.wait(5.0))
+    engine = AutomationEngine()
+    try:
+        assert engine.start_automation({"type": "test_blocking"})
+        time.sleep(0.05)
+        assert not engine.stop_automation(timeout=0.05)
+        assert not engine.start_automation({"type": "macro"})
+    finally:
+        gate.set()
+    assert engine.join(2.0)
+    assert engine.start_automation({"type": "macro", "delay": 60.0})
+    assert engine.stop_automation(timeout=2.0)
+
+def test_bots_stop_promptly():
+    framework = BotFramework()
+    for index in range(3):
+        framework.create_bot(f"bot{index}", BotType.VISIT_BOT, {"game_id": 1, "delay": 60})
+        assert framework.start_bot(f"bot{index}")
+    start = time.monotonic()
+    assert framework.stop_all(timeout=2.0) == []
+    assert time.monotonic() - start < 1.0
+    assert not any(bot.thread.is_alive() for bot in framework.get_all_bots())
+
+def test_cancelled_untimed_waits_do_not_pile_up():
+    clock = SimulatedClock()
+    for _ in range(50):
+        event = threading.Event()
+        clock.add_participant()
+
+        def waiter(event=event):
+            try:
+                clock.wait(event)
+            finally:
+                clock.remove_participant()
+        thread = threading.Thread(target=waiter, daemon=True)
+        thread.start()
+        while not clock.pending():
+            time.sleep(0.001)
+        clock.set(event)
+        thread.join(2.0)
+    assert len(clock._sleepers) <= 2
@@ -0,0 +1,32 @@
+"""compile_task: validation errors of task configs"""
+
+import pytest
+from core.task_spec import TaskSpecError, compile_task
+
+@pytest.mark.parametrize("config, message", [
+    ([1], "must be a dict"),
+    ({"type": "water_plants", "dleay": 1}, "did you mean 'delay'"),
+    ({"type": "water_plants", "delay": -1}, "must be >= 0.0"),
+    ({"type": "clicker", "button": "side"}, "must be one of"),
+    ({"type": "clicker", "position": (1,)}, "expected an (x, y) point"),
+    ({"type": "auto_tap", "cps": "fast"}, "expected a number"),
+])
+def test_invalid_configs_raise(config, message):
+    with pytest.raises(TaskSpecError) as error:
+        compile_task(config)
+    assert message in str(error.value)
+
+def test_task_spec_error_is_a_value_error():
+    with pytest.raises(ValueError):
+        compile_task({"type": "water_plants", "delay": -1})
+
+def test_defaults_and_replace():
+    spec = compile_task({"type": "auto_plant_all"})
+    assert spec.seed_type == "Best Available"
+    assert spec.replace(horizon=10).horizon == 10.0
+    assert spec.horizon == 3600.0
+
+def test_specs_are_immutable():
+    spec = compile_task({"type": "auto_plant_all"})
+    with pytest.raises(AttributeError):
+        spec.seed_type = "Carrot"
@@ -0,0 +1,43 @@
+"""Worker registration, zombie detection and snapshots"""
+
+import threading
+from core.thread_registry import ThreadRegistry
+
+def test_register_renames_and_spawn_does_not_start():
+    registry = ThreadRegistry()
+    thread = threading.Thread(target=lambda: None)
+    info = registry.register(thread, "Owner", "work", name="worker-1")
+    assert thread.name == "worker-1" and info.name == "worker-1"
+    assert registry.get(thread) is info
+
+    spawned = registry.spawn(lambda: None, "Owner", "other work", "worker-2")
+    assert spawned.name == "worker-2" and spawned.daemon
+    assert not spawned.is_alive()
+    assert registry.get(spawned).purpose == "other work"
+
+def test_worker_outliving_its_stop_is_a_zombie():
+    registry = ThreadRegistry(grace=0.0)
+    release = threading.Event()
+    thread = registry.spawn(release.wait, "Owner", "hang", "hanging", args=(5.0,))
+    thread.start()
+    try:
+        assert registry.zombies() == []
+        registry.stop_requested(thread)
+        assert [info.name for info in registry.zombies()] == ["hanging"]
+        record = next(record for record in registry.snapshot() if record["name"] == "hanging")
+        assert record["owner"] == "Owner" and record["zombie"]
+    finally:
+        release.set()
+        thread.join(2.0)
+    assert registry.zombies() == []
+
+def test_snapshot_forgets_exited_threads():
+    registry = ThreadRegistry()
+    thread = registry.spawn(lambda: None, "Owner", "quick", "quick")
+    thread.start()
+    thread.join(2.0)
+    records = registry.snapshot()
+    assert all(record["name"] != "quick" for record in records)
+    assert registry.get(thread) is None
+    current = next(record for record in records if record["name"] == threading.current_thread().name)
+    assert current["owner"] == "unregistered"
@@ -0,0 +1,65 @@
+"""Yield accounting and the bandit parameter tuner"""
+
+import pytest
+from core.task_spec import compile_task
+from core.yield_tracker import ParameterTuner, TaskOutcome, YieldTracker
+
+def test_coerce():
+    assert TaskOutcome.coerce(None) is None
+    assert TaskOutcome.coerce({"items": 2, "xp": 1.5}).to_dict() == {"items": 2, "currency": 0.0, "xp": 1.5}
+    outcome = TaskOutcome(items=1)
+    assert TaskOutcome.coerce(outcome) is outcome
+    with pytest.raises(TypeError):
+        TaskOutcome.coerce(3)
+
+def test_yield_per_hour_over_the_time_seen():
+    tracker = YieldTracker(window=3600.0)
+    tracker.record("coin_farm", (), TaskOutcome(currency=10.0), now=0.0)
+    tracker.record("coin_farm", (), TaskOutcome(currency=10.0), now=1800.0)
+    assert tracker.yield_per_hour("coin_farm", (), now=1800.0)["currency"] == 40.0
+
+def test_old_outcomes_leave_the_window():
+    tracker = YieldTracker(window=100.0, weights={"items": 2.0})
+    tracker.record("auto_mine", (), TaskOutcome(items=5), now=0.0)
+    tracker.record("auto_mine", (), TaskOutcome(items=1), now=150.0)
+    rates = tracker.yield_per_hour("auto_mine", (), now=150.0)
+    assert rates["items"] == 36.0
+    assert rates["value"] == 72.0
+
+def test_report_is_sorted_by_value():
+    tracker = YieldTracker()
+    tracker.record("a", (("delay", 1.0),), TaskOutcome(items=1), now=0.0)
+    tracker.record("b", (), TaskOutcome(items=9), now=0.0)
+    tracker.record("a", (("delay", 1.0),), None, now=10.0)
+    tracker.record("b", (), None, now=10.0)
+    report = tracker.report(now=10.0)
+    assert [row["type"] for row in report] == ["b", "a"]
+    assert report[1]["params"] == {"delay": 1.0}
+    assert report[1]["ticks"] == 2
+
+def test_param_key_ignores_unset_common_options():
+    plain = compile_task({"type": "auto_fertilize", "game": "Grow a Garden"})
+    explicit = compile_task({"type": "auto_fertilize", "delay": 1.0, "counter_stat": "currency"})
+    assert plain.param_key == explicit.param_key == (("fertilizer", "Basic"),)
+    assert compile_task({"type": "auto_fertilize", "delay": 2.0}).param_key != plain.param_key
+
+def test_tuner_holds_each_arm_and_tries_all():
+    tuner = ParameterTuner({"delay": [1.0, 2.0, 3.0]}, pulls_per_arm=2, seed=1)
+    seen = []
+    for _ in range(6):
+        seen.append(tuner.select()["delay"])
+        tuner.update(None, 1.0)
+    assert seen == [1.0, 1.0, 2.0, 2.0, 3.0, 3.0]
+
+def test_tuner_converges_on_the_best_arm():
+    yields = {"Spawn": 1, "Desert": 5, "Snow": 2}
+    tuner = ParameterTuner({"world": list(yields)}, epsilon=0.3, decay=0.8, pulls_per_arm=1, seed=7)
+    for _ in range(200):
+        tuner.update(TaskOutcome(items=yields[tuner.select()["world"]]), 1.0)
+    assert tuner.converged
+    assert tuner.best() == {"world": "Desert"}
+    assert max(tuner.stats(), key=lambda row: row["value_per_hour"])["params"] == {"world": "Desert"}
+
+def test_tuner_needs_candidates():
+    with pytest.raises(ValueError):
+        ParameterTuner({"delay": []})
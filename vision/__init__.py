@@ -0,0 +1 @@
+"""Screen capture and image matching for state-aware automation"""
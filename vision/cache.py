@@ -0,0 +1,92 @@
+"""
+Template Cache
+Precomputed template pyramids and FFTs kept on disk between runs
+
+Each template is stored as ``cache/templates/<key>.npz``, where the key is a
+hash of the template's source, so an edited template simply gets a new file.
+The file holds the pyramid levels and the kernel FFTs computed so far for
+frame sizes seen before; loading it skips decoding, downscaling and the
+transforms. Large FFTs (coarse or full frames) are left out: past a few
+hundred KB reading one back is no faster than computing it.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Union
+import numpy as np
+from vision.matching import DEFAULT_THRESHOLD, Template
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path("cache") / "templates"
+# Largest kernel FFT written to disk, in complex elements (512 KB)
+FFT_LIMIT = 1 << 15
+# Bump when the stored layout or the pyramid construction changes
+CACHE_VERSION = 1
+
+def file_key(path: Union[str, Path]) -> str:
+    """Cache key of a template file (hash of its bytes)"""
+    digest = hashlib.sha1(f"v{CACHE_VERSION}:".encode())
+    digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:20]
+
+class TemplateCache:
+    """Directory of cached templates"""
+
+    def __init__(self, directory: Path = CACHE_DIR, fft_limit: int = FFT_LIMIT):
+        self.directory = Path(directory)
+        self.fft_limit = fft_limit
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def load(self, key: str, name: str = "", threshold: float = DEFAULT_THRESHOLD) -> Optional[Template]:
+        """Get a cached template (None if it is not cached or the file is unreadable)"""
+        try:
+            with np.load(self.path(key)) as arrays:
+                return Template.from_arrays(dict(arrays), key, name=name, threshold=threshold)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable template cache %s: %s", self.path(key), e)
+            return None
+
+    def store(self, template: Template) -> bool:
+        """
+        Write a template if it has state the cached copy lacks
+
+        Returns:
+            True if the file was written
+        """
+        if template.unsaved == 0 and self.path(template.key).is_file():
+            return False
+        arrays = template.arrays(self.fft_limit)
+        template.unsaved = 0
+        try:
+            with self._lock:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(prefix=".template-", suffix=".npz", dir=self.directory)
+                with os.fdopen(fd, 'wb') as f:
+                    np.savez(f, **arrays)
+                os.replace(tmp_path, self.path(template.key))
+            return True
+        except OSError as e:
+            # A read-only install still works, it just rebuilds templates every start
+            logger.warning("Could not write template cache for %s: %s", template.name, e)
+            return False
+
+_cache: Optional[TemplateCache] = None
+_cache_lock = threading.Lock()
+
+def get_template_cache() -> TemplateCache:
+    """Get the process-wide template cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TemplateCache()
+        return _cache
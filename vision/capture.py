@@ -0,0 +1,164 @@
+"""
+Screen Capture
+Frames as NumPy arrays from the screen or from image files
+
+A frame is an ``(height, width, 3)`` uint8 RGB array. Regions are
+``(left, top, width, height)`` tuples in frame pixels. ``ScreenCapture`` grabs
+the real screen through Pillow; ``FileCapture`` serves saved screenshots (or
+arrays) instead, so detection can be developed and checked without a game.
+"""
+
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+Region = Tuple[int, int, int, int]
+ImageSource = Union[str, Path, np.ndarray]
+# File types looked for when images are named without an extension
+EXTENSIONS = (".png", ".npy", ".bmp", ".jpg")
+
+# ITU-R BT.601 luma weights
+LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+def load_image(source: ImageSource) -> np.ndarray:
+    """
+    Load an RGB frame
+
+    Args:
+        source: Path to an image (.npy, or anything Pillow reads) or an array
+
+    Returns:
+        (height, width, 3) uint8 array
+    """
+    if isinstance(source, np.ndarray):
+        image = source
+    else:
+        path = Path(source)
+        if path.suffix == ".npy":
+            image = np.load(path)
+        else:
+            from PIL import Image
+            with Image.open(path) as img:
+                image = np.asarray(img.convert("RGB"))
+    if image.ndim == 2:
+        image = np.repeat(image[:, :, None], 3, axis=2)
+    elif image.shape[2] == 4:
+        image = image[:, :, :3]
+    return np.ascontiguousarray(image, dtype=np.uint8)
+
+def save_image(image: np.ndarray, path: Union[str, Path]):
+    """Save a frame as .npy, or through Pillow for any other extension"""
+    path = Path(path)
+    if path.suffix == ".npy":
+        np.save(path, image)
+    else:
+        from PIL import Image
+        Image.fromarray(image).save(path)
+
+def clip_region(region: Optional[Region], width: int, height: int) -> Region:
+    """Clamp a region to a frame (None: the whole frame)"""
+    if region is None:
+        return (0, 0, width, height)
+    left, top, w, h = (int(v) for v in region)
+    left = min(max(left, 0), width)
+    top = min(max(top, 0), height)
+    return (left, top, max(0, min(w, width - left)), max(0, min(h, height - top)))
+
+def crop(frame: np.ndarray, region: Optional[Region]) -> np.ndarray:
+    """Get a region of a frame as a view (clamped to the frame)"""
+    if region is None:
+        return frame
+    left, top, w, h = clip_region(region, frame.shape[1], frame.shape[0])
+    return frame[top:top + h, left:left + w]
+
+def to_gray(frame: np.ndarray) -> np.ndarray:
+    """Convert an RGB frame (or a gray one) to float32 luma"""
+    if frame.ndim == 2:
+        return frame.astype(np.float32, copy=False)
+    return frame[:, :, :3] @ LUMA
+
+class Capture:
+    """Source of screen frames"""
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        """Capture the screen, or just ``region`` of it"""
+        raise NotImplementedError
+
+    def size(self) -> Tuple[int, int]:
+        """Get the (width, height) of a full frame"""
+        frame = self.grab()
+        return frame.shape[1], frame.shape[0]
+
+class ScreenCapture(Capture):
+    """The real screen, through Pillow's ImageGrab"""
+
+    def __init__(self):
+        self._grab = None
+        self._lock = threading.Lock()
+
+    def _get(self):
+        """Import ImageGrab on first use (it needs a display)"""
+        if self._grab is None:
+            with self._lock:
+                if self._grab is None:
+                    from PIL import ImageGrab
+                    self._grab = ImageGrab.grab
+        return self._grab
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        bbox = None
+        if region is not None:
+            left, top, width, height = region
+            bbox = (left, top, left + width, top + height)
+        image = self._get()(bbox=bbox)
+        return np.asarray(image.convert("RGB"))
+
+class FileCapture(Capture):
+    """Serves saved screenshots in place of the screen"""
+
+    def __init__(self, frames: Sequence[ImageSource], loop: bool = True):
+        """
+        Args:
+            frames: Image paths or arrays, shown in order
+            loop: Start over after the last frame (otherwise stay on it)
+        """
+        if not frames:
+            raise ValueError("FileCapture needs at least one frame")
+        self._sources = list(frames)
+        self._frames: List[Optional[np.ndarray]] = [None] * len(self._sources)
+        self.loop = loop
+        self.index = 0
+        self._lock = threading.Lock()
+
+    def _frame(self, index: int) -> np.ndarray:
+        """Load a frame on first use; frames are read-only"""
+        frame = self._frames[index]
+        if frame is None:
+            frame = load_image(self._sources[index])
+            frame.setflags(write=False)
+            self._frames[index] = frame
+        return frame
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        with self._lock:
+            frame = self._frame(self.index)
+        return crop(frame, region)
+
+    def advance(self, steps: int = 1) -> int:
+        """Move to a later frame; returns the new index"""
+        with self._lock:
+            index = self.index + steps
+            if self.loop:
+                index %= len(self._sources)
+            else:
+                index = min(index, len(self._sources) - 1)
+            self.index = index
+            return index
+
+    def show(self, index: int):
+        """Jump to a frame"""
+        with self._lock:
+            self.index = index % len(self._sources)
+
+screen_capture = ScreenCapture()
@@ -0,0 +1,80 @@
+"""
+Change Detection
+Tells whether a screen region changed between frames
+
+A region's signature is its gray image averaged over ``block`` x ``block``
+pixel blocks. Two signatures differ when any block's mean moved by more than
+``threshold`` gray levels (0-255), which ignores sensor-like noise and small
+animations but catches an item appearing or a counter changing.
+"""
+
+from typing import Optional
+import numpy as np
+from vision.capture import Region
+from vision.frames import Frame
+from vision.matching import downscale
+
+DEFAULT_BLOCK = 8
+DEFAULT_THRESHOLD = 6.0
+
+def signature(gray: np.ndarray, block: int = DEFAULT_BLOCK) -> np.ndarray:
+    """Block-mean signature of a gray image (regions smaller than a block use one block)"""
+    if gray.shape[0] < block or gray.shape[1] < block:
+        return np.array([[gray.mean(dtype=np.float32)]], dtype=np.float32) if gray.size else np.zeros((1, 1), np.float32)
+    return downscale(gray, block)
+
+def difference(before: np.ndarray, after: np.ndarray) -> float:
+    """Largest block-mean change between two signatures (inf if their shapes differ)"""
+    if before.shape != after.shape:
+        return float("inf")
+    return float(np.abs(after - before).max())
+
+class ChangeDetector:
+    """Watches one screen region for changes against a reference"""
+
+    def __init__(self, region: Region, threshold: float = DEFAULT_THRESHOLD, block: int = DEFAULT_BLOCK):
+        """
+        Args:
+            region: Screen region to watch
+            threshold: Block-mean change in gray levels that counts as a change
+            block: Block size in pixels
+        """
+        self.region = tuple(region)
+        self.threshold = threshold
+        self.block = block
+        self.reference: Optional[np.ndarray] = None
+        self._latest: Optional[np.ndarray] = None
+        self._rebase = False
+
+    def check(self, frame: Frame) -> bool:
+        """
+        Compare the region in a frame with the reference
+
+        Returns:
+            True if it changed (always True before the first reference)
+        """
+        latest = signature(frame.gray(self.region), self.block)
+        self._latest = latest
+        if self._rebase or self.reference is None:
+            changed = self.reference is None
+            self.reference = latest
+            self._rebase = False
+            return changed
+        return difference(self.reference, latest) > self.threshold
+
+    def accept(self, rebase: bool = True):
+        """
+        Take the last checked frame as the new reference
+
+        Args:
+            rebase: Replace the reference once more at the next check, so the
+                effect of acting on the change is not itself seen as a change
+        """
+        self.reference = self._latest
+        self._rebase = rebase
+
+    def reset(self):
+        """Forget the reference; the next check reports a change"""
+        self.reference = None
+        self._latest = None
+        self._rebase = False
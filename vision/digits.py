@@ -0,0 +1,224 @@
+"""
+Digit Reader
+Reads HUD numbers (coins, pollen, level) with a calibrated glyph bank
+
+The region is split into ink and background with Otsu's threshold (the
+minority side is taken as ink, so light and dark text both work), and glyphs
+are cut where the column projection of the ink is empty. Each glyph is
+resampled over the full line height to a small bitmap, so a "." stays at the
+bottom and a "1" spans the line, and all of them are compared with every
+bitmap in the bank in one matrix product.
+
+The bank is built once from a screenshot whose counter shows known text
+(``calibrate``), and saved as ``templates/<game>/glyphs.npz``.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+import numpy as np
+from vision.capture import to_gray
+
+# Glyph bitmap size (width, height)
+GLYPH_SIZE = (8, 12)
+# Worst accepted match: fraction of differing bitmap pixels plus the aspect penalty
+MAX_DISTANCE = 0.3
+# Weight of the glyph width (relative to the line height) in the distance
+ASPECT_WEIGHT = 0.5
+# Smallest glyph, in ink pixels per squared line height (drops specks)
+MIN_INK = 0.01
+# Segments wider than this many of the widest known glyph are split (touching glyphs)
+SPLIT_WIDTH = 1.4
+# Text suffixes games use for large numbers
+SUFFIXES = {"k": 1e3, "m": 1e6, "b": 1e9, "t": 1e12, "q": 1e15}
+BANK_VERSION = 1
+
+def _otsu(gray: np.ndarray) -> float:
+    """Threshold between the two gray populations of an image"""
+    counts = np.bincount(gray.astype(np.uint8).ravel(), minlength=256).astype(np.float64)
+    levels = np.arange(256, dtype=np.float64)
+    weight = np.cumsum(counts)
+    total = weight[-1]
+    means = np.cumsum(counts * levels)
+    between = (means[-1] * weight - total * means) ** 2
+    between /= np.maximum(weight * (total - weight), 1.0)
+    # Clean text has an empty gray range between the populations: cut in its middle
+    best = np.flatnonzero(between >= between.max() * (1.0 - 1e-6))
+    return (best[0] + best[-1]) / 2.0 + 0.5
+
+def ink(image: np.ndarray) -> np.ndarray:
+    """Boolean ink mask of an RGB or gray text region"""
+    gray = to_gray(image)
+    mask = gray > _otsu(gray)
+    # Text covers less of a counter than its background does
+    if mask.mean() > 0.5:
+        mask = ~mask
+    return mask
+
+def parse_number(text: str) -> Optional[float]:
+    """
+    Convert counter text to a number ("1,234" -> 1234, "1.5K" -> 1500)
+
+    Returns:
+        The value, or None if the text is not a number
+    """
+    text = text.replace(",", "").replace("$", "").replace(" ", "").lower()
+    scale = 1.0
+    if text and text[-1] in SUFFIXES:
+        scale = SUFFIXES[text[-1]]
+        text = text[:-1]
+    try:
+        return float(text) * scale
+    except ValueError:
+        return None
+
+class GlyphBank:
+    """Reference bitmaps of the characters of one HUD font"""
+
+    def __init__(self, chars: Optional[List[str]] = None, bitmaps: Optional[np.ndarray] = None,
+                 aspects: Optional[np.ndarray] = None):
+        """
+        Args:
+            chars: Character of each bitmap (repeats allowed: several samples)
+            bitmaps: (n, height, width) boolean glyph bitmaps
+            aspects: Glyph width / line height of each bitmap
+        """
+        self.chars: List[str] = list(chars or [])
+        width, height = GLYPH_SIZE
+        self.bitmaps = (np.asarray(bitmaps, dtype=bool) if bitmaps is not None
+                        else np.zeros((0, height, width), dtype=bool))
+        self.aspects = np.asarray(aspects if aspects is not None else (), dtype=np.float32)
+        self._compile()
+
+    def _compile(self):
+        """Precompute the matrices reading compares against"""
+        flat = self.bitmaps.reshape(len(self.chars), GLYPH_SIZE[0] * GLYPH_SIZE[1]).astype(np.float32)
+        self._ones = flat.T
+        self._zeros = (1.0 - flat).T
+        self._max_aspect = float(self.aspects.max()) if len(self.aspects) else 0.0
+
+    def __len__(self) -> int:
+        return len(self.chars)
+
+    def segment(self, mask: np.ndarray) -> Tuple[np.ndarray, List[Tuple[int, int]], float]:
+        """
+        Cut an ink mask into glyphs
+
+        Returns:
+            (glyph bitmaps, (first, end) column of each glyph, line height);
+            no glyphs if the region has no ink
+        """
+        width, height = GLYPH_SIZE
+        empty = (np.zeros((0, height, width), dtype=bool), [], 0.0)
+        # Rows with a single ink pixel are specks, not text
+        rows = np.flatnonzero(mask.sum(axis=1) >= 2)
+        if rows.size == 0:
+            return empty
+        line = mask[rows[0]:rows[-1] + 1]
+        line_height = float(line.shape[0])
+        projection = line.sum(axis=0)
+        inked = np.flatnonzero(projection)
+        # Runs of inked columns: a gap starts a new glyph
+        breaks = np.flatnonzero(np.diff(inked) > 1)
+        starts = np.concatenate(([inked[0]], inked[breaks + 1]))
+        ends = np.concatenate((inked[breaks] + 1, [inked[-1] + 1]))
+        # Drop specks; even a "." has a few pixels of ink
+        totals = np.add.reduceat(projection, starts)
+        keep = totals >= max(2.0, line_height * line_height * MIN_INK)
+        spans = list(zip(starts[keep].tolist(), ends[keep].tolist()))
+        if not spans:
+            return empty
+        if self._max_aspect:
+            spans = self._split(spans, projection, self._max_aspect * line_height * SPLIT_WIDTH)
+
+        # Resample every glyph to the bitmap grid in one fancy index
+        row_index = ((np.arange(height) + 0.5) * line_height / height).astype(np.intp)
+        col_index = np.array([start + ((np.arange(width) + 0.5) * (end - start) / width).astype(np.intp)
+                              for start, end in spans])
+        glyphs = line[row_index[None, :, None], col_index[:, None, :]]
+        return glyphs, spans, line_height
+
+    @staticmethod
+    def _split(spans: List[Tuple[int, int]], projection: np.ndarray, limit: float) -> List[Tuple[int, int]]:
+        """Split spans wider than ``limit`` at their thinnest column"""
+        result = []
+        pending = list(reversed(spans))
+        while pending:
+            start, end = pending.pop()
+            if end - start <= limit or end - start < 4:
+                result.append((start, end))
+                continue
+            # Look for the cut in the middle, away from the glyphs' own edges
+            low, high = start + (end - start) // 4, end - (end - start) // 4
+            cut = low + int(np.argmin(projection[low:high]))
+            pending.append((cut, end))
+            pending.append((start, cut))
+        return result
+
+    def read(self, image: np.ndarray) -> Optional[str]:
+        """
+        Read the text of a counter region
+
+        Returns:
+            The text, "" if the region is empty, or None if a glyph matches
+            nothing in the bank closely enough
+        """
+        if not self.chars:
+            raise ValueError("Glyph bank is empty; calibrate it first")
+        glyphs, spans, line_height = self.segment(ink(image))
+        if not spans:
+            return ""
+        flat = glyphs.reshape(len(spans), -1).astype(np.float32)
+        # Differing pixels against every bank bitmap: ink where the bank has none and vice versa
+        distance = flat @ self._zeros + (1.0 - flat) @ self._ones
+        distance *= 1.0 / flat.shape[1]
+        widths = np.array([end - start for start, end in spans], dtype=np.float32) / line_height
+        distance += ASPECT_WEIGHT * np.abs(widths[:, None] - self.aspects[None, :])
+        best = distance.argmin(axis=1)
+        if distance[np.arange(len(spans)), best].max() > MAX_DISTANCE:
+            return None
+        return "".join(self.chars[index] for index in best.tolist())
+
+    def value(self, image: np.ndarray) -> Optional[float]:
+        """Read a counter region as a number (None if unreadable)"""
+        text = self.read(image)
+        return parse_number(text) if text else None
+
+    def calibrate(self, image: np.ndarray, text: str):
+        """
+        Add the glyphs of a region showing known text
+
+        Args:
+            image: Counter region (RGB or gray)
+            text: What it shows, e.g. "1,234,567" (spaces are ignored)
+
+        Raises:
+            ValueError: If the region does not split into one glyph per character
+        """
+        chars = [char for char in text if not char.isspace()]
+        glyphs, spans, line_height = self.segment(ink(image))
+        if len(spans) != len(chars):
+            raise ValueError(f"Found {len(spans)} glyphs for {len(chars)} characters of {text!r}; "
+                             "crop the region tighter or check the text")
+        widths = np.array([end - start for start, end in spans], dtype=np.float32) / line_height
+        self.chars.extend(chars)
+        self.bitmaps = np.concatenate((self.bitmaps, glyphs))
+        self.aspects = np.concatenate((self.aspects, widths))
+        self._compile()
+
+    def save(self, path: Union[str, Path]):
+        """Write the bank as .npz"""
+        np.savez(path, version=BANK_VERSION, chars=np.array(self.chars, dtype="<U1"),
+                 bitmaps=self.bitmaps, aspects=self.aspects)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "GlyphBank":
+        """
+        Read a bank written by ``save``
+
+        Raises:
+            ValueError: If the file is from an incompatible version
+        """
+        with np.load(path) as bank:
+            if int(bank["version"]) != BANK_VERSION:
+                raise ValueError(f"{path}: glyph bank version {int(bank['version'])}, expected {BANK_VERSION}")
+            return cls([str(char) for char in bank["chars"]], bank["bitmaps"], bank["aspects"])
@@ -0,0 +1,253 @@
+"""
+Frame Service
+One shared screen capture per interval for every engine
+
+Each engine (or anything else that looks at the screen) subscribes with the
+regions it cares about. The service grabs at most one frame per ``interval``,
+covering only the bounding box of all subscribed regions, copies it into a
+reusable buffer and hands every subscriber the same read-only ``Frame``.
+Crops are views of that buffer and the gray conversion is done once per
+frame, so N engines cost one capture rather than N.
+
+Buffers are reused, but only once nothing refers to them any more: a Frame,
+and every crop or gray view taken from it, stays intact for as long as it is
+held, however many grabs happen meanwhile (a subscriber adding a region
+forces a grab within the interval). While all buffers are in use a grab gets
+a new one, so there are as many as frames held at once, plus one.
+"""
+
+import sys
+import threading
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+from core.clock import Clock, system_clock
+from vision.capture import LUMA, Capture, Region, clip_region, screen_capture
+from vision.matching import Match, Template, find_all
+
+DEFAULT_INTERVAL = 0.1
+
+def union(regions: Iterable[Optional[Region]]) -> Optional[Region]:
+    """Bounding box of regions (None if any of them is the whole screen, or there are none)"""
+    boxes = list(regions)
+    if not boxes or any(region is None for region in boxes):
+        return None
+    left = min(region[0] for region in boxes)
+    top = min(region[1] for region in boxes)
+    right = max(region[0] + region[2] for region in boxes)
+    bottom = max(region[1] + region[3] for region in boxes)
+    return (left, top, right - left, bottom - top)
+
+def _covers(outer: Optional[Region], inner: Optional[Region]) -> bool:
+    """True if ``outer`` contains ``inner`` (None is the whole screen)"""
+    if outer is None:
+        return True
+    if inner is None:
+        return False
+    return (outer[0] <= inner[0] and outer[1] <= inner[1]
+            and inner[0] + inner[2] <= outer[0] + outer[2] and inner[1] + inner[3] <= outer[1] + outer[3])
+
+def _on_screen(area: Optional[Region]) -> Optional[Region]:
+    """Drop the part of a region above or left of the screen origin"""
+    if area is None:
+        return None
+    left, top = max(area[0], 0), max(area[1], 0)
+    return (left, top, max(0, area[0] + area[2] - left), max(0, area[1] + area[3] - top))
+
+class _Slot:
+    """A reusable pair of RGB and gray buffers"""
+
+    __slots__ = ("rgb", "gray")
+
+    def __init__(self):
+        self.rgb: Optional[np.ndarray] = None
+        self.gray: Optional[np.ndarray] = None
+
+    def in_use(self) -> bool:
+        """True while a Frame or a view still refers to the buffers"""
+        # Views keep their base array alive, so any reference beyond this slot's
+        # own (and getrefcount's argument) is a Frame or a crop of one
+        return ((self.rgb is not None and sys.getrefcount(self.rgb) > 2)
+                or (self.gray is not None and sys.getrefcount(self.gray) > 2))
+
+class Frame:
+    """A captured area of the screen, shared read-only between subscribers"""
+
+    __slots__ = ("seq", "time", "origin", "rgb", "_slot", "_gray", "_lock")
+
+    def __init__(self, seq: int, time: float, origin: Tuple[int, int], rgb: np.ndarray, slot: _Slot):
+        self.seq = seq
+        self.time = time
+        self.origin = origin
+        self.rgb = rgb
+        self._slot = slot
+        self._gray: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    @property
+    def region(self) -> Region:
+        """Screen area this frame covers"""
+        return (self.origin[0], self.origin[1], self.rgb.shape[1], self.rgb.shape[0])
+
+    def local(self, region: Optional[Region]) -> Optional[Region]:
+        """Translate a screen region into this frame's pixel coordinates"""
+        if region is None:
+            return None
+        return (region[0] - self.origin[0], region[1] - self.origin[1], region[2], region[3])
+
+    def crop(self, region: Optional[Region] = None) -> np.ndarray:
+        """Get a screen region as a read-only RGB view (clipped to the frame)"""
+        return self._view(self.rgb, region)
+
+    def gray(self, region: Optional[Region] = None) -> np.ndarray:
+        """Get a screen region as a read-only float32 luma view (converted once per frame)"""
+        if self._gray is None:
+            with self._lock:
+                if self._gray is None:
+                    slot = self._slot
+                    if slot.gray is None or slot.gray.shape != self.rgb.shape[:2]:
+                        slot.gray = np.empty(self.rgb.shape[:2], dtype=np.float32)
+                    np.matmul(self.rgb, LUMA, out=slot.gray)
+                    gray = slot.gray.view()
+                    gray.setflags(write=False)
+                    self._gray = gray
+        return self._view(self._gray, region)
+
+    def _view(self, image: np.ndarray, region: Optional[Region]) -> np.ndarray:
+        if region is None:
+            return image
+        left, top, width, height = clip_region(self.local(region), image.shape[1], image.shape[0])
+        return image[top:top + height, left:left + width]
+
+    def find_all(self, template: Template, region: Optional[Region] = None,
+                 threshold: Optional[float] = None, max_matches: int = 10) -> List[Match]:
+        """Find a template in a screen region of this frame (matches in screen coordinates)"""
+        matches = find_all(self.gray(), template, self.local(region), threshold, max_matches)
+        for match in matches:
+            match.x += self.origin[0]
+            match.y += self.origin[1]
+        return matches
+
+    def find(self, template: Template, region: Optional[Region] = None,
+             threshold: Optional[float] = None) -> Optional[Match]:
+        """Find the best occurrence of a template in a screen region of this frame"""
+        matches = self.find_all(template, region, threshold, max_matches=1)
+        return matches[0] if matches else None
+
+class Subscription:
+    """A subscriber's regions of interest"""
+
+    def __init__(self, service: "FrameService", regions: List[Optional[Region]]):
+        self.service = service
+        self.regions = regions
+
+    def frame(self) -> Frame:
+        """Get the current shared frame (grabbed now if the last one is older than the interval)"""
+        return self.service.frame()
+
+    def add(self, region: Optional[Region]):
+        """Widen the subscription to another region (no-op if it is already covered)"""
+        if any(_covers(existing, region) for existing in self.regions):
+            return
+        with self.service._lock:
+            self.regions.append(region)
+            self.service._union_dirty = True
+
+    def close(self):
+        """Stop contributing regions to the shared capture"""
+        self.service.unsubscribe(self)
+
+class FrameService:
+    """Shared, rate-limited screen capture"""
+
+    def __init__(self, capture: Optional[Capture] = None, interval: float = DEFAULT_INTERVAL,
+                 clock: Optional[Clock] = None):
+        """
+        Args:
+            capture: Frame source (default: the screen)
+            interval: Minimum seconds between grabs; callers within it share a frame
+            clock: Time source for the interval
+        """
+        self.capture = capture or screen_capture
+        self.interval = interval
+        self.clock = clock or system_clock
+        self.grabs = 0
+        self._subscriptions: List[Subscription] = []
+        self._union: Optional[Region] = None
+        self._union_dirty = False
+        self._slots: List[_Slot] = []
+        self._frame: Optional[Frame] = None
+        self._frame_area: Optional[Region] = None
+        self._lock = threading.Lock()
+        self._grab_lock = threading.Lock()
+
+    def subscribe(self, regions: Optional[Iterable[Optional[Region]]] = None) -> Subscription:
+        """
+        Declare regions of interest
+
+        Args:
+            regions: Screen regions (None or a None entry: the whole screen)
+        """
+        subscription = Subscription(self, list(regions) if regions is not None else [None])
+        with self._lock:
+            self._subscriptions.append(subscription)
+            self._union_dirty = True
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+                self._union_dirty = True
+
+    def _current_union(self) -> Optional[Region]:
+        """Bounding box of every subscribed region (lock held)"""
+        if self._union_dirty:
+            self._union = union(region for subscription in self._subscriptions for region in subscription.regions)
+            self._union_dirty = False
+        return self._union
+
+    def frame(self) -> Frame:
+        """Get a frame covering every subscribed region, grabbing only when the last one is stale"""
+        with self._grab_lock:
+            now = self.clock.monotonic()
+            with self._lock:
+                area = _on_screen(self._current_union())
+            current = self._frame
+            if current is not None and now - current.time < self.interval and _covers(self._frame_area, area):
+                return current
+            return self._grab(area, now)
+
+    def _free_slot(self) -> _Slot:
+        """Get a slot nothing refers to, adding one if all are in use (grab lock held)"""
+        for slot in self._slots:
+            if not slot.in_use():
+                return slot
+        slot = _Slot()
+        self._slots.append(slot)
+        return slot
+
+    def _grab(self, area: Optional[Region], now: float) -> Frame:
+        """Capture into a slot no held frame is using (grab lock held)"""
+        image = self.capture.grab(area)
+        slot = self._free_slot()
+        if slot.rgb is None or slot.rgb.shape != image.shape:
+            slot.rgb = np.empty(image.shape, dtype=np.uint8)
+        np.copyto(slot.rgb, image)
+        rgb = slot.rgb.view()
+        rgb.setflags(write=False)
+        self.grabs += 1
+        origin = (area[0], area[1]) if area is not None else (0, 0)
+        self._frame = Frame(self.grabs, now, origin, rgb, slot)
+        self._frame_area = area
+        return self._frame
+
+_services_lock = threading.Lock()
+
+def get_frame_service(capture: Optional[Capture] = None, clock: Optional[Clock] = None) -> FrameService:
+    """Get the shared frame service of a capture source (default: the screen)"""
+    capture = capture or screen_capture
+    with _services_lock:
+        service = getattr(capture, "frame_service", None)
+        if service is None:
+            service = capture.frame_service = FrameService(capture, clock=clock)
+        return service
@@ -0,0 +1,370 @@
+"""
+Template Matching
+Normalized cross-correlation over image pyramids
+
+``ncc`` scores every placement of a template in an image at once: the
+correlation with the zero-mean template comes from an FFT, and the window
+means and variances from integral images. ``find``/``find_all`` first search
+a downscaled copy of both and then refine the best coarse candidates at full
+resolution, so large frames cost a fraction of a full-size search.
+Candidates are separate peaks (each masks a template-sized window around
+it), and when a convincing coarse peak refines below the threshold the
+search repeats one level finer.
+Scores are in [-1, 1]; 1 is a perfect match regardless of brightness and
+contrast.
+"""
+
+import hashlib
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from vision.capture import ImageSource, Region, clip_region, load_image, to_gray
+
+DEFAULT_THRESHOLD = 0.85
+# Templates are not downscaled below this size (pixels, smaller side)
+MIN_PYRAMID_SIZE = 8
+MAX_PYRAMID_LEVELS = 3
+# Coarse scores are blurred; candidates this far below the threshold are still refined
+COARSE_MARGIN = 0.2
+# Below this many template pixels the direct sum beats an FFT
+_DIRECT_LIMIT = 64
+
+class Match:
+    """Where a template was found, in frame pixels"""
+
+    __slots__ = ("x", "y", "width", "height", "score")
+
+    def __init__(self, x: int, y: int, width: int, height: int, score: float):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.score = score
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Center point, e.g. to click on"""
+        return self.x + self.width // 2, self.y + self.height // 2
+
+    @property
+    def region(self) -> Region:
+        return (self.x, self.y, self.width, self.height)
+
+    def __repr__(self) -> str:
+        return f"Match(x={self.x}, y={self.y}, width={self.width}, height={self.height}, score={self.score:.3f})"
+
+def downscale(image: np.ndarray, factor: int = 2) -> np.ndarray:
+    """Shrink an image by averaging ``factor`` x ``factor`` blocks"""
+    height = image.shape[0] // factor * factor
+    width = image.shape[1] // factor * factor
+    if factor <= 4:
+        # A few strided adds beat a reduction over tiny axes by ~10x
+        total = np.zeros((height // factor, width // factor, *image.shape[2:]), dtype=np.float32)
+        for dy in range(factor):
+            for dx in range(factor):
+                total += image[dy:height:factor, dx:width:factor]
+    else:
+        rows = image[:height].reshape(height // factor, factor, *image.shape[1:]).sum(axis=1, dtype=np.float32)
+        total = np.add.reduceat(rows[:, :width], np.arange(0, width, factor), axis=1)
+    total *= 1.0 / (factor * factor)
+    return total
+
+def _window_sums(image: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Sum of every height x width window (valid placements), via an integral image"""
+    integral = np.zeros((image.shape[0] + 1, image.shape[1] + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(image, axis=0, dtype=np.float64), axis=1, out=integral[1:, 1:])
+    return (integral[height:, width:] - integral[:-height, width:]
+            - integral[height:, :-width] + integral[:-height, :-width])
+
+def _correlate(image: np.ndarray, kernel: np.ndarray, kernel_fft: Optional[np.ndarray] = None) -> np.ndarray:
+    """Sum of image * kernel at every valid placement"""
+    height, width = kernel.shape
+    if kernel.size <= _DIRECT_LIMIT:
+        return np.einsum("ijkl,kl->ij", sliding_window_view(image, kernel.shape), kernel)
+    # Circular convolution at the image's size: the valid part does not wrap
+    shape = image.shape
+    if kernel_fft is None:
+        kernel_fft = np.fft.rfft2(kernel[::-1, ::-1], shape)
+    full = np.fft.irfft2(np.fft.rfft2(image, shape) * kernel_fft, shape)
+    return full[height - 1:, width - 1:]
+
+def ncc(image: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """
+    Normalized cross-correlation of a template at every valid placement
+
+    Args:
+        image: 2-D gray image
+        template: 2-D gray template, no larger than the image
+
+    Returns:
+        (H - h + 1, W - w + 1) float32 scores (0 where the image window is flat)
+    """
+    kernel = template.astype(np.float64)
+    kernel -= kernel.mean()
+    return _ncc(image, kernel, float(np.sqrt((kernel * kernel).sum())))
+
+def _ncc(image: np.ndarray, kernel: np.ndarray, kernel_norm: float,
+         kernel_fft: Optional[np.ndarray] = None) -> np.ndarray:
+    """NCC against a zero-mean kernel whose norm is already known"""
+    height, width = kernel.shape
+    if image.shape[0] < height or image.shape[1] < width or kernel_norm == 0.0:
+        return np.zeros((max(0, image.shape[0] - height + 1), max(0, image.shape[1] - width + 1)), np.float32)
+    image = image.astype(np.float64, copy=False)
+    numerator = _correlate(image, kernel, kernel_fft)
+    sums = _window_sums(image, height, width)
+    squares = _window_sums(image * image, height, width)
+    variance = np.maximum(squares - sums * sums / kernel.size, 0.0)
+    denominator = np.sqrt(variance) * kernel_norm
+    scores = np.zeros(numerator.shape, dtype=np.float64)
+    # Flat windows (and float noise on them) score 0 rather than dividing by ~0
+    np.divide(numerator, denominator, out=scores, where=denominator > 1e-6 * kernel_norm * kernel_norm)
+    return np.clip(scores, -1.0, 1.0).astype(np.float32)
+
+class Template:
+    """A template image with its precomputed pyramid"""
+
+    def __init__(self, image: ImageSource, name: str = "", threshold: float = DEFAULT_THRESHOLD,
+                 levels: Optional[int] = None, key: Optional[str] = None):
+        """
+        Args:
+            image: RGB or gray array, or a path to one
+            name: Label used in logs
+            threshold: Default minimum score for a match
+            levels: Pyramid levels below full size (default: as many as the
+                template's size allows, up to MAX_PYRAMID_LEVELS)
+            key: Content hash identifying the template in caches (default:
+                a hash of its gray pixels)
+
+        Raises:
+            ValueError: If the template is a single flat colour (NCC cannot
+                match it; use a pixel probe instead)
+        """
+        if not isinstance(image, np.ndarray) or image.ndim == 3:
+            image = load_image(image)
+        self.name = name or "template"
+        self.threshold = threshold
+        gray = to_gray(image)
+        if levels is None:
+            levels = 0
+            while levels < MAX_PYRAMID_LEVELS and min(gray.shape) >> (levels + 1) >= MIN_PYRAMID_SIZE:
+                levels += 1
+        gray = np.ascontiguousarray(gray, dtype=np.float32)
+        self.key = key or hashlib.sha1(repr(gray.shape).encode() + gray.tobytes()).hexdigest()[:20]
+        # Level 0 is full size; each level halves both sides
+        pyramid = [gray]
+        for _ in range(levels):
+            pyramid.append(downscale(pyramid[-1]))
+        self._build(pyramid)
+
+    def _build(self, pyramid: List[np.ndarray], floors: Optional[List[float]] = None):
+        """Derive the zero-mean kernels (and the coarse floors, unless known) from a pyramid"""
+        self.pyramid: List[np.ndarray] = pyramid
+        self.height, self.width = pyramid[0].shape
+        self.kernels: List[Tuple[np.ndarray, float]] = []
+        for level in pyramid:
+            kernel = level.astype(np.float64)
+            kernel -= kernel.mean()
+            self.kernels.append((kernel, float(np.sqrt((kernel * kernel).sum()))))
+        if self.kernels[0][1] < 1e-6:
+            raise ValueError(f"Template {self.name!r} is a flat colour; it cannot be matched by correlation")
+        self.floors: List[float] = self._coarse_floors() if floors is None else floors
+        # (level, image shape) -> kernel FFT; frames of one size repeat every tick
+        self._ffts: Dict[Tuple[int, Tuple[int, int]], np.ndarray] = {}
+        # FFTs computed since the template was last saved
+        self.unsaved = 0
+
+    def _coarse_floors(self) -> List[float]:
+        """
+        Lowest score an exact copy of the template gets at each pyramid level
+
+        Downscaling a frame averages blocks on a fixed grid, so a copy that
+        does not start on a block boundary is blurred differently from the
+        template's own pyramid and scores less than 1. Fine detail loses the
+        most; the copy is tried at aligned and half-block offsets.
+        """
+        base = self.pyramid[0]
+        floors = [1.0]
+        for level in range(1, len(self.pyramid)):
+            scale = 1 << level
+            padded = np.pad(base, scale, mode="edge")
+            kernel, norm = self.kernels[level]
+            worst = 1.0
+            for dy in (0, scale // 2):
+                for dx in (0, scale // 2):
+                    image = padded[scale - dy:, scale - dx:]
+                    for _ in range(level):
+                        image = downscale(image)
+                    worst = min(worst, float(_ncc(image, kernel, norm).max()))
+            floors.append(worst)
+        return floors
+
+    def arrays(self, fft_limit: int) -> Dict[str, np.ndarray]:
+        """
+        Get the precomputed state as named arrays (for ``np.savez``)
+
+        Args:
+            fft_limit: Largest kernel FFT (in elements) to include; bigger ones
+                are quicker to recompute than to read back
+        """
+        arrays = {f"level{i}": level for i, level in enumerate(self.pyramid)}
+        arrays["floors"] = np.asarray(self.floors, dtype=np.float64)
+        for (level, (height, width)), fft in self._ffts.items():
+            if fft.size <= fft_limit:
+                arrays[f"fft_{level}_{height}_{width}"] = fft
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, key: str, name: str = "", threshold: float = DEFAULT_THRESHOLD) -> "Template":
+        """Rebuild a template from ``arrays()`` output without recomputing it"""
+        template = cls.__new__(cls)
+        template.name = name or "template"
+        template.threshold = threshold
+        template.key = key
+        levels = sorted(int(field[5:]) for field in arrays if field.startswith("level"))
+        floors = [float(floor) for floor in arrays["floors"]] if "floors" in arrays else None
+        template._build([np.asarray(arrays[f"level{i}"], dtype=np.float32) for i in levels], floors)
+        for field in arrays:
+            if field.startswith("fft_"):
+                level, height, width = (int(part) for part in field[4:].split("_"))
+                template._ffts[(level, (height, width))] = np.asarray(arrays[field])
+        return template
+
+    @property
+    def levels(self) -> int:
+        return len(self.pyramid) - 1
+
+    def kernel_fft(self, level: int, shape: Tuple[int, int]) -> Optional[np.ndarray]:
+        """Get the kernel's FFT at an image size (None when the direct sum is used)"""
+        kernel = self.kernels[level][0]
+        if kernel.size <= _DIRECT_LIMIT:
+            return None
+        key = (level, shape)
+        fft = self._ffts.get(key)
+        if fft is None:
+            if len(self._ffts) >= 16:
+                self._ffts.clear()
+            fft = self._ffts[key] = np.fft.rfft2(kernel[::-1, ::-1], shape)
+            self.unsaved += 1
+        return fft
+
+    def scores(self, image: np.ndarray, level: int = 0) -> np.ndarray:
+        """NCC map of this template's pyramid level over a gray image of the same level"""
+        kernel, norm = self.kernels[level]
+        return _ncc(image, kernel, norm, self.kernel_fft(level, image.shape))
+
+    def __repr__(self) -> str:
+        return f"Template({self.name!r}, {self.width}x{self.height}, levels={self.levels})"
+
+def _top_candidates(scores: np.ndarray, minimum: float, count: int,
+                    spacing: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """
+    Positions of the ``count`` best separate peaks at or above ``minimum``
+
+    Each accepted peak masks a template-sized window around itself, so the
+    neighbours of one strong (possibly false) peak cannot crowd the others out.
+
+    Args:
+        scores: NCC map
+        minimum: Lowest score to accept
+        count: Most peaks to return
+        spacing: Template (height, width) at the map's level
+    """
+    half_height, half_width = (spacing[0] + 1) // 2, (spacing[1] + 1) // 2
+    work = None
+    candidates = []
+    while len(candidates) < count:
+        source = scores if work is None else work
+        index = int(np.argmax(source))
+        y, x = divmod(index, scores.shape[1])
+        if source[y, x] < minimum:
+            break
+        candidates.append((y, x))
+        if work is None:
+            work = scores.copy()
+        work[max(0, y - half_height + 1):y + half_height, max(0, x - half_width + 1):x + half_width] = -np.inf
+    return candidates
+
+def _suppress(matches: List[Match], limit: int) -> List[Match]:
+    """Drop matches overlapping a better one by more than half the template"""
+    kept: List[Match] = []
+    for match in sorted(matches, key=lambda m: m.score, reverse=True):
+        if all(abs(match.x - other.x) * 2 >= match.width or abs(match.y - other.y) * 2 >= match.height
+               for other in kept):
+            kept.append(match)
+            if len(kept) >= limit:
+                break
+    return kept
+
+def find_all(frame: np.ndarray, template: Template, region: Optional[Region] = None,
+             threshold: Optional[float] = None, max_matches: int = 10,
+             coarse: Optional[Dict[int, np.ndarray]] = None) -> List[Match]:
+    """
+    Find non-overlapping occurrences of a template
+
+    Args:
+        frame: RGB frame (or an already gray one)
+        template: What to look for
+        region: Only search this part of the frame
+        threshold: Minimum score (default: the template's)
+        max_matches: Best matches to return
+        coarse: Downscaled copies of the searched area by pyramid level,
+            filled in as needed; pass the same dict when searching one area
+            for several templates so it is downscaled once
+
+    Returns:
+        Matches in frame coordinates, best first
+    """
+    threshold = template.threshold if threshold is None else threshold
+    left, top, width, height = clip_region(region, frame.shape[1], frame.shape[0])
+    if width < template.width or height < template.height:
+        return []
+    gray = to_gray(frame[top:top + height, left:left + width])
+
+    # Deepest level both the template and the searched area still fit at
+    level = template.levels
+    while level > 0 and (gray.shape[0] >> level < template.pyramid[level].shape[0] * 2
+                         or gray.shape[1] >> level < template.pyramid[level].shape[1] * 2):
+        level -= 1
+
+    coarse = {} if coarse is None else coarse
+    while level > 0:
+        if level not in coarse:
+            deepest = max((known for known in coarse if known < level), default=0)
+            image = coarse[deepest] if deepest else gray
+            for known in range(deepest + 1, level + 1):
+                image = coarse[known] = downscale(image)
+        coarse_scores = template.scores(coarse[level], level)
+        # An exact copy only scores floors[level] here
+        minimum = threshold - COARSE_MARGIN - (1.0 - template.floors[level])
+        candidates = _top_candidates(coarse_scores, minimum, max_matches * 4,
+                                     template.pyramid[level].shape)
+        scale = 1 << level
+        matches = []
+        for cy, cx in candidates:
+            # Full-resolution window around the coarse hit
+            y0 = max(0, cy * scale - scale)
+            x0 = max(0, cx * scale - scale)
+            y1 = min(gray.shape[0], cy * scale + scale + template.height)
+            x1 = min(gray.shape[1], cx * scale + scale + template.width)
+            window = template.scores(gray[y0:y1, x0:x1])
+            if window.size == 0:
+                continue
+            y, x = np.unravel_index(int(np.argmax(window)), window.shape)
+            score = float(window[y, x])
+            if score >= threshold:
+                matches.append(Match(left + x0 + int(x), top + y0 + int(y), template.width, template.height, score))
+        if matches or not candidates or coarse_scores[candidates[0]] < threshold - COARSE_MARGIN:
+            return _suppress(matches, max_matches)
+        # A convincing coarse peak refined below the threshold: blurred false
+        # peaks may be hiding the match, so look again one level finer
+        level -= 1
+
+    scores = template.scores(gray)
+    candidates = _top_candidates(scores, threshold, max_matches, (template.height, template.width))
+    return [Match(left + x, top + y, template.width, template.height, float(scores[y, x])) for y, x in candidates]
+
+def find(frame: np.ndarray, template: Template, region: Optional[Region] = None,
+         threshold: Optional[float] = None) -> Optional[Match]:
+    """Find the best occurrence of a template (None if nothing scores above the threshold)"""
+    matches = find_all(frame, template, region, threshold, max_matches=1)
+    return matches[0] if matches else None
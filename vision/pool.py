@@ -0,0 +1,218 @@
+"""
+Match Pool
+Matches many templates against one frame in worker processes
+
+Matching is NumPy work that holds the GIL for long stretches, so dozens of
+templates matched in engine threads slow the GUI and each other. The pool
+fans them out over a ``ProcessPoolExecutor`` instead:
+
+- the searched area's gray image is copied once into a shared-memory block
+  that every worker maps, so no frame is ever pickled;
+- workers load templates from the on-disk template cache by key, and keep
+  them, so only (key, threshold) pairs cross the process boundary;
+- each worker downscales the searched area once per batch and shares it
+  between the templates it was given.
+
+Batches smaller than ``MIN_POOL_TEMPLATES`` are matched in the calling thread,
+where the hand-off would cost more than it saves, and so is everything on a
+single-core machine. If the pool cannot be used
+(no shared memory, a worker died) matching falls back to the calling thread.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from core.shutdown import get_shutdown_coordinator
+from vision.cache import TemplateCache, get_template_cache
+from vision.capture import Region
+from vision.frames import Frame
+from vision.matching import Match, Template, find_all
+
+logger = logging.getLogger(__name__)
+
+# Fewer templates than this are matched in the calling thread
+MIN_POOL_TEMPLATES = 4
+
+def default_workers() -> int:
+    """Workers to start: one per core, leaving one for the GUI, at most 4 (0 on one core)"""
+    return max(0, min(4, (os.cpu_count() or 1) - 1))
+
+# Worker process state (one copy per worker)
+_worker_cache: Optional[TemplateCache] = None
+_worker_templates: Dict[str, Template] = {}
+_worker_saved: Set[str] = set()
+_worker_memory: Dict[str, SharedMemory] = {}
+
+def _init_worker(cache_dir: str, fft_limit: int):
+    global _worker_cache
+    _worker_cache = TemplateCache(Path(cache_dir), fft_limit)
+
+def _attach(name: str) -> SharedMemory:
+    """Map the parent's frame block (it is replaced when a bigger one is needed)"""
+    memory = _worker_memory.get(name)
+    if memory is None:
+        for old in _worker_memory.values():
+            old.close()
+        _worker_memory.clear()
+        memory = _worker_memory[name] = SharedMemory(name=name)
+    return memory
+
+def _match_chunk(memory_name: str, shape: Tuple[int, int], jobs: List[Tuple[str, float, int]]
+                 ) -> Dict[str, Optional[List[Tuple[int, int, float]]]]:
+    """
+    Match templates against the shared gray image (runs in a worker)
+
+    Args:
+        memory_name: Shared-memory block holding the image
+        shape: (height, width) of the float32 image
+        jobs: (template key, threshold, max matches) per template
+
+    Returns:
+        Key -> (x, y, score) per match, or None if the template is not in the cache
+    """
+    image = np.ndarray(shape, dtype=np.float32, buffer=_attach(memory_name).buf)
+    coarse: Dict[int, np.ndarray] = {}
+    results: Dict[str, Optional[List[Tuple[int, int, float]]]] = {}
+    for key, threshold, max_matches in jobs:
+        template = _worker_templates.get(key)
+        if template is None:
+            template = _worker_cache.load(key)
+            if template is None:
+                results[key] = None
+                continue
+            _worker_templates[key] = template
+        matches = find_all(image, template, None, threshold, max_matches, coarse=coarse)
+        results[key] = [(match.x, match.y, match.score) for match in matches]
+        # Keep the transforms for the frame sizes seen, once per worker
+        if template.unsaved and key not in _worker_saved:
+            _worker_cache.store(template)
+            _worker_saved.add(key)
+    return results
+
+class MatchPool:
+    """Worker processes for matching many templates at once"""
+
+    def __init__(self, workers: Optional[int] = None, cache: Optional[TemplateCache] = None):
+        """
+        Args:
+            workers: Worker processes (default: ``default_workers()``; 0
+                matches everything in the calling thread)
+            cache: Template cache the workers load from
+        """
+        self.workers = default_workers() if workers is None else workers
+        self.cache = cache or get_template_cache()
+        self.batches = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._memory: Optional[SharedMemory] = None
+        self._stored: Set[str] = set()
+        self._broken = False
+        # One batch at a time: they share the frame block
+        self._lock = threading.Lock()
+
+    def _start(self) -> ProcessPoolExecutor:
+        """Start the workers on first use (spawned, so no engine threads are forked)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(str(self.cache.directory), self.cache.fft_limit),
+            )
+        return self._executor
+
+    def _share(self, image: np.ndarray) -> SharedMemory:
+        """Copy an image into the frame block, growing it if needed"""
+        if self._memory is None or self._memory.size < image.nbytes:
+            self._release_memory()
+            self._memory = SharedMemory(create=True, size=max(image.nbytes, 1))
+        np.copyto(np.ndarray(image.shape, dtype=image.dtype, buffer=self._memory.buf), image)
+        return self._memory
+
+    def _release_memory(self):
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def find_many(self, frame: Frame, templates: Sequence[Template], region: Optional[Region] = None,
+                  threshold: Optional[float] = None, max_matches: int = 1) -> Dict[str, List[Match]]:
+        """
+        Find several templates in one screen region of a frame
+
+        Args:
+            frame: Shared frame to search
+            templates: What to look for (names should be unique)
+            region: Screen region to search (default: the whole frame)
+            threshold: Minimum score (default: each template's own)
+            max_matches: Best matches to return per template
+
+        Returns:
+            Template name -> matches in screen coordinates, best first
+        """
+        if len(templates) < MIN_POOL_TEMPLATES or self.workers < 1 or self._broken:
+            return {template.name: frame.find_all(template, region, threshold, max_matches)
+                    for template in templates}
+        gray = frame.gray(region)
+        left, top = frame.origin[0], frame.origin[1]
+        if region is not None:
+            left, top = max(left, region[0]), max(top, region[1])
+        by_key = {template.key: template for template in templates}
+        try:
+            with self._lock:
+                for template in templates:
+                    if template.key not in self._stored:
+                        self.cache.store(template)
+                        self._stored.add(template.key)
+                executor = self._start()
+                memory = self._share(gray)
+                jobs = [(template.key, template.threshold if threshold is None else threshold, max_matches)
+                        for template in by_key.values()]
+                futures = [executor.submit(_match_chunk, memory.name, gray.shape, jobs[i::self.workers])
+                           for i in range(min(self.workers, len(jobs)))]
+                found: Dict[str, Optional[List[Tuple[int, int, float]]]] = {}
+                for future in futures:
+                    found.update(future.result())
+                self.batches += 1
+        except Exception as e:
+            logger.warning("Match pool unavailable, matching in-thread instead: %s", e)
+            self._broken = True
+            self.close()
+            return self.find_many(frame, templates, region, threshold, max_matches)
+
+        results: Dict[str, List[Match]] = {}
+        for template in templates:
+            hits = found.get(template.key)
+            if hits is None:
+                # Not cached (e.g. the cache is read-only): match it here
+                results[template.name] = frame.find_all(template, region, threshold, max_matches)
+            else:
+                results[template.name] = [Match(left + x, top + y, template.width, template.height, score)
+                                          for x, y, score in hits]
+        return results
+
+    def close(self):
+        """Stop the workers and free the frame block"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            self._release_memory()
+
+_pool: Optional[MatchPool] = None
+_pool_lock = threading.Lock()
+
+def get_match_pool() -> MatchPool:
+    """Get the process-wide match pool (workers start on the first large batch)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = MatchPool()
+            pool = _pool
+            get_shutdown_coordinator().add_flush("MatchPool", lambda remaining: pool.close())
+        return _pool
@@ -0,0 +1,130 @@
+"""
+Pixel Probes
+Named single-pixel colour checks evaluated together
+
+A probe is a screen point with an expected RGB colour and a tolerance (the
+largest per-channel difference still counted as a hit). A ``ProbeSet``
+compiles its probes into coordinate and colour arrays, so checking all of
+them against a frame is a single fancy-index read plus one comparison.
+
+Probe files are JSON objects of ``name -> {"x", "y", "color", "tolerance"}``::
+
+    {"inventory_full": {"x": 1510, "y": 88, "color": [220, 40, 40], "tolerance": 30}}
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from vision.capture import Region
+
+DEFAULT_TOLERANCE = 24
+
+class ProbeSet:
+    """Named pixel probes checked in one vectorized operation"""
+
+    def __init__(self, probes: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            probes: name -> {"x", "y", "color", "tolerance" (optional)}
+        """
+        self.names: List[str] = []
+        self._points: List[Tuple[int, int]] = []
+        self._colors: List[Sequence[int]] = []
+        self._tolerances: List[int] = []
+        for name, probe in (probes or {}).items():
+            self._put(name, probe["x"], probe["y"], probe["color"], probe.get("tolerance", DEFAULT_TOLERANCE))
+        self._compile()
+
+    def add(self, name: str, x: int, y: int, color: Sequence[int], tolerance: int = DEFAULT_TOLERANCE):
+        """Add (or replace) a probe"""
+        self._put(name, x, y, color, tolerance)
+        self._compile()
+
+    def _put(self, name: str, x: int, y: int, color: Sequence[int], tolerance: int):
+        if len(color) != 3:
+            raise ValueError(f"Probe {name!r}: color must be [r, g, b], got {color!r}")
+        if name in self.names:
+            index = self.names.index(name)
+            self._points[index] = (int(x), int(y))
+            self._colors[index] = tuple(color)
+            self._tolerances[index] = int(tolerance)
+        else:
+            self.names.append(name)
+            self._points.append((int(x), int(y)))
+            self._colors.append(tuple(color))
+            self._tolerances.append(int(tolerance))
+
+    def _compile(self):
+        """Build the arrays the evaluation indexes with"""
+        points = np.array(self._points, dtype=np.intp).reshape(-1, 2)
+        self.xs = points[:, 0]
+        self.ys = points[:, 1]
+        self.colors = np.array(self._colors, dtype=np.int16).reshape(-1, 3)
+        self.tolerances = np.array(self._tolerances, dtype=np.int16)
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    @property
+    def region(self) -> Optional[Region]:
+        """Bounding box of all probes (None when empty)"""
+        if not self.names:
+            return None
+        left, top = int(self.xs.min()), int(self.ys.min())
+        return (left, top, int(self.xs.max()) - left + 1, int(self.ys.max()) - top + 1)
+
+    def hits(self, image: np.ndarray, origin: Tuple[int, int] = (0, 0)) -> np.ndarray:
+        """
+        Check every probe against an RGB image
+
+        Args:
+            image: RGB array covering the probes (a Frame's ``rgb``)
+            origin: Screen position of the image's top-left pixel
+
+        Returns:
+            Boolean array in ``names`` order; probes outside the image miss
+        """
+        xs = self.xs - origin[0]
+        ys = self.ys - origin[1]
+        inside = (xs >= 0) & (ys >= 0) & (xs < image.shape[1]) & (ys < image.shape[0])
+        if not inside.all():
+            xs = np.where(inside, xs, 0)
+            ys = np.where(inside, ys, 0)
+        pixels = image[ys, xs, :3].astype(np.int16)
+        return (np.abs(pixels - self.colors).max(axis=1) <= self.tolerances) & inside
+
+    def mask(self, image: np.ndarray, origin: Tuple[int, int] = (0, 0)) -> int:
+        """Check every probe; bit i of the result is ``names[i]``"""
+        packed = np.packbits(self.hits(image, origin), bitorder="little")
+        return int.from_bytes(packed.tobytes(), "little")
+
+    def check(self, image: np.ndarray, origin: Tuple[int, int] = (0, 0)) -> Dict[str, bool]:
+        """Check every probe; returns name -> hit"""
+        return dict(zip(self.names, self.hits(image, origin).tolist()))
+
+    def bits(self, names: Iterable[str]) -> int:
+        """Mask with the bits of the named probes set (to compare with ``mask``)"""
+        value = 0
+        for name in names:
+            value |= 1 << self.index[name]
+        return value
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ProbeSet":
+        """Load a probe file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def merged(self, other: "ProbeSet") -> "ProbeSet":
+        """Get a set with ``other``'s probes added (they win on name clashes)"""
+        result = ProbeSet()
+        for source in (self, other):
+            for i, name in enumerate(source.names):
+                result._put(name, *source._points[i], source._colors[i], source._tolerances[i])
+        result._compile()
+        return result
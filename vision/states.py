@@ -0,0 +1,182 @@
+"""
+Screen States
+Labels a frame as one of a game's screens (lobby, raid, shop open, ...)
+
+A frame's features are a joint colour histogram and a coarse gray layout,
+both taken from a fixed grid of sample pixels, so a full 1080p frame costs
+the same few microseconds as a small region. The trainer reads folders of
+labelled screenshots (``<directory>/<label>/*.png``), standardizes their
+features and keeps one centroid per label; a frame gets the label of the
+nearest centroid, or none when it is farther from it than any of that
+label's screenshots were (a screen the model was never shown).
+
+Models are ``.npz`` files, looked up as ``templates/<game>/states.npz`` by
+the template library.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from vision.capture import EXTENSIONS, LUMA, ImageSource, Region, crop, load_image
+
+# Sample grid (width, height): 16:9 like the game window
+SAMPLE_SIZE = (64, 36)
+# Gray layout cells (width, height); each averages 4 x 4 samples
+LAYOUT_SIZE = (16, 9)
+# Top 2 bits of each channel: 64 colour bins
+HIST_SHIFT = 6
+HIST_BINS = 64
+# A frame this much farther from its centroid than the label's farthest
+# training screenshot is reported as unknown
+RADIUS_MARGIN = 1.5
+MODEL_VERSION = 1
+
+_grids: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+def _grid(height: int, width: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Row indices, column indices and flat pixel indices of the samples of an image size"""
+    grid = _grids.get((height, width))
+    if grid is None:
+        rows = ((np.arange(SAMPLE_SIZE[1]) + 0.5) * height / SAMPLE_SIZE[1]).astype(np.intp)
+        cols = ((np.arange(SAMPLE_SIZE[0]) + 0.5) * width / SAMPLE_SIZE[0]).astype(np.intp)
+        grid = _grids[(height, width)] = (rows[:, None], cols[None, :], (rows[:, None] * width + cols).ravel())
+    return grid
+
+def _averaging(cells: int, size: int) -> np.ndarray:
+    """(cells, size) matrix averaging runs of size // cells values"""
+    run = size // cells
+    return np.kron(np.eye(cells, dtype=np.float32), np.full((1, run), 1.0 / run, dtype=np.float32))
+
+# The gray layout is rows @ samples @ cols: two tiny products instead of a strided mean
+_LAYOUT_ROWS = _averaging(LAYOUT_SIZE[1], SAMPLE_SIZE[1])
+_LAYOUT_COLS = _averaging(LAYOUT_SIZE[0], SAMPLE_SIZE[0]).T * np.float32(1.0 / 255.0)
+
+def features(image: np.ndarray) -> np.ndarray:
+    """
+    Feature vector of an RGB image
+
+    Returns:
+        float32 array: HIST_BINS colour fractions, then the gray layout (0-1)
+    """
+    rows, cols, flat = _grid(image.shape[0], image.shape[1])
+    if image.flags.c_contiguous and image.shape[2] == 3:
+        sample = image.reshape(-1, 3).take(flat, axis=0)
+    else:
+        # Crops are views with gaps between rows; a flat take would copy them first
+        sample = image[rows, cols, :3].reshape(-1, 3)
+    codes = sample >> HIST_SHIFT
+    bins = (codes[:, 0] << 4) | (codes[:, 1] << 2) | codes[:, 2]
+    histogram = np.bincount(bins, minlength=HIST_BINS).astype(np.float32) * np.float32(1.0 / len(bins))
+    gray = (sample @ LUMA).reshape(SAMPLE_SIZE[1], SAMPLE_SIZE[0])
+    layout = _LAYOUT_ROWS @ gray @ _LAYOUT_COLS
+    return np.concatenate((histogram, layout.ravel()))
+
+class StateClassifier:
+    """Nearest-centroid screen state model"""
+
+    def __init__(self, labels: Sequence[str], centroids: np.ndarray, mean: np.ndarray, scale: np.ndarray,
+                 radii: np.ndarray, region: Optional[Region] = None):
+        """
+        Args:
+            labels: State names, one per centroid
+            centroids: (labels, features) standardized class means
+            mean: Feature means of the training set
+            scale: Feature standard deviations of the training set
+            radii: Largest distance from each centroid still given its label
+            region: Screen region the features are taken from (None: the whole frame)
+        """
+        self.labels = list(labels)
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.scale = np.asarray(scale, dtype=np.float32)
+        self.radii = np.asarray(radii, dtype=np.float32)
+        self.region = tuple(int(v) for v in region) if region is not None else None
+        # Squared distance = |x|^2 - 2 x.c + |c|^2; the |c|^2 part is fixed
+        self._norms = (self.centroids * self.centroids).sum(axis=1)
+
+    def classify(self, image: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        Label an image (already cropped to ``region``)
+
+        Returns:
+            (label, distance to its centroid); the label is None for a screen
+            unlike any the model was trained on
+        """
+        x = (features(image) - self.mean) / self.scale
+        distances = self._norms - 2.0 * (self.centroids @ x) + float(x @ x)
+        best = int(np.argmin(distances))
+        distance = float(np.sqrt(max(float(distances[best]), 0.0)))
+        return (self.labels[best] if distance <= self.radii[best] else None), distance
+
+    def label(self, image: np.ndarray) -> Optional[str]:
+        """Label an image (None: unknown screen)"""
+        return self.classify(image)[0]
+
+    def save(self, path: Union[str, Path]):
+        """Write the model as .npz"""
+        np.savez(path, version=MODEL_VERSION, labels=np.array(self.labels), centroids=self.centroids,
+                 mean=self.mean, scale=self.scale, radii=self.radii,
+                 region=np.array(self.region if self.region is not None else (), dtype=np.int64))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "StateClassifier":
+        """
+        Read a model written by ``save``
+
+        Raises:
+            ValueError: If the file is from an incompatible version
+        """
+        with np.load(path) as model:
+            if int(model["version"]) != MODEL_VERSION:
+                raise ValueError(f"{path}: state model version {int(model['version'])}, expected {MODEL_VERSION}")
+            region = tuple(model["region"].tolist()) or None
+            return cls([str(label) for label in model["labels"]], model["centroids"], model["mean"],
+                       model["scale"], model["radii"], region)
+
+def train(examples: Dict[str, Sequence[ImageSource]], region: Optional[Region] = None) -> StateClassifier:
+    """
+    Fit a model to labelled screenshots
+
+    Args:
+        examples: Label -> screenshots (paths or arrays) of that screen
+        region: Only look at this part of each screenshot
+
+    Raises:
+        ValueError: If there are fewer than two labels or a label has no screenshots
+    """
+    if len(examples) < 2:
+        raise ValueError("Need screenshots of at least two screen states")
+    labels = sorted(examples)
+    rows: List[np.ndarray] = []
+    owners: List[int] = []
+    for index, label in enumerate(labels):
+        if not examples[label]:
+            raise ValueError(f"No screenshots for state {label!r}")
+        for source in examples[label]:
+            rows.append(features(crop(load_image(source), region)))
+            owners.append(index)
+    data = np.stack(rows)
+    owner = np.array(owners)
+    mean = data.mean(axis=0)
+    # Constant features would divide by zero; they carry no information anyway
+    scale = np.maximum(data.std(axis=0), 1e-3)
+    data = (data - mean) / scale
+    centroids = np.stack([data[owner == index].mean(axis=0) for index in range(len(labels))])
+
+    between = np.sqrt(((centroids[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2))
+    np.fill_diagonal(between, np.inf)
+    radii = np.empty(len(labels), dtype=np.float32)
+    for index in range(len(labels)):
+        spread = np.sqrt(((data[owner == index] - centroids[index]) ** 2).sum(axis=1)).max()
+        # A single screenshot has no spread: allow up to halfway to the nearest other state
+        radii[index] = max(spread * RADIUS_MARGIN, between[index].min() / 2)
+    return StateClassifier(labels, centroids, mean, scale, radii, region)
+
+def train_directory(directory: Union[str, Path], region: Optional[Region] = None) -> StateClassifier:
+    """Fit a model to ``<directory>/<label>/`` folders of screenshots"""
+    directory = Path(directory)
+    examples = {
+        folder.name: sorted(path for path in folder.iterdir() if path.suffix.lower() in EXTENSIONS)
+        for folder in sorted(directory.iterdir()) if folder.is_dir()
+    }
+    return train(examples, region)
@@ -0,0 +1,132 @@
+"""
+Template Library
+Named templates loaded from the templates/ directory
+
+Templates live in ``templates/<game>/<name>.<ext>`` (game-specific) or
+``templates/<name>.<ext>`` (shared), as PNG or any other format Pillow reads,
+or as ``.npy`` arrays. Each is loaded and its pyramid built once, on first use,
+and kept in the on-disk template cache so later runs skip even that.
+Pixel probes come from ``probes.json`` in the same two folders, and the
+screen state model from ``states.npz`` and the HUD font's glyph bank from
+``glyphs.npz``.
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from core.shutdown import get_shutdown_coordinator
+from vision.cache import TemplateCache, file_key, get_template_cache
+from vision.capture import EXTENSIONS
+from vision.digits import GlyphBank
+from vision.matching import DEFAULT_THRESHOLD, Template
+from vision.probes import ProbeSet
+from vision.states import StateClassifier
+
+class TemplateLibrary:
+    """Loads and caches named templates"""
+
+    def __init__(self, directory: Path = Path("templates"), threshold: float = DEFAULT_THRESHOLD,
+                 cache: Optional[TemplateCache] = None):
+        self.directory = Path(directory)
+        self.threshold = threshold
+        self.cache = cache or get_template_cache()
+        self._templates: Dict[Tuple[Optional[str], str], Template] = {}
+        self._probes: Dict[Optional[str], ProbeSet] = {}
+        self._states: Dict[Optional[str], Optional[StateClassifier]] = {}
+        self._glyphs: Dict[Optional[str], Optional[GlyphBank]] = {}
+        self._lock = threading.Lock()
+
+    def _locate(self, name: str, game: Optional[str]) -> Optional[Path]:
+        """Find a template file, preferring the game's own folder"""
+        folders = [self.directory / game] if game else []
+        folders.append(self.directory)
+        for folder in folders:
+            for extension in EXTENSIONS:
+                path = folder / f"{name}{extension}"
+                if path.is_file():
+                    return path
+        return None
+
+    def add(self, name: str, template: Template, game: Optional[str] = None):
+        """Register a template that does not come from a file"""
+        with self._lock:
+            self._templates[(game, name)] = template
+
+    def get(self, name: str, game: Optional[str] = None) -> Template:
+        """
+        Get a template by name
+
+        Raises:
+            KeyError: If no such template is registered or on disk
+        """
+        with self._lock:
+            template = self._templates.get((game, name)) or self._templates.get((None, name))
+            if template is not None:
+                return template
+            path = self._locate(name, game)
+            if path is None:
+                where = f"{self.directory / game} or {self.directory}" if game else str(self.directory)
+                raise KeyError(f"No template {name!r} in {where}")
+            key = file_key(path)
+            template = self.cache.load(key, name=name, threshold=self.threshold)
+            if template is None:
+                template = Template(path, name=name, threshold=self.threshold, key=key)
+                self.cache.store(template)
+            # Cache under the folder it came from so other games can share it
+            self._templates[(game if path.parent != self.directory else None, name)] = template
+            return template
+
+    def save(self) -> int:
+        """Write FFTs computed since loading to the template cache; returns templates written"""
+        with self._lock:
+            templates = list(self._templates.values())
+        return sum(self.cache.store(template) for template in templates if template.unsaved)
+
+    def probes(self, game: Optional[str] = None) -> ProbeSet:
+        """Get the shared probes plus the game's own (empty if there are no probe files)"""
+        with self._lock:
+            probes = self._probes.get(game)
+            if probes is None:
+                probes = ProbeSet()
+                folders = [self.directory] + ([self.directory / game] if game else [])
+                for folder in folders:
+                    path = folder / "probes.json"
+                    if path.is_file():
+                        probes = probes.merged(ProbeSet.load(path))
+                self._probes[game] = probes
+            return probes
+
+    def _model(self, filename: str, game: Optional[str]) -> Optional[Path]:
+        """Find a model file, preferring the game's own folder"""
+        folders = ([self.directory / game] if game else []) + [self.directory]
+        paths = [folder / filename for folder in folders if (folder / filename).is_file()]
+        return paths[0] if paths else None
+
+    def states(self, game: Optional[str] = None) -> Optional[StateClassifier]:
+        """Get the game's screen state model, or the shared one (None if neither exists)"""
+        with self._lock:
+            if game not in self._states:
+                path = self._model("states.npz", game)
+                self._states[game] = StateClassifier.load(path) if path is not None else None
+            return self._states[game]
+
+    def glyphs(self, game: Optional[str] = None) -> Optional[GlyphBank]:
+        """Get the game's HUD glyph bank, or the shared one (None if neither exists)"""
+        with self._lock:
+            if game not in self._glyphs:
+                path = self._model("glyphs.npz", game)
+                self._glyphs[game] = GlyphBank.load(path) if path is not None else None
+            return self._glyphs[game]
+
+_library: Optional[TemplateLibrary] = None
+_library_lock = threading.Lock()
+
+def get_template_library() -> TemplateLibrary:
+    """Get the process-wide template library"""
+    global _library
+    with _library_lock:
+        if _library is None:
+            _library = TemplateLibrary()
+            library = _library
+            get_shutdown_coordinator().add_flush("TemplateLibrary", lambda remaining: library.save())
+        return _library